@@ -6,6 +6,19 @@
 
 from __future__ import annotations
 
-from sdlc_core.session import Session
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sdlc_core.session import Session
 
 __all__ = ["Session"]
+
+
+# Imported on first access so that ``import sdlc_core.<module>`` (every CLI
+# entry point) does not pay for the session module and dataclasses.
+def __getattr__(name: str) -> object:
+    if name == "Session":
+        from sdlc_core.session import Session
+
+        return Session
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
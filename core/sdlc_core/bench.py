@@ -0,0 +1,259 @@
+"""bench.py: Time metrics, checks and status queries on a large experiment.db.
+
+Usage:
+    python -m sdlc_core.bench --runs 200 --out logs/bench.json
+    python -m sdlc_core.bench --db logs/experiment.db --repeat 10
+    python -m sdlc_core.bench --runs 200 --baseline logs/bench.json --max-ratio 1.25
+
+Without ``--db`` a temporary database is filled by
+:func:`sdlc_core.synthetic.generate` (``--runs``, ``--artifacts-per-phase``,
+``--seed``), so the same arguments always benchmark the same rows.  With
+``--db`` an existing database is read, never modified.
+
+Each metric category (:func:`sdlc_core.metrics.category_queries`), each
+integrity check (:data:`sdlc_core.check.CHECKS`) and each status query
+(:data:`sdlc_core.status.RUN_QUERIES`, plus the full snapshot) is run
+``--repeat`` times on one connection; the best and median wall times are
+reported in milliseconds.  The JSON written by ``--out`` records the row
+count of every table next to the timings, so two results are only compared
+when they describe the same dataset.
+
+``--baseline`` compares the run with an earlier JSON result and prints the
+ratio of best times for every shared entry; with ``--max-ratio`` the command
+exits with code 1 when any entry is slower than the baseline by more than
+that factor.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from sdlc_core import check, metrics, status
+from sdlc_core.synthetic import generate
+
+# Tables whose row counts describe a dataset, in schema order.
+_DATASET_TABLES = (
+    "runs", "sessions", "phase_progress", "artifacts", "traceability_links",
+    "interactions", "interventions", "validation_results", "defects", "pipeline_events",
+)
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+def _time(fn: Callable[[], object], repeat: int) -> dict[str, float]:
+    """Run *fn* *repeat* times and return its best and median time in ms."""
+    samples: list[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return {"best_ms": round(min(samples), 3), "median_ms": round(statistics.median(samples), 3)}
+
+
+def _dataset(conn: sqlite3.Connection) -> dict[str, int]:
+    return {
+        table: int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+        for table in _DATASET_TABLES
+    }
+
+
+def run_benchmark(db_path: Path, *, repeat: int = 5) -> dict[str, Any]:
+    """Time every metric category, check and status query on *db_path*.
+
+    Args:
+        db_path: Database to read.
+        repeat:  Timed repetitions per entry.
+
+    Returns:
+        JSON-serialisable result with ``dataset`` row counts and a
+        ``timings`` dict holding ``metrics``, ``checks`` and ``status``
+        groups of ``{"best_ms", "median_ms"}`` entries.
+
+    Raises:
+        ValueError: If *repeat* is less than 1.
+
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1.")
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    try:
+        timings: dict[str, dict[str, dict[str, float]]] = {
+            "metrics": {
+                name: _time(partial(query, conn), repeat)
+                for name, query in metrics.category_queries().items()
+            },
+            "checks": {
+                check_id: _time(partial(fn, conn), repeat)
+                for check_id, fn in check.CHECKS
+            },
+        }
+
+        latest = status._fetch_latest_run(conn)
+        status_timings = {"latest_run": _time(lambda: status._fetch_latest_run(conn), repeat)}
+        if latest is not None:
+            run_id = str(latest["id"])
+            for key, fetch in status.RUN_QUERIES.items():
+                status_timings[key] = _time(partial(fetch, conn, run_id), repeat)
+        status_timings["snapshot"] = _time(lambda: status._status_snapshot(db_path), repeat)
+        timings["status"] = status_timings
+        dataset = _dataset(conn)
+    finally:
+        conn.close()
+
+    return {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "database": db_path.as_posix(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "repeat": repeat,
+        "dataset": dataset,
+        "timings": timings,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------
+
+def compare(result: dict[str, Any], baseline: dict[str, Any]) -> dict[str, float]:
+    """Return ``{"group/name": best_ms / baseline best_ms}`` for shared entries.
+
+    Entries with a zero baseline time are left out.
+    """
+    ratios: dict[str, float] = {}
+    for group, entries in result["timings"].items():
+        base_group = baseline.get("timings", {}).get(group, {})
+        for name, timing in entries.items():
+            base = base_group.get(name, {}).get("best_ms")
+            if base:
+                ratios[f"{group}/{name}"] = timing["best_ms"] / base
+    return ratios
+
+
+def _print_result(result: dict[str, Any], ratios: dict[str, float] | None) -> None:
+    dataset = ", ".join(f"{table}={count}" for table, count in result["dataset"].items())
+    print(f"[sdlc_core.bench] {dataset}")
+    print(f"[sdlc_core.bench] best / median of {result['repeat']} (ms)")
+    for group, entries in result["timings"].items():
+        print(f"\n{group}:")
+        for name, timing in entries.items():
+            line = f"  {name:<26} {timing['best_ms']:10.2f} {timing['median_ms']:10.2f}"
+            if ratios is not None and f"{group}/{name}" in ratios:
+                line += f"   x{ratios[f'{group}/{name}']:.2f} vs baseline"
+            print(line)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    """Parse command-line arguments, run the benchmark and report the result."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark metrics, checks and status queries on experiment.db"
+    )
+    parser.add_argument(
+        "--db",
+        default=None,
+        help="Existing database to benchmark (default: generate a synthetic one)",
+    )
+    parser.add_argument("--runs", type=int, default=50, help="Synthetic runs (default: 50)")
+    parser.add_argument(
+        "--artifacts-per-phase",
+        type=int,
+        default=12,
+        help="Mean synthetic artifacts per reached phase (default: 12)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0)")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed repetitions per entry (default: 5)"
+    )
+    parser.add_argument("--out", default=None, help="Write the result to this JSON file")
+    parser.add_argument("--baseline", default=None, help="Earlier JSON result to compare with")
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=None,
+        help="With --baseline, exit 1 if any entry is slower by more than this factor",
+    )
+    args = parser.parse_args()
+
+    baseline: dict[str, Any] | None = None
+    if args.baseline:
+        try:
+            baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"[sdlc_core.bench] ERROR: cannot read baseline: {exc}", file=sys.stderr)
+            sys.exit(1)
+
+    try:
+        if args.db:
+            db_path = Path(args.db)
+            if not db_path.exists():
+                print(
+                    f"[sdlc_core.bench] ERROR: database not found at {db_path}",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+            result = run_benchmark(db_path, repeat=args.repeat)
+        else:
+            with tempfile.TemporaryDirectory(prefix="sdlc-bench-") as tmp:
+                db_path = Path(tmp) / "experiment.db"
+                generate(
+                    db_path,
+                    runs=args.runs,
+                    artifacts_per_phase=args.artifacts_per_phase,
+                    seed=args.seed,
+                )
+                result = run_benchmark(db_path, repeat=args.repeat)
+            result["generator"] = {
+                "runs": args.runs,
+                "artifacts_per_phase": args.artifacts_per_phase,
+                "seed": args.seed,
+            }
+    except ValueError as exc:
+        print(f"[sdlc_core.bench] ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    ratios = None
+    if baseline is not None:
+        if baseline.get("dataset") != result["dataset"]:
+            print(
+                "[sdlc_core.bench] WARNING: baseline was measured on a different dataset",
+                file=sys.stderr,
+            )
+        ratios = compare(result, baseline)
+    _print_result(result, ratios)
+
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"\n[sdlc_core.bench] Result written to {out_path}")
+
+    if ratios and args.max_ratio is not None:
+        slower = {key: ratio for key, ratio in ratios.items() if ratio > args.max_ratio}
+        for key, ratio in slower.items():
+            print(f"[sdlc_core.bench] REGRESSION: {key} x{ratio:.2f}", file=sys.stderr)
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
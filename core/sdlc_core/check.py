@@ -48,9 +48,13 @@
 import json
 import sqlite3
 import sys
+from collections.abc import Callable, Mapping
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol
+
+from sdlc_core.tracegraph import TraceGraph, load_graphs
 
 # ---------------------------------------------------------------------------
 # Types
@@ -60,6 +64,16 @@
 CheckResult = dict[str, Any]
 
 
+class _GraphCheck(Protocol):
+    """A check that can reuse traceability graphs already built by the caller."""
+
+    def __call__(
+        self, conn: sqlite3.Connection, graphs: Mapping[str, TraceGraph] | None = None
+    ) -> CheckResult:
+        """Run the check on *conn*, reading *graphs* instead of loading them."""
+        ...
+
+
 def _now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
@@ -121,47 +135,47 @@ def p1_seed_artifacts_registered(conn: sqlite3.Connection) -> CheckResult:
     return _check("P1", desc, True)
 
 
-def g1_artifact_upstream_links(conn: sqlite3.Connection) -> CheckResult:
-    """Every artifact (except phase-1 seeds) has ≥1 upstream link."""
-    rows = conn.execute(
-        """
-        SELECT a.id, a.run_id, a.phase
-        FROM artifacts a
-        LEFT JOIN traceability_links tl
-            ON tl.from_artifact_id = a.id AND tl.run_id = a.run_id
-        WHERE a.phase > 1
-          AND tl.from_artifact_id IS NULL
-        """
-    ).fetchall()
-    if not rows:
+def g1_artifact_upstream_links(
+    conn: sqlite3.Connection, graphs: Mapping[str, TraceGraph] | None = None
+) -> CheckResult:
+    """Every artifact (except phase-1 seeds) has ≥1 upstream link.
+
+    *graphs* is the result of :func:`load_graphs` when the caller already
+    built it; otherwise it is loaded from *conn*.
+    """
+    graphs = load_graphs(conn) if graphs is None else graphs
+    missing = [
+        f"{run_id}/{artifact_id} (phase {graph.phase(artifact_id)})"
+        for run_id, graph in graphs.items()
+        for artifact_id in graph
+        if (graph.phase(artifact_id) or 0) > 1 and not graph.direct_upstream(artifact_id)
+    ]
+    if not missing:
         return _check("G1", "All non-seed artifacts have ≥1 upstream link", True)
-    detail = "; ".join(f"{r['run_id']}/{r['id']} (phase {r['phase']})" for r in rows)
     return _check("G1", "All non-seed artifacts have ≥1 upstream link", False,
-                  f"Missing upstream links: {detail}")
+                  f"Missing upstream links: {'; '.join(missing)}")
 
 
-def g2_impl_has_ver(conn: sqlite3.Connection) -> CheckResult:
-    """Every IMPL-NN artifact has ≥1 VER-NN linked to it."""
-    rows = conn.execute(
-        """
-        SELECT a.id, a.run_id
-        FROM artifacts a
-        WHERE a.id LIKE 'IMPL-%'
-          AND NOT EXISTS (
-              SELECT 1 FROM traceability_links tl
-              JOIN artifacts a2
-                  ON a2.id = tl.from_artifact_id AND a2.run_id = tl.run_id
-              WHERE tl.to_artifact_id = a.id
-                AND tl.run_id = a.run_id
-                AND a2.id LIKE 'VER-%'
-          )
-        """
-    ).fetchall()
-    if not rows:
+def g2_impl_has_ver(
+    conn: sqlite3.Connection, graphs: Mapping[str, TraceGraph] | None = None
+) -> CheckResult:
+    """Every IMPL-NN artifact has ≥1 VER-NN linked to it.
+
+    *graphs* is used as in :func:`g1_artifact_upstream_links`.
+    """
+    graphs = load_graphs(conn) if graphs is None else graphs
+    unverified = [
+        f"{run_id}/{artifact_id}"
+        for run_id, graph in graphs.items()
+        for artifact_id in graph
+        if artifact_id.startswith("IMPL-")
+        and graph.phase(artifact_id) is not None
+        and not any(d.startswith("VER-") for d in graph.direct_downstream(artifact_id))
+    ]
+    if not unverified:
         return _check("G2", "All IMPL artifacts are linked to ≥1 VER artifact", True)
-    detail = "; ".join(f"{r['run_id']}/{r['id']}" for r in rows)
     return _check("G2", "All IMPL artifacts are linked to ≥1 VER artifact", False,
-                  f"Unverified IMPL artifacts: {detail}")
+                  f"Unverified IMPL artifacts: {'; '.join(unverified)}")
 
 
 def g3_defect_count_matches(conn: sqlite3.Connection) -> CheckResult:
@@ -467,6 +481,36 @@ def p8_transition_evidence(conn: sqlite3.Connection) -> CheckResult:
 # Runner
 # ---------------------------------------------------------------------------
 
+# Every check in report order, as (id, function of an open connection).
+CHECKS: tuple[tuple[str, Callable[[sqlite3.Connection], CheckResult]], ...] = (
+    ("G1", g1_artifact_upstream_links),
+    ("G2", g2_impl_has_ver),
+    ("G3", g3_defect_count_matches),
+    ("G4", g4_no_accepted_with_open_critical),
+    ("G5", g5_all_sessions_closed),
+    ("G6", g6_unique_artifact_ids_per_run),
+    ("G7", g7_monotonic_pks),
+    ("G8", g8_single_model_per_run_phase),
+    ("P1", p1_seed_artifacts_registered),
+    ("P2", partial(_phase_artifact_check, check_id="P2", phase=2,
+                   artifact_type_like="Requirements")),
+    ("P3", partial(_phase_artifact_check, check_id="P3", phase=3,
+                   artifact_type_like="Architecture")),
+    ("P4", partial(_phase_artifact_check, check_id="P4", phase=4, artifact_type_like="Design")),
+    ("P5", partial(_phase_artifact_check, check_id="P5", phase=5,
+                   artifact_type_like="Implementation")),
+    ("P6", partial(_phase_validation_check, check_id="P6", phase=6)),
+    ("P7", partial(_phase_validation_check, check_id="P7", phase=7)),
+    ("P8", p8_transition_evidence),
+)
+
+# Checks that read the traceability graph; run_all_checks builds it once for them.
+_GRAPH_CHECKS: dict[str, _GraphCheck] = {
+    "G1": g1_artifact_upstream_links,
+    "G2": g2_impl_has_ver,
+}
+
+
 def run_all_checks(db_path: Path) -> list[CheckResult]:
     """Run all semantic integrity checks against *db_path*.
 
@@ -479,27 +523,16 @@ def run_all_checks(db_path: Path) -> list[CheckResult]:
 
     """
     conn = _open(db_path)
-    results: list[CheckResult] = []
     try:
-        results.append(g1_artifact_upstream_links(conn))
-        results.append(g2_impl_has_ver(conn))
-        results.append(g3_defect_count_matches(conn))
-        results.append(g4_no_accepted_with_open_critical(conn))
-        results.append(g5_all_sessions_closed(conn))
-        results.append(g6_unique_artifact_ids_per_run(conn))
-        results.append(g7_monotonic_pks(conn))
-        results.append(g8_single_model_per_run_phase(conn))
-        results.append(p1_seed_artifacts_registered(conn))
-        results.append(_phase_artifact_check(conn, "P2", 2, "Requirements"))
-        results.append(_phase_artifact_check(conn, "P3", 3, "Architecture"))
-        results.append(_phase_artifact_check(conn, "P4", 4, "Design"))
-        results.append(_phase_artifact_check(conn, "P5", 5, "Implementation"))
-        results.append(_phase_validation_check(conn, "P6", 6))
-        results.append(_phase_validation_check(conn, "P7", 7))
-        results.append(p8_transition_evidence(conn))
+        graphs = load_graphs(conn)
+        return [
+            graph_check(conn, graphs=graphs)
+            if (graph_check := _GRAPH_CHECKS.get(check_id)) is not None
+            else check(conn)
+            for check_id, check in CHECKS
+        ]
     finally:
         conn.close()
-    return results
 
 
 def write_report(results: list[CheckResult], out_path: Path) -> None:
@@ -0,0 +1,375 @@
+"""daemon.py: Optional long-lived server for the operator commands, and the ``sdlc`` client.
+
+Every ``sdlc-*`` command starts a fresh interpreter, imports its modules and
+opens the database.  Operators run ``sdlc-status`` and friends many times per
+hour, so ``sdlc daemon`` keeps one interpreter alive on a Unix socket with
+every command module already imported, and ``sdlc <command>`` forwards its
+arguments there:
+
+    sdlc status --json          ->  sdlc-status --json
+    sdlc phase-status ...       ->  sdlc-phase-status ...
+    sdlc pause / resume / abandon-run
+    sdlc diff-summary ...       ->  sdlc-diff-summary ...
+    sdlc metrics / check / trace / search
+
+The client sends its working directory and ``SDLC_DB_PATH`` with each
+request, so relative paths such as the default ``logs/experiment.db`` mean
+the same thing as when the command runs directly.  The daemon runs one
+command at a time (the commands change directory and redirect stdout), and
+returns the exit code and captured output.
+
+When no daemon answers on the socket, the client runs the command
+in-process instead, so ``sdlc`` always works; the daemon only makes it
+faster.  The socket is ``logs/sdlc.sock`` unless ``--socket`` or
+``SDLC_DAEMON_SOCKET`` says otherwise, and is created readable by the
+owner only.
+
+This module imports nothing beyond ``json``, ``os``, ``socket`` and ``sys`` at
+load time, so the client itself starts quickly.
+
+Usage:
+    sdlc daemon                     # serve in the foreground until Ctrl-C
+    sdlc daemon --stop              # stop a running daemon
+    sdlc status --json
+    sdlc phase-status --phase 3 --status completed
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import socketserver
+
+# Command name -> (module, function).  Each function parses ``sys.argv``.
+COMMANDS: dict[str, tuple[str, str]] = {
+    "status": ("sdlc_core.status", "main"),
+    "phase-status": ("sdlc_core.phase_status", "main"),
+    "pause": ("sdlc_core.run_control", "pause_main"),
+    "resume": ("sdlc_core.run_control", "resume_main"),
+    "abandon-run": ("sdlc_core.run_control", "abandon_main"),
+    "diff-summary": ("sdlc_core.diff_summary", "main"),
+    "metrics": ("sdlc_core.metrics", "main"),
+    "check": ("sdlc_core.check", "main"),
+    "trace": ("sdlc_core.tracegraph", "main"),
+    "search": ("sdlc_core.search", "main"),
+}
+
+# Environment variables forwarded from the client to the daemon.
+_FORWARDED_ENV = ("SDLC_DB_PATH",)
+
+_STOP = "__stop__"
+_PING = "__ping__"
+
+
+def default_socket_path() -> Path:
+    """Return ``$SDLC_DAEMON_SOCKET``, or ``logs/sdlc.sock`` relative to the cwd."""
+    env = os.environ.get("SDLC_DAEMON_SOCKET")
+    return Path(env) if env else Path("logs") / "sdlc.sock"
+
+
+# ---------------------------------------------------------------------------
+# In-process execution
+# ---------------------------------------------------------------------------
+
+
+def _invoke(command: str, args: list[str]) -> int:
+    """Run *command* with *args* in this process and return its exit code."""
+    import importlib
+    import traceback
+
+    module_name, func_name = COMMANDS[command]
+    func = getattr(importlib.import_module(module_name), func_name)
+    saved_argv = sys.argv
+    sys.argv = [f"sdlc {command}", *args]
+    try:
+        func()
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        print(exc.code, file=sys.stderr)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.argv = saved_argv
+    return 0
+
+
+def run_command(
+    command: str,
+    args: list[str],
+    *,
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
+) -> tuple[int, str, str]:
+    """Run an operator command in-process and capture its output.
+
+    The working directory and the forwarded environment variables are
+    switched for the duration of the call and restored afterwards, so the
+    caller must not run two commands at once.
+
+    Args:
+        command: A key of :data:`COMMANDS`.
+        args:    Command-line arguments, without the command name.
+        cwd:     Directory the command runs in; the current one if ``None``.
+        env:     Values for the forwarded variables (``SDLC_DB_PATH``); a
+                 forwarded variable missing from *env* is unset.
+
+    Returns:
+        ``(exit_code, stdout, stderr)``.
+
+    Raises:
+        KeyError: If *command* is unknown.
+
+    """
+    import contextlib
+    import io
+
+    if command not in COMMANDS:
+        raise KeyError(f"unknown command {command!r}; choose from {', '.join(COMMANDS)}")
+
+    out, err = io.StringIO(), io.StringIO()
+    saved_cwd = os.getcwd()
+    saved_env = {name: os.environ.get(name) for name in _FORWARDED_ENV}
+    try:
+        if cwd is not None:
+            os.chdir(cwd)
+        if env is not None:
+            for name in _FORWARDED_ENV:
+                _set_env(name, env.get(name))
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            code = _invoke(command, args)
+    finally:
+        os.chdir(saved_cwd)
+        for name, value in saved_env.items():
+            _set_env(name, value)
+    return code, out.getvalue(), err.getvalue()
+
+
+def _set_env(name: str, value: str | None) -> None:
+    if value is None:
+        os.environ.pop(name, None)
+    else:
+        os.environ[name] = value
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+def _read_message(sock: socket.socket) -> dict[str, Any]:
+    with sock.makefile("rb") as reader:
+        line = reader.readline()
+    if not line:
+        raise ConnectionError("connection closed before a request was received")
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("request must be a JSON object")
+    return message
+
+
+def _send_message(sock: socket.socket, message: dict[str, Any]) -> None:
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def make_server(socket_path: Path | str | None = None) -> socketserver.UnixStreamServer:
+    """Bind the daemon socket and preload every command module.
+
+    Call ``serve_forever()`` on the result; a ``__stop__`` request or
+    ``shutdown()`` ends it.  ``server_close()`` removes the socket file.
+
+    Args:
+        socket_path: Socket to bind.  Defaults to :func:`default_socket_path`.
+
+    Returns:
+        The bound server.
+
+    Raises:
+        RuntimeError: If another daemon already answers on *socket_path*.
+
+    """
+    import importlib
+    import socketserver
+    import threading
+
+    path = Path(socket_path) if socket_path else default_socket_path()
+    if path.exists():
+        if ping(path):
+            raise RuntimeError(f"a daemon is already listening on {path}")
+        path.unlink()  # left behind by a daemon that did not shut down cleanly
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    for module_name, _ in COMMANDS.values():
+        importlib.import_module(module_name)
+
+    lock = threading.Lock()
+
+    class _Handler(socketserver.BaseRequestHandler):
+        def handle(self) -> None:
+            try:
+                request = _read_message(self.request)
+                command = str(request.get("command", ""))
+                if command == _PING:
+                    _send_message(self.request, {"exit_code": 0, "stdout": "", "stderr": ""})
+                    return
+                if command == _STOP:
+                    _send_message(self.request, {"exit_code": 0, "stdout": "", "stderr": ""})
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    return
+                with lock:
+                    code, out, err = run_command(
+                        command,
+                        [str(arg) for arg in request.get("args", [])],
+                        cwd=request.get("cwd"),
+                        env=request.get("env") or {},
+                    )
+                reply = {"exit_code": code, "stdout": out, "stderr": err}
+            except (KeyError, ValueError, OSError) as exc:
+                reply = {"exit_code": 2, "stdout": "", "stderr": f"{exc}\n"}
+            _send_message(self.request, reply)
+
+    class _Server(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def server_close(self) -> None:
+            super().server_close()
+            path.unlink(missing_ok=True)
+
+    old_umask = os.umask(0o077)
+    try:
+        server = _Server(str(path), _Handler)
+    finally:
+        os.umask(old_umask)
+    return server
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+def request(
+    socket_path: Path | str,
+    command: str,
+    args: list[str] | None = None,
+    *,
+    timeout: float | None = None,
+) -> tuple[int, str, str]:
+    """Send one command to a running daemon.
+
+    Args:
+        socket_path: Daemon socket.
+        command:     A key of :data:`COMMANDS`, or ``"__stop__"``.
+        args:        Command-line arguments, without the command name.
+        timeout:     Socket timeout in seconds; ``None`` waits indefinitely.
+
+    Returns:
+        ``(exit_code, stdout, stderr)`` as produced by the daemon.
+
+    Raises:
+        OSError: If no daemon is listening (``FileNotFoundError`` or
+            ``ConnectionRefusedError``) or the connection fails.
+
+    """
+    payload = {
+        "command": command,
+        "args": list(args or []),
+        "cwd": os.getcwd(),
+        "env": {name: os.environ[name] for name in _FORWARDED_ENV if name in os.environ},
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        _send_message(sock, payload)
+        reply = _read_message(sock)
+    return int(reply["exit_code"]), str(reply["stdout"]), str(reply["stderr"])
+
+
+def ping(socket_path: Path | str) -> bool:
+    """Return ``True`` when a daemon answers on *socket_path*."""
+    try:
+        request(socket_path, _PING, timeout=2.0)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _die(message: str) -> None:
+    print(f"[sdlc_core.daemon] ERROR: {message}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _serve_main(socket_path: Path, stop: bool) -> None:
+    if stop:
+        try:
+            request(socket_path, _STOP, timeout=5.0)
+        except OSError:
+            _die(f"no daemon is listening on {socket_path}")
+        print(f"[sdlc_core.daemon] Stopped daemon on {socket_path}")
+        return
+
+    try:
+        server = make_server(socket_path)
+    except (RuntimeError, OSError) as exc:
+        _die(str(exc))
+    print(f"[sdlc_core.daemon] Serving {', '.join(COMMANDS)} on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main() -> None:
+    """Entry point for the ``sdlc`` command."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="sdlc",
+        description=(
+            "Run an operator command through the sdlc daemon when it is running, "
+            "in-process otherwise."
+        ),
+    )
+    parser.add_argument(
+        "--socket", type=Path, default=None,
+        help="Daemon socket (default: $SDLC_DAEMON_SOCKET or logs/sdlc.sock).",
+    )
+    parser.add_argument(
+        "--no-daemon", action="store_true", help="Always run the command in-process."
+    )
+    parser.add_argument("command", choices=["daemon", *COMMANDS])
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the command.")
+    args = parser.parse_args()
+    socket_path = args.socket or default_socket_path()
+
+    if args.command == "daemon":
+        daemon_parser = argparse.ArgumentParser(prog="sdlc daemon")
+        daemon_parser.add_argument("--stop", action="store_true", help="Stop a running daemon.")
+        _serve_main(socket_path, daemon_parser.parse_args(args.args).stop)
+        return
+
+    if not args.no_daemon:
+        try:
+            code, out, err = request(socket_path, args.command, args.args)
+        except (FileNotFoundError, ConnectionRefusedError):
+            pass  # no daemon: fall through to in-process execution
+        else:
+            sys.stdout.write(out)
+            sys.stderr.write(err)
+            sys.exit(code)
+
+    sys.exit(_invoke(args.command, args.args))
+
+
+if __name__ == "__main__":
+    main()
@@ -19,13 +19,15 @@
 from __future__ import annotations
 
 import os
+import re
 import sqlite3
 import warnings
-from collections.abc import Generator
+from collections.abc import Generator, Mapping, Sequence
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 from sdlc_core.enums import (
     InterventionCategory,
@@ -33,6 +35,7 @@
     PhaseStatus,
     PipelineEventType,
     Severity,
+    SpanName,
     ValidationResult,
     ValidationType,
     ViolationType,
@@ -125,11 +128,60 @@ def setup_db(db_path: Path | str | None = None) -> Path:
 
     with sqlite3.connect(path) as conn:
         conn.executescript(schema_sql)
+        _ensure_columns(conn)
+        _ensure_checks(conn, schema_sql)
 
     print(f"[sdlc_core] Database ready at {path}")
     return path
 
 
+# Columns added after a table was first released.  ``CREATE TABLE IF NOT
+# EXISTS`` leaves existing tables untouched, so setup_db adds these in place.
+_ADDED_COLUMNS: tuple[tuple[str, str, str], ...] = (
+    ("interactions", "duration_ms", "REAL"),
+    ("interactions", "human_review_ms", "REAL"),
+    ("review_queue", "duration_ms", "REAL"),
+)
+
+
+def _ensure_columns(conn: sqlite3.Connection) -> None:
+    for table, column, decl in _ADDED_COLUMNS:
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+# CHECK constraints widened after a table was first released, as (table, a
+# value the current constraint allows).  SQLite cannot alter a constraint, so
+# setup_db rebuilds a table whose stored definition lacks that value.
+_WIDENED_CHECKS: tuple[tuple[str, str], ...] = (
+    ("pipeline_events", "'step_start'"),
+)
+
+
+def _ensure_checks(conn: sqlite3.Connection, schema_sql: str) -> None:
+    for table, value in _WIDENED_CHECKS:
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        if row is None or value in row[0]:
+            continue
+        create = re.search(
+            rf"CREATE TABLE IF NOT EXISTS {table} \(.*?\n\);", schema_sql, re.DOTALL
+        )
+        assert create is not None, f"{table} missing from schema.sql"
+        conn.executescript(
+            f"""
+            BEGIN IMMEDIATE;
+            ALTER TABLE {table} RENAME TO _old_{table};
+            {create.group(0)}
+            INSERT INTO {table} SELECT * FROM _old_{table};
+            DROP TABLE _old_{table};
+            COMMIT;
+            """
+        )
+
+
 # ---------------------------------------------------------------------------
 # runs
 # ---------------------------------------------------------------------------
@@ -495,6 +547,8 @@ def log_interaction(
     human_review_seconds: int | None = None,
     prompt_tokens: int | None = None,
     completion_tokens: int | None = None,
+    duration_ms: float | None = None,
+    human_review_ms: float | None = None,
     db_path: Path | None = None,
 ) -> int:
     """Insert one prompt-response exchange into ``interactions``.
@@ -527,6 +581,10 @@ def log_interaction(
                                    the provider does not report usage.
         completion_tokens:         Token count of the model response.  ``None``
                                    when the provider does not report usage.
+        duration_ms:               *duration_seconds* at millisecond
+                                   resolution.
+        human_review_ms:           *human_review_seconds* at millisecond
+                                   resolution.
         db_path:                   Optional path to the SQLite database file.
 
     Returns:
@@ -536,6 +594,109 @@ def log_interaction(
         ValueError: If *human_modified* is ``True`` and
                     *human_modification_notes* is ``None`` or empty.
 
+    """
+    params = _interaction_params(
+        run_id=run_id,
+        sdlc_phase=sdlc_phase,
+        approach=approach,
+        agent_role=agent_role,
+        model=model,
+        prompt=prompt,
+        response=response,
+        iteration=iteration,
+        outcome=outcome,
+        human_modified=human_modified,
+        artifact_id=artifact_id,
+        human_modification_notes=human_modification_notes,
+        duration_seconds=duration_seconds,
+        human_review_seconds=human_review_seconds,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        duration_ms=duration_ms,
+        human_review_ms=human_review_ms,
+    )
+
+    with _connect(db_path) as conn:
+        cur = conn.execute(_INSERT_INTERACTION_SQL, params)
+        # INSERT always produces a rowid
+        assert cur.lastrowid is not None
+        return cur.lastrowid
+
+
+def log_interactions(
+    *,
+    rows: Sequence[Mapping[str, Any]],
+    db_path: Path | None = None,
+) -> list[int]:
+    """Insert several prompt-response exchanges into ``interactions`` atomically.
+
+    Every row is validated before anything is written, then all rows are
+    inserted in a single transaction: either every row is stored or none is.
+
+    Args:
+        rows:    One mapping per interaction holding the keyword arguments
+                 accepted by :func:`log_interaction` (without ``db_path``).
+        db_path: Path to ``experiment.db``.  Defaults to
+                 :func:`_default_db_path`.
+
+    Returns:
+        The ``rowid`` of each inserted row, in the order of *rows*.
+
+    Raises:
+        ValueError: If any row fails the validation applied by
+                    :func:`log_interaction`.
+
+    """
+    all_params = [_interaction_params(**row) for row in rows]
+    if not all_params:
+        return []
+
+    ids: list[int] = []
+    with _connect(db_path) as conn:
+        for params in all_params:
+            cur = conn.execute(_INSERT_INTERACTION_SQL, params)
+            # INSERT always produces a rowid
+            assert cur.lastrowid is not None
+            ids.append(cur.lastrowid)
+    return ids
+
+
+_INSERT_INTERACTION_SQL = """
+    INSERT INTO interactions
+        (run_id, artifact_id, timestamp, sdlc_phase, approach, agent_role, model,
+         prompt, response, iteration, outcome, human_modified,
+         human_modification_notes, duration_seconds, human_review_seconds,
+         prompt_tokens, completion_tokens, duration_ms, human_review_ms)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _interaction_params(
+    *,
+    run_id: str,
+    sdlc_phase: int,
+    approach: int,
+    agent_role: str,
+    model: str,
+    prompt: str,
+    response: str,
+    iteration: int,
+    outcome: Outcome | str,
+    human_modified: bool,
+    artifact_id: str | None = None,
+    human_modification_notes: str | None = None,
+    duration_seconds: int | None = None,
+    human_review_seconds: int | None = None,
+    prompt_tokens: int | None = None,
+    completion_tokens: int | None = None,
+    duration_ms: float | None = None,
+    human_review_ms: float | None = None,
+    timestamp: str | None = None,
+) -> tuple[Any, ...]:
+    """Validate one interaction and return its ``_INSERT_INTERACTION_SQL`` parameters.
+
+    *timestamp* defaults to now; deferred reviews pass the time the response
+    was queued so the row reflects when the exchange took place.
     """
     outcome_str = _coerce_enum(
         outcome, {m.value for m in Outcome}, "outcome", fallback="accepted"
@@ -546,28 +707,280 @@ def log_interaction(
             "human_modification_notes is required when human_modified is True."
         )
 
+    return (
+        run_id, artifact_id, timestamp or _now(), sdlc_phase, approach, agent_role, model,
+        prompt, response, iteration, outcome_str, int(human_modified),
+        human_modification_notes, duration_seconds, human_review_seconds,
+        prompt_tokens, completion_tokens, duration_ms, human_review_ms,
+    )
+
+
+# ---------------------------------------------------------------------------
+# review_queue
+# ---------------------------------------------------------------------------
+
+_REVIEW_FIELDS = (
+    "run_id", "artifact_id", "sdlc_phase", "approach", "agent_role", "model",
+    "prompt", "response", "iteration", "duration_seconds", "prompt_tokens",
+    "completion_tokens", "duration_ms",
+)
+
+
+def enqueue_review(
+    *,
+    run_id: str,
+    sdlc_phase: int,
+    approach: int,
+    agent_role: str,
+    model: str,
+    prompt: str,
+    response: str,
+    iteration: int,
+    artifact_id: str | None = None,
+    duration_seconds: int | None = None,
+    prompt_tokens: int | None = None,
+    completion_tokens: int | None = None,
+    duration_ms: float | None = None,
+    db_path: Path | None = None,
+) -> int:
+    """Queue one model response for a deferred outcome decision.
+
+    The row holds everything :func:`log_interaction` needs except the
+    researcher's judgement.  :func:`complete_review` supplies that later and
+    writes the ``interactions`` row.
+
+    Args:
+        run_id:            Identifier of the parent run.
+        sdlc_phase:        SDLC phase number (2 to 8).
+        approach:          Approach number (1 or 2).
+        agent_role:        Role label for the AI agent.
+        model:             Model identifier string.
+        prompt:            Full prompt text submitted to the model.
+        response:          Full model response text.
+        iteration:         1-based iteration count for this artifact.
+        artifact_id:       Optional identifier of the artifact being produced.
+        duration_seconds:  AI response latency.
+        prompt_tokens:     Token count of the submitted prompt, if reported.
+        completion_tokens: Token count of the model response, if reported.
+        duration_ms:       *duration_seconds* at millisecond resolution.
+        db_path:           Optional path to the SQLite database file.
+
+    Returns:
+        The ``id`` of the new ``review_queue`` row.
+
+    """
+    return enqueue_reviews(
+        rows=[{
+            "run_id": run_id,
+            "artifact_id": artifact_id,
+            "sdlc_phase": sdlc_phase,
+            "approach": approach,
+            "agent_role": agent_role,
+            "model": model,
+            "prompt": prompt,
+            "response": response,
+            "iteration": iteration,
+            "duration_seconds": duration_seconds,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "duration_ms": duration_ms,
+        }],
+        db_path=db_path,
+    )[0]
+
+
+def enqueue_reviews(
+    *,
+    rows: Sequence[Mapping[str, Any]],
+    db_path: Path | None = None,
+) -> list[int]:
+    """Queue several model responses in a single transaction.
+
+    Args:
+        rows:    One mapping per response holding the keyword arguments
+                 accepted by :func:`enqueue_review` (without ``db_path``).
+                 Keys outside that set are ignored.
+        db_path: Optional path to the SQLite database file.
+
+    Returns:
+        The ``id`` of each new ``review_queue`` row, in the order of *rows*.
+
+    """
+    if not rows:
+        return []
+
+    queued_at = _now()
+    ids: list[int] = []
     with _connect(db_path) as conn:
-        cur = conn.execute(
-            """
-            INSERT INTO interactions
-                (run_id, artifact_id, timestamp, sdlc_phase, approach, agent_role, model,
-                 prompt, response, iteration, outcome, human_modified,
-                 human_modification_notes, duration_seconds, human_review_seconds,
-                 prompt_tokens, completion_tokens)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                run_id, artifact_id, _now(), sdlc_phase, approach, agent_role, model,
-                prompt, response, iteration, outcome_str, int(human_modified),
-                human_modification_notes, duration_seconds, human_review_seconds,
-                prompt_tokens, completion_tokens,
-            ),
+        for row in rows:
+            cur = conn.execute(
+                f"""
+                INSERT INTO review_queue (queued_at, {", ".join(_REVIEW_FIELDS)})
+                VALUES (?, {", ".join("?" for _ in _REVIEW_FIELDS)})
+                """,
+                (queued_at, *(row.get(name) for name in _REVIEW_FIELDS)),
+            )
+            # INSERT always produces a rowid
+            assert cur.lastrowid is not None
+            ids.append(cur.lastrowid)
+    return ids
+
+
+def pending_reviews(
+    *,
+    run_id: str | None = None,
+    limit: int | None = None,
+    db_path: Path | None = None,
+) -> list[dict[str, Any]]:
+    """Return queued responses that have no outcome yet, oldest first.
+
+    Args:
+        run_id:  Restrict to one run.  ``None`` returns every run's queue.
+        limit:   Maximum number of rows to return.  ``None`` returns all.
+        db_path: Optional path to the SQLite database file.
+
+    Returns:
+        One dict per pending ``review_queue`` row, keyed by column name.
+
+    """
+    sql = "SELECT * FROM review_queue WHERE reviewed_at IS NULL"
+    params: list[Any] = []
+    if run_id is not None:
+        sql += " AND run_id = ?"
+        params.append(run_id)
+    sql += " ORDER BY id"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    with _connect(db_path) as conn:
+        return [dict(row) for row in conn.execute(sql, params).fetchall()]
+
+
+def complete_review(
+    *,
+    review_id: int,
+    outcome: Outcome | str,
+    human_modified: bool,
+    human_modification_notes: str | None = None,
+    human_review_seconds: int | None = None,
+    human_review_ms: float | None = None,
+    db_path: Path | None = None,
+) -> int:
+    """Record the outcome for a queued response and write its interaction row.
+
+    The ``interactions`` insert and the queue update share one transaction,
+    so a response is never logged twice or left half-reviewed.  The
+    transaction is opened with ``BEGIN IMMEDIATE`` before ``reviewed_at`` is
+    read, so when two review sessions complete the same item the second one
+    waits and then sees it as already completed.  Spans recorded against the
+    queued response are linked to the new interaction in the same
+    transaction.
+
+    Args:
+        review_id:                ``id`` of the pending ``review_queue`` row.
+        outcome:                  Interaction outcome; an
+                                  :class:`~sdlc_core.enums.Outcome` member or
+                                  its string value.
+        human_modified:           Whether the response was edited before
+                                  acceptance.
+        human_modification_notes: Required when *human_modified* is ``True``.
+        human_review_seconds:     Time from response display to outcome entry.
+        human_review_ms:          *human_review_seconds* at millisecond
+                                  resolution.
+        db_path:                  Optional path to the SQLite database file.
+
+    Returns:
+        The ``rowid`` of the inserted ``interactions`` row.
+
+    Raises:
+        ValueError: If *review_id* does not exist or was already reviewed, or
+                    if *human_modified* is ``True`` without notes.
+
+    """
+    with _connect(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            "SELECT * FROM review_queue WHERE id = ?", (review_id,)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Review {review_id} does not exist.")
+        if row["reviewed_at"] is not None:
+            raise ValueError(f"Review {review_id} was already completed.")
+
+        params = _interaction_params(
+            **{name: row[name] for name in _REVIEW_FIELDS},
+            outcome=outcome,
+            human_modified=human_modified,
+            human_modification_notes=human_modification_notes,
+            human_review_seconds=human_review_seconds,
+            human_review_ms=human_review_ms,
+            timestamp=row["queued_at"],
         )
+        cur = conn.execute(_INSERT_INTERACTION_SQL, params)
         # INSERT always produces a rowid
         assert cur.lastrowid is not None
+        conn.execute(
+            "UPDATE review_queue SET reviewed_at = ?, interaction_id = ? WHERE id = ?",
+            (_now(), cur.lastrowid, review_id),
+        )
+        conn.execute(
+            "UPDATE spans SET interaction_id = ? WHERE review_id = ?",
+            (cur.lastrowid, review_id),
+        )
         return cur.lastrowid
 
 
+# ---------------------------------------------------------------------------
+# spans
+# ---------------------------------------------------------------------------
+
+def log_spans(
+    *,
+    rows: Sequence[Mapping[str, Any]],
+    db_path: Path | None = None,
+) -> None:
+    """Insert latency spans into ``spans`` in a single transaction.
+
+    Args:
+        rows:    One mapping per span with ``run_id``, ``name`` (a
+                 :class:`~sdlc_core.enums.SpanName` member or its value),
+                 ``offset_ms``, ``duration_ms``, and at least one of
+                 ``interaction_id`` / ``review_id``.
+                 :meth:`sdlc_core.spans.SpanRecorder.rows` builds these.
+        db_path: Optional path to the SQLite database file.
+
+    Raises:
+        ValueError: If a row has an unknown span name or neither
+                    ``interaction_id`` nor ``review_id``.
+
+    """
+    if not rows:
+        return
+
+    recorded_at = _now()
+    params: list[tuple[Any, ...]] = []
+    for row in rows:
+        name = SpanName(row["name"]).value
+        if row.get("interaction_id") is None and row.get("review_id") is None:
+            raise ValueError("Each span needs an interaction_id or a review_id.")
+        params.append((
+            row["run_id"], row.get("interaction_id"), row.get("review_id"), name,
+            float(row["offset_ms"]), float(row["duration_ms"]), recorded_at,
+        ))
+
+    with _connect(db_path) as conn:
+        conn.executemany(
+            """
+            INSERT INTO spans
+                (run_id, interaction_id, review_id, name, offset_ms, duration_ms,
+                 recorded_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            params,
+        )
+
+
 # ---------------------------------------------------------------------------
 # interventions
 # ---------------------------------------------------------------------------
@@ -810,6 +1223,158 @@ def log_pipeline_event(
         return cur.lastrowid
 
 
+def allocate_pipeline_id(*, run_id: str, db_path: Path | None = None) -> str:
+    """Reserve the next ``PIPE-[RUN_ID]-[NN]`` pipeline id of a run.
+
+    The index lives in ``pipeline_counters`` and is incremented inside an
+    immediate transaction, so parallel pipeline processes never receive the
+    same id and the cost does not grow with the number of pipeline events.
+    The first allocation for a run starts after the highest index already
+    present in ``pipeline_events``, which keeps databases written before the
+    counter existed consistent.
+
+    Args:
+        run_id:  Identifier of the parent run.
+        db_path: Path to ``experiment.db``.  Defaults to
+                 :func:`_default_db_path`.
+
+    Returns:
+        The allocated pipeline id, e.g. ``"PIPE-run-001-03"``.
+
+    """
+    prefix = f"PIPE-{run_id}-"
+    with _connect(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            "UPDATE pipeline_counters SET last_index = last_index + 1 "
+            "WHERE run_id = ? RETURNING last_index",
+            (run_id,),
+        ).fetchone()
+        if row is None:
+            row = conn.execute(
+                """
+                INSERT INTO pipeline_counters (run_id, last_index)
+                SELECT ?, 1 + COALESCE(MAX(CAST(substr(pipeline_id, ?) AS INTEGER)), 0)
+                FROM pipeline_events
+                WHERE run_id = ? AND substr(pipeline_id, 1, ?) = ?
+                RETURNING last_index
+                """,
+                (run_id, len(prefix) + 1, run_id, len(prefix), prefix),
+            ).fetchone()
+    return f"{prefix}{int(row[0]):02d}"
+
+
+# ---------------------------------------------------------------------------
+# pipeline_checkpoints (Approach 2 only)
+# ---------------------------------------------------------------------------
+
+def step_key(*, pipeline_id: str, phase: int, artifact_id: str | None, prompt: str) -> str:
+    """Return the checkpoint key of one pipeline step.
+
+    The key is the SHA-256 of the pipeline id, phase, artifact id and the
+    SHA-256 of the prompt, so editing a prompt makes its step run again.
+
+    Args:
+        pipeline_id: Pipeline the step belongs to.
+        phase:       SDLC phase number (2 to 8).
+        artifact_id: Artifact produced by the step, or ``None``.
+        prompt:      Full prompt text sent to the model.
+
+    Returns:
+        A 64-character hex digest.
+
+    """
+    parts = (pipeline_id, str(phase), artifact_id or "", _sha256(prompt))
+    return _sha256("\x1f".join(parts))
+
+
+def _sha256(text: str) -> str:
+    """Return the hex SHA-256 digest of *text*.
+
+    ``hashlib`` is imported here rather than at module level because it loads
+    OpenSSL, which only pipeline runs need, not every ``db`` import.
+    """
+    import hashlib
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_checkpoint(
+    *,
+    pipeline_id: str,
+    phase: int,
+    artifact_id: str | None,
+    prompt: str,
+    db_path: Path | None = None,
+) -> dict[str, Any] | None:
+    """Return the checkpoint of a completed pipeline step, if there is one.
+
+    Args:
+        pipeline_id: Pipeline the step belongs to.
+        phase:       SDLC phase number (2 to 8).
+        artifact_id: Artifact produced by the step, or ``None``.
+        prompt:      Full prompt text sent to the model.
+        db_path:     Path to ``experiment.db``.  Defaults to
+                     :func:`_default_db_path`.
+
+    Returns:
+        The ``pipeline_checkpoints`` row as a dict, or ``None`` when the step
+        has not completed yet.
+
+    """
+    key = step_key(pipeline_id=pipeline_id, phase=phase, artifact_id=artifact_id, prompt=prompt)
+    with _connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT * FROM pipeline_checkpoints WHERE step_key = ?", (key,)
+        ).fetchone()
+    return None if row is None else dict(row)
+
+
+def record_checkpoint(
+    *,
+    run_id: str,
+    pipeline_id: str,
+    phase: int,
+    artifact_id: str | None,
+    prompt: str,
+    interaction_id: int | None = None,
+    db_path: Path | None = None,
+) -> str:
+    """Mark a pipeline step as completed in ``pipeline_checkpoints``.
+
+    Recording the same step twice keeps the first row, so a step that is
+    retried after its checkpoint was written stays idempotent.
+
+    Args:
+        run_id:         Identifier of the parent run.
+        pipeline_id:    Pipeline the step belongs to.
+        phase:          SDLC phase number (2 to 8).
+        artifact_id:    Artifact produced by the step, or ``None``.
+        prompt:         Full prompt text sent to the model.
+        interaction_id: ``interactions`` row holding the step's output.
+        db_path:        Path to ``experiment.db``.  Defaults to
+                        :func:`_default_db_path`.
+
+    Returns:
+        The step key (see :func:`step_key`).
+
+    """
+    key = step_key(pipeline_id=pipeline_id, phase=phase, artifact_id=artifact_id, prompt=prompt)
+    with _connect(db_path) as conn:
+        conn.execute(
+            """
+            INSERT INTO pipeline_checkpoints
+                (step_key, run_id, pipeline_id, phase, artifact_id, prompt_sha256,
+                 interaction_id, completed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (step_key) DO NOTHING
+            """,
+            (key, run_id, pipeline_id, phase, artifact_id,
+             _sha256(prompt), interaction_id, _now()),
+        )
+    return key
+
+
 # ---------------------------------------------------------------------------
 # violations
 # ---------------------------------------------------------------------------
@@ -1,4 +1,12 @@
-"""diff_summary.py: Summarize file changes and artifact ownership since a commit."""
+"""diff_summary.py: Summarize file changes and artifact ownership since a commit.
+
+The history since ``--since`` is read with a single streaming
+``git log --numstat`` pass that yields each commit's author and files
+together.  Changed files, commit counts per author and line churn per
+artifact are accumulated as the commits arrive, and the artifact
+classification uses one database connection.  A file counts as changed
+when any commit in the range touched it.
+"""
 
 from __future__ import annotations
 
@@ -8,131 +16,183 @@
 import sqlite3
 import subprocess
 from collections import Counter
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 _ARTIFACT_PATH_RE = re.compile(r"^artifacts/phase\d+/([^/]+)")
 
 
-def _run_git(repo: Path, args: list[str]) -> str:
-    result = subprocess.run(
-        ["git", *args],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return result.stdout.strip()
+def _artifact_id(path: str) -> str | None:
+    match = _ARTIFACT_PATH_RE.match(path)
+    if not match:
+        return None
+    return match.group(1).split(".")[0]
 
 
-def _latest_run_id(db_path: Path) -> str | None:
-    conn = sqlite3.connect(db_path)
-    try:
-        row = conn.execute(
-            "SELECT id FROM runs ORDER BY started_at DESC LIMIT 1"
-        ).fetchone()
-        if row is None:
-            return None
-        return str(row[0])
-    finally:
-        conn.close()
+def _artifact_ids_from_paths(paths: list[str]) -> set[str]:
+    return {artifact_id for artifact_id in map(_artifact_id, paths) if artifact_id is not None}
 
 
-def _changed_files(repo: Path, since: str) -> list[str]:
-    output = _run_git(repo, ["diff", "--name-only", f"{since}..HEAD"])
-    if not output:
-        return []
-    return [line.strip() for line in output.splitlines() if line.strip()]
+# Marks the first line of each commit in the ``git log`` stream.
+_COMMIT_MARKER = "\x1e"
 
 
-def _author_counts(repo: Path, since: str) -> dict[str, int]:
-    output = _run_git(repo, ["log", "--pretty=%an", f"{since}..HEAD"])
-    if not output:
-        return {}
-    counter = Counter(line.strip() for line in output.splitlines() if line.strip())
-    return dict(counter)
+def _stream_git(repo: Path, args: list[str]) -> Iterator[str]:
+    """Yield the stdout lines of a git command as they are produced."""
+    cmd = ["git", *args]
+    with subprocess.Popen(
+        cmd,
+        cwd=repo,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    ) as proc:
+        assert proc.stdout is not None and proc.stderr is not None
+        for line in proc.stdout:
+            yield line.rstrip("\n")
+        stderr = proc.stderr.read()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
+
+
+def _iter_commits(repo: Path, since: str) -> Iterator[tuple[str, list[tuple[str, int, int]]]]:
+    """Yield ``(author, [(path, lines_added, lines_deleted), ...])`` per commit since *since*.
+
+    One ``git log --numstat`` process streams every commit, so memory stays
+    bounded by the largest commit.  Renames are reported as a deletion plus
+    an addition; binary files count zero lines.
+    """
+    lines = _stream_git(
+        repo,
+        [
+            "-c", "core.quotePath=false",
+            "log", "--no-renames", "--numstat",
+            f"--format={_COMMIT_MARKER}%an",
+            f"{since}..HEAD",
+        ],
+    )
+    author: str | None = None
+    files: list[tuple[str, int, int]] = []
+    for line in lines:
+        if line.startswith(_COMMIT_MARKER):
+            if author is not None:
+                yield author, files
+            author, files = line[len(_COMMIT_MARKER):].strip(), []
+            continue
+        parts = line.split("\t", 2)
+        if len(parts) != 3:
+            continue
+        added, deleted, path = parts
+        files.append((path, int(added) if added.isdigit() else 0,
+                      int(deleted) if deleted.isdigit() else 0))
+    if author is not None:
+        yield author, files
+
+
+def _scan_history(repo: Path, since: str) -> dict[str, Any]:
+    """Aggregate changed files, commit authors and artifact churn in one pass."""
+    changed: set[str] = set()
+    authors: Counter[str] = Counter()
+    churn: dict[str, dict[str, int]] = {}
+    for author, files in _iter_commits(repo, since):
+        if author:
+            authors[author] += 1
+        touched: set[str] = set()
+        for path, added, deleted in files:
+            changed.add(path)
+            artifact_id = _artifact_id(path)
+            if artifact_id is None:
+                continue
+            stats = churn.setdefault(
+                artifact_id, {"commits": 0, "lines_added": 0, "lines_deleted": 0}
+            )
+            stats["lines_added"] += added
+            stats["lines_deleted"] += deleted
+            touched.add(artifact_id)
+        for artifact_id in touched:
+            churn[artifact_id]["commits"] += 1
+    return {
+        "files": sorted(changed),
+        "authors": dict(authors),
+        "churn": {artifact_id: churn[artifact_id] for artifact_id in sorted(churn)},
+    }
 
 
-def _artifact_ids_from_paths(paths: list[str]) -> set[str]:
-    artifact_ids: set[str] = set()
-    for path in paths:
-        match = _ARTIFACT_PATH_RE.match(path)
-        if not match:
-            continue
-        base = match.group(1)
-        artifact_ids.add(base.split(".")[0])
-    return artifact_ids
+def _latest_run_id(conn: sqlite3.Connection) -> str | None:
+    row = conn.execute(
+        "SELECT id FROM runs ORDER BY started_at DESC LIMIT 1"
+    ).fetchone()
+    if row is None:
+        return None
+    return str(row[0])
 
 
 def _artifact_classification(
-    db_path: Path,
+    conn: sqlite3.Connection,
     run_id: str,
     artifact_ids: set[str],
 ) -> dict[str, str]:
     if not artifact_ids:
         return {}
 
-    conn = sqlite3.connect(db_path)
-    try:
-        placeholders = ",".join("?" for _ in artifact_ids)
-        params = [run_id, *sorted(artifact_ids)]
-
-        ai_rows = conn.execute(
-            f"""
-            SELECT artifact_id, MAX(CASE WHEN human_modified = 1 THEN 1 ELSE 0 END)
-            FROM interactions
-            WHERE run_id = ?
-              AND artifact_id IN ({placeholders})
-            GROUP BY artifact_id
-            """,
-            params,
-        ).fetchall()
-
-        manual_rows = conn.execute(
-            f"""
-            SELECT artifact_id, COUNT(*)
-            FROM interventions
-            WHERE run_id = ?
-              AND category = 'manual_edit'
-              AND artifact_id IN ({placeholders})
-            GROUP BY artifact_id
-            """,
-            params,
-        ).fetchall()
-
-        has_interaction = {str(row[0]): int(row[1]) for row in ai_rows}
-        has_manual_edit = {str(row[0]): int(row[1]) for row in manual_rows}
-
-        result: dict[str, str] = {}
-        for artifact_id in sorted(artifact_ids):
-            human_modified = has_interaction.get(artifact_id, 0) == 1
-            manual_edit_count = has_manual_edit.get(artifact_id, 0)
-            if human_modified or manual_edit_count > 0:
-                result[artifact_id] = "human-modified"
-            elif artifact_id in has_interaction:
-                result[artifact_id] = "ai-originated"
-            else:
-                result[artifact_id] = "unknown"
-        return result
-    finally:
-        conn.close()
+    placeholders = ",".join("?" for _ in artifact_ids)
+    params = [run_id, *sorted(artifact_ids)]
+
+    ai_rows = conn.execute(
+        f"""
+        SELECT artifact_id, MAX(CASE WHEN human_modified = 1 THEN 1 ELSE 0 END)
+        FROM interactions
+        WHERE run_id = ?
+          AND artifact_id IN ({placeholders})
+        GROUP BY artifact_id
+        """,
+        params,
+    ).fetchall()
+
+    manual_rows = conn.execute(
+        f"""
+        SELECT artifact_id, COUNT(*)
+        FROM interventions
+        WHERE run_id = ?
+          AND category = 'manual_edit'
+          AND artifact_id IN ({placeholders})
+        GROUP BY artifact_id
+        """,
+        params,
+    ).fetchall()
+
+    has_interaction = {str(row[0]): int(row[1]) for row in ai_rows}
+    has_manual_edit = {str(row[0]): int(row[1]) for row in manual_rows}
+
+    result: dict[str, str] = {}
+    for artifact_id in sorted(artifact_ids):
+        human_modified = has_interaction.get(artifact_id, 0) == 1
+        manual_edit_count = has_manual_edit.get(artifact_id, 0)
+        if human_modified or manual_edit_count > 0:
+            result[artifact_id] = "human-modified"
+        elif artifact_id in has_interaction:
+            result[artifact_id] = "ai-originated"
+        else:
+            result[artifact_id] = "unknown"
+    return result
 
 
 def _summary(repo: Path, db_path: Path, since: str) -> dict[str, Any]:
-    files = _changed_files(repo, since)
-    run_id = _latest_run_id(db_path)
+    history = _scan_history(repo, since)
+    files: list[str] = history["files"]
     artifact_ids = _artifact_ids_from_paths(files)
 
-    classifications: dict[str, str] = {}
-    if run_id is not None:
-        classifications = _artifact_classification(db_path, run_id, artifact_ids)
-
-    classified_files = [
-        path
-        for path in files
-        if _ARTIFACT_PATH_RE.match(path)
-    ]
-    unlinked_files = [path for path in files if path not in classified_files]
+    conn = sqlite3.connect(db_path)
+    try:
+        run_id = _latest_run_id(conn)
+        classifications: dict[str, str] = {}
+        if run_id is not None:
+            classifications = _artifact_classification(conn, run_id, artifact_ids)
+    finally:
+        conn.close()
 
     return {
         "since": since,
@@ -142,8 +202,9 @@ def _summary(repo: Path, db_path: Path, since: str) -> dict[str, Any]:
         "changed_files": files,
         "changed_file_count": len(files),
         "artifact_classification": classifications,
-        "authors": _author_counts(repo, since),
-        "unlinked_files": unlinked_files,
+        "artifact_churn": history["churn"],
+        "authors": history["authors"],
+        "unlinked_files": [path for path in files if _artifact_id(path) is None],
     }
 
 
@@ -153,8 +214,17 @@ def _print_human(summary: dict[str, Any]) -> None:
     print(f"latest_run_id: {summary['latest_run_id']}")
     print(f"authors: {summary['authors']}")
     print("artifact_classification:")
+    churn = summary["artifact_churn"]
     for artifact_id, status in summary["artifact_classification"].items():
-        print(f"  {artifact_id}: {status}")
+        stats = churn.get(artifact_id)
+        if stats is None:
+            print(f"  {artifact_id}: {status}")
+            continue
+        print(
+            f"  {artifact_id}: {status} "
+            f"(+{stats['lines_added']}/-{stats['lines_deleted']} "
+            f"in {stats['commits']} commit(s))"
+        )
     if summary["unlinked_files"]:
         print("unlinked_files:")
         for path in summary["unlinked_files"]:
@@ -79,6 +79,7 @@ class PipelineEventType(str, Enum):
     REENTRY_APPROVAL = "reentry_approval"
     HALT = "halt"
     RESUME = "resume"
+    STEP_START = "step_start"
 
 
 class ArtifactStatus(str, Enum):
@@ -106,6 +107,24 @@ class AutomationLevel(str, Enum):
     MANUAL = "Manual"
 
 
+class ReviewMode(str, Enum):
+    """When LoggedProvider collects the researcher's outcome decision."""
+
+    INTERACTIVE = "interactive"
+    DEFERRED = "deferred"
+    AUTO_ACCEPT = "auto_accept"  # no researcher: load tests and replays only
+
+
+class SpanName(str, Enum):
+    """Timed phases of one interaction recorded in the spans table."""
+
+    PROMPT_VALIDATION = "prompt_validation"
+    PROVIDER_CALL = "provider_call"
+    FIRST_TOKEN = "first_token"
+    DB_WRITE = "db_write"
+    HUMAN_REVIEW = "human_review"
+
+
 # ---------------------------------------------------------------------------
 # Lookup table
 # ---------------------------------------------------------------------------
@@ -122,6 +141,8 @@ class AutomationLevel(str, Enum):
     ArtifactStatus,
     PhaseStatus,
     AutomationLevel,
+    ReviewMode,
+    SpanName,
 ]
 
 # Mapping from enum class name to its set of valid string values
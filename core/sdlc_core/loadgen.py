@@ -0,0 +1,360 @@
+"""loadgen.py: Drive concurrent simulated pipelines through the full logging path.
+
+Each worker plays one researcher or pipeline with its own approach-2 run.
+It loops over the same steps a real pipeline takes:
+
+    validate_prompt -> LoggedProvider.complete -> db.log_interaction
+                    -> db.log_spans -> db.log_pipeline_event
+
+The provider comes from ``get_provider`` (``--model``), or is a built-in
+:class:`~sdlc_core.providers.fake.FakeProvider` with ``--latency-ms``.  Every
+response is accepted automatically (``ReviewMode.AUTO_ACCEPT``), so the load
+is bounded by the provider and by SQLite, not by a human.
+
+All workers start together and run for ``--duration`` seconds, or until each
+has done ``--interactions`` steps.  The report gives:
+
+* sustained interactions per second over the measured window;
+* end-to-end step latency, interaction write latency (the ``db_write``
+  spans recorded by ``LoggedProvider``) and pipeline event write latency,
+  as percentiles in milliseconds;
+* lock contention.  ``lock_errors`` counts writes that failed with
+  "database is locked" after SQLite's busy timeout.  ``lock_waits`` counts
+  writes slower than ``--lock-wait-ms``.  An uncontended insert takes far
+  less than that, so these writes spent most of their time waiting for the
+  write lock.
+
+Runs are named ``run-loadgen-<timestamp>-wNNN``; point ``--db`` at a scratch
+database, not at a live experiment.
+
+Usage:
+    python -m sdlc_core.loadgen --db logs/loadgen.db --workers 8 --duration 30
+    python -m sdlc_core.loadgen --db logs/loadgen.db --workers 16 --model llama3 --out load.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sdlc_core import db
+from sdlc_core.enums import PipelineEventType, ReviewMode, SpanName
+from sdlc_core.providers.base import ModelProvider
+from sdlc_core.providers.fake import FakeProvider
+from sdlc_core.providers.logged import LoggedProvider
+from sdlc_core.quantiles import LatencySummary
+from sdlc_core.session import Session
+
+# Histogram upper bounds for write and step latencies, in milliseconds.
+_BUCKETS_MS: tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+_PROMPT = """## PERSONA
+You are a requirements analyst.
+
+## TASK
+Draft requirement {n} for pipeline {worker}.
+
+## INPUT ARTIFACTS
+SEED-01
+
+## OUTPUT TEMPLATE
+REQ-NN with title, description and acceptance criteria.
+
+## ACCEPTANCE CRITERIA
+The requirement is testable and traces to SEED-01.
+
+## CHAIN-OF-THOUGHT
+List the stakeholder needs before writing the requirement.
+"""
+
+
+# ---------------------------------------------------------------------------
+# Workers
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _WorkerResult:
+    run_id: str = ""
+    interactions: int = 0
+    errors: int = 0
+    lock_errors: int = 0
+    step_ms: list[float] = field(default_factory=list)
+    event_write_ms: list[float] = field(default_factory=list)
+    first_error: str | None = None
+
+
+def _is_lock_error(exc: BaseException) -> bool:
+    return isinstance(exc, sqlite3.OperationalError) and "locked" in str(exc)
+
+
+def _worker(
+    index: int,
+    *,
+    run_id: str,
+    db_path: Path,
+    make_provider: Callable[[], ModelProvider],
+    phase: int,
+    validate_prompts: bool,
+    max_interactions: int | None,
+    start: threading.Barrier,
+    stop_at: list[float],
+    result: _WorkerResult,
+) -> None:
+    session = Session(run_id=run_id, approach=2, active_phase=phase, db_path=db_path)
+    try:
+        provider = LoggedProvider(
+            make_provider(), session=session,
+            review_mode=ReviewMode.AUTO_ACCEPT, validate_prompts=validate_prompts,
+        )
+    except Exception as exc:  # reported; the other workers still run
+        result.errors += 1
+        result.first_error = f"{type(exc).__name__}: {exc}"
+        start.wait()
+        return
+    pipeline_id = f"loadgen-w{index:03d}"
+    start.wait()
+
+    n = 0
+    while time.perf_counter() < stop_at[0] and (max_interactions is None or n < max_interactions):
+        n += 1
+        t0 = time.perf_counter()
+        try:
+            provider.complete(_PROMPT.format(n=n, worker=index), agent_role="requirements_analyst")
+            t1 = time.perf_counter()
+            db.log_pipeline_event(
+                run_id=run_id, pipeline_id=pipeline_id, step="draft_requirement",
+                agent_role="requirements_analyst", event_type=PipelineEventType.GATE_PASS,
+                detail=f"step {n}", db_path=db_path,
+            )
+        except Exception as exc:  # counted and reported, never fatal
+            if _is_lock_error(exc):
+                result.lock_errors += 1
+            else:
+                result.errors += 1
+            result.first_error = result.first_error or f"{type(exc).__name__}: {exc}"
+            continue
+        t2 = time.perf_counter()
+        result.interactions += 1
+        result.step_ms.append((t2 - t0) * 1000.0)
+        result.event_write_ms.append((t2 - t1) * 1000.0)
+
+
+def _summary(values: list[float]) -> dict[str, Any]:
+    summary = LatencySummary(_BUCKETS_MS)
+    for value in values:
+        summary.add(value)
+    return summary.as_dict(digits=3)
+
+
+def run_load(
+    db_path: Path,
+    *,
+    workers: int = 4,
+    duration: float = 10.0,
+    interactions: int | None = None,
+    make_provider: Callable[[], ModelProvider] | None = None,
+    phase: int = 3,
+    validate_prompts: bool = True,
+    lock_wait_ms: float = 50.0,
+) -> dict[str, Any]:
+    """Run *workers* concurrent pipelines against *db_path* and report throughput.
+
+    Args:
+        db_path:          Database to write; created with
+                          :func:`~sdlc_core.db.setup_db` if needed.
+        workers:          Number of concurrent simulated pipelines.
+        duration:         Seconds to run.
+        interactions:     Optional cap on steps per worker; the run ends
+                          early once every worker reaches it.
+        make_provider:    Called once per worker to build its provider.
+                          Defaults to an instant :class:`FakeProvider`.
+        phase:            SDLC phase of the generated interactions.
+        validate_prompts: Run ``validate_prompt`` before each call.
+        lock_wait_ms:     Writes slower than this count as lock waits.
+
+    Returns:
+        JSON-serialisable report (see module docstring).
+
+    Raises:
+        ValueError: If *workers*, *duration* or *interactions* is not positive.
+
+    """
+    if workers < 1 or duration <= 0 or (interactions is not None and interactions < 1):
+        raise ValueError("workers, duration and interactions must be positive.")
+    factory = make_provider or FakeProvider
+    db.setup_db(db_path)
+
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+    results = [_WorkerResult(run_id=f"run-loadgen-{stamp}-w{i:03d}") for i in range(workers)]
+    for result in results:
+        db.open_run(project="loadgen", approach=2, run_id=result.run_id, db_path=db_path)
+
+    start = threading.Barrier(workers + 1)
+    stop_at = [float("inf")]
+    threads = [
+        threading.Thread(
+            target=_worker,
+            args=(i,),
+            kwargs={
+                "run_id": result.run_id, "db_path": db_path, "make_provider": factory,
+                "phase": phase, "validate_prompts": validate_prompts,
+                "max_interactions": interactions, "start": start, "stop_at": stop_at,
+                "result": result,
+            },
+            daemon=True,
+        )
+        for i, result in enumerate(results)
+    ]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    t0 = time.perf_counter()
+    stop_at[0] = t0 + duration
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - t0
+
+    run_ids = [r.run_id for r in results]
+    conn = sqlite3.connect(db_path)
+    try:
+        interaction_write_ms = [
+            float(row[0])
+            for row in conn.execute(
+                f"SELECT duration_ms FROM spans WHERE name = ? "
+                f"AND run_id IN ({', '.join('?' * len(run_ids))})",
+                (SpanName.DB_WRITE.value, *run_ids),
+            )
+        ]
+    finally:
+        conn.close()
+
+    event_write_ms = [v for r in results for v in r.event_write_ms]
+    total = sum(r.interactions for r in results)
+    errors = [r.first_error for r in results if r.first_error]
+    return {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "database": db_path.as_posix(),
+        "workers": workers,
+        "elapsed_seconds": round(elapsed, 3),
+        "interactions": total,
+        "interactions_per_second": round(total / elapsed, 2) if elapsed else 0.0,
+        "errors": sum(r.errors for r in results),
+        "lock_errors": sum(r.lock_errors for r in results),
+        "lock_waits": sum(
+            1 for v in (*interaction_write_ms, *event_write_ms) if v > lock_wait_ms
+        ),
+        "lock_wait_threshold_ms": lock_wait_ms,
+        "latency_ms": {
+            "step": _summary([v for r in results for v in r.step_ms]),
+            "interaction_write": _summary(interaction_write_ms),
+            "pipeline_event_write": _summary(event_write_ms),
+        },
+        "first_errors": errors[:5],
+        "run_ids": run_ids,
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(
+        f"[sdlc_core.loadgen] {report['workers']} workers, {report['interactions']} interactions "
+        f"in {report['elapsed_seconds']:.2f}s = {report['interactions_per_second']:.1f}/s"
+    )
+    print(
+        f"[sdlc_core.loadgen] errors={report['errors']} lock_errors={report['lock_errors']} "
+        f"lock_waits={report['lock_waits']} (> {report['lock_wait_threshold_ms']:g} ms)"
+    )
+    print(f"\n  {'latency (ms)':<22} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+    for name, summary in report["latency_ms"].items():
+        if not summary["count"]:
+            continue
+        print(
+            f"  {name:<22} {summary['p50']:9.2f} {summary['p90']:9.2f} "
+            f"{summary['p99']:9.2f} {summary['max']:9.2f}"
+        )
+    for error in report["first_errors"]:
+        print(f"[sdlc_core.loadgen] WARNING: {error}", file=sys.stderr)
+
+
+def main() -> None:
+    """Parse command-line arguments, run the load and report the result."""
+    parser = argparse.ArgumentParser(
+        description="Load-test the interaction logging path with concurrent pipelines."
+    )
+    parser.add_argument(
+        "--db", default="logs/loadgen.db", help="Target DB (default: logs/loadgen.db)."
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent pipelines.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run.")
+    parser.add_argument(
+        "--interactions", type=int, default=None, help="Stop each worker after N steps."
+    )
+    parser.add_argument(
+        "--model", default=None,
+        help="models.toml entry to use (default: built-in fake provider).",
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Fake provider latency (default: 0)."
+    )
+    parser.add_argument("--phase", type=int, default=3, help="SDLC phase (default: 3).")
+    parser.add_argument(
+        "--no-validate", action="store_true", help="Skip validate_prompt before each call."
+    )
+    parser.add_argument(
+        "--lock-wait-ms", type=float, default=50.0,
+        help="Writes slower than this count as lock waits (default: 50).",
+    )
+    parser.add_argument("--out", default=None, help="Write the report to this JSON file.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON output.")
+    args = parser.parse_args()
+
+    make_provider: Callable[[], ModelProvider]
+    if args.model:
+        from sdlc_core.providers.registry import get_provider
+
+        def make_provider() -> ModelProvider:
+            return get_provider(args.model)
+
+        try:
+            make_provider()
+        except (FileNotFoundError, KeyError, ValueError) as exc:
+            print(f"[sdlc_core.loadgen] ERROR: {exc}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        def make_provider() -> ModelProvider:
+            return FakeProvider(latency_ms=args.latency_ms)
+
+    try:
+        report = run_load(
+            Path(args.db), workers=args.workers, duration=args.duration,
+            interactions=args.interactions, make_provider=make_provider, phase=args.phase,
+            validate_prompts=not args.no_validate, lock_wait_ms=args.lock_wait_ms,
+        )
+    except ValueError as exc:
+        print(f"[sdlc_core.loadgen] ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+
+
+if __name__ == "__main__":
+    main()
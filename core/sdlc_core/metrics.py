@@ -3,6 +3,7 @@
 Usage:
     python -m sdlc_core.metrics --db logs/experiment.db
     python -m sdlc_core.metrics --db logs/experiment.db --out logs/metrics_report.json
+    python -m sdlc_core.metrics --db logs/experiment.db --models-toml models.toml
 
 All metrics are derived at query time from the raw tables.
 No pre-computed values are stored in the database.
@@ -11,6 +12,12 @@
 If a metric requires data from a phase that was not reached, the value is ``null``
 (JSON) rather than a number; callers should treat ``null`` as N/A and exclude
 it from cross-approach averages.
+
+The ``token_usage`` and ``latency_distributions`` categories are operational
+rather than metrics.md metrics: they report throughput, latency, and token
+spend for hardware sizing and model comparison.  Costs are filled in only when
+a price table is supplied (see :func:`load_prices`).  Percentiles come from
+:mod:`sdlc_core.quantiles`.
 """
 
 from __future__ import annotations
@@ -19,10 +26,18 @@
 import json
 import sqlite3
 import sys
+import tomllib
+from collections import defaultdict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from sdlc_core.quantiles import LatencySummary, QuantileSketch
+from sdlc_core.tracegraph import load_graphs
+
 # ---------------------------------------------------------------------------
 # Connection
 # ---------------------------------------------------------------------------
@@ -141,10 +156,22 @@ def _traceability(conn: sqlite3.Connection) -> dict[str, Any]:
     ) or 0
     req_to_test_rate = round(req_to_test / total_req * 100, 2) if total_req else None
 
+    # Reachability over the link graph: artifacts that trace to a
+    # requirement through any chain of links, and cycles in the graph.
+    covered = eligible = cycles = 0
+    for graph in load_graphs(conn).values():
+        run_covered, run_eligible = graph.requirement_coverage()
+        covered += run_covered
+        eligible += run_eligible
+        cycles += len(graph.cycles())
+    transitive_rate = round(covered / eligible * 100, 2) if eligible else None
+
     return {
         "traceability_coverage_rate_pct": coverage,
         "requirement_to_design_linkage_rate_pct": req_to_design_rate,
         "requirement_to_test_linkage_rate_pct": req_to_test_rate,
+        "transitive_requirement_coverage_rate_pct": transitive_rate,
+        "traceability_cycle_count": cycles,
     }
 
 
@@ -482,11 +509,277 @@ def _deployment(conn: sqlite3.Connection) -> dict[str, Any]:
     }
 
 
+# ---------------------------------------------------------------------------
+# Token usage and cost (operational; not defined in metrics.md)
+# ---------------------------------------------------------------------------
+
+_PERCENTILES = (50, 90, 99)
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """Price of one model in USD per million tokens."""
+
+    prompt_per_mtok: float
+    completion_per_mtok: float
+
+    def cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        """Return the USD cost of the given token counts."""
+        return (
+            prompt_tokens * self.prompt_per_mtok + completion_tokens * self.completion_per_mtok
+        ) / 1_000_000
+
+
+def load_prices(models_toml: Path) -> dict[str, ModelPrice]:
+    """Read per-model prices from a ``models.toml`` file.
+
+    Entries opt in with ``prompt_price_per_mtok`` and
+    ``completion_price_per_mtok`` (USD per million tokens).  Prices are keyed
+    by ``model_id``, which is what ``interactions.model`` records, and by the
+    entry name as a fallback.  Entries without either key are skipped.
+
+    Args:
+        models_toml: Path to the ``models.toml`` file.
+
+    Returns:
+        Mapping of model identifier to :class:`ModelPrice`.
+
+    Raises:
+        FileNotFoundError: If *models_toml* does not exist.
+        ValueError: If a price is not a non-negative number.
+
+    """
+    with models_toml.open("rb") as fh:
+        data = tomllib.load(fh)
+
+    prices: dict[str, ModelPrice] = {}
+    for name, entry in data.get("models", {}).items():
+        if not isinstance(entry, dict):
+            continue
+        if "prompt_price_per_mtok" not in entry and "completion_price_per_mtok" not in entry:
+            continue
+        values = []
+        for key in ("prompt_price_per_mtok", "completion_price_per_mtok"):
+            value = entry.get(key, 0.0)
+            if isinstance(value, bool) or not isinstance(value, int | float) or value < 0:
+                raise ValueError(
+                    f"models.toml entry {name!r}: {key} must be a non-negative number."
+                )
+            values.append(float(value))
+        price = ModelPrice(*values)
+        prices[name] = price
+        prices[str(entry.get("model_id") or name)] = price
+    return prices
+
+
+def _percentiles(sketch: QuantileSketch) -> dict[str, float | None]:
+    return {
+        key: round(value, 4) if value is not None else None
+        for key, value in sketch.percentiles(_PERCENTILES).items()
+    }
+
+
+class _UsageGroup:
+    """Running totals and samples for one model or phase."""
+
+    def __init__(self) -> None:
+        self.interactions = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.latencies = QuantileSketch()
+        self.throughputs = QuantileSketch()
+        self.cost: float | None = None
+
+    def add(
+        self, prompt: int, completion: int, latency: float | None, cost: float | None
+    ) -> None:
+        self.interactions += 1
+        self.prompt_tokens += prompt
+        self.completion_tokens += completion
+        if latency is not None and latency >= 0:
+            self.latencies.add(latency)
+            if completion and latency > 0:
+                self.throughputs.add(completion / latency)
+        if cost is not None:
+            self.cost = (self.cost or 0.0) + cost
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "interactions": self.interactions,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency_seconds": _percentiles(self.latencies),
+            "tokens_per_second": _percentiles(self.throughputs),
+            "cost_usd": round(self.cost, 6) if self.cost is not None else None,
+        }
+
+
+def _token_usage(
+    conn: sqlite3.Connection, prices: Mapping[str, ModelPrice] | None = None
+) -> dict[str, Any]:
+    rows = _q(
+        conn,
+        """
+        SELECT i.model, i.sdlc_phase, i.run_id, i.artifact_id,
+               COALESCE(i.prompt_tokens, 0) AS prompt_tokens,
+               COALESCE(i.completion_tokens, 0) AS completion_tokens,
+               COALESCE(i.duration_ms / 1000.0, i.duration_seconds) AS latency,
+               a.status AS artifact_status
+        FROM interactions i
+        LEFT JOIN artifacts a ON a.id = i.artifact_id AND a.run_id = i.run_id
+        """,
+    )
+
+    overall = _UsageGroup()
+    per_model: defaultdict[str, _UsageGroup] = defaultdict(_UsageGroup)
+    per_phase: defaultdict[int, _UsageGroup] = defaultdict(_UsageGroup)
+    # Artifact ids repeat across runs, so artifacts are keyed "run_id/artifact_id".
+    per_artifact: defaultdict[str, int] = defaultdict(int)
+    accepted: set[str] = set()
+    unpriced: set[str] = set()
+
+    for r in rows:
+        prompt, completion = r["prompt_tokens"], r["completion_tokens"]
+        price = prices.get(r["model"]) if prices else None
+        if prices is not None and price is None:
+            unpriced.add(r["model"])
+        cost = price.cost(prompt, completion) if price else None
+        for group in (overall, per_model[r["model"]], per_phase[r["sdlc_phase"]]):
+            group.add(prompt, completion, r["latency"], cost)
+        if r["artifact_id"] is not None:
+            artifact_key = f"{r['run_id']}/{r['artifact_id']}"
+            per_artifact[artifact_key] += prompt + completion
+            if r["artifact_status"] == "accepted":
+                accepted.add(artifact_key)
+
+    accepted_totals = [per_artifact[a] for a in accepted]
+    summary = overall.summary()
+    return {
+        "total_prompt_tokens": summary["prompt_tokens"],
+        "total_completion_tokens": summary["completion_tokens"],
+        "total_tokens": summary["prompt_tokens"] + summary["completion_tokens"],
+        "latency_seconds": summary["latency_seconds"],
+        "tokens_per_second": summary["tokens_per_second"],
+        "per_model": {m: g.summary() for m, g in sorted(per_model.items())},
+        "per_phase": {p: g.summary() for p, g in sorted(per_phase.items())},
+        "tokens_per_artifact": dict(sorted(per_artifact.items())),
+        "mean_tokens_per_artifact": (
+            round(sum(per_artifact.values()) / len(per_artifact), 2) if per_artifact else None
+        ),
+        "mean_tokens_per_accepted_artifact": (
+            round(sum(accepted_totals) / len(accepted_totals), 2) if accepted_totals else None
+        ),
+        "total_cost_usd": summary["cost_usd"],
+        "unpriced_models": sorted(unpriced),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Latency distributions (operational; not defined in metrics.md)
+# ---------------------------------------------------------------------------
+
+class _LatencyGroups:
+    """One :class:`LatencySummary` overall and one per key."""
+
+    def __init__(self) -> None:
+        self.overall = LatencySummary()
+        self.by_key: defaultdict[Any, LatencySummary] = defaultdict(LatencySummary)
+
+    def add(self, keys: tuple[Any, ...], value: float | None) -> None:
+        self.overall.add(value)
+        for key in keys:
+            self.by_key[key].add(value)
+
+    def grouped(self, kind: str) -> dict[Any, dict[str, Any]]:
+        return {
+            key[1]: summary.as_dict()
+            for key, summary in sorted(self.by_key.items(), key=lambda kv: str(kv[0]))
+            if key[0] == kind
+        }
+
+
+def _latency_distributions(conn: sqlite3.Connection) -> dict[str, Any]:
+    ai = _LatencyGroups()
+    review = _LatencyGroups()
+    # One streaming pass over interactions feeds every summary
+    for model, phase, latency, review_seconds in conn.execute(
+        """
+        SELECT model, sdlc_phase,
+               COALESCE(duration_ms / 1000.0, duration_seconds),
+               COALESCE(human_review_ms / 1000.0, human_review_seconds)
+        FROM interactions
+        """
+    ):
+        keys = (("model", model), ("phase", phase))
+        ai.add(keys, latency)
+        review.add(keys, review_seconds)
+
+    # Gap before each pipeline event, attributed to that event's step
+    gaps = _LatencyGroups()
+    previous: tuple[str, float] | None = None
+    for pipeline_id, step, julian in conn.execute(
+        """
+        SELECT pipeline_id, step, julianday(timestamp)
+        FROM pipeline_events
+        ORDER BY pipeline_id, timestamp, id
+        """
+    ):
+        if julian is not None and previous is not None and previous[0] == pipeline_id:
+            gaps.add((("step", step),), (julian - previous[1]) * 86400.0)
+        previous = (pipeline_id, julian) if julian is not None else None
+
+    return {
+        "interaction_duration_seconds": {
+            "overall": ai.overall.as_dict(),
+            "per_model": ai.grouped("model"),
+            "per_phase": ai.grouped("phase"),
+        },
+        "human_review_seconds": {
+            "overall": review.overall.as_dict(),
+            "per_model": review.grouped("model"),
+            "per_phase": review.grouped("phase"),
+        },
+        "pipeline_event_gap_seconds": {
+            "overall": gaps.overall.as_dict(),
+            "per_step": gaps.grouped("step"),
+        },
+    }
+
+
 # ---------------------------------------------------------------------------
 # Master runner
 # ---------------------------------------------------------------------------
 
-def collect_all_metrics(conn: sqlite3.Connection) -> dict[str, Any]:
+def category_queries(
+    prices: Mapping[str, ModelPrice] | None = None,
+) -> dict[str, Callable[[sqlite3.Connection], dict[str, Any]]]:
+    """Return the query function of every metric category, in report order.
+
+    Args:
+        prices: Optional per-model prices, bound into ``token_usage``.
+
+    Returns:
+        Category key → function computing that category from a connection.
+
+    """
+    return {
+        "phase_reach_rate": _phase_reach_rate,
+        "traceability": _traceability,
+        "governance_rules": _governance,
+        "human_effort": _human_effort,
+        "time_effort": _time_effort,
+        "defects": _defects,
+        "prompt_refinements": _prompt_refinements,
+        "defect_origin_mappings": _defect_origin,
+        "deployment": _deployment,
+        "token_usage": partial(_token_usage, prices=prices),
+        "latency_distributions": _latency_distributions,
+    }
+
+
+def collect_all_metrics(
+    conn: sqlite3.Connection, *, prices: Mapping[str, ModelPrice] | None = None
+) -> dict[str, Any]:
     """Run every metric query against *conn* and return the results.
 
     All values are derived at query time from the raw tables.  Nothing is
@@ -495,25 +788,20 @@ def collect_all_metrics(conn: sqlite3.Connection) -> dict[str, Any]:
     reached are ``None`` (serialises as JSON ``null``).
 
     Args:
-        conn: Open SQLite connection to ``experiment.db``.
+        conn:   Open SQLite connection to ``experiment.db``.
+        prices: Optional per-model prices from :func:`load_prices`.  When
+                omitted, every ``cost_usd`` value in ``token_usage`` is
+                ``None``.
 
     Returns:
         Dict with a ``generated_at`` timestamp key and one nested dict per
         metric category.
 
     """
-    return {
-        "generated_at": _now_iso(),
-        "phase_reach_rate": _phase_reach_rate(conn),
-        "traceability": _traceability(conn),
-        "governance_rules": _governance(conn),
-        "human_effort": _human_effort(conn),
-        "time_effort": _time_effort(conn),
-        "defects": _defects(conn),
-        "prompt_refinements": _prompt_refinements(conn),
-        "defect_origin_mappings": _defect_origin(conn),
-        "deployment": _deployment(conn),
-    }
+    metrics: dict[str, Any] = {"generated_at": _now_iso()}
+    for name, query in category_queries(prices).items():
+        metrics[name] = query(conn)
+    return metrics
 
 
 def write_report(metrics: dict[str, Any], out_path: Path) -> None:
@@ -544,6 +832,11 @@ def main() -> None:
         default=None,
         help="Output JSON path (default: same dir as --db, metrics_report.json)",
     )
+    parser.add_argument(
+        "--models-toml",
+        default=None,
+        help="models.toml with per-model prices for token cost (optional)",
+    )
     args = parser.parse_args()
 
     db_path = Path(args.db)
@@ -553,9 +846,17 @@ def main() -> None:
 
     out_path = Path(args.out) if args.out else db_path.parent / "metrics_report.json"
 
+    prices: dict[str, ModelPrice] | None = None
+    if args.models_toml:
+        try:
+            prices = load_prices(Path(args.models_toml))
+        except (OSError, tomllib.TOMLDecodeError, ValueError) as exc:
+            print(f"[sdlc_core.metrics] ERROR: cannot read prices: {exc}", file=sys.stderr)
+            sys.exit(1)
+
     conn = _open(db_path)
     try:
-        metrics = collect_all_metrics(conn)
+        metrics = collect_all_metrics(conn, prices=prices)
     finally:
         conn.close()
 
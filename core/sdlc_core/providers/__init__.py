@@ -6,6 +6,8 @@
 - ``OllamaProvider``: Default provider for locally-hosted models via Ollama.
 - ``LangChainProvider``: Bridge wrapping any LangChain ``BaseChatModel`` (recommended for
   LangGraph integration; ``ChatOllama`` is the default, swap to any other chat model).
+- ``FakeProvider``: Deterministic offline provider for load tests (latency, token and
+  failure injection); ``sdlc_core.providers.stub_server`` serves it over HTTP.
 - ``LoggedProvider``: Wrapper that adds automatic timing and DB logging around any provider.
 - ``InterventionLogger``: Guided terminal UI for logging human interventions outside AI calls.
 - ``get_provider``: Registry that resolves a model name from ``models.toml`` to a provider instance.
@@ -14,7 +16,8 @@
 Built-in providers
 ------------------
 Ollama is the default because it requires no API key and works with any
-open-source model.  See ``sdlc_core/providers/examples/`` for ready-to-use
+open-source model.  ``fake`` needs no model at all and is meant for
+benchmarks and CI.  See ``sdlc_core/providers/examples/`` for ready-to-use
 extensions for Anthropic, OpenAI, Google Gemini, and LangChain + Ollama.
 
 Adding a custom provider
@@ -40,12 +43,20 @@ def my_api_complete(prompt, system=None, **kwargs):
 
 from __future__ import annotations
 
-from sdlc_core.providers.base import ModelProvider
-from sdlc_core.providers.intervention import InterventionLogger
-from sdlc_core.providers.logged import LoggedProvider
-from sdlc_core.providers.registry import get_provider, register_provider
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sdlc_core.providers.base import ModelProvider
+    from sdlc_core.providers.fake import FakeProvider
+    from sdlc_core.providers.intervention import InterventionLogger
+    from sdlc_core.providers.langchain_provider import LangChainProvider
+    from sdlc_core.providers.logged import LoggedProvider
+    from sdlc_core.providers.ollama import OllamaProvider
+    from sdlc_core.providers.registry import get_provider, register_provider
 
 __all__ = [
+    "FakeProvider",
     "InterventionLogger",
     "LangChainProvider",
     "LoggedProvider",
@@ -55,12 +66,30 @@ def my_api_complete(prompt, system=None, **kwargs):
     "register_provider",
 ]
 
-# Lazy imports so optional packages are only required when actually used
+# Every public name is imported on first access.  Optional packages are then
+# only required when actually used, and importing one submodule (or running a
+# CLI that needs none of them) does not pull in the database layer, the
+# registry or tomllib.
+_LAZY_ATTRS: dict[str, str] = {
+    "FakeProvider": "sdlc_core.providers.fake",
+    "InterventionLogger": "sdlc_core.providers.intervention",
+    "LangChainProvider": "sdlc_core.providers.langchain_provider",
+    "LoggedProvider": "sdlc_core.providers.logged",
+    "ModelProvider": "sdlc_core.providers.base",
+    "OllamaProvider": "sdlc_core.providers.ollama",
+    "get_provider": "sdlc_core.providers.registry",
+    "register_provider": "sdlc_core.providers.registry",
+}
+
+
 def __getattr__(name: str) -> object:
-    if name == "OllamaProvider":
-        from sdlc_core.providers.ollama import OllamaProvider
-        return OllamaProvider
-    if name == "LangChainProvider":
-        from sdlc_core.providers.langchain_provider import LangChainProvider
-        return LangChainProvider
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
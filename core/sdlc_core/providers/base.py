@@ -12,13 +12,54 @@
 
 Register it in ``registry.py`` under a ``provider`` name and add a matching
 entry to ``models.toml``.  No other changes are needed.
+
+Batch completion
+----------------
+Providers may optionally implement ``complete_batch`` (see
+:class:`BatchModelProvider`) when the backend can serve several prompts in
+one call.  Callers should not invoke it directly; use
+:func:`sdlc_core.providers.batch.complete_batch`, which falls back to a
+thread pool over ``complete`` for providers without native support.
+
+Optional reporting attributes
+-----------------------------
+After each ``complete`` call a provider may expose:
+
+- ``last_token_usage``: dict with ``prompt_tokens``, ``completion_tokens``
+  and ``total_tokens``.
+- ``last_time_to_first_token``: seconds from request to the first generated
+  token, or ``None`` when unknown.
+
+``LoggedProvider`` records these when present and ignores them otherwise.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
 
+@dataclass(frozen=True)
+class Completion:
+    """One response produced by a batch completion call.
+
+    Attributes:
+        text:             The model's response as a plain string.
+        token_usage:      Token counts for this item only, using the same keys
+                          as ``last_token_usage`` (``prompt_tokens``,
+                          ``completion_tokens``, ``total_tokens``).  Empty when
+                          the backend does not report usage.
+        duration_seconds: Wall-clock latency of this item, or ``None`` when the
+                          backend served the whole batch in one request.
+
+    """
+
+    text: str
+    token_usage: dict[str, int] = field(default_factory=dict)
+    duration_seconds: float | None = None
+
+
 @runtime_checkable
 class ModelProvider(Protocol):
     """Contract that every model provider implementation must satisfy.
@@ -46,3 +87,27 @@ def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str
 
         """
         ...
+
+
+@runtime_checkable
+class BatchModelProvider(ModelProvider, Protocol):
+    """Optional extension for providers with native multi-prompt support."""
+
+    def complete_batch(
+        self,
+        prompts: Sequence[str],
+        system: str | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[Completion]:
+        """Send every prompt in *prompts* and return one result per prompt.
+
+        Args:
+            prompts: User-turn texts to send.  Each is an independent request.
+            system:  Optional system prompt shared by every item.
+            **kwargs: Provider-specific parameters, as for ``complete``.
+
+        Returns:
+            One :class:`Completion` per prompt, in the same order as *prompts*.
+
+        """
+        ...
@@ -0,0 +1,126 @@
+"""batch.py: Run several prompts through a provider in one call.
+
+``complete_batch`` is the single entry point.  Providers that implement
+``complete_batch`` natively (LangChain ``batch``, LiteLLM
+``batch_completion``, pooled OpenAI requests) are called once; every other
+provider is driven through a thread pool over its ``complete`` method.
+
+Usage::
+
+    from sdlc_core.providers import get_provider
+    from sdlc_core.providers.batch import complete_batch
+
+    results = complete_batch(get_provider("llama3"), prompts, system="Be brief.")
+    for item in results:
+        print(item.text, item.token_usage)
+
+Token usage in the fallback path
+--------------------------------
+Providers report usage through the ``last_token_usage`` attribute, which is
+instance state overwritten by every call.  When a provider exposes that
+attribute and has no native batch method, the fallback calls it sequentially
+so each item is attributed the correct counts.  Providers without usage
+reporting are called concurrently.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any
+
+from sdlc_core.providers.base import Completion, ModelProvider
+
+_DEFAULT_MAX_WORKERS = 4
+
+
+def supports_native_batch(provider: ModelProvider) -> bool:
+    """Return ``True`` when *provider* defines its own ``complete_batch``.
+
+    The check is made on the class, not the instance, so that mocks and
+    proxies exposing arbitrary attributes are not mistaken for batch-capable
+    providers.
+    """
+    return callable(getattr(type(provider), "complete_batch", None))
+
+
+def _reports_usage(provider: ModelProvider) -> bool:
+    return hasattr(type(provider), "last_token_usage")
+
+
+def _read_usage(provider: ModelProvider) -> dict[str, int]:
+    raw = getattr(provider, "last_token_usage", None)
+    return dict(raw) if isinstance(raw, dict) else {}
+
+
+def _complete_one(
+    provider: ModelProvider,
+    prompt: str,
+    system: str | None,
+    kwargs: dict[str, Any],
+) -> Completion:
+    t0 = time.perf_counter()
+    text = provider.complete(prompt, system=system, **kwargs)
+    elapsed = time.perf_counter() - t0
+    return Completion(text=text, token_usage=_read_usage(provider), duration_seconds=elapsed)
+
+
+def complete_batch(
+    provider: ModelProvider,
+    prompts: Sequence[str],
+    *,
+    system: str | None = None,
+    max_workers: int = _DEFAULT_MAX_WORKERS,
+    **kwargs: Any,  # noqa: ANN401
+) -> list[Completion]:
+    """Complete every prompt in *prompts* and return the results in order.
+
+    Args:
+        provider:    Any object satisfying the ``ModelProvider`` protocol.
+        prompts:     User-turn texts to send.
+        system:      Optional system prompt shared by every item.
+        max_workers: Upper bound on concurrent ``complete`` calls in the
+                     fallback path.  Ignored for native batch providers.
+        **kwargs:    Forwarded to the provider for every item.
+
+    Returns:
+        One :class:`~sdlc_core.providers.base.Completion` per prompt, in the
+        same order as *prompts*.  Items served by a single native request
+        carry the whole batch's wall-clock time as ``duration_seconds``.
+
+    Raises:
+        ValueError: If *max_workers* is less than 1, or a native provider
+                    returns a different number of results than prompts.
+
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    if not prompts:
+        return []
+
+    if supports_native_batch(provider):
+        t0 = time.perf_counter()
+        results: list[Completion] = provider.complete_batch(  # type: ignore[attr-defined]
+            list(prompts), system=system, **kwargs
+        )
+        elapsed = time.perf_counter() - t0
+        if len(results) != len(prompts):
+            raise ValueError(
+                f"{type(provider).__name__}.complete_batch returned {len(results)} "
+                f"result(s) for {len(prompts)} prompt(s)."
+            )
+        return [
+            item if item.duration_seconds is not None
+            else replace(item, duration_seconds=elapsed)
+            for item in results
+        ]
+
+    workers = 1 if _reports_usage(provider) else min(max_workers, len(prompts))
+    if workers == 1:
+        return [_complete_one(provider, prompt, system, kwargs) for prompt in prompts]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order, so results line up with prompts
+        return list(pool.map(lambda p: _complete_one(provider, p, system, kwargs), prompts))
@@ -33,6 +33,8 @@ class AnthropicProvider:
        from my_template.providers import AnthropicProvider
        PROVIDER_CLASSES["anthropic"] = AnthropicProvider
 
-These files are intentionally self-contained so they can be copied without
-bringing any sdlc_core internals with them.
+These files are intentionally small so they can be copied into a template
+repo.  The Anthropic, OpenAI and Gemini providers share one SDK client per
+configuration through ``_clients.shared_client``; copy ``_clients.py`` along
+with them.
 """
@@ -0,0 +1,37 @@
+"""_clients.py: Process-wide SDK client cache shared by the example providers.
+
+SDK clients own an HTTP connection pool with keep-alive and are
+thread-safe, so one client per configuration serves every provider
+instance and thread.  Copy this file next to a provider that uses it.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+# Shared SDK clients keyed by (client factory, sorted constructor kwargs).
+_clients: dict[tuple[Any, tuple[tuple[str, Any], ...]], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def shared_client(factory: Any, **client_kwargs: Any) -> Any:  # noqa: ANN401
+    """Return the process-wide ``factory(**client_kwargs)``, building it once.
+
+    Args:
+        factory:        SDK client class, e.g. ``anthropic.Anthropic``.
+        **client_kwargs: Constructor arguments; each distinct set gets its
+                        own client.
+
+    Returns:
+        The cached client.
+
+    """
+    key = (factory, tuple(sorted(client_kwargs.items())))
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = factory(**client_kwargs)
+    return client
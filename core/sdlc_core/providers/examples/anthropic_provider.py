@@ -14,6 +14,7 @@
     provider    = "anthropic"
     model_id    = "claude-haiku-3-5"
     api_key_env = "ANTHROPIC_API_KEY"
+    # api_base  = "https://llm-gateway.example.com"   # optional proxy/gateway
 
 Registration (add to your setup script or template entry point)
 ---------------------------------------------------------------
@@ -26,6 +27,14 @@
     # @register_provider("anthropic")
     # class AnthropicProvider: ...
 
+Connection reuse
+----------------
+The ``anthropic.Anthropic`` client is built once per (API key, base URL) and
+shared by every provider instance in the process.  It owns an HTTP connection
+pool with keep-alive, so after the first call a request reuses an open TLS
+connection instead of performing a new handshake.  The client is thread-safe,
+so concurrent calls share the pool as well.
+
 Supported models (as of early 2026)
 ------------------------------------
     claude-opus-4-5
@@ -39,6 +48,8 @@
 import os
 from typing import Any
 
+from sdlc_core.providers.examples._clients import shared_client
+
 
 class AnthropicProvider:
     """Provider for Anthropic Claude models.
@@ -47,6 +58,8 @@ class AnthropicProvider:
         model_id:    The Anthropic model identifier, e.g. ``"claude-sonnet-4-5"``.
         api_key_env: Name of the environment variable holding the API key.
                      Defaults to ``"ANTHROPIC_API_KEY"``.
+        api_base:    Base URL of the API.  Defaults to the official Anthropic
+                     URL.  Override for a proxy or gateway.
 
     """
 
@@ -54,10 +67,12 @@ def __init__(
         self,
         model_id: str = "claude-sonnet-4-5",
         api_key_env: str = "ANTHROPIC_API_KEY",
+        api_base: str = "",
     ) -> None:
         """Initialise the provider. See class docstring for parameters."""
         self._model_id = model_id
         self._api_key_env = api_key_env
+        self._api_base = api_base
 
     def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str:  # noqa: ANN401
         """Send *prompt* to the Claude model and return the response text.
@@ -93,7 +108,10 @@ def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str
                 "Add it to your .env file."
             )
 
-        client = anthropic.Anthropic(api_key=api_key)
+        client_kwargs: dict[str, Any] = {"api_key": api_key}
+        if self._api_base:
+            client_kwargs["base_url"] = self._api_base
+        client = shared_client(anthropic.Anthropic, **client_kwargs)
 
         create_kwargs: dict[str, Any] = {
             "model": self._model_id,
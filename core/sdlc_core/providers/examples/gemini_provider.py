@@ -31,6 +31,12 @@
 Gemini supports a dedicated ``system_instruction`` field.  This provider
 passes the ``system`` argument there when provided.
 
+Connection reuse
+----------------
+The ``genai.Client`` is built once per API key and shared by every provider
+instance in the process, so its HTTP connection pool (and the open TLS
+connections in it) is reused across calls.
+
 Supported models (as of early 2026)
 ------------------------------------
     gemini-2.5-pro, gemini-2.0-flash, gemini-2.0-flash-lite
@@ -42,6 +48,8 @@
 import os
 from typing import Any
 
+from sdlc_core.providers.examples._clients import shared_client
+
 
 class GeminiProvider:
     """Provider for Google Gemini models via the google-genai SDK.
@@ -97,7 +105,7 @@ def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str
                 "Add it to your .env file."
             )
 
-        client = genai.Client(api_key=api_key)
+        client = shared_client(genai.Client, api_key=api_key)
 
         config_kwargs: dict[str, Any] = {}
         if system:
@@ -47,8 +47,10 @@
 from __future__ import annotations
 
 import importlib
+from collections.abc import Sequence
 from typing import Any
 
+from sdlc_core.providers.base import Completion
 from sdlc_core.providers.langchain_provider import LangChainProvider
 
 
@@ -133,3 +135,22 @@ def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str
 
         """
         return self._get_inner().complete(prompt, system=system, **kwargs)
+
+    def complete_batch(
+        self,
+        prompts: Sequence[str],
+        system: str | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[Completion]:
+        """Send every prompt through ``ChatOllama.batch`` and return the results in order.
+
+        Args:
+            prompts: User-turn texts, one independent request each.
+            system: Optional system prompt shared by every item.
+            **kwargs: Forwarded to ``ChatOllama.batch``.
+
+        Returns:
+            One :class:`~sdlc_core.providers.base.Completion` per prompt.
+
+        """
+        return self._get_inner().complete_batch(prompts, system=system, **kwargs)
@@ -25,14 +25,22 @@
     from sdlc_core.providers.examples.litellm_provider import LiteLLMProvider
 
     register_provider("litellm")(LiteLLMProvider)
+
+Batch completion
+----------------
+``complete_batch`` sends a list of prompts through ``litellm.batch_completion``
+in one call and returns per-item token usage.
 """
 
 from __future__ import annotations
 
 import importlib
 import os
+from collections.abc import Sequence
 from typing import Any
 
+from sdlc_core.providers.base import Completion
+
 
 class LiteLLMProvider:
     """Provider backed by LiteLLM's ``completion`` API.
@@ -88,15 +96,58 @@ def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str
             OSError: If ``api_key_env`` is configured but not set.
 
         """
+        completion_fn = self._litellm_attr("completion")
+        call_kwargs = self._call_kwargs(kwargs)
+        call_kwargs["messages"] = _messages(prompt, system)
+
+        response = completion_fn(**call_kwargs)
+        self._last_token_usage = _usage_from(response)
+        return _content_from(response)
+
+    def complete_batch(
+        self,
+        prompts: Sequence[str],
+        system: str | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[Completion]:
+        """Send every prompt through ``litellm.batch_completion`` in one call.
+
+        Args:
+            prompts: User messages, one independent request each.
+            system: Optional system prompt shared by every item.
+            **kwargs: Forwarded to ``litellm.batch_completion``.
+
+        Returns:
+            One :class:`~sdlc_core.providers.base.Completion` per prompt, in
+            order.  ``last_token_usage`` reflects the final item.
+
+        Raises:
+            ImportError: If ``litellm`` is not installed.
+            OSError: If ``api_key_env`` is configured but not set.
+
+        """
+        batch_fn = self._litellm_attr("batch_completion")
+        call_kwargs = self._call_kwargs(kwargs)
+        call_kwargs["messages"] = [_messages(prompt, system) for prompt in prompts]
+
+        results: list[Completion] = []
+        for response in batch_fn(**call_kwargs):
+            usage = _usage_from(response)
+            results.append(Completion(text=_content_from(response), token_usage=usage))
+            self._last_token_usage = usage
+        return results
+
+    def _litellm_attr(self, name: str) -> Any:  # noqa: ANN401
         try:
             litellm_mod = importlib.import_module("litellm")
-            completion_fn = litellm_mod.completion
+            return getattr(litellm_mod, name)
         except (ImportError, AttributeError) as exc:
             raise ImportError(
                 "The 'litellm' package is required for LiteLLMProvider. "
                 "Install it with: pip install litellm"
             ) from exc
 
+    def _call_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
         api_key = ""
         if self._api_key_env:
             api_key = os.environ.get(self._api_key_env, "")
@@ -106,50 +157,51 @@ def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str
                     "Add it to your .env file."
                 )
 
-        messages: list[dict[str, str]] = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
-
-        call_kwargs: dict[str, Any] = {
-            "model": self._model_id,
-            "messages": messages,
-        }
+        call_kwargs: dict[str, Any] = {"model": self._model_id}
         if api_key:
             call_kwargs["api_key"] = api_key
         if self._api_base:
             call_kwargs["api_base"] = self._api_base
         call_kwargs.update(kwargs)
+        return call_kwargs
+
+
+def _messages(prompt: str, system: str | None) -> list[dict[str, str]]:
+    messages: list[dict[str, str]] = []
+    if system:
+        messages.append({"role": "system", "content": system})
+    messages.append({"role": "user", "content": prompt})
+    return messages
 
-        response = completion_fn(**call_kwargs)
 
-        usage = getattr(response, "usage", None)
-        if usage is None and isinstance(response, dict):
-            usage = response.get("usage")
-
-        if isinstance(usage, dict):
-            self._last_token_usage = {
-                "prompt_tokens": int(usage.get("prompt_tokens", 0)),
-                "completion_tokens": int(usage.get("completion_tokens", 0)),
-                "total_tokens": int(usage.get("total_tokens", 0)),
-            }
-        else:
-            self._last_token_usage = {
-                "prompt_tokens": int(getattr(usage, "prompt_tokens", 0)),
-                "completion_tokens": int(getattr(usage, "completion_tokens", 0)),
-                "total_tokens": int(getattr(usage, "total_tokens", 0)),
-            }
-
-        content = ""
-        if isinstance(response, dict):
-            choices = response.get("choices", [])
-            if choices:
-                message = choices[0].get("message", {})
-                content = str(message.get("content", ""))
-        else:
-            choices = getattr(response, "choices", [])
-            if choices:
-                message = getattr(choices[0], "message", None)
-                content = str(getattr(message, "content", ""))
-
-        return content
+def _usage_from(response: Any) -> dict[str, int]:  # noqa: ANN401
+    usage = getattr(response, "usage", None)
+    if usage is None and isinstance(response, dict):
+        usage = response.get("usage")
+
+    if isinstance(usage, dict):
+        return {
+            "prompt_tokens": int(usage.get("prompt_tokens", 0)),
+            "completion_tokens": int(usage.get("completion_tokens", 0)),
+            "total_tokens": int(usage.get("total_tokens", 0)),
+        }
+    return {
+        "prompt_tokens": int(getattr(usage, "prompt_tokens", 0)),
+        "completion_tokens": int(getattr(usage, "completion_tokens", 0)),
+        "total_tokens": int(getattr(usage, "total_tokens", 0)),
+    }
+
+
+def _content_from(response: Any) -> str:  # noqa: ANN401
+    content = ""
+    if isinstance(response, dict):
+        choices = response.get("choices", [])
+        if choices:
+            message = choices[0].get("message", {})
+            content = str(message.get("content", ""))
+    else:
+        choices = getattr(response, "choices", [])
+        if choices:
+            message = getattr(choices[0], "message", None)
+            content = str(getattr(message, "content", ""))
+    return content
@@ -47,6 +47,20 @@
     # @register_provider("openai")
     # class OpenAIProvider: ...
 
+Connection reuse
+----------------
+The ``OpenAI`` client is built once per (API key, base URL) and shared by
+every provider instance in the process.  It owns an HTTP connection pool with
+keep-alive, so after the first call a request reuses an open TLS connection
+instead of performing a new handshake.
+
+Batch completion
+----------------
+The Chat Completions API takes one conversation per request, so
+``complete_batch`` issues the requests concurrently over a single client
+(and therefore a single HTTP connection pool) and reads per-item usage from
+each response.
+
 Supported models (as of early 2026)
 ------------------------------------
     gpt-4o, gpt-4o-mini, o1, o3-mini
@@ -56,8 +70,13 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from sdlc_core.providers.base import Completion
+from sdlc_core.providers.examples._clients import shared_client
+
 
 class OpenAIProvider:
     """Provider for OpenAI and OpenAI-compatible API endpoints.
@@ -100,6 +119,61 @@ def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str
             EnvironmentError: If the API key env var is set but empty.
 
         """
+        client = self._client()
+        response = client.chat.completions.create(
+            model=self._model_id,
+            messages=_messages(prompt, system),
+            **kwargs,
+        )
+        return response.choices[0].message.content or ""
+
+    def complete_batch(
+        self,
+        prompts: Sequence[str],
+        system: str | None = None,
+        max_concurrency: int = 4,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[Completion]:
+        """Send every prompt concurrently over one client and return results in order.
+
+        Args:
+            prompts: User messages, one independent request each.
+            system: Optional system prompt shared by every item.
+            max_concurrency: Upper bound on in-flight requests.
+            **kwargs: Forwarded to every ``client.chat.completions.create`` call.
+
+        Returns:
+            One :class:`~sdlc_core.providers.base.Completion` per prompt, with
+            usage read from each response.
+
+        Raises:
+            ImportError: If the ``openai`` package is not installed.
+            EnvironmentError: If the API key env var is set but empty.
+
+        """
+        client = self._client()
+
+        def _one(prompt: str) -> Completion:
+            response = client.chat.completions.create(
+                model=self._model_id,
+                messages=_messages(prompt, system),
+                **kwargs,
+            )
+            usage = getattr(response, "usage", None)
+            return Completion(
+                text=response.choices[0].message.content or "",
+                token_usage={
+                    "prompt_tokens": int(getattr(usage, "prompt_tokens", 0) or 0),
+                    "completion_tokens": int(getattr(usage, "completion_tokens", 0) or 0),
+                    "total_tokens": int(getattr(usage, "total_tokens", 0) or 0),
+                },
+            )
+
+        workers = max(1, min(max_concurrency, len(prompts)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_one, prompts))
+
+    def _client(self) -> Any:  # noqa: ANN401
         try:
             from openai import OpenAI
         except ImportError as exc:
@@ -118,17 +192,12 @@ def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str
         client_kwargs: dict[str, Any] = {"api_key": api_key}
         if self._api_base:
             client_kwargs["base_url"] = self._api_base
+        return shared_client(OpenAI, **client_kwargs)
 
-        client = OpenAI(**client_kwargs)
-
-        messages: list[dict[str, str]] = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
 
-        response = client.chat.completions.create(
-            model=self._model_id,
-            messages=messages,
-            **kwargs,
-        )
-        return response.choices[0].message.content or ""
+def _messages(prompt: str, system: str | None) -> list[dict[str, str]]:
+    messages: list[dict[str, str]] = []
+    if system:
+        messages.append({"role": "system", "content": system})
+    messages.append({"role": "user", "content": prompt})
+    return messages
@@ -0,0 +1,254 @@
+"""fake.py: FakeProvider, a deterministic offline provider for load testing.
+
+``FakeProvider`` needs no daemon, network or API key.  Responses are built
+from a hash of the prompt, so the same prompt always gets the same text and
+token counts.  Latency, time to first token, and injected failures come from
+a seeded generator, so the same seed and call sequence always behave the same.
+This makes it possible to measure ``LoggedProvider``, the registry, and the
+pipeline runner offline and in CI.
+
+It is registered as the built-in ``"fake"`` provider.  Behaviour is set with
+the optional ``options`` table of the models.toml entry:
+
+Usage in models.toml
+--------------------
+    [models.fake]
+    provider = "fake"
+    model_id = "fake-7b"
+
+    [models.fake-slow]
+    provider = "fake"
+    model_id = "fake-slow"
+    options  = { latency = "lognormal", latency_ms = 800, latency_spread_ms = 400,
+                 completion_tokens = 256, failure_rate = 0.05, seed = 7 }
+
+Latency distributions
+---------------------
+``latency_ms`` is the mean of every distribution.
+``latency_spread_ms`` is the half-width for ``uniform`` and the standard
+deviation for ``normal`` and ``lognormal``.  ``exponential`` uses the mean
+only.  Samples below zero are clamped to zero.  The first
+``ttft_fraction`` of each latency is reported as ``last_time_to_first_token``.
+
+:mod:`sdlc_core.providers.stub_server` serves the same replies over the
+Ollama and OpenAI-compatible HTTP APIs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+# Words used to build response text; one word per completion token.
+_VOCABULARY = (
+    "the system shall record each requirement with a unique identifier and "
+    "trace it to design components verification results and deployment notes "
+    "so that reviewers can confirm coverage before the phase is closed"
+).split()
+
+
+class FakeProviderError(RuntimeError):
+    """Raised by :meth:`FakeProvider.complete` for an injected failure."""
+
+
+@dataclass(frozen=True)
+class FakeReply:
+    """Planned outcome of one fake completion.
+
+    Attributes:
+        text:                The response text.
+        prompt_tokens:       Whitespace-separated words in the prompt and system prompt.
+        completion_tokens:   Words in *text*.
+        latency:             Total response time in seconds.
+        time_to_first_token: Seconds before the first token.
+        failed:              Whether this call is an injected failure.
+
+    """
+
+    text: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency: float
+    time_to_first_token: float
+    failed: bool
+
+    @property
+    def token_usage(self) -> dict[str, int]:
+        """Return the usage dict in the ``last_token_usage`` format."""
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.prompt_tokens + self.completion_tokens,
+        }
+
+
+class FakeProvider:
+    """Deterministic provider with configurable latency, tokens and failures.
+
+    Args:
+        model_id:                Name reported for the model.
+        latency:                 Distribution name (see :data:`LATENCY_DISTRIBUTIONS`).
+        latency_ms:              Mean latency in milliseconds.
+        latency_spread_ms:       Spread of the distribution in milliseconds.
+        ttft_fraction:           Share of the latency spent before the first token.
+        completion_tokens:       Mean number of completion tokens.
+        completion_tokens_spread: Half-width of the uniform spread around
+                                 *completion_tokens*.
+        failure_rate:            Probability that a call fails.
+        fail_every:              When set, every N-th call fails as well.
+        seed:                    Seed for text, latency and failure sampling.
+
+    Raises:
+        ValueError: If an argument is out of range.
+
+    """
+
+    def __init__(
+        self,
+        model_id: str = "fake",
+        *,
+        latency: str = "fixed",
+        latency_ms: float = 0.0,
+        latency_spread_ms: float = 0.0,
+        ttft_fraction: float = 0.2,
+        completion_tokens: int = 32,
+        completion_tokens_spread: int = 0,
+        failure_rate: float = 0.0,
+        fail_every: int = 0,
+        seed: int = 0,
+    ) -> None:
+        """Initialise the provider. See class docstring for parameters."""
+        if latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution {latency!r}; "
+                f"expected one of {', '.join(LATENCY_DISTRIBUTIONS)}."
+            )
+        if latency_ms < 0 or latency_spread_ms < 0:
+            raise ValueError("latency_ms and latency_spread_ms must not be negative.")
+        if not 0.0 <= ttft_fraction <= 1.0:
+            raise ValueError("ttft_fraction must be between 0 and 1.")
+        if completion_tokens < 1 or completion_tokens_spread < 0:
+            raise ValueError("completion_tokens must be at least 1 and its spread not negative.")
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError("failure_rate must be between 0 and 1.")
+        if fail_every < 0:
+            raise ValueError("fail_every must not be negative.")
+        self._model_id = model_id
+        self._latency = latency
+        self._latency_ms = float(latency_ms)
+        self._latency_spread_ms = float(latency_spread_ms)
+        self._ttft_fraction = ttft_fraction
+        self._completion_tokens = completion_tokens
+        self._completion_tokens_spread = completion_tokens_spread
+        self._failure_rate = failure_rate
+        self._fail_every = fail_every
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._last_token_usage: dict[str, int] | None = None
+        self._last_time_to_first_token: float | None = None
+
+    @property
+    def model_id(self) -> str:
+        """Return the configured model name."""
+        return self._model_id
+
+    @property
+    def calls(self) -> int:
+        """Return the number of replies planned so far."""
+        return self._calls
+
+    @property
+    def last_token_usage(self) -> dict[str, int] | None:
+        """Return the token usage of the last successful call."""
+        return self._last_token_usage
+
+    @property
+    def last_time_to_first_token(self) -> float | None:
+        """Return the simulated time to first token of the last call, in seconds."""
+        return self._last_time_to_first_token
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def plan(self, prompt: str, system: str | None = None) -> FakeReply:
+        """Return the outcome of the next call without sleeping or raising.
+
+        Text and token counts depend only on *prompt*, *system* and the seed.
+        Latency and failure are drawn from the provider's generator, which is
+        shared by all threads and advanced once per call.
+        """
+        digest = hashlib.sha256(f"{self._seed}\0{system or ''}\0{prompt}".encode()).digest()
+        content_rng = random.Random(digest)
+        spread = self._completion_tokens_spread
+        n_tokens = max(1, self._completion_tokens + content_rng.randint(-spread, spread))
+        text = " ".join(content_rng.choice(_VOCABULARY) for _ in range(n_tokens))
+        prompt_tokens = len(prompt.split()) + len((system or "").split())
+
+        with self._lock:
+            self._calls += 1
+            latency = self._sample_latency() / 1000
+            failed = self._rng.random() < self._failure_rate or (
+                self._fail_every > 0 and self._calls % self._fail_every == 0
+            )
+
+        return FakeReply(
+            text=text,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=n_tokens,
+            latency=latency,
+            time_to_first_token=latency * self._ttft_fraction,
+            failed=failed,
+        )
+
+    def _sample_latency(self) -> float:
+        mean, spread = self._latency_ms, self._latency_spread_ms
+        if self._latency == "uniform":
+            value = self._rng.uniform(mean - spread, mean + spread)
+        elif self._latency == "normal":
+            value = self._rng.gauss(mean, spread)
+        elif self._latency == "lognormal" and mean > 0:
+            sigma2 = math.log1p((spread / mean) ** 2)
+            value = self._rng.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+        elif self._latency == "exponential" and mean > 0:
+            value = self._rng.expovariate(1 / mean)
+        else:
+            value = mean
+        return max(0.0, value)
+
+    # ------------------------------------------------------------------
+    # ModelProvider interface
+    # ------------------------------------------------------------------
+
+    def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str:  # noqa: ANN401
+        """Sleep for the sampled latency and return the deterministic response.
+
+        Args:
+            prompt: The user message.
+            system: Optional system prompt; part of the response seed.
+            **kwargs: Accepted and ignored.
+
+        Returns:
+            The response text.
+
+        Raises:
+            FakeProviderError: If this call is an injected failure.
+
+        """
+        reply = self.plan(prompt, system)
+        if reply.latency:
+            time.sleep(reply.latency)
+        self._last_time_to_first_token = reply.time_to_first_token
+        if reply.failed:
+            raise FakeProviderError(f"Injected failure from fake model {self._model_id!r}.")
+        self._last_token_usage = reply.token_usage
+        return reply.text
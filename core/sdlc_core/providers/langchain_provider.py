@@ -29,6 +29,12 @@
 and are automatically read by ``LoggedProvider`` to populate the
 ``prompt_tokens`` and ``completion_tokens`` columns in ``interactions``.
 
+Batch completion
+----------------
+``complete_batch`` forwards a list of prompts to the model's native
+``batch`` method and returns per-item token counts, so
+:func:`sdlc_core.providers.batch.complete_batch` needs no thread pool.
+
 Registration
 ------------
 To expose this provider through the ``models.toml`` registry, register it
@@ -52,8 +58,11 @@ def complete(self, prompt, system=None, **kwargs):
 from __future__ import annotations
 
 import importlib
+from collections.abc import Sequence
 from typing import Any
 
+from sdlc_core.providers.base import Completion
+
 
 class LangChainProvider:
     """Wraps any LangChain ``BaseChatModel`` as a ``ModelProvider``.
@@ -114,6 +123,47 @@ def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str
             ImportError: If ``langchain-core`` is not installed.
 
         """
+        messages = self._build_messages(prompt, system)
+        response = self._model.invoke(messages, **kwargs)
+        self._last_token_usage = _usage_from(response)
+        return str(response.content)
+
+    def complete_batch(
+        self,
+        prompts: Sequence[str],
+        system: str | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[Completion]:
+        """Send every prompt through the model's native ``batch`` method.
+
+        LangChain runs the requests concurrently inside ``batch`` (bounded by
+        the model's ``max_concurrency`` config), so this is one call from the
+        caller's point of view.
+
+        Args:
+            prompts: User-turn texts, one independent request each.
+            system:  Optional system prompt shared by every item.
+            **kwargs: Forwarded to the model's ``batch`` call.
+
+        Returns:
+            One :class:`~sdlc_core.providers.base.Completion` per prompt, in
+            order.  ``last_token_usage`` reflects the final item.
+
+        Raises:
+            ImportError: If ``langchain-core`` is not installed.
+
+        """
+        inputs = [self._build_messages(prompt, system) for prompt in prompts]
+        responses = self._model.batch(inputs, **kwargs)
+
+        results: list[Completion] = []
+        for response in responses:
+            usage = _usage_from(response)
+            results.append(Completion(text=str(response.content), token_usage=usage))
+            self._last_token_usage = usage
+        return results
+
+    def _build_messages(self, prompt: str, system: str | None) -> list[Any]:
         try:
             messages_mod = importlib.import_module("langchain_core.messages")
             human_message_cls = messages_mod.HumanMessage
@@ -128,15 +178,14 @@ def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str
         if system:
             messages.append(system_message_cls(content=system))
         messages.append(human_message_cls(content=prompt))
+        return messages
 
-        response = self._model.invoke(messages, **kwargs)
 
-        # Read usage_metadata (LangChain 0.3+). Default to zeros when omitted.
-        usage = getattr(response, "usage_metadata", None) or {}
-        self._last_token_usage = {
-            "prompt_tokens": int(usage.get("input_tokens", 0)),
-            "completion_tokens": int(usage.get("output_tokens", 0)),
-            "total_tokens": int(usage.get("total_tokens", 0)),
-        }
-
-        return str(response.content)
+def _usage_from(response: Any) -> dict[str, int]:  # noqa: ANN401
+    """Read ``usage_metadata`` (LangChain 0.3+), defaulting to zeros when omitted."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    return {
+        "prompt_tokens": int(usage.get("input_tokens", 0)),
+        "completion_tokens": int(usage.get("output_tokens", 0)),
+        "total_tokens": int(usage.get("total_tokens", 0)),
+    }
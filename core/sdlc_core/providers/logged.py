@@ -21,17 +21,65 @@
         artifact_id="ARCH-VIEW-01",
     )
 
+Batches
+-------
+``complete_batch()`` submits several prompts at once (natively when the
+provider supports it, otherwise through a thread pool), then walks the
+researcher through each response in order and writes every row in a single
+transaction::
+
+    responses = provider.complete_batch(
+        [prompt_a, prompt_b],
+        agent_role="software_designer",
+        artifact_ids=["DESIGN-01", "DESIGN-02"],
+    )
+
+Deferred review
+---------------
+With ``review_mode=ReviewMode.DEFERRED`` the wrapper does not wait for the
+researcher.  Each response is written to ``review_queue`` and returned
+immediately, so the next model call can start while earlier responses are
+still unread.  The researcher drains the queue later with ``sdlc-review``,
+which writes the ``interactions`` rows::
+
+    provider = LoggedProvider(base, session=session, review_mode="deferred")
+
+``review_mode=ReviewMode.AUTO_ACCEPT`` records every response as accepted
+without displaying it or prompting.  It exists for load generation
+(``sdlc-loadgen``) and must not be used in an experiment run.
+
+Threads
+-------
+Interactive review reads the outcome from the process's one terminal, so
+concurrent ``complete()`` calls (e.g. ``sdlc-pipeline --all --workers N``)
+take turns: the model calls run in parallel, but each response is displayed
+and its outcome captured before the next one is shown.
+
+Timing
+------
+Durations are measured with ``time.perf_counter`` and stored both as whole
+seconds (``duration_seconds``, ``human_review_seconds``) and in milliseconds
+(``duration_ms``, ``human_review_ms``).  Each call also writes a per-phase
+breakdown to the ``spans`` table: prompt validation (when
+``validate_prompts=True``), provider call, first token (when the provider
+reports ``last_time_to_first_token``), DB write, and human review.
+
 """
 
 from __future__ import annotations
 
+import threading
 import time
+from collections.abc import Sequence
 from typing import Any
 
 from sdlc_core import db
-from sdlc_core.enums import Outcome
+from sdlc_core.enums import Outcome, ReviewMode, SpanName
+from sdlc_core.prompt_validator import validate_prompt
 from sdlc_core.providers.base import ModelProvider
+from sdlc_core.providers.batch import complete_batch
 from sdlc_core.session import Session
+from sdlc_core.spans import SpanRecorder
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -39,6 +87,10 @@
 
 _SEPARATOR = "-" * 72
 
+# Held from displaying a response until its outcome is read, so concurrent
+# reviews cannot interleave on stdout or take each other's answers.
+_terminal_lock = threading.Lock()
+
 _OUTCOME_MAP: dict[str, Outcome] = {
     "a": Outcome.ACCEPTED,
     "r": Outcome.REJECTED,
@@ -55,16 +107,47 @@ class LoggedProvider:
     """Wraps any ModelProvider with automatic timing and DB interaction logging.
 
     Args:
-        provider: The underlying model provider to call.
-        session:  Active experiment session holding ``run_id``, ``approach``,
-                  ``active_phase``, and ``db_path``.
+        provider:    The underlying model provider to call.
+        session:     Active experiment session holding ``run_id``, ``approach``,
+                     ``active_phase``, and ``db_path``.
+        review_mode: ``interactive`` (default) asks for the outcome before
+                     returning; ``deferred`` queues the response for
+                     ``sdlc-review`` and returns at once; ``auto_accept``
+                     logs every response as accepted without asking.
+        validate_prompts: Run :func:`~sdlc_core.prompt_validator.validate_prompt`
+                     on every prompt before submitting it, recording the
+                     time taken as a ``prompt_validation`` span.
 
     """
 
-    def __init__(self, provider: ModelProvider, session: Session) -> None:
+    def __init__(
+        self,
+        provider: ModelProvider,
+        session: Session,
+        *,
+        review_mode: ReviewMode | str = ReviewMode.INTERACTIVE,
+        validate_prompts: bool = False,
+    ) -> None:
         """Initialise the wrapper with a provider and active session."""
         self._provider = provider
         self._session = session
+        self._review_mode = ReviewMode(review_mode)
+        self._validate_prompts = validate_prompts
+        self._last_interaction_id: int | None = None
+
+    @property
+    def review_mode(self) -> ReviewMode:
+        """Return whether outcomes are captured inline or deferred to the queue."""
+        return self._review_mode
+
+    @property
+    def last_interaction_id(self) -> int | None:
+        """Return the ``interactions`` row written by the last :meth:`complete` call.
+
+        ``None`` before the first call and when the response was queued for
+        deferred review.
+        """
+        return self._last_interaction_id
 
     @property
     def model_id(self) -> str:
@@ -101,88 +184,300 @@ def complete(
 
         Returns:
             The model response text exactly as returned by the provider.
+            In deferred mode the response is queued rather than displayed.
 
         """
-        t0 = time.perf_counter()
-        response = self._provider.complete(prompt, system=system, **kwargs)
-        ai_duration = int(time.perf_counter() - t0)
-
-        print()
-        print(_SEPARATOR)
-        print("RESPONSE")
-        print(_SEPARATOR)
-        print(response)
-        print(_SEPARATOR)
-
-        t_review = time.perf_counter()
-        outcome, notes = self._capture_outcome()
-        human_review = int(time.perf_counter() - t_review)
+        recorder = SpanRecorder()
+        self._validate(prompt, artifact_id, recorder)
 
-        iteration = (
-            self._session.next_iteration(artifact_id) if artifact_id is not None else 1
-        )
+        call_start = recorder.now_ms()
+        with recorder.span(SpanName.PROVIDER_CALL):
+            response = self._provider.complete(prompt, system=system, **kwargs)
+        ttft = getattr(self._provider, "last_time_to_first_token", None)
+        if isinstance(ttft, int | float) and not isinstance(ttft, bool):
+            recorder.add(SpanName.FIRST_TOKEN, offset_ms=call_start, duration_ms=ttft * 1000.0)
 
         # Read token usage only when the provider exposes a real dict
         _raw_usage = getattr(self._provider, "last_token_usage", None)
         token_usage: dict[str, int] = _raw_usage if isinstance(_raw_usage, dict) else {}
 
-        db.log_interaction(
-            run_id=self._session.run_id,
-            sdlc_phase=self._session.active_phase,
-            approach=self._session.approach,
+        row = self._base_row(
+            prompt,
+            response,
             agent_role=agent_role,
-            model=self.model_id,
-            prompt=prompt,
-            response=response,
-            iteration=iteration,
-            outcome=outcome,
-            human_modified=(outcome == Outcome.ACCEPTED_WITH_MODIFICATIONS),
             artifact_id=artifact_id,
-            human_modification_notes=notes,
-            duration_seconds=ai_duration,
-            human_review_seconds=human_review,
-            prompt_tokens=token_usage.get("prompt_tokens") or None,
-            completion_tokens=token_usage.get("completion_tokens") or None,
-            db_path=self._session.db_path,
+            ai_ms=recorder.duration_ms(SpanName.PROVIDER_CALL) or 0.0,
+            token_usage=token_usage,
         )
+        db_path = self._session.db_path
+        self._last_interaction_id = None
+        if self._review_mode == ReviewMode.DEFERRED:
+            with recorder.span(SpanName.DB_WRITE):
+                review_id = db.enqueue_review(**row, db_path=db_path)
+            db.log_spans(
+                rows=recorder.rows(run_id=self._session.run_id, review_id=review_id),
+                db_path=db_path,
+            )
+            print(f"[sdlc_core] Response queued for review (#{review_id}).")
+        else:
+            full_row = self._outcome_row(row, recorder)
+            with recorder.span(SpanName.DB_WRITE):
+                interaction_id = db.log_interaction(**full_row, db_path=db_path)
+            self._last_interaction_id = interaction_id
+            db.log_spans(
+                rows=recorder.rows(run_id=self._session.run_id, interaction_id=interaction_id),
+                db_path=db_path,
+            )
 
         return response
 
-    def _capture_outcome(self) -> tuple[Outcome, str | None]:
-        """Prompt the researcher at the terminal to declare the interaction outcome.
+    def complete_batch(
+        self,
+        prompts: Sequence[str],
+        *,
+        agent_role: str,
+        artifact_ids: Sequence[str | None] | None = None,
+        system: str | None = None,
+        max_workers: int = 4,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[str]:
+        """Submit several prompts at once, review each response, and log every row.
+
+        All model calls complete before the first response is displayed.
+        The researcher then declares an outcome for each response in prompt
+        order, and all rows are written to ``interactions`` in one
+        transaction.  In deferred mode every response is queued in one
+        transaction instead.
+
+        Args:
+            prompts:      Prompt texts to submit, one interaction each.
+            agent_role:   Declared role of the AI, shared by every item.
+            artifact_ids: Optional artifact identifier per prompt.  Must have
+                          the same length as *prompts* when given.  ``None``
+                          marks every item as exploratory.
+            system:       Optional system prompt shared by every item.
+            max_workers:  Concurrency bound for providers without native
+                          batch support.
+            **kwargs:     Forwarded to the underlying provider.
 
         Returns:
-            A tuple of (outcome, modification_notes). Notes are ``None`` unless
-            the outcome is ``accepted_with_modifications``.
+            The response texts, in the same order as *prompts*.
+
+        Raises:
+            ValueError: If *artifact_ids* and *prompts* differ in length.
 
         """
-        outcome = self._read_outcome()
-        notes = self._read_notes() if outcome == Outcome.ACCEPTED_WITH_MODIFICATIONS else None
-        return outcome, notes
+        ids: list[str | None] = (
+            list(artifact_ids) if artifact_ids is not None else [None] * len(prompts)
+        )
+        if len(ids) != len(prompts):
+            raise ValueError(
+                f"artifact_ids has {len(ids)} item(s) but prompts has {len(prompts)}."
+            )
+
+        recorders = [SpanRecorder() for _ in prompts]
+        for prompt, artifact_id, recorder in zip(prompts, ids, recorders, strict=True):
+            self._validate(prompt, artifact_id, recorder)
+
+        call_starts = [recorder.now_ms() for recorder in recorders]
+        results = complete_batch(
+            self._provider, prompts, system=system, max_workers=max_workers, **kwargs
+        )
 
-    def _read_outcome(self) -> Outcome:
-        """Read a valid outcome choice from stdin, re-prompting on invalid input.
+        rows: list[dict[str, Any]] = []
+        for prompt, result, artifact_id, recorder, call_start in zip(
+            prompts, results, ids, recorders, call_starts, strict=True
+        ):
+            ai_ms = (result.duration_seconds or 0.0) * 1000.0
+            recorder.add(SpanName.PROVIDER_CALL, offset_ms=call_start, duration_ms=ai_ms)
+            rows.append(
+                self._base_row(
+                    prompt,
+                    result.text,
+                    agent_role=agent_role,
+                    artifact_id=artifact_id,
+                    ai_ms=ai_ms,
+                    token_usage=result.token_usage,
+                )
+            )
+
+        db_path = self._session.db_path
+        run_id = self._session.run_id
+        if self._review_mode == ReviewMode.DEFERRED:
+            write_start = time.perf_counter()
+            review_ids = db.enqueue_reviews(rows=rows, db_path=db_path)
+            _add_shared_write(recorders, write_start)
+            db.log_spans(
+                rows=[
+                    span
+                    for recorder, review_id in zip(recorders, review_ids, strict=True)
+                    for span in recorder.rows(run_id=run_id, review_id=review_id)
+                ],
+                db_path=db_path,
+            )
+            print(f"[sdlc_core] {len(review_ids)} response(s) queued for review.")
+        else:
+            full_rows = [
+                self._outcome_row(row, recorder)
+                for row, recorder in zip(rows, recorders, strict=True)
+            ]
+            write_start = time.perf_counter()
+            interaction_ids = db.log_interactions(rows=full_rows, db_path=db_path)
+            _add_shared_write(recorders, write_start)
+            db.log_spans(
+                rows=[
+                    span
+                    for recorder, interaction_id in zip(recorders, interaction_ids, strict=True)
+                    for span in recorder.rows(run_id=run_id, interaction_id=interaction_id)
+                ],
+                db_path=db_path,
+            )
+
+        return [result.text for result in results]
+
+    def _validate(self, prompt: str, artifact_id: str | None, recorder: SpanRecorder) -> None:
+        """Check prompt structure when enabled, timing it as a span."""
+        if not self._validate_prompts:
+            return
+        with recorder.span(SpanName.PROMPT_VALIDATION):
+            validate_prompt(prompt, session=self._session, artifact_id=artifact_id)
+
+    def _outcome_row(self, row: dict[str, Any], recorder: SpanRecorder) -> dict[str, Any]:
+        """Complete *row* with the researcher's outcome, or auto-accept it."""
+        if self._review_mode == ReviewMode.AUTO_ACCEPT:
+            return _auto_accept(row)
+        return _review(row, recorder)
+
+    def _base_row(
+        self,
+        prompt: str,
+        response: str,
+        *,
+        agent_role: str,
+        artifact_id: str | None,
+        ai_ms: float,
+        token_usage: dict[str, int],
+    ) -> dict[str, Any]:
+        """Build the interaction fields known before the researcher's review.
 
         Returns:
-            The resolved ``Outcome`` enum member.
+            Keyword arguments shared by :func:`sdlc_core.db.enqueue_review`
+            and :func:`sdlc_core.db.log_interaction`, excluding ``db_path``.
 
         """
-        while True:
-            raw = input("\nOutcome? [A]ccept / [R]eject / [M]odified: ").strip().lower()
-            result = _OUTCOME_MAP.get(raw[:1] if raw else "")
-            if result is not None:
-                return result
-            print("  Enter A, R, or M.")
+        iteration = (
+            self._session.next_iteration(artifact_id) if artifact_id is not None else 1
+        )
+        return {
+            "run_id": self._session.run_id,
+            "sdlc_phase": self._session.active_phase,
+            "approach": self._session.approach,
+            "agent_role": agent_role,
+            "model": self.model_id,
+            "prompt": prompt,
+            "response": response,
+            "iteration": iteration,
+            "artifact_id": artifact_id,
+            "duration_seconds": int(ai_ms / 1000.0),
+            "duration_ms": ai_ms,
+            "prompt_tokens": token_usage.get("prompt_tokens") or None,
+            "completion_tokens": token_usage.get("completion_tokens") or None,
+        }
 
-    def _read_notes(self) -> str:
-        """Read a non-empty modification notes string from stdin.
 
-        Returns:
-            A non-empty string describing what was changed and why.
+# ---------------------------------------------------------------------------
+# Terminal review
+# ---------------------------------------------------------------------------
 
-        """
-        while True:
-            notes = input("Modification notes (required): ").strip()
-            if notes:
-                return notes
-            print("  Notes are required for modified outcomes.")
+
+def display_response(response: str) -> None:
+    """Print *response* between separator rules."""
+    print()
+    print(_SEPARATOR)
+    print("RESPONSE")
+    print(_SEPARATOR)
+    print(response)
+    print(_SEPARATOR)
+
+
+def capture_outcome() -> tuple[Outcome, str | None]:
+    """Prompt the researcher at the terminal to declare the interaction outcome.
+
+    Returns:
+        A tuple of (outcome, modification_notes). Notes are ``None`` unless
+        the outcome is ``accepted_with_modifications``.
+
+    """
+    outcome = _read_outcome()
+    notes = _read_notes() if outcome == Outcome.ACCEPTED_WITH_MODIFICATIONS else None
+    return outcome, notes
+
+
+def _review(row: dict[str, Any], recorder: SpanRecorder) -> dict[str, Any]:
+    """Display the response in *row*, capture the outcome, and return the full row."""
+    with _terminal_lock:
+        display_response(row["response"])
+        with recorder.span(SpanName.HUMAN_REVIEW):
+            outcome, notes = capture_outcome()
+    review_ms = recorder.duration_ms(SpanName.HUMAN_REVIEW) or 0.0
+
+    return {
+        **row,
+        "outcome": outcome,
+        "human_modified": outcome == Outcome.ACCEPTED_WITH_MODIFICATIONS,
+        "human_modification_notes": notes,
+        "human_review_seconds": int(review_ms / 1000.0),
+        "human_review_ms": review_ms,
+    }
+
+
+def _auto_accept(row: dict[str, Any]) -> dict[str, Any]:
+    """Return *row* completed as an unmodified acceptance with no review time."""
+    return {
+        **row,
+        "outcome": Outcome.ACCEPTED,
+        "human_modified": False,
+        "human_modification_notes": None,
+        "human_review_seconds": 0,
+        "human_review_ms": 0.0,
+    }
+
+
+def _add_shared_write(recorders: Sequence[SpanRecorder], write_start: float) -> None:
+    """Attribute one batched DB write, started at *write_start*, to every recorder."""
+    elapsed_ms = (time.perf_counter() - write_start) * 1000.0
+    for recorder in recorders:
+        recorder.add(
+            SpanName.DB_WRITE,
+            offset_ms=recorder.now_ms() - elapsed_ms,
+            duration_ms=elapsed_ms,
+        )
+
+
+def _read_outcome() -> Outcome:
+    """Read a valid outcome choice from stdin, re-prompting on invalid input.
+
+    Returns:
+        The resolved ``Outcome`` enum member.
+
+    """
+    while True:
+        raw = input("\nOutcome? [A]ccept / [R]eject / [M]odified: ").strip().lower()
+        result = _OUTCOME_MAP.get(raw[:1] if raw else "")
+        if result is not None:
+            return result
+        print("  Enter A, R, or M.")
+
+
+def _read_notes() -> str:
+    """Read a non-empty modification notes string from stdin.
+
+    Returns:
+        A non-empty string describing what was changed and why.
+
+    """
+    while True:
+        notes = input("Modification notes (required): ").strip()
+        if notes:
+            return notes
+        print("  Notes are required for modified outcomes.")
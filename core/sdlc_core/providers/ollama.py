@@ -45,6 +45,17 @@ def __init__(
         """Initialise the provider. See class docstring for parameters."""
         self._model_id = model_id
         self._api_base = api_base.rstrip("/")
+        self._last_time_to_first_token: float | None = None
+
+    @property
+    def last_time_to_first_token(self) -> float | None:
+        """Return the model-side time to first token of the last call, in seconds.
+
+        Derived from Ollama's ``load_duration`` and ``prompt_eval_duration``
+        (nanoseconds), which together cover everything before the first
+        generated token.  ``None`` when the daemon did not report them.
+        """
+        return self._last_time_to_first_token
 
     def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str:  # noqa: ANN401
         """Send *prompt* to the Ollama model and return the response text.
@@ -88,4 +99,16 @@ def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str
             messages=messages,
             options=options if options else None,
         )
+        self._last_time_to_first_token = _time_to_first_token(response)
         return str(response["message"]["content"])
+
+
+def _time_to_first_token(response: Any) -> float | None:  # noqa: ANN401
+    try:
+        load = response.get("load_duration")
+        prompt_eval = response.get("prompt_eval_duration")
+    except AttributeError:
+        return None
+    if not isinstance(load, int) or not isinstance(prompt_eval, int):
+        return None
+    return (load + prompt_eval) / 1e9
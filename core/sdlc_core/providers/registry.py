@@ -13,6 +13,19 @@
 Built-in provider keys
 ----------------------
 ``"ollama"``  → :class:`sdlc_core.providers.ollama.OllamaProvider`
+``"fake"``    → :class:`sdlc_core.providers.fake.FakeProvider` (offline, deterministic)
+``"recorded"`` → :class:`sdlc_core.replay.RecordedProvider` (recorded responses)
+
+Provider options
+----------------
+An optional ``options`` table in a models.toml entry is passed to the
+provider constructor as keyword arguments, after ``model_id`` and
+``api_base``:
+
+    [models.fake-slow]
+    provider = "fake"
+    model_id = "fake-slow"
+    options  = { latency_ms = 800, failure_rate = 0.05 }
 
 Registering a custom provider (decorator style)
 ------------------------------------------------
@@ -67,8 +80,18 @@ def _ollama_class() -> type:
     from sdlc_core.providers.ollama import OllamaProvider
     return OllamaProvider
 
+def _fake_class() -> type:
+    from sdlc_core.providers.fake import FakeProvider
+    return FakeProvider
+
+def _recorded_class() -> type:
+    from sdlc_core.replay import RecordedProvider
+    return RecordedProvider
+
 PROVIDER_CLASSES: dict[str, Any] = {
     "ollama": _ollama_class,
+    "fake": _fake_class,
+    "recorded": _recorded_class,
 }
 
 
@@ -171,7 +194,8 @@ def get_provider(model_name: str) -> ModelProvider:
     Raises:
         FileNotFoundError: If ``models.toml`` is missing.
         KeyError: If *model_name* has no entry in ``models.toml``.
-        ValueError: If the ``provider`` field names an unregistered class.
+        ValueError: If the ``provider`` field names an unregistered class,
+                    or ``options`` is not a table.
 
     """
     data = _load_models_toml()
@@ -215,6 +239,11 @@ def get_provider(model_name: str) -> ModelProvider:
     if api_base:
         init_kwargs["api_base"] = api_base
 
+    options = entry.get("options", {})
+    if not isinstance(options, dict):
+        raise ValueError(f"models.toml entry {model_name!r}: 'options' must be a table.")
+    init_kwargs.update(options)
+
     # Constructors that don't accept standard kwargs will receive no kwargs.
     if not init_kwargs:
         return cls()  # type: ignore[no-any-return]
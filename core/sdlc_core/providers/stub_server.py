@@ -0,0 +1,388 @@
+r"""stub_server.py: Local HTTP stub speaking the Ollama and OpenAI chat APIs.
+
+Serves :class:`~sdlc_core.providers.fake.FakeProvider` replies over HTTP, so
+the real ``OllamaProvider`` and ``OpenAIProvider`` (and anything else that
+speaks these APIs) can be measured without a model.  Point ``api_base`` at
+the stub:
+
+    [models.stub-ollama]
+    provider = "ollama"
+    model_id = "llama3"
+    api_base = "http://127.0.0.1:11435"
+
+    [models.stub-openai]
+    provider    = "openai"
+    model_id    = "gpt-4o"
+    api_key_env = ""
+    api_base    = "http://127.0.0.1:11435/v1"
+
+Endpoints
+---------
+    POST /api/chat             Ollama chat (NDJSON stream unless "stream": false)
+    GET  /api/tags             Ollama model list
+    POST /v1/chat/completions  OpenAI chat (SSE stream when "stream": true)
+    GET  /v1/models            OpenAI model list
+
+Streamed replies send the first chunk after the time to first token and
+spread the rest of the latency over the remaining tokens.  Injected failures
+answer with ``--failure-status`` (default 500) and each API's error body.
+
+Usage:
+    python -m sdlc_core.providers.stub_server --port 11435 --latency-ms 300
+    python -m sdlc_core.providers.stub_server --latency lognormal --latency-ms 800 \
+        --latency-spread-ms 400 --completion-tokens 256 --failure-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from sdlc_core.providers.fake import LATENCY_DISTRIBUTIONS, FakeProvider, FakeReply
+
+# ---------------------------------------------------------------------------
+# Request parsing
+# ---------------------------------------------------------------------------
+
+
+def _text(content: Any) -> str:  # noqa: ANN401
+    """Return the text of a message ``content`` (string or list of parts)."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(
+            str(part.get("text", "")) for part in content if isinstance(part, dict)
+        )
+    return ""
+
+
+def _prompt_and_system(messages: list[dict[str, Any]]) -> tuple[str, str | None]:
+    """Return the last user message and the joined system messages."""
+    prompt = ""
+    system_parts: list[str] = []
+    for message in messages:
+        role = message.get("role")
+        if role == "system":
+            system_parts.append(_text(message.get("content")))
+        elif role == "user":
+            prompt = _text(message.get("content"))
+    return prompt, "\n".join(system_parts) or None
+
+
+def _chunks(reply: FakeReply) -> Iterator[tuple[float, str]]:
+    """Yield ``(delay_seconds, text)`` pieces of a streamed reply."""
+    words = reply.text.split(" ")
+    rest = (reply.latency - reply.time_to_first_token) / max(1, len(words) - 1)
+    yield reply.time_to_first_token, words[0]
+    for word in words[1:]:
+        yield rest, " " + word
+
+
+# ---------------------------------------------------------------------------
+# Handler
+# ---------------------------------------------------------------------------
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StubServer
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: ANN401
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # -- routing -------------------------------------------------------------
+
+    def do_GET(self) -> None:  # noqa: N802
+        name = self.server.provider.model_id
+        if self.path == "/api/tags":
+            self._send_json(200, {"models": [{"name": name, "model": name}]})
+        elif self.path == "/v1/models":
+            self._send_json(
+                200, {"object": "list", "data": [{"id": name, "object": "model"}]}
+            )
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "request body is not valid JSON"})
+            return
+        if self.path == "/api/chat":
+            self._ollama_chat(body)
+        elif self.path == "/v1/chat/completions":
+            self._openai_chat(body)
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+
+    # -- Ollama --------------------------------------------------------------
+
+    def _ollama_chat(self, body: dict[str, Any]) -> None:
+        model = str(body.get("model") or self.server.provider.model_id)
+        reply = self.server.provider.plan(*_prompt_and_system(body.get("messages", [])))
+        if reply.failed:
+            time.sleep(reply.time_to_first_token)
+            self._send_json(self.server.failure_status, {"error": "injected failure"})
+            return
+
+        def _chunk(content: str, *, done: bool) -> dict[str, Any]:
+            return {
+                "model": model,
+                "created_at": datetime.now(UTC).isoformat(),
+                "message": {"role": "assistant", "content": content},
+                "done": done,
+            }
+
+        final = _chunk("", done=True) | {
+            "done_reason": "stop",
+            "total_duration": int(reply.latency * 1e9),
+            "load_duration": 0,
+            "prompt_eval_count": reply.prompt_tokens,
+            "prompt_eval_duration": int(reply.time_to_first_token * 1e9),
+            "eval_count": reply.completion_tokens,
+            "eval_duration": int((reply.latency - reply.time_to_first_token) * 1e9),
+        }
+        if not body.get("stream", True):
+            time.sleep(reply.latency)
+            final["message"]["content"] = reply.text
+            self._send_json(200, final)
+            return
+
+        self._start_chunked("application/x-ndjson")
+        for delay, piece in _chunks(reply):
+            time.sleep(delay)
+            self._write_chunk(json.dumps(_chunk(piece, done=False)) + "\n")
+        self._write_chunk(json.dumps(final) + "\n")
+        self._end_chunked()
+
+    # -- OpenAI --------------------------------------------------------------
+
+    def _openai_chat(self, body: dict[str, Any]) -> None:
+        model = str(body.get("model") or self.server.provider.model_id)
+        reply = self.server.provider.plan(*_prompt_and_system(body.get("messages", [])))
+        if reply.failed:
+            time.sleep(reply.time_to_first_token)
+            self._send_json(
+                self.server.failure_status,
+                {"error": {"message": "injected failure", "type": "server_error", "code": None}},
+            )
+            return
+
+        completion_id = f"chatcmpl-stub-{self.server.provider.calls}"
+        created = int(time.time())
+        if not body.get("stream", False):
+            time.sleep(reply.latency)
+            self._send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": reply.text},
+                    "finish_reason": "stop",
+                }],
+                "usage": reply.token_usage,
+            })
+            return
+
+        def _event(delta: dict[str, str], finish: str | None) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        self._start_chunked("text/event-stream")
+        for index, (delay, piece) in enumerate(_chunks(reply)):
+            time.sleep(delay)
+            delta = {"role": "assistant", "content": piece} if index == 0 else {"content": piece}
+            self._write_chunk(_event(delta, None))
+        self._write_chunk(_event({}, "stop"))
+        if (body.get("stream_options") or {}).get("include_usage"):
+            usage = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [],
+                "usage": reply.token_usage,
+            }
+            self._write_chunk(f"data: {json.dumps(usage)}\n\n")
+        self._write_chunk("data: [DONE]\n\n")
+        self._end_chunked()
+
+    # -- response helpers ----------------------------------------------------
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _start_chunked(self, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _write_chunk(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _end_chunked(self) -> None:
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering chat requests with *provider* replies.
+
+    Use as a context manager to serve from a background thread::
+
+        with StubServer(FakeProvider(latency_ms=50)) as server:
+            provider = OllamaProvider("llama3", api_base=server.url)
+
+    Args:
+        provider:       Source of replies, latency and failures.
+        host:           Interface to bind.
+        port:           Port to bind; ``0`` picks a free one.
+        failure_status: HTTP status returned for injected failures.
+        verbose:        Log every request to stderr.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        provider: FakeProvider | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        failure_status: int = 500,
+        verbose: bool = False,
+    ) -> None:
+        """Bind the server. See class docstring for parameters."""
+        super().__init__((host, port), _Handler)
+        self.provider = provider or FakeProvider()
+        self.failure_status = failure_status
+        self.verbose = verbose
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Return the base URL, e.g. ``http://127.0.0.1:11435``."""
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> StubServer:
+        """Start serving in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop serving and close the socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    """Parse command-line arguments and serve until interrupted."""
+    parser = argparse.ArgumentParser(
+        description="Local stub model server (Ollama and OpenAI-compatible chat APIs)."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=11435, help="Port (default: 11435)")
+    parser.add_argument("--model-id", default="fake", help="Model name to report")
+    parser.add_argument(
+        "--latency", choices=LATENCY_DISTRIBUTIONS, default="fixed",
+        help="Latency distribution (default: fixed)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean latency in ms")
+    parser.add_argument(
+        "--latency-spread-ms", type=float, default=0.0,
+        help="Half-width (uniform) or standard deviation (normal, lognormal) in ms",
+    )
+    parser.add_argument(
+        "--ttft-fraction", type=float, default=0.2,
+        help="Share of the latency before the first token (default: 0.2)",
+    )
+    parser.add_argument("--completion-tokens", type=int, default=32, help="Mean reply tokens")
+    parser.add_argument(
+        "--completion-tokens-spread", type=int, default=0, help="Uniform spread of reply tokens"
+    )
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Failure probability")
+    parser.add_argument("--fail-every", type=int, default=0, help="Also fail every N-th request")
+    parser.add_argument(
+        "--failure-status", type=int, default=500, help="HTTP status of failures (default: 500)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    try:
+        provider = FakeProvider(
+            args.model_id,
+            latency=args.latency,
+            latency_ms=args.latency_ms,
+            latency_spread_ms=args.latency_spread_ms,
+            ttft_fraction=args.ttft_fraction,
+            completion_tokens=args.completion_tokens,
+            completion_tokens_spread=args.completion_tokens_spread,
+            failure_rate=args.failure_rate,
+            fail_every=args.fail_every,
+            seed=args.seed,
+        )
+        server = StubServer(
+            provider, args.host, args.port,
+            failure_status=args.failure_status, verbose=args.verbose,
+        )
+    except (ValueError, OSError) as exc:
+        print(f"[sdlc_core.providers.stub_server] ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"[sdlc_core.providers.stub_server] Serving {args.model_id!r} on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""quantiles.py: Streaming percentile and histogram summaries for latency data.
+
+:class:`QuantileSketch` answers percentile queries over a stream of
+non-negative values.  It keeps every value while the stream is small and
+answers exactly (linear interpolation between closest ranks).  Once the
+stream exceeds ``exact_limit`` values it folds them into logarithmic
+buckets, HDR-histogram style: bucket ``i`` covers ``(gamma**(i-1), gamma**i]``
+with ``gamma = (1 + rel_error) / (1 - rel_error)``, so every reported
+percentile is within ``rel_error`` of a true sample value while memory stays
+bounded by the dynamic range rather than the stream length.
+
+:class:`FixedHistogram` counts values into caller-defined upper bounds, and
+:class:`LatencySummary` feeds both from a single ``add`` call so a metrics
+query only needs one pass over its rows.
+
+Usage::
+
+    summary = LatencySummary()
+    for (seconds,) in conn.execute("SELECT duration_seconds FROM interactions"):
+        summary.add(seconds)
+    report = summary.as_dict()   # count, min, max, mean, p50..p99, histogram
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+DEFAULT_PERCENTILES: tuple[float, ...] = (50, 90, 95, 99)
+
+# Upper bounds in seconds, covering sub-second local completions up to an
+# hour-long human review.
+DEFAULT_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600,
+)
+
+_DEFAULT_EXACT_LIMIT = 2048
+_DEFAULT_REL_ERROR = 0.01
+
+# Values at or below this are counted in the sketch's zero bucket
+_MIN_POSITIVE = 1e-9
+
+
+def exact_percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Return the *pct* percentile of non-empty *sorted_values* by linear interpolation.
+
+    Args:
+        sorted_values: Values in ascending order.
+        pct:           Percentile between 0 and 100.
+
+    Returns:
+        The interpolated value; matches ``numpy.percentile``'s default method.
+
+    """
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+class QuantileSketch:
+    """Percentile estimator, exact for small streams and bounded for large ones.
+
+    Args:
+        exact_limit: Number of values kept verbatim before switching to
+                     logarithmic buckets.
+        rel_error:   Relative accuracy of percentiles once bucketed.
+
+    Raises:
+        ValueError: If *exact_limit* is negative or *rel_error* is not in
+                    ``(0, 1)``.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        exact_limit: int = _DEFAULT_EXACT_LIMIT,
+        rel_error: float = _DEFAULT_REL_ERROR,
+    ) -> None:
+        """Create an empty sketch. See class docstring for parameters."""
+        if exact_limit < 0:
+            raise ValueError(f"exact_limit must be >= 0, got {exact_limit}")
+        if not 0 < rel_error < 1:
+            raise ValueError(f"rel_error must be in (0, 1), got {rel_error}")
+        self._exact_limit = exact_limit
+        self._gamma = (1 + rel_error) / (1 - rel_error)
+        self._log_gamma = math.log(self._gamma)
+        self._values: list[float] | None = []
+        self._buckets: dict[int, int] = {}
+        self._zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    @property
+    def is_exact(self) -> bool:
+        """Return ``True`` while every value is still held verbatim."""
+        return self._values is not None
+
+    def add(self, value: float) -> None:
+        """Record one value.
+
+        Raises:
+            ValueError: If *value* is negative or not finite.
+
+        """
+        if not math.isfinite(value) or value < 0:
+            raise ValueError(f"QuantileSketch accepts finite non-negative values, got {value}")
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        if self._values is not None:
+            self._values.append(value)
+            if len(self._values) > self._exact_limit:
+                values, self._values = self._values, None
+                for v in values:
+                    self._bucket(v)
+            return
+        self._bucket(value)
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Record every value in *values*."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Fold *other* into this sketch.
+
+        Raises:
+            ValueError: If the sketches were built with different accuracy.
+
+        """
+        if not math.isclose(self._gamma, other._gamma):
+            raise ValueError("Cannot merge sketches with different rel_error.")
+        if other._values is not None:
+            self.extend(other._values)
+            return
+        if self._values is not None:
+            values, self._values = self._values, None
+            for v in values:
+                self._bucket(v)
+        for index, n in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + n
+        self._zeros += other._zeros
+        self.count += other.count
+        self.total += other.total
+        for bound in (other.min, other.max):
+            if bound is not None:
+                self.min = bound if self.min is None else min(self.min, bound)
+                self.max = bound if self.max is None else max(self.max, bound)
+
+    def quantile(self, pct: float) -> float | None:
+        """Return the *pct* percentile (0-100), or ``None`` when empty.
+
+        ``pct`` 0 and 100 always return the exact :attr:`min` and :attr:`max`.
+
+        Raises:
+            ValueError: If *pct* is outside ``[0, 100]``.
+
+        """
+        if not 0 <= pct <= 100:
+            raise ValueError(f"pct must be between 0 and 100, got {pct}")
+        if self.count == 0:
+            return None
+        if self._values is not None:
+            return exact_percentile(sorted(self._values), pct)
+
+        assert self.min is not None and self.max is not None
+        # The extremes are tracked exactly; a bucket midpoint would only
+        # approximate them.
+        if pct <= 0:
+            return self.min
+        if pct >= 100:
+            return self.max
+        rank = pct / 100 * (self.count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return self.min
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket in relative terms
+                estimate = 2 * self._gamma**index / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def percentiles(
+        self, pcts: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> dict[str, float | None]:
+        """Return ``{"p50": ..., ...}`` for each percentile in *pcts*."""
+        if self._values is not None and self._values:
+            ordered = sorted(self._values)
+            return {_key(p): exact_percentile(ordered, p) for p in pcts}
+        return {_key(p): self.quantile(p) for p in pcts}
+
+    def _bucket(self, value: float) -> None:
+        if value <= _MIN_POSITIVE:
+            self._zeros += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+
+class FixedHistogram:
+    """Counts values into buckets with fixed inclusive upper bounds.
+
+    Args:
+        bounds: Strictly increasing upper bounds.  Values above the last
+                bound are counted in an overflow bucket.
+
+    Raises:
+        ValueError: If *bounds* is empty or not strictly increasing.
+
+    """
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS_SECONDS) -> None:
+        """Create a histogram with zeroed counts."""
+        if not bounds or any(b >= a for a, b in zip(bounds[1:], bounds, strict=False)):
+            raise ValueError("bounds must be a non-empty, strictly increasing sequence.")
+        self._bounds = tuple(float(b) for b in bounds)
+        self._counts = [0] * (len(self._bounds) + 1)
+
+    def add(self, value: float) -> None:
+        """Count *value* in the first bucket whose bound is >= *value*."""
+        self._counts[bisect_left(self._bounds, value)] += 1
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return ``[{"le": bound, "count": n}, ...]`` ending with ``"le": "+Inf"``."""
+        labels: list[float | str] = [*self._bounds, "+Inf"]
+        return [{"le": le, "count": n} for le, n in zip(labels, self._counts, strict=True)]
+
+
+class LatencySummary:
+    """Percentiles, mean and histogram of one latency series, fed in one pass.
+
+    Args:
+        bounds:      Histogram upper bounds, in the same unit as the values.
+        exact_limit: Forwarded to :class:`QuantileSketch`.
+        rel_error:   Forwarded to :class:`QuantileSketch`.
+
+    """
+
+    def __init__(
+        self,
+        bounds: Sequence[float] = DEFAULT_BUCKETS_SECONDS,
+        *,
+        exact_limit: int = _DEFAULT_EXACT_LIMIT,
+        rel_error: float = _DEFAULT_REL_ERROR,
+    ) -> None:
+        """Create an empty summary. See class docstring for parameters."""
+        self.sketch = QuantileSketch(exact_limit=exact_limit, rel_error=rel_error)
+        self.histogram = FixedHistogram(bounds)
+
+    def add(self, value: float | None) -> None:
+        """Record *value*; ``None`` (not measured) and negative values are skipped."""
+        if value is None or value < 0:
+            return
+        self.sketch.add(value)
+        self.histogram.add(value)
+
+    def as_dict(
+        self, pcts: Sequence[float] = DEFAULT_PERCENTILES, digits: int = 4
+    ) -> dict[str, Any]:
+        """Return a JSON-ready summary; statistics are ``None`` when empty."""
+        sketch = self.sketch
+        return {
+            "count": sketch.count,
+            "min": _round(sketch.min, digits),
+            "max": _round(sketch.max, digits),
+            "mean": _round(sketch.total / sketch.count if sketch.count else None, digits),
+            **{k: _round(v, digits) for k, v in sketch.percentiles(pcts).items()},
+            "exact": sketch.is_exact,
+            "histogram": self.histogram.as_list(),
+        }
+
+
+def _key(pct: float) -> str:
+    return f"p{pct:g}"
+
+
+def _round(value: float | None, digits: int) -> float | None:
+    return round(value, digits) if value is not None else None
@@ -0,0 +1,497 @@
+r"""replay.py: Re-execute recorded interactions against a provider.
+
+``interactions`` holds every prompt, response and model of a run.  This
+module turns that trace into a benchmark workload:
+
+* :func:`replay` streams interactions from a source ``experiment.db`` and
+  sends every prompt to a provider with bounded concurrency.  Given a
+  ``make_provider`` factory, each worker thread builds its own provider.  A
+  single shared provider that keeps ``last_token_usage`` on the instance
+  (every built-in provider except :class:`RecordedProvider`) would report
+  another thread's usage, so it is called from one thread only.  The answers
+  are written to a fresh target database, together with the run's
+  skeleton: runs, sessions, phase progress, model assignments, artifacts and
+  traceability links.  The recorded outcome, iteration and human
+  modification of each row are kept, so the metrics of the two databases can
+  be compared directly.
+* :class:`RecordedProvider` serves the recorded responses as a
+  deterministic provider.  Replaying with it measures the logging and
+  infrastructure path without any model.  It is also registered as the
+  ``"recorded"`` provider, so a pipeline can use it from models.toml:
+
+      [models.trace]
+      provider = "recorded"
+      options  = { source_db = "logs/experiment.db", realtime = true }
+
+Interactions are read in id order with ``fetchmany``, never loaded whole.
+Results are written in batches of ``--batch-size``, one transaction per
+batch, in the order of the source rows.
+
+Usage:
+    python -m sdlc_core.replay --source logs/experiment.db --target logs/replay.db \
+        --model llama3 --concurrency 8
+    python -m sdlc_core.replay --source logs/experiment.db --target logs/replay.db \
+        --recorded --run-id run-proj1-approach2-20260310
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sdlc_core.db import _connect, log_interactions, setup_db
+from sdlc_core.providers.base import ModelProvider
+from sdlc_core.quantiles import LatencySummary
+
+# Tables copied from the source so the replayed interactions keep their
+# run, phase and artifact context (foreign keys included), in FK order.
+_SKELETON_TABLES = (
+    "runs", "sessions", "phase_progress", "model_assignments", "artifacts", "traceability_links",
+)
+
+# Interaction columns carried over unchanged from the recorded row.
+_KEPT_COLUMNS = (
+    "run_id", "artifact_id", "timestamp", "sdlc_phase", "approach", "agent_role",
+    "iteration", "outcome", "human_modified", "human_modification_notes",
+    "human_review_seconds", "human_review_ms",
+)
+
+_FETCH_SIZE = 500
+
+
+# ---------------------------------------------------------------------------
+# Reading the source
+# ---------------------------------------------------------------------------
+
+def _open_source(source_db: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(f"file:{source_db}?mode=ro", uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def iter_interactions(
+    conn: sqlite3.Connection, run_ids: Sequence[str] | None = None
+) -> Iterator[sqlite3.Row]:
+    """Yield interaction rows in id order, optionally for *run_ids* only."""
+    sql = "SELECT * FROM interactions"
+    params: tuple[str, ...] = ()
+    if run_ids:
+        sql += f" WHERE run_id IN ({', '.join('?' * len(run_ids))})"
+        params = tuple(run_ids)
+    cursor = conn.execute(sql + " ORDER BY id", params)
+    while rows := cursor.fetchmany(_FETCH_SIZE):
+        yield from rows
+
+
+def _prompt_key(prompt: str) -> bytes:
+    return hashlib.sha256(prompt.encode("utf-8")).digest()
+
+
+# ---------------------------------------------------------------------------
+# Recorded provider
+# ---------------------------------------------------------------------------
+
+class RecordedProvider:
+    """Provider that answers each prompt with its recorded response.
+
+    Repeated prompts are answered with their recorded responses in the
+    original order (in call order when calls are concurrent).  When they
+    are used up, the last one is repeated.
+    Only prompt digests and row ids are held in memory.  A response is read
+    from the source database when it is served.
+
+    ``last_token_usage`` is kept per thread, so concurrent callers each see
+    the usage of their own call.
+
+    Args:
+        model_id:  Name reported for the model.
+        source_db: Database holding the recorded interactions.
+        run_ids:   Only serve responses recorded in these runs (all runs
+                   when ``None``), so identical prompts of other runs are
+                   never answered first.
+        realtime:  Sleep for each row's recorded ``duration_ms`` before
+                   answering, reproducing the original latency.
+
+    Raises:
+        FileNotFoundError: If *source_db* does not exist.
+
+    """
+
+    def __init__(
+        self,
+        model_id: str = "recorded",
+        *,
+        source_db: Path | str,
+        run_ids: Sequence[str] | None = None,
+        realtime: bool = False,
+    ) -> None:
+        """Index the recorded prompts. See class docstring for parameters."""
+        self._model_id = model_id
+        self._source_db = Path(source_db)
+        if not self._source_db.exists():
+            raise FileNotFoundError(f"Recorded database not found at {self._source_db}")
+        self._realtime = realtime
+        self._conn = _open_source(self._source_db)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._rows: dict[bytes, deque[int]] = defaultdict(deque)
+        for row in iter_interactions(self._conn, run_ids):
+            self._rows[_prompt_key(row["prompt"])].append(int(row["id"]))
+
+    @property
+    def last_token_usage(self) -> dict[str, int] | None:
+        """Return the recorded token usage of this thread's last call."""
+        return getattr(self._local, "token_usage", None)
+
+    @property
+    def last_time_to_first_token(self) -> float | None:
+        """Return ``None``; recorded interactions carry no first-token time."""
+        return None
+
+    def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str:  # noqa: ANN401
+        """Return the recorded response to *prompt*.
+
+        Args:
+            prompt: The user message; must match a recorded prompt exactly.
+            system: Ignored (interactions do not record system prompts).
+            **kwargs: Ignored.
+
+        Returns:
+            The recorded response text.
+
+        Raises:
+            KeyError: If *prompt* was never recorded.
+
+        """
+        with self._lock:
+            ids = self._rows.get(_prompt_key(prompt))
+            if not ids:
+                raise KeyError(f"No recorded response for prompt {prompt[:60]!r}")
+            row_id = ids.popleft() if len(ids) > 1 else ids[0]
+            row = self._conn.execute(
+                "SELECT response, duration_ms, duration_seconds, prompt_tokens, "
+                "completion_tokens FROM interactions WHERE id = ?",
+                (row_id,),
+            ).fetchone()
+
+        if self._realtime:
+            ms = row["duration_ms"]
+            if ms is None and row["duration_seconds"] is not None:
+                ms = row["duration_seconds"] * 1000.0
+            if ms:
+                time.sleep(ms / 1000.0)
+
+        if row["prompt_tokens"] is None and row["completion_tokens"] is None:
+            self._local.token_usage = None
+        else:
+            prompt_tokens = int(row["prompt_tokens"] or 0)
+            completion_tokens = int(row["completion_tokens"] or 0)
+            self._local.token_usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            }
+        return str(row["response"])
+
+    def close(self) -> None:
+        """Close the connection to the source database."""
+        self._conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Replay engine
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ReplayStats:
+    """Summary of one replay.
+
+    Attributes:
+        interactions:    Interactions written to the target database.
+        failures:        Prompts whose provider call raised; not written.
+        elapsed_seconds: Wall time of the whole replay.
+        throughput:      Replayed interactions per second.
+        concurrency:     Provider calls actually in flight at most.
+        latency:         Provider call latency summary in seconds
+                         (:meth:`~sdlc_core.quantiles.LatencySummary.as_dict`).
+        errors:          First few error messages, for diagnosis.
+
+    """
+
+    interactions: int = 0
+    failures: int = 0
+    elapsed_seconds: float = 0.0
+    throughput: float = 0.0
+    concurrency: int = 0
+    latency: dict[str, Any] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+
+
+def _copy_skeleton(target_db: Path, source_db: Path, run_ids: Sequence[str]) -> None:
+    """Copy the context rows of *run_ids* from *source_db* into *target_db*."""
+    with _connect(target_db) as conn:
+        conn.execute("ATTACH DATABASE ? AS src", (f"file:{source_db}?mode=ro",))
+        try:
+            marks = ", ".join("?" * len(run_ids))
+            for table in _SKELETON_TABLES:
+                src_cols = {r[1] for r in conn.execute(f"PRAGMA src.table_info({table})")}
+                cols = ", ".join(
+                    r[1] for r in conn.execute(f"PRAGMA main.table_info({table})")
+                    if r[1] in src_cols
+                )
+                key = "id" if table == "runs" else "run_id"
+                conn.execute(
+                    f"INSERT INTO main.{table} ({cols}) SELECT {cols} FROM src.{table} "
+                    f"WHERE {key} IN ({marks})",
+                    tuple(run_ids),
+                )
+            conn.commit()
+        finally:
+            conn.execute("DETACH DATABASE src")
+
+
+_CallResult = tuple[str, float, dict[str, int] | None]
+
+
+def _shares_usage_state(provider: ModelProvider) -> bool:
+    """Whether concurrent calls on *provider* overwrite each other's token usage."""
+    return hasattr(type(provider), "last_token_usage") and not isinstance(
+        provider, RecordedProvider
+    )
+
+
+def _call(get_provider: Callable[[], ModelProvider], prompt: str) -> _CallResult:
+    """Return the response, latency in seconds, and reported token usage."""
+    provider = get_provider()
+    t0 = time.perf_counter()
+    response = provider.complete(prompt)
+    elapsed = time.perf_counter() - t0
+    usage = getattr(provider, "last_token_usage", None)
+    return response, elapsed, usage if isinstance(usage, dict) else None
+
+
+def _provider_source(
+    provider: ModelProvider | None,
+    make_provider: Callable[[], ModelProvider] | None,
+    concurrency: int,
+) -> tuple[Callable[[], ModelProvider], int]:
+    """Return the worker threads' provider getter and the usable concurrency."""
+    if provider is not None and make_provider is None:
+        shared = provider
+        return (lambda: shared), 1 if _shares_usage_state(shared) else concurrency
+    if make_provider is not None and provider is None:
+        factory = make_provider
+        local = threading.local()
+
+        def get_provider() -> ModelProvider:
+            if not hasattr(local, "provider"):
+                local.provider = factory()
+            own: ModelProvider = local.provider
+            return own
+
+        return get_provider, concurrency
+    raise ValueError("Pass exactly one of provider and make_provider.")
+
+
+def replay(
+    source_db: Path,
+    target_db: Path,
+    provider: ModelProvider | None = None,
+    *,
+    make_provider: Callable[[], ModelProvider] | None = None,
+    model: str | None = None,
+    run_ids: Sequence[str] | None = None,
+    concurrency: int = 4,
+    batch_size: int = 200,
+) -> ReplayStats:
+    """Send every recorded prompt to *provider* and log the answers in *target_db*.
+
+    Args:
+        source_db:   Database holding the recorded interactions.
+        target_db:   New database to create; must not exist yet.
+        provider:    Provider that answers the prompts, shared by every
+                     worker.  When it keeps ``last_token_usage`` per
+                     instance, the calls run one at a time.
+        make_provider: Called once per worker thread to build its own
+                     provider; use it instead of *provider* for concurrent
+                     replays against a real model.
+        model:       Model name written to the replayed rows.  Defaults to
+                     the recorded model of each row.
+        run_ids:     Only replay these runs; all runs by default.
+        concurrency: Maximum provider calls in flight.
+        batch_size:  Interactions written per transaction.
+
+    Returns:
+        Counts, throughput and provider latency of the replay.
+
+    Raises:
+        FileNotFoundError: If *source_db* does not exist.
+        FileExistsError:   If *target_db* already exists.
+        ValueError:        If *concurrency* or *batch_size* is below 1, a
+                           requested run is not in the source, or not
+                           exactly one of *provider* and *make_provider* is
+                           given.
+
+    """
+    if concurrency < 1 or batch_size < 1:
+        raise ValueError("concurrency and batch_size must be at least 1.")
+    get_provider, concurrency = _provider_source(provider, make_provider, concurrency)
+    if not source_db.exists():
+        raise FileNotFoundError(f"Source database not found at {source_db}")
+    if target_db.exists():
+        raise FileExistsError(f"Target database already exists at {target_db}")
+
+    source = _open_source(source_db)
+    try:
+        known = [str(r[0]) for r in source.execute("SELECT id FROM runs ORDER BY id")]
+        selected = list(run_ids) if run_ids else known
+        missing = sorted(set(selected) - set(known))
+        if missing:
+            raise ValueError(f"Run(s) not in source database: {', '.join(missing)}")
+
+        setup_db(target_db)
+        _copy_skeleton(target_db, source_db, selected)
+
+        stats = ReplayStats(concurrency=concurrency)
+        latency = LatencySummary()
+        batch: list[dict[str, Any]] = []
+
+        def _finish(row: sqlite3.Row, future: Future[_CallResult]) -> None:
+            try:
+                response, elapsed, usage = future.result()
+            except Exception as exc:  # any provider error counts as a failure
+                stats.failures += 1
+                if len(stats.errors) < 5:
+                    stats.errors.append(f"interaction {row['id']}: {exc}")
+                return
+            latency.add(elapsed)
+            present = row.keys()
+            record = {c: row[c] if c in present else None for c in _KEPT_COLUMNS}
+            record["human_modified"] = bool(record["human_modified"])
+            batch.append(record | {
+                "model": model or row["model"],
+                "prompt": row["prompt"],
+                "response": response,
+                "duration_seconds": round(elapsed),
+                "duration_ms": elapsed * 1000.0,
+                "prompt_tokens": usage.get("prompt_tokens") if usage else None,
+                "completion_tokens": usage.get("completion_tokens") if usage else None,
+            })
+            if len(batch) >= batch_size:
+                stats.interactions += len(log_interactions(rows=batch, db_path=target_db))
+                batch.clear()
+
+        t0 = time.perf_counter()
+        pending: deque[tuple[sqlite3.Row, Future[_CallResult]]] = deque()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for row in iter_interactions(source, selected):
+                pending.append((row, pool.submit(_call, get_provider, row["prompt"])))
+                if len(pending) >= concurrency:
+                    _finish(*pending.popleft())
+            while pending:
+                _finish(*pending.popleft())
+        if batch:
+            stats.interactions += len(log_interactions(rows=batch, db_path=target_db))
+    finally:
+        source.close()
+
+    stats.elapsed_seconds = round(time.perf_counter() - t0, 4)
+    stats.throughput = round(
+        stats.interactions / stats.elapsed_seconds if stats.elapsed_seconds else 0.0, 2
+    )
+    stats.latency = latency.as_dict()
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    """Parse command-line arguments and replay the recorded interactions."""
+    parser = argparse.ArgumentParser(
+        description="Replay recorded interactions against a provider into a fresh DB."
+    )
+    parser.add_argument("--source", required=True, help="Recorded experiment DB.")
+    parser.add_argument("--target", required=True, help="New DB to write (must not exist).")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--model", help="models.toml entry to send the prompts to.")
+    mode.add_argument(
+        "--recorded", action="store_true", help="Answer with the recorded responses."
+    )
+    parser.add_argument(
+        "--realtime", action="store_true",
+        help="With --recorded, reproduce each recorded latency.",
+    )
+    parser.add_argument(
+        "--run-id", action="append", default=None, help="Replay this run (repeatable)."
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="Provider calls in flight (default: 4)."
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=200, help="Rows per write transaction (default: 200)."
+    )
+    parser.add_argument("--json", action="store_true", help="Emit JSON output.")
+    args = parser.parse_args()
+
+    source_db, target_db = Path(args.source), Path(args.target)
+    model: str | None = None
+    try:
+        if args.recorded:
+            recorded = RecordedProvider(
+                source_db=source_db, run_ids=args.run_id, realtime=args.realtime
+            )
+            try:
+                stats = replay(
+                    source_db, target_db, recorded,
+                    run_ids=args.run_id, concurrency=args.concurrency, batch_size=args.batch_size,
+                )
+            finally:
+                recorded.close()
+        else:
+            from sdlc_core.providers.registry import _load_models_toml, get_provider
+
+            get_provider(args.model)  # fail early on an unknown or broken entry
+            entry = _load_models_toml()["models"][args.model]
+            model = str(entry.get("model_id") or args.model)
+            stats = replay(
+                source_db, target_db, make_provider=lambda: get_provider(args.model),
+                model=model, run_ids=args.run_id, concurrency=args.concurrency,
+                batch_size=args.batch_size,
+            )
+    except (FileNotFoundError, FileExistsError, KeyError, ValueError) as exc:
+        print(f"[sdlc_core.replay] ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(asdict(stats), indent=2))
+        return
+    lat = stats.latency
+    print(
+        f"[sdlc_core.replay] {stats.interactions} interactions replayed into {target_db} "
+        f"in {stats.elapsed_seconds:.2f}s ({stats.throughput:.1f}/s, "
+        f"concurrency {stats.concurrency}), {stats.failures} failed"
+    )
+    if lat.get("count"):
+        print(
+            f"[sdlc_core.replay] provider latency p50 {lat['p50']:.3f}s  "
+            f"p90 {lat['p90']:.3f}s  p99 {lat['p99']:.3f}s"
+        )
+    for error in stats.errors:
+        print(f"[sdlc_core.replay] WARNING: {error}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
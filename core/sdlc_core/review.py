@@ -0,0 +1,142 @@
+"""review.py: CLI for draining the deferred human review queue.
+
+``LoggedProvider`` in deferred review mode writes each model response to
+``review_queue`` and returns without waiting for the researcher.  This
+command displays the queued responses oldest first, captures the outcome
+for each one, and writes the corresponding ``interactions`` row.
+``human_review_seconds`` is measured here, from display to outcome entry, and
+``human_review`` and ``db_write`` spans are added to the ones recorded when
+the response was queued.
+
+Usage::
+
+    sdlc-review                    # review everything pending
+    sdlc-review --run-id run-001   # one run only
+    sdlc-review --limit 5          # stop after five responses
+    sdlc-review --list             # show the queue without reviewing
+
+Stopping with Ctrl-C or Ctrl-D leaves the current and remaining responses
+pending; nothing is half-written.  A response completed by another
+``sdlc-review`` session while it was on screen is skipped, not logged twice.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any
+
+from sdlc_core import db
+from sdlc_core.enums import Outcome, SpanName
+from sdlc_core.providers.logged import capture_outcome, display_response
+from sdlc_core.spans import SpanRecorder
+
+
+def _die(message: str) -> None:
+    print(f"[review] ERROR: {message}", file=sys.stderr)
+    raise SystemExit(1)
+
+
+def _db_path(path_arg: str | None) -> Path:
+    return Path(path_arg) if path_arg else Path("logs") / "experiment.db"
+
+
+def _header(item: dict[str, Any]) -> str:
+    artifact = item["artifact_id"] or "exploratory"
+    return (
+        f"#{item['id']}  run={item['run_id']}  phase={item['sdlc_phase']}  "
+        f"artifact={artifact}  iteration={item['iteration']}  "
+        f"role={item['agent_role']}  model={item['model']}"
+    )
+
+
+def _print_queue(items: list[dict[str, Any]]) -> None:
+    for item in items:
+        first_line = item["prompt"].strip().splitlines()[0] if item["prompt"].strip() else ""
+        print(_header(item))
+        print(f"    queued {item['queued_at']}: {first_line[:80]}")
+    print(f"[review] {len(items)} response(s) pending.")
+
+
+def _review_one(item: dict[str, Any], db_path: Path) -> int:
+    print()
+    print(_header(item))
+    print("PROMPT")
+    print(item["prompt"])
+    display_response(item["response"])
+
+    recorder = SpanRecorder()
+    with recorder.span(SpanName.HUMAN_REVIEW):
+        outcome, notes = capture_outcome()
+    review_ms = recorder.duration_ms(SpanName.HUMAN_REVIEW) or 0.0
+
+    with recorder.span(SpanName.DB_WRITE):
+        interaction_id = db.complete_review(
+            review_id=item["id"],
+            outcome=outcome,
+            human_modified=outcome == Outcome.ACCEPTED_WITH_MODIFICATIONS,
+            human_modification_notes=notes,
+            human_review_seconds=int(review_ms / 1000.0),
+            human_review_ms=review_ms,
+            db_path=db_path,
+        )
+    db.log_spans(
+        rows=recorder.rows(
+            run_id=item["run_id"], interaction_id=interaction_id, review_id=item["id"]
+        ),
+        db_path=db_path,
+    )
+    return interaction_id
+
+
+def main() -> None:
+    """Parse arguments and review pending responses one at a time."""
+    parser = argparse.ArgumentParser(
+        prog="sdlc-review",
+        description="Record outcomes for model responses queued in deferred review mode.",
+    )
+    parser.add_argument("--run-id", default=None, help="Only review this run's queue.")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after N responses.")
+    parser.add_argument("--list", action="store_true", help="List pending responses and exit.")
+    parser.add_argument("--db", default=None, help="Path to experiment.db.")
+    args = parser.parse_args()
+
+    path = _db_path(args.db)
+    if not path.exists():
+        _die(f"Database not found at {path}. Run sdlc-setup first.")
+
+    try:
+        items = db.pending_reviews(run_id=args.run_id, limit=args.limit, db_path=path)
+    except sqlite3.OperationalError:
+        _die("The review_queue table is missing. Run sdlc-setup to update the schema.")
+        return
+
+    if not items:
+        print("[review] No responses awaiting review.")
+        return
+    if args.list:
+        _print_queue(items)
+        return
+
+    reviewed = 0
+    try:
+        for item in items:
+            try:
+                _review_one(item, path)
+            except ValueError:
+                # Another sdlc-review session completed it while it was shown.
+                print(f"[review] #{item['id']} was reviewed elsewhere; skipped.")
+                continue
+            reviewed += 1
+    except (KeyboardInterrupt, EOFError):
+        print()
+        print("[review] Stopped; the current response is still pending.")
+
+    remaining = len(db.pending_reviews(run_id=args.run_id, db_path=path))
+    print(f"[review] {reviewed} response(s) reviewed, {remaining} still pending.")
+
+
+if __name__ == "__main__":
+    main()
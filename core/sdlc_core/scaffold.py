@@ -275,6 +275,10 @@ def _models_example_toml() -> str:
 # startup_check_system  -> optional system message for the probe
 # startup_check_*       -> any additional startup check kwargs passed to provider.complete()
 #                         Example: startup_check_max_tokens = 8
+#
+# Token cost (optional, read by python -m sdlc_core.metrics --models-toml models.toml)
+# prompt_price_per_mtok     -> USD per million prompt tokens
+# completion_price_per_mtok -> USD per million completion tokens
 # -------------------------------------------------------------------------------
 
 # -- Ollama via LangChain (recommended: integrates with LangGraph natively) ---
@@ -322,6 +326,8 @@ def _models_example_toml() -> str:
 # model_id    = "gpt-4o"
 # api_key_env = "OPENAI_API_KEY"
 # api_base    = ""
+# prompt_price_per_mtok     = 2.50
+# completion_price_per_mtok = 10.00
 
 # [models.gemini-flash]
 # provider    = "gemini"
@@ -473,7 +479,12 @@ def _readme(
     run_phase_snippet = (
         "poetry run sdlc-hitl-run --phase 2 --agent-role requirements_analyst --artifact-id REQ-01"
         if approach == 1
-        else "poetry run sdlc-pipeline --phase 2"
+        else (
+            "poetry run sdlc-pipeline --phase 2\n"
+            "# or every phase of pipeline_contract.json in dependency order:\n"
+            "poetry run sdlc-pipeline --all --workers 4 --approve-reentry-by <name>\n"
+            "poetry run sdlc-pipeline --all --resume --approve-reentry-by <name>"
+        )
     )
     if core_source == "git":
         core_mode_text = (
@@ -1066,11 +1077,19 @@ def _pipeline_runner_py() -> str:
 from pathlib import Path
 from typing import Any
 
-from sdlc_core.db import get_model_assignment, log_pipeline_event, set_phase_status
+from sdlc_core.db import (
+    allocate_pipeline_id,
+    get_checkpoint,
+    get_model_assignment,
+    log_pipeline_event,
+    record_checkpoint,
+    set_phase_status,
+)
 from sdlc_core.enums import PhaseStatus, PipelineEventType
 from sdlc_core.prompt_validator import validate_prompt
 from sdlc_core.providers import LoggedProvider
 from sdlc_core.providers.registry import get_provider
+from sdlc_core.scheduler import Node, completed_nodes, latest_pipeline_id, load_graph, run_graph
 from sdlc_core.session import Session
 from .preflight import run_preflight
 
@@ -1155,35 +1174,161 @@ def _load_phase_prompt(phase: int, contract_prompt: str) -> str:
     raise ValueError(f"No prompt available for phase {phase}")
 
 
-def _next_pipeline_id(db_path: Path, run_id: str) -> str:
-    conn = sqlite3.connect(db_path)
-    try:
-        rows = conn.execute(
-                        \"\"\"
-            SELECT pipeline_id
-            FROM pipeline_events
-            WHERE run_id = ?
-              AND pipeline_id LIKE ?
-            ORDER BY id ASC
-                        \"\"\",
-            (run_id, f"PIPE-{run_id}-%"),
-        ).fetchall()
-    finally:
-        conn.close()
+def _load_contract() -> dict[str, Any]:
+    contract_path = Path("pipeline_contract.json")
+    if not contract_path.exists():
+        raise ValueError("pipeline_contract.json not found.")
+    return dict(json.loads(contract_path.read_text(encoding="utf-8")))
+
+
+def _execute(
+    *,
+    db_path: Path,
+    run_id: str,
+    pipeline_id: str,
+    phase: int,
+    step: str,
+    model_name: str,
+    prompt: str,
+    artifact_id: str | None,
+    agent_role: str,
+) -> None:
+    # Validates and sends one prompt, logging a retry event per failed attempt
+    # within the phase budget.  The last failure is re-raised.  A step whose
+    # checkpoint exists in this pipeline already has its output logged.
+    checkpoint = get_checkpoint(
+        pipeline_id=pipeline_id,
+        phase=phase,
+        artifact_id=artifact_id,
+        prompt=prompt,
+        db_path=db_path,
+    )
+    if checkpoint is not None:
+        print(f"[pipeline] {step}: checkpoint found, skipping model call")
+        return
+
+    contract_phase = _load_contract_phase(phase)
+    max_attempts = int(contract_phase["max_retries"]) + 1
+    for attempt in range(1, max_attempts + 1):
+        try:
+            session = Session(run_id=run_id, approach=2, active_phase=phase, db_path=db_path)
+            validate_prompt(
+                prompt,
+                session=session,
+                artifact_id=artifact_id,
+                db_path=db_path,
+                strict=True,
+            )
+            provider = LoggedProvider(get_provider(model_name), session=session)
+            provider.complete(prompt, agent_role=agent_role, artifact_id=artifact_id)
+        except Exception as exc:  # pragma: no cover - exercised in generated repos
+            if attempt == max_attempts:
+                raise
+            log_pipeline_event(
+                run_id=run_id,
+                pipeline_id=pipeline_id,
+                step=step,
+                agent_role=agent_role,
+                event_type=PipelineEventType.RETRY,
+                detail=f"Attempt {attempt}/{max_attempts} failed: {type(exc).__name__}: {exc}",
+                artifact_id=artifact_id,
+                db_path=db_path,
+            )
+            continue
+        record_checkpoint(
+            run_id=run_id,
+            pipeline_id=pipeline_id,
+            phase=phase,
+            artifact_id=artifact_id,
+            prompt=prompt,
+            interaction_id=provider.last_interaction_id,
+            db_path=db_path,
+        )
+        return
+
 
-    max_index = 0
-    for row in rows:
-        pipeline_id = str(row[0])
-        suffix = pipeline_id.rsplit("-", 1)[-1]
-        if suffix.isdigit():
-            max_index = max(max_index, int(suffix))
+def _pipeline_id_for(args: argparse.Namespace, db_path: Path, run_id: str) -> str:
+    if args.resume is None:
+        return allocate_pipeline_id(run_id=run_id, db_path=db_path)
+    pipeline_id = args.resume or latest_pipeline_id(run_id, db_path=db_path)
+    if not pipeline_id:
+        raise SystemExit("No pipeline to resume for this run.")
+    return pipeline_id
 
-    return f"PIPE-{run_id}-{max_index + 1:02d}"
+
+def _run_all(args: argparse.Namespace, db_path: Path, run_id: str) -> None:
+    graph = load_graph(_load_contract())
+    pipeline_id = _pipeline_id_for(args, db_path, run_id)
+
+    done = completed_nodes(run_id, pipeline_id, db_path=db_path)
+    open_phases = sorted({node.phase for node in graph.values() if node.id not in done})
+    for phase in open_phases:
+        if not bool(_load_contract_phase(phase)["requires_reentry_approval"]):
+            continue
+        if not args.approve_reentry_by:
+            log_pipeline_event(
+                run_id=run_id,
+                pipeline_id=pipeline_id,
+                step=f"phase{phase}",
+                agent_role=args.agent_role,
+                event_type=PipelineEventType.HALT,
+                detail="Missing required --approve-reentry-by for this phase.",
+                db_path=db_path,
+            )
+            raise SystemExit(f"Phase {phase} requires --approve-reentry-by.")
+        log_pipeline_event(
+            run_id=run_id,
+            pipeline_id=pipeline_id,
+            step=f"phase{phase}",
+            agent_role=args.agent_role,
+            event_type=PipelineEventType.REENTRY_APPROVAL,
+            detail=f"Re-entry approved by {args.approve_reentry_by}.",
+            db_path=db_path,
+        )
+
+    def _run_node(node: Node) -> None:
+        _execute(
+            db_path=db_path,
+            run_id=run_id,
+            pipeline_id=pipeline_id,
+            phase=node.phase,
+            step=node.id,
+            model_name=_model_for_phase(db_path, run_id, node.phase),
+            prompt=_load_phase_prompt(node.phase, node.prompt),
+            artifact_id=node.artifact_id,
+            agent_role=args.agent_role,
+        )
+
+    result = run_graph(
+        graph,
+        _run_node,
+        run_id=run_id,
+        pipeline_id=pipeline_id,
+        workers=args.workers,
+        agent_role=args.agent_role,
+        db_path=db_path,
+    )
+    print(
+        f"[pipeline] {pipeline_id}: {len(result.executed)} executed, "
+        f"{len(result.skipped)} already done, {len(result.failed)} failed, "
+        f"{len(result.pending)} not started"
+    )
+    for node_id, error in result.failed.items():
+        print(f"  - {node_id}: {error}")
+    if not result.ok:
+        print(f"Resume with: sdlc-pipeline --all --resume {pipeline_id}")
+        raise SystemExit(1)
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Run one autonomous pipeline phase.")
-    parser.add_argument("--phase", type=int, required=True, choices=range(2, 9))
+    parser = argparse.ArgumentParser(description="Run autonomous pipeline phases.")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--phase", type=int, choices=range(2, 9))
+    target.add_argument(
+        "--all",
+        action="store_true",
+        help="Run every phase of pipeline_contract.json in dependency order.",
+    )
     parser.add_argument("--run-id", default=None)
     parser.add_argument("--artifact-id", default=None)
     parser.add_argument("--agent-role", default="pipeline_orchestrator")
@@ -1192,6 +1337,23 @@ def main() -> None:
         default=None,
         help="Required approver identity when contract requires re-entry approval.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="With --all: maximum number of artifacts produced at once.",
+    )
+    parser.add_argument(
+        "--resume",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PIPELINE_ID",
+        help=(
+            "Continue a pipeline (default: the latest one) instead of starting a new one; "
+            "steps with a checkpoint are skipped."
+        ),
+    )
     args = parser.parse_args()
 
     if run_preflight(phase=args.phase, strict=True, quiet=False) != 0:
@@ -1199,10 +1361,14 @@ def main() -> None:
 
     db_path = Path("logs") / "experiment.db"
     run_id = _resolve_run_id(db_path, args.run_id)
+    if args.all:
+        _run_all(args, db_path, run_id)
+        return
+
     contract_phase = _load_contract_phase(args.phase)
     model_name = _model_for_phase(db_path, run_id, args.phase)
     prompt = _load_phase_prompt(args.phase, str(contract_phase["prompt"]))
-    pipeline_id = _next_pipeline_id(db_path, run_id)
+    pipeline_id = _pipeline_id_for(args, db_path, run_id)
 
     if bool(contract_phase["requires_reentry_approval"]):
         if not args.approve_reentry_by:
@@ -1234,7 +1400,7 @@ def main() -> None:
         pipeline_id=pipeline_id,
         step=f"phase{args.phase}",
         agent_role=args.agent_role,
-        event_type=PipelineEventType.RESUME,
+        event_type=PipelineEventType.STEP_START,
         detail="Phase execution started",
         artifact_id=args.artifact_id,
         db_path=db_path,
@@ -1247,66 +1413,51 @@ def main() -> None:
         db_path=db_path,
     )
 
-    retry_budget = int(contract_phase["max_retries"])
-    max_attempts = retry_budget + 1
-    for attempt in range(1, max_attempts + 1):
-        try:
-            session = Session(run_id=run_id, approach=2, active_phase=args.phase, db_path=db_path)
-            validate_prompt(
-                prompt,
-                session=session,
-                artifact_id=args.artifact_id,
-                db_path=db_path,
-                strict=True,
-            )
-            provider = LoggedProvider(get_provider(model_name), session=session)
-            provider.complete(prompt, agent_role=args.agent_role, artifact_id=args.artifact_id)
-            break
-        except Exception as exc:  # pragma: no cover - exercised in generated repos
-            if attempt < max_attempts:
-                log_pipeline_event(
-                    run_id=run_id,
-                    pipeline_id=pipeline_id,
-                    step=f"phase{args.phase}",
-                    agent_role=args.agent_role,
-                    event_type=PipelineEventType.RETRY,
-                    detail=f"Attempt {attempt}/{max_attempts} failed: {type(exc).__name__}: {exc}",
-                    artifact_id=args.artifact_id,
-                    db_path=db_path,
-                )
-                continue
-
-            log_pipeline_event(
-                run_id=run_id,
-                pipeline_id=pipeline_id,
-                step=f"phase{args.phase}",
-                agent_role=args.agent_role,
-                event_type=PipelineEventType.GATE_FAIL,
-                detail=f"Final attempt failed: {type(exc).__name__}: {exc}",
-                artifact_id=args.artifact_id,
-                db_path=db_path,
-            )
-            log_pipeline_event(
-                run_id=run_id,
-                pipeline_id=pipeline_id,
-                step=f"phase{args.phase}",
-                agent_role=args.agent_role,
-                event_type=PipelineEventType.CIRCUIT_BREAK,
-                detail="Retry budget exhausted; circuit breaker triggered.",
-                artifact_id=args.artifact_id,
-                db_path=db_path,
-            )
-            log_pipeline_event(
-                run_id=run_id,
-                pipeline_id=pipeline_id,
-                step=f"phase{args.phase}",
-                agent_role=args.agent_role,
-                event_type=PipelineEventType.HALT,
-                detail="Execution halted pending human intervention.",
-                artifact_id=args.artifact_id,
-                db_path=db_path,
-            )
-            raise SystemExit(1) from exc
+    max_attempts = int(contract_phase["max_retries"]) + 1
+    try:
+        _execute(
+            db_path=db_path,
+            run_id=run_id,
+            pipeline_id=pipeline_id,
+            phase=args.phase,
+            step=f"phase{args.phase}",
+            model_name=model_name,
+            prompt=prompt,
+            artifact_id=args.artifact_id,
+            agent_role=args.agent_role,
+        )
+    except Exception as exc:  # pragma: no cover - exercised in generated repos
+        log_pipeline_event(
+            run_id=run_id,
+            pipeline_id=pipeline_id,
+            step=f"phase{args.phase}",
+            agent_role=args.agent_role,
+            event_type=PipelineEventType.GATE_FAIL,
+            detail=f"Final attempt failed: {type(exc).__name__}: {exc}",
+            artifact_id=args.artifact_id,
+            db_path=db_path,
+        )
+        log_pipeline_event(
+            run_id=run_id,
+            pipeline_id=pipeline_id,
+            step=f"phase{args.phase}",
+            agent_role=args.agent_role,
+            event_type=PipelineEventType.CIRCUIT_BREAK,
+            detail="Retry budget exhausted; circuit breaker triggered.",
+            artifact_id=args.artifact_id,
+            db_path=db_path,
+        )
+        log_pipeline_event(
+            run_id=run_id,
+            pipeline_id=pipeline_id,
+            step=f"phase{args.phase}",
+            agent_role=args.agent_role,
+            event_type=PipelineEventType.HALT,
+            detail="Execution halted pending human intervention.",
+            artifact_id=args.artifact_id,
+            db_path=db_path,
+        )
+        raise SystemExit(1) from exc
 
     log_pipeline_event(
         run_id=run_id,
@@ -1434,6 +1585,8 @@ def _scaffold(
             "phases": {
                 str(phase): {
                     "name": _PHASE_NAMES[phase],
+                    "depends_on": [phase - 1] if phase > 2 else [],
+                    "artifacts": [],
                     "inputs": [],
                     "outputs": [],
                     "acceptance_criteria": [],
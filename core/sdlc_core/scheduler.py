@@ -0,0 +1,349 @@
+"""scheduler.py: Run the phases of an Approach 2 pipeline as a dependency graph.
+
+The graph is read from the ``phases`` section of ``pipeline_contract.json``.
+Each phase may declare:
+
+* ``depends_on``: phase numbers that must finish first.  When the key is
+  absent the phase depends on the previous phase of the contract, so an
+  unchanged contract chains phases 2 to 8 in order.
+* ``artifacts``: independent artifacts produced by the phase, each
+  ``{"id": "DESIGN-01", "prompt": "...", "depends_on": ["DESIGN-00"]}``.
+  ``prompt`` and ``depends_on`` are optional; ``depends_on`` names other
+  artifacts of the same phase.  A phase without artifacts is one node.
+
+Node ids are ``"phase<N>"`` or ``"phase<N>:<artifact id>"`` and are used as
+the ``step`` of every pipeline event.  A node waits for all nodes of the
+phases it depends on and for its own artifact dependencies.
+
+:func:`run_graph` starts every ready node on a thread pool, at most
+``workers`` at a time.  Only the node callback runs on the pool; every
+database write happens on the calling thread:
+
+* ``step_start`` when a node starts and ``gate_pass`` when it succeeds;
+* ``phase_progress`` set to ``in_progress`` when the first node of a phase
+  starts and to ``completed`` when its last node passes;
+* ``gate_fail`` for a node whose callback raised, then, once the nodes
+  already running have finished, ``circuit_break`` and ``halt``.  No new
+  node is started after a failure.
+
+Progress is therefore the ``gate_pass`` events of a pipeline id.  Calling
+:func:`run_graph` again with the same ``pipeline_id`` skips those nodes
+and continues from where the interrupted run stopped.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from graphlib import CycleError, TopologicalSorter
+from pathlib import Path
+from typing import Any
+
+from sdlc_core import db
+from sdlc_core.enums import PhaseStatus, PipelineEventType
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Node:
+    """One schedulable unit of work.
+
+    Attributes:
+        id:          ``"phase<N>"`` or ``"phase<N>:<artifact id>"``.
+        phase:       SDLC phase number.
+        artifact_id: Artifact produced by the node, or ``None`` for a
+                     phase-level node.
+        prompt:      Prompt from the contract; empty when the runner should
+                     fall back to ``prompts/phase<N>.md``.
+        depends_on:  Ids of the nodes that must pass first.
+
+    """
+
+    id: str
+    phase: int
+    artifact_id: str | None
+    prompt: str
+    depends_on: tuple[str, ...]
+
+
+def _node_id(phase: int, artifact_id: str | None = None) -> str:
+    return f"phase{phase}" if artifact_id is None else f"phase{phase}:{artifact_id}"
+
+
+def load_graph(contract: Mapping[str, Any]) -> dict[str, Node]:
+    """Build the node graph from a parsed ``pipeline_contract.json``.
+
+    Args:
+        contract: The contract as returned by ``json.loads``.
+
+    Returns:
+        Nodes keyed by id, in topological order.
+
+    Raises:
+        ValueError: If the ``phases`` section is malformed, names an
+            unknown dependency, or contains a cycle.
+
+    """
+    phases_cfg = contract.get("phases", {})
+    if not isinstance(phases_cfg, Mapping):
+        raise ValueError("pipeline contract 'phases' must be an object")
+    try:
+        phases = sorted(int(key) for key in phases_cfg)
+    except ValueError as exc:
+        raise ValueError(f"pipeline contract phase keys must be numbers: {exc}") from exc
+
+    artifacts_by_phase: dict[int, list[str]] = {}
+    nodes: dict[str, Node] = {}
+    for index, phase in enumerate(phases):
+        cfg = phases_cfg[str(phase)]
+        if not isinstance(cfg, Mapping):
+            raise ValueError(f"Invalid contract structure for phase {phase}")
+
+        default_deps = [phases[index - 1]] if index else []
+        phase_deps = [int(dep) for dep in cfg.get("depends_on", default_deps)]
+        for dep in phase_deps:
+            if str(dep) not in phases_cfg:
+                raise ValueError(f"Phase {phase} depends on unknown phase {dep}")
+        upstream = tuple(f"phase{dep}" for dep in phase_deps)
+        phase_prompt = str(cfg.get("prompt", "")).strip()
+
+        artifacts = cfg.get("artifacts", [])
+        if not isinstance(artifacts, list):
+            raise ValueError(f"Phase {phase} 'artifacts' must be a list")
+        if not artifacts:
+            artifacts_by_phase[phase] = []
+            nodes[_node_id(phase)] = Node(_node_id(phase), phase, None, phase_prompt, upstream)
+            continue
+
+        ids = [str(a.get("id", "")).strip() if isinstance(a, Mapping) else "" for a in artifacts]
+        if not all(ids) or len(set(ids)) != len(ids):
+            raise ValueError(f"Phase {phase} artifacts need unique, non-empty ids")
+        artifacts_by_phase[phase] = ids
+        for artifact, artifact_id in zip(artifacts, ids, strict=True):
+            local_deps = [str(local) for local in artifact.get("depends_on", [])]
+            for local in local_deps:
+                if local not in ids:
+                    raise ValueError(
+                        f"Artifact {artifact_id} of phase {phase} depends on unknown "
+                        f"artifact {local}"
+                    )
+            node_id = _node_id(phase, artifact_id)
+            nodes[node_id] = Node(
+                node_id,
+                phase,
+                artifact_id,
+                str(artifact.get("prompt", "")).strip() or phase_prompt,
+                upstream + tuple(_node_id(phase, local) for local in local_deps),
+            )
+
+    # Phase-level dependencies expand to every node of the upstream phase.
+    def _expand(dep: str) -> list[str]:
+        if ":" in dep:
+            return [dep]
+        phase = int(dep.removeprefix("phase"))
+        return [_node_id(phase, a) for a in artifacts_by_phase[phase]] or [dep]
+
+    expanded = {
+        node_id: Node(
+            node.id, node.phase, node.artifact_id, node.prompt,
+            tuple(dict.fromkeys(d for dep in node.depends_on for d in _expand(dep))),
+        )
+        for node_id, node in nodes.items()
+    }
+    try:
+        order = TopologicalSorter(
+            {node_id: node.depends_on for node_id, node in expanded.items()}
+        ).static_order()
+        return {node_id: expanded[node_id] for node_id in order}
+    except CycleError as exc:
+        raise ValueError(f"pipeline contract has a dependency cycle: {exc.args[1]}") from exc
+
+
+# ---------------------------------------------------------------------------
+# Progress
+# ---------------------------------------------------------------------------
+
+
+def completed_nodes(
+    run_id: str, pipeline_id: str, db_path: Path | None = None
+) -> set[str]:
+    """Return the node ids that already passed in a pipeline.
+
+    Args:
+        run_id:      Run the pipeline belongs to.
+        pipeline_id: Pipeline whose progress is read.
+        db_path:     Path to ``experiment.db``.
+
+    """
+    conn = sqlite3.connect(db_path or db._default_db_path())
+    try:
+        rows = conn.execute(
+            "SELECT DISTINCT step FROM pipeline_events "
+            "WHERE run_id = ? AND pipeline_id = ? AND event_type = ?",
+            (run_id, pipeline_id, PipelineEventType.GATE_PASS.value),
+        ).fetchall()
+    finally:
+        conn.close()
+    return {str(row[0]) for row in rows}
+
+
+def latest_pipeline_id(run_id: str, db_path: Path | None = None) -> str | None:
+    """Return the pipeline id of the most recent pipeline event of a run, if any."""
+    conn = sqlite3.connect(db_path or db._default_db_path())
+    try:
+        row = conn.execute(
+            "SELECT pipeline_id FROM pipeline_events WHERE run_id = ? ORDER BY id DESC LIMIT 1",
+            (run_id,),
+        ).fetchone()
+    finally:
+        conn.close()
+    return None if row is None else str(row[0])
+
+
+# ---------------------------------------------------------------------------
+# Scheduling
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ScheduleResult:
+    """Outcome of one :func:`run_graph` call.
+
+    Attributes:
+        pipeline_id: Pipeline the events were written under.
+        executed:    Nodes that passed during this call, in completion order.
+        skipped:     Nodes that had already passed before this call.
+        failed:      Failed nodes and their error message.
+        pending:     Nodes never started because the pipeline halted.
+
+    """
+
+    pipeline_id: str
+    executed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    pending: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """``True`` when every node has passed."""
+        return not self.failed and not self.pending
+
+
+def run_graph(
+    graph: Mapping[str, Node],
+    execute: Callable[[Node], object],
+    *,
+    run_id: str,
+    pipeline_id: str,
+    workers: int = 4,
+    agent_role: str = "pipeline_orchestrator",
+    db_path: Path | None = None,
+) -> ScheduleResult:
+    """Execute *graph*, running independent nodes concurrently.
+
+    Args:
+        graph:       Nodes from :func:`load_graph`.
+        execute:     Called once per node on a worker thread.  It should
+                     handle its own retries; raising marks the node failed
+                     and halts the pipeline.
+        run_id:      Run the events belong to.
+        pipeline_id: Pipeline id for every event; reuse it to resume.
+        workers:     Maximum number of nodes running at once.
+        agent_role:  ``agent_role`` of the scheduler's pipeline events.
+        db_path:     Path to ``experiment.db``.
+
+    Returns:
+        A :class:`ScheduleResult`.
+
+    Raises:
+        ValueError: If *workers* is below 1.
+
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    def _event(node: Node | None, event_type: PipelineEventType, detail: str) -> None:
+        db.log_pipeline_event(
+            run_id=run_id,
+            pipeline_id=pipeline_id,
+            step=node.id if node else "pipeline",
+            agent_role=agent_role,
+            event_type=event_type,
+            detail=detail,
+            artifact_id=node.artifact_id if node else None,
+            db_path=db_path,
+        )
+
+    result = ScheduleResult(pipeline_id=pipeline_id)
+    done = completed_nodes(run_id, pipeline_id, db_path) & set(graph)
+    result.skipped = [node_id for node_id in graph if node_id in done]
+    remaining = {phase: 0 for phase in (node.phase for node in graph.values())}
+    for node in graph.values():
+        if node.id not in done:
+            remaining[node.phase] += 1
+    started_phases: set[int] = set()
+    running: dict[Future[object], Node] = {}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sdlc-node") as pool:
+        while True:
+            if not result.failed:
+                for node in graph.values():
+                    if len(running) >= workers:
+                        break
+                    if (
+                        node.id in done
+                        or node in running.values()
+                        or not all(dep in done for dep in node.depends_on)
+                    ):
+                        continue
+                    if node.phase not in started_phases:
+                        started_phases.add(node.phase)
+                        db.set_phase_status(
+                            run_id=run_id,
+                            phase_number=node.phase,
+                            status=PhaseStatus.IN_PROGRESS,
+                            db_path=db_path,
+                        )
+                    _event(node, PipelineEventType.STEP_START, "Node execution started")
+                    running[pool.submit(execute, node)] = node
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                node = running.pop(future)
+                exc = future.exception()
+                if exc is not None:
+                    message = f"{type(exc).__name__}: {exc}"
+                    result.failed[node.id] = message
+                    _event(node, PipelineEventType.GATE_FAIL, f"Node failed: {message}")
+                    continue
+                done.add(node.id)
+                result.executed.append(node.id)
+                _event(node, PipelineEventType.GATE_PASS, "Node execution completed")
+                remaining[node.phase] -= 1
+                if remaining[node.phase] == 0:
+                    db.set_phase_status(
+                        run_id=run_id,
+                        phase_number=node.phase,
+                        status=PhaseStatus.COMPLETED,
+                        db_path=db_path,
+                    )
+
+    result.pending = [
+        node_id for node_id in graph if node_id not in done and node_id not in result.failed
+    ]
+    if result.failed:
+        _event(
+            None,
+            PipelineEventType.CIRCUIT_BREAK,
+            f"Node failure stopped scheduling; {len(result.pending)} node(s) not started.",
+        )
+        _event(None, PipelineEventType.HALT, "Execution halted pending human intervention.")
+    return result
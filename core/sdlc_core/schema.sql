@@ -108,6 +108,8 @@ CREATE TABLE IF NOT EXISTS interactions (
     human_review_seconds        INTEGER,   -- time from response display to outcome entry
     prompt_tokens               INTEGER,   -- token count of the submitted prompt
     completion_tokens           INTEGER,   -- token count of the model response
+    duration_ms                 REAL,      -- duration_seconds at millisecond resolution
+    human_review_ms             REAL,      -- human_review_seconds at millisecond resolution
     FOREIGN KEY (artifact_id, run_id) REFERENCES artifacts (id, run_id),
     CHECK (
         (human_modified = 0 AND human_modification_notes IS NULL) OR
@@ -115,6 +117,59 @@ CREATE TABLE IF NOT EXISTS interactions (
     )
 );
 
+-- ---------------------------------------------------------------------------
+-- review_queue
+-- One row per model response awaiting the researcher's outcome decision.
+-- Written by LoggedProvider in deferred review mode; drained by sdlc-review,
+-- which writes the matching interactions row and links it via interaction_id.
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS review_queue (
+    id                  INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id              TEXT    NOT NULL REFERENCES runs (id),
+    artifact_id         TEXT,              -- NULL for exploratory prompts
+    queued_at           TEXT    NOT NULL,  -- ISO 8601; becomes the interaction timestamp
+    sdlc_phase          INTEGER NOT NULL CHECK (sdlc_phase BETWEEN 2 AND 8),
+    approach            INTEGER NOT NULL CHECK (approach IN (1, 2)),
+    agent_role          TEXT    NOT NULL,
+    model               TEXT    NOT NULL,
+    prompt              TEXT    NOT NULL,
+    response            TEXT    NOT NULL,
+    iteration           INTEGER NOT NULL CHECK (iteration >= 1),
+    duration_seconds    INTEGER,           -- AI response latency only
+    prompt_tokens       INTEGER,
+    completion_tokens   INTEGER,
+    duration_ms         REAL,              -- duration_seconds at millisecond resolution
+    reviewed_at         TEXT,              -- ISO 8601; NULL while pending
+    interaction_id      INTEGER REFERENCES interactions (id),
+    FOREIGN KEY (artifact_id, run_id) REFERENCES artifacts (id, run_id),
+    CHECK ((reviewed_at IS NULL) = (interaction_id IS NULL))
+);
+
+-- ---------------------------------------------------------------------------
+-- spans
+-- One row per timed phase of an interaction (prompt validation, provider call,
+-- first token, DB write, human review).  Written by LoggedProvider and
+-- sdlc-review.  A deferred response's spans carry review_id first and gain
+-- interaction_id when the review is completed.
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS spans (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id          TEXT    NOT NULL REFERENCES runs (id),
+    interaction_id  INTEGER REFERENCES interactions (id),
+    review_id       INTEGER REFERENCES review_queue (id),
+    name            TEXT    NOT NULL CHECK (name IN (
+                        'prompt_validation', 'provider_call', 'first_token',
+                        'db_write', 'human_review'
+                    )),
+    offset_ms       REAL    NOT NULL,      -- start relative to the recording call
+    duration_ms     REAL    NOT NULL CHECK (duration_ms >= 0),
+    recorded_at     TEXT    NOT NULL,      -- ISO 8601
+    CHECK (interaction_id IS NOT NULL OR review_id IS NOT NULL)
+);
+
+CREATE INDEX IF NOT EXISTS idx_spans_interaction ON spans (interaction_id);
+CREATE INDEX IF NOT EXISTS idx_spans_review ON spans (review_id);
+
 -- ---------------------------------------------------------------------------
 -- interventions
 -- One row per human action taken outside an AI interaction.
@@ -203,12 +258,40 @@ CREATE TABLE IF NOT EXISTS pipeline_events (
     agent_role  TEXT    NOT NULL,
     event_type  TEXT    NOT NULL CHECK (event_type IN (
                     'gate_pass', 'gate_fail', 'retry', 'circuit_break',
-                    'reentry_approval', 'halt', 'resume'
+                    'reentry_approval', 'halt', 'resume', 'step_start'
                 )),
     artifact_id TEXT,
     detail      TEXT    NOT NULL
 );
 
+-- ---------------------------------------------------------------------------
+-- pipeline_counters
+-- Approach 2 only.
+-- Last pipeline_id index handed out per run, so that allocating the next
+-- PIPE-[RUN_ID]-[NN] is a single-row update.
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS pipeline_counters (
+    run_id      TEXT    PRIMARY KEY REFERENCES runs (id),
+    last_index  INTEGER NOT NULL CHECK (last_index >= 1)
+);
+
+-- ---------------------------------------------------------------------------
+-- pipeline_checkpoints
+-- Approach 2 only.
+-- One row per completed pipeline step.  A resumed pipeline looks its steps up
+-- here and skips the model calls whose output is already logged.
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS pipeline_checkpoints (
+    step_key        TEXT    PRIMARY KEY,   -- sha256 of pipeline_id, phase, artifact, prompt hash
+    run_id          TEXT    NOT NULL REFERENCES runs (id),
+    pipeline_id     TEXT    NOT NULL,
+    phase           INTEGER NOT NULL CHECK (phase BETWEEN 2 AND 8),
+    artifact_id     TEXT,
+    prompt_sha256   TEXT    NOT NULL,
+    interaction_id  INTEGER REFERENCES interactions (id),
+    completed_at    TEXT    NOT NULL       -- ISO 8601
+);
+
 -- ---------------------------------------------------------------------------
 -- violations
 -- One row per integrity or semantic failure detected during a run.
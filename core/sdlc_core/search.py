@@ -0,0 +1,316 @@
+r"""search.py: Optional full-text search over prompts, responses and rationales.
+
+Finding an old prompt or an intervention rationale otherwise means a
+``LIKE '%...%'`` scan over every multi-KB text column.  This module adds
+SQLite FTS5 indexes on demand:
+
+    interactions_fts   interactions.prompt, interactions.response
+    interventions_fts  interventions.rationale
+    defects_fts        defects.description
+
+Each index is an external-content table (the text is not stored twice) kept
+in sync by ``AFTER INSERT/UPDATE/DELETE`` triggers on its base table, so
+rows written by the normal :mod:`sdlc_core.db` helpers are searchable at
+once.  The indexes are not part of ``schema.sql``: a database only carries
+them after :func:`enable_index` (``sdlc-search --build``) has run, and
+:func:`disable_index` removes them again.
+
+Queries use FTS5 syntax (``word``, ``"exact phrase"``, ``a AND b``,
+``prefix*``); ``--phrase`` treats the whole input as one phrase.  Results
+are ranked with ``bm25`` and can be filtered by run and phase.
+
+Usage:
+    python -m sdlc_core.search --db logs/experiment.db --build
+    python -m sdlc_core.search --db logs/experiment.db "retry budget"
+    python -m sdlc_core.search --db logs/experiment.db --phrase "circuit breaker" \
+        --source interventions --run-id run-proj1-approach2-20260310 --phase 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from sdlc_core.db import _connect
+
+# ---------------------------------------------------------------------------
+# Indexed sources
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _Source:
+    table: str
+    columns: tuple[str, ...]
+    phase_column: str
+    time_column: str
+
+    @property
+    def fts(self) -> str:
+        return f"{self.table}_fts"
+
+
+SOURCES: dict[str, _Source] = {
+    "interactions": _Source("interactions", ("prompt", "response"), "sdlc_phase", "timestamp"),
+    "interventions": _Source("interventions", ("rationale",), "sdlc_phase", "timestamp"),
+    "defects": _Source("defects", ("description",), "sdlc_phase_detected", "detected_at"),
+}
+
+
+def _index_ddl(source: _Source) -> list[str]:
+    cols = ", ".join(source.columns)
+    new = ", ".join(f"new.{c}" for c in source.columns)
+    old = ", ".join(f"old.{c}" for c in source.columns)
+    delete = (
+        f"INSERT INTO {source.fts} ({source.fts}, rowid, {cols}) VALUES ('delete', old.id, {old});"
+    )
+    insert = f"INSERT INTO {source.fts} (rowid, {cols}) VALUES (new.id, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {source.fts} USING fts5("
+        f"{cols}, content='{source.table}', content_rowid='id', "
+        "tokenize='porter unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS {source.fts}_ai AFTER INSERT ON {source.table} "
+        f"BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {source.fts}_ad AFTER DELETE ON {source.table} "
+        f"BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {source.fts}_au AFTER UPDATE OF {cols} "
+        f"ON {source.table} BEGIN {delete} {insert} END",
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Index management
+# ---------------------------------------------------------------------------
+
+def fts5_available() -> bool:
+    """Return whether the linked SQLite library was built with FTS5."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE probe USING fts5(text)")
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+    return True
+
+
+def is_enabled(conn: sqlite3.Connection) -> bool:
+    """Return whether every search index exists in the database of *conn*."""
+    names = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    return all(source.fts in names for source in SOURCES.values())
+
+
+def enable_index(db_path: Path | None = None) -> dict[str, int]:
+    """Create the search indexes and triggers, and index all existing rows.
+
+    Safe to run again: existing indexes are rebuilt from their base tables,
+    which also repairs an index that fell out of sync.
+
+    Args:
+        db_path: Path to ``experiment.db``.  Defaults to the
+                 :func:`sdlc_core.db._default_db_path` location.
+
+    Returns:
+        Number of indexed rows per source.
+
+    Raises:
+        RuntimeError: If SQLite was built without FTS5.
+
+    """
+    if not fts5_available():
+        raise RuntimeError("This SQLite build does not include FTS5; search is unavailable.")
+    counts: dict[str, int] = {}
+    with _connect(db_path) as conn:
+        for name, source in SOURCES.items():
+            for statement in _index_ddl(source):
+                conn.execute(statement)
+            conn.execute(f"INSERT INTO {source.fts} ({source.fts}) VALUES ('rebuild')")
+            counts[name] = int(conn.execute(f"SELECT COUNT(*) FROM {source.table}").fetchone()[0])
+    return counts
+
+
+def disable_index(db_path: Path | None = None) -> None:
+    """Drop the search indexes and their triggers (no-op if absent)."""
+    with _connect(db_path) as conn:
+        for source in SOURCES.values():
+            for suffix in ("ai", "ad", "au"):
+                conn.execute(f"DROP TRIGGER IF EXISTS {source.fts}_{suffix}")
+            conn.execute(f"DROP TABLE IF EXISTS {source.fts}")
+
+
+# ---------------------------------------------------------------------------
+# Querying
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One matching row.
+
+    Attributes:
+        source:    Base table name (``interactions``, ``interventions``,
+                   ``defects``).
+        row_id:    Primary key of the row in *source*.
+        run_id:    Run the row belongs to.
+        phase:     SDLC phase of the row.
+        timestamp: ISO 8601 time of the row.
+        snippet:   Matching text excerpt with hits wrapped in ``[...]``.
+        rank:      ``bm25`` score; lower is more relevant.
+
+    """
+
+    source: str
+    row_id: int
+    run_id: str
+    phase: int
+    timestamp: str
+    snippet: str
+    rank: float
+
+
+def phrase(text: str) -> str:
+    """Return *text* as a single FTS5 phrase query."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def search(
+    conn: sqlite3.Connection,
+    query: str,
+    *,
+    sources: Iterable[str] | None = None,
+    run_id: str | None = None,
+    phase: int | None = None,
+    limit: int = 20,
+) -> list[SearchHit]:
+    """Return the best *limit* matches for *query*, most relevant first.
+
+    Args:
+        conn:    Open connection to a database with the search index.
+        query:   FTS5 query (see :func:`phrase` for literal phrases).
+        sources: Subset of :data:`SOURCES` to search; all by default.
+        run_id:  Only return rows of this run.
+        phase:   Only return rows of this SDLC phase.
+        limit:   Maximum number of hits.
+
+    Returns:
+        Hits ordered by ascending ``bm25`` rank across all sources.
+
+    Raises:
+        RuntimeError: If the search index has not been built.
+        ValueError:   If *query* is not valid FTS5 syntax, or a source is unknown.
+
+    """
+    if not is_enabled(conn):
+        raise RuntimeError("Search index not built. Run sdlc-search --build first.")
+    names = list(sources) if sources is not None else list(SOURCES)
+    unknown = sorted(set(names) - set(SOURCES))
+    if unknown:
+        raise ValueError(f"Unknown search source(s): {', '.join(unknown)}")
+
+    hits: list[SearchHit] = []
+    for name in names:
+        source = SOURCES[name]
+        sql = (
+            f"SELECT t.id, t.run_id, t.{source.phase_column}, t.{source.time_column}, "
+            f"snippet({source.fts}, -1, '[', ']', '…', 12), bm25({source.fts}) "
+            f"FROM {source.fts} JOIN {source.table} t ON t.id = {source.fts}.rowid "
+            f"WHERE {source.fts} MATCH ? "
+            "AND (? IS NULL OR t.run_id = ?) "
+            f"AND (? IS NULL OR t.{source.phase_column} = ?) "
+            f"ORDER BY bm25({source.fts}) LIMIT ?"
+        )
+        try:
+            rows = conn.execute(sql, (query, run_id, run_id, phase, phase, limit)).fetchall()
+        except sqlite3.OperationalError as exc:
+            raise ValueError(
+                f"Invalid search query {query!r}: {exc} "
+                "(quote terms that contain punctuation, or use --phrase)"
+            ) from exc
+        hits.extend(
+            SearchHit(name, int(r[0]), str(r[1]), int(r[2]), str(r[3]), str(r[4]), float(r[5]))
+            for r in rows
+        )
+
+    hits.sort(key=lambda hit: hit.rank)
+    return hits[:limit]
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    """Parse command-line arguments and build, drop or query the search index."""
+    parser = argparse.ArgumentParser(
+        description="Full-text search over prompts, responses, rationales and defects."
+    )
+    parser.add_argument("query", nargs="?", help="FTS5 query, e.g. 'timeout' or '\"exact phrase\"'")
+    parser.add_argument("--db", default="logs/experiment.db", help="Path to experiment DB.")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--build", action="store_true", help="Create or rebuild the index.")
+    action.add_argument("--drop", action="store_true", help="Remove the index and triggers.")
+    parser.add_argument(
+        "--source", action="append", choices=sorted(SOURCES),
+        help="Restrict to a source (repeatable; default: all).",
+    )
+    parser.add_argument("--run-id", default=None, help="Only rows of this run.")
+    parser.add_argument("--phase", type=int, default=None, help="Only rows of this phase.")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum hits (default: 20).")
+    parser.add_argument("--phrase", action="store_true", help="Match the query as one phrase.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON output.")
+    args = parser.parse_args()
+
+    db_path = Path(args.db)
+    if not db_path.exists():
+        print(f"[sdlc_core.search] ERROR: database not found at {db_path}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.build:
+        try:
+            counts = enable_index(db_path)
+        except RuntimeError as exc:
+            print(f"[sdlc_core.search] ERROR: {exc}", file=sys.stderr)
+            sys.exit(1)
+        summary = ", ".join(f"{name}={count}" for name, count in counts.items())
+        print(f"[sdlc_core.search] Index built ({summary})")
+        return
+    if args.drop:
+        disable_index(db_path)
+        print("[sdlc_core.search] Index removed")
+        return
+    if not args.query:
+        parser.error("a query is required unless --build or --drop is given")
+
+    query = phrase(args.query) if args.phrase else args.query
+    conn = sqlite3.connect(db_path)
+    try:
+        hits = search(
+            conn, query, sources=args.source, run_id=args.run_id,
+            phase=args.phase, limit=args.limit,
+        )
+    except (RuntimeError, ValueError) as exc:
+        print(f"[sdlc_core.search] ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    if args.json:
+        print(json.dumps([asdict(hit) for hit in hits], indent=2))
+        return
+    if not hits:
+        print("No matches.")
+        return
+    for hit in hits:
+        print(f"{hit.source}#{hit.row_id}  {hit.run_id}  phase {hit.phase}  {hit.timestamp}")
+        print(f"    {hit.snippet}")
+
+
+if __name__ == "__main__":
+    main()
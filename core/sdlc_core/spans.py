@@ -0,0 +1,118 @@
+"""spans.py: Lightweight latency spans for a single interaction.
+
+A :class:`SpanRecorder` measures named phases of one prompt-response
+exchange (prompt validation, provider call, first token, DB write, human
+review) with ``time.perf_counter`` and keeps them in memory.  ``rows()``
+turns them into mappings for :func:`sdlc_core.db.log_spans`, which writes
+them to the ``spans`` table.  No tracing service is involved.
+
+Offsets are measured from the moment the recorder was created, so spans
+from the same recorder can be laid out on one timeline.
+
+Usage::
+
+    recorder = SpanRecorder()
+    with recorder.span(SpanName.PROVIDER_CALL):
+        response = provider.complete(prompt)
+    db.log_spans(rows=recorder.rows(run_id="run-001", interaction_id=42))
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from sdlc_core.enums import SpanName
+
+
+@dataclass(frozen=True)
+class Span:
+    """One timed phase of an interaction.
+
+    Attributes:
+        name:        Which phase was measured.
+        offset_ms:   Start time relative to the recorder's creation.
+        duration_ms: Elapsed time of the phase.
+
+    """
+
+    name: SpanName
+    offset_ms: float
+    duration_ms: float
+
+
+class SpanRecorder:
+    """Collects :class:`Span` records against a single ``perf_counter`` origin."""
+
+    def __init__(self) -> None:
+        """Start the recorder's clock."""
+        self._origin = time.perf_counter()
+        self._spans: list[Span] = []
+
+    @property
+    def spans(self) -> list[Span]:
+        """Return the spans recorded so far, in recording order."""
+        return list(self._spans)
+
+    def now_ms(self) -> float:
+        """Return milliseconds elapsed since the recorder was created."""
+        return (time.perf_counter() - self._origin) * 1000.0
+
+    def add(self, name: SpanName | str, *, offset_ms: float, duration_ms: float) -> Span:
+        """Record a span measured elsewhere, e.g. a provider-reported latency.
+
+        Args:
+            name:        Phase name; a :class:`~sdlc_core.enums.SpanName` or its value.
+            offset_ms:   Start time relative to the recorder's creation.
+            duration_ms: Elapsed time of the phase.
+
+        Returns:
+            The recorded span.
+
+        """
+        span = Span(SpanName(name), offset_ms, max(duration_ms, 0.0))
+        self._spans.append(span)
+        return span
+
+    @contextmanager
+    def span(self, name: SpanName | str) -> Generator[None]:
+        """Time the enclosed block and record it under *name*.
+
+        The span is recorded even when the block raises.
+        """
+        start = self.now_ms()
+        try:
+            yield
+        finally:
+            self.add(name, offset_ms=start, duration_ms=self.now_ms() - start)
+
+    def duration_ms(self, name: SpanName | str) -> float | None:
+        """Return the duration of the last span called *name*, or ``None``."""
+        wanted = SpanName(name)
+        for span in reversed(self._spans):
+            if span.name == wanted:
+                return span.duration_ms
+        return None
+
+    def rows(
+        self,
+        *,
+        run_id: str,
+        interaction_id: int | None = None,
+        review_id: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the spans as row mappings for :func:`sdlc_core.db.log_spans`."""
+        return [
+            {
+                "run_id": run_id,
+                "interaction_id": interaction_id,
+                "review_id": review_id,
+                "name": span.name,
+                "offset_ms": span.offset_ms,
+                "duration_ms": span.duration_ms,
+            }
+            for span in self._spans
+        ]
@@ -5,6 +5,7 @@
 import argparse
 import json
 import sqlite3
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, cast
 
@@ -107,6 +108,15 @@ def _fetch_open_violations(conn: sqlite3.Connection, run_id: str) -> int:
     return int(row[0]) if row is not None else 0
 
 
+# Snapshot key → per-run query, in display order.
+RUN_QUERIES: dict[str, Callable[[sqlite3.Connection, str], Any]] = {
+    "active_phase": _fetch_active_phase,
+    "pending_checkpoints": _fetch_pending_checkpoints,
+    "last_accepted_artifact": _fetch_last_accepted_artifact,
+    "open_violations": _fetch_open_violations,
+}
+
+
 def _status_snapshot(db_path: Path) -> dict[str, Any]:
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
@@ -142,10 +152,7 @@ def _status_snapshot(db_path: Path) -> dict[str, Any]:
                     None if run["terminal_phase"] is None else int(run["terminal_phase"])
                 ),
             },
-            "active_phase": _fetch_active_phase(conn, run_id),
-            "pending_checkpoints": _fetch_pending_checkpoints(conn, run_id),
-            "last_accepted_artifact": _fetch_last_accepted_artifact(conn, run_id),
-            "open_violations": _fetch_open_violations(conn, run_id),
+            **{key: fetch(conn, run_id) for key, fetch in RUN_QUERIES.items()},
         }
     finally:
         conn.close()
@@ -0,0 +1,431 @@
+"""synthetic.py: Populate experiment.db with a realistic synthetic workload.
+
+The test fixtures in ``conftest.py`` hold a handful of rows, which says
+nothing about how ``metrics``, ``check`` and ``status`` behave on a study
+that has run for weeks.  :func:`generate` fills a database with data shaped
+like a real run so that those queries can be measured at scale:
+
+* ``runs`` alternate between approach 1 and 2 and stop at a random
+  terminal phase between 2 and 8; each has three closed sessions, one
+  ``phase_progress`` row per phase and one model assignment per phase.
+* Every reached phase produces artifacts with the usual ID prefixes
+  (``REQ-``, ``ARCH-``, ``DESIGN-``, ``IMPL-``, ``VER-``, ``VAL-``,
+  ``TRANS-``) on top of a few phase-1 seeds.  Each artifact links to one
+  to three artifacts of earlier phases, so ``traceability_links`` forms a
+  DAG; every ``VER-`` artifact links to an ``IMPL-`` one.
+* Each artifact has an iteration chain of interactions: zero or more
+  rejected attempts followed by an accepted one, some with human
+  modifications.  A few exploratory interactions have no artifact.
+* Phases 6 to 8 get validation sessions with matching ``defects`` rows,
+  most of them resolved.  Interventions are scattered over all phases.
+* Approach-2 runs get ``pipeline_events`` (gate passes, failures, retries
+  and the occasional halt/resume).
+
+Rows are written with ``executemany`` in one transaction, which is orders of
+magnitude faster than the per-row write helpers in :mod:`sdlc_core.db`.
+The same seed always produces the same rows.
+
+Usage::
+
+    from sdlc_core.synthetic import generate
+
+    counts = generate(Path("/tmp/bench.db"), runs=50, seed=1)
+    counts["interactions"]   # number of rows written
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from sdlc_core.db import _connect, setup_db
+from sdlc_core.enums import (
+    ArtifactStatus,
+    InterventionCategory,
+    Outcome,
+    PhaseStatus,
+    PipelineEventType,
+    Severity,
+    ValidationResult,
+    ValidationType,
+)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# Phase → (artifact ID prefix, artifact_type), matching the check.py rules.
+_PHASE_ARTIFACTS: dict[int, tuple[str, str]] = {
+    1: ("SEED", "Stakeholder Requirements"),
+    2: ("REQ", "Requirements Document"),
+    3: ("ARCH", "Architecture Document"),
+    4: ("DESIGN", "Design"),
+    5: ("IMPL", "Implementation"),
+    6: ("VER", "Verification Test"),
+    7: ("VAL", "Validation Test"),
+    8: ("TRANS", "Transition Plan"),
+}
+
+_AGENT_ROLES: dict[int, str] = {
+    2: "requirements_analyst",
+    3: "architect",
+    4: "designer",
+    5: "developer",
+    6: "tester",
+    7: "validator",
+    8: "release_manager",
+}
+
+_MODELS = ("model-a", "model-b", "model-c")
+_SEVERITIES = (Severity.MINOR, Severity.MODERATE, Severity.CRITICAL)
+_SEVERITY_WEIGHTS: list[float] = [6, 3, 1]
+_PIPELINE_STEPS = ("lint", "unit_tests", "integration_tests", "build", "deploy_staging")
+
+_BASE_TIME = datetime(2026, 1, 5, 8, 0, tzinfo=UTC)
+
+
+# ---------------------------------------------------------------------------
+# Row accumulation
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Rows:
+    """Rows per table, in insertion order, plus a per-run clock."""
+
+    tables: dict[str, list[tuple[Any, ...]]] = field(default_factory=dict)
+    clock: datetime = _BASE_TIME
+
+    def add(self, table: str, row: tuple[Any, ...]) -> None:
+        self.tables.setdefault(table, []).append(row)
+
+    def tick(self, rng: random.Random, low: float, high: float) -> str:
+        """Advance the clock by a random number of seconds and return it."""
+        self.clock += timedelta(seconds=rng.uniform(low, high))
+        return self.clock.isoformat()
+
+
+_INSERT_SQL: dict[str, str] = {
+    "runs": (
+        "INSERT INTO runs (id, project, approach, started_at, ended_at, terminal_phase) "
+        "VALUES (?, ?, ?, ?, ?, ?)"
+    ),
+    "sessions": (
+        "INSERT INTO sessions (run_id, session_number, started_at, ended_at) "
+        "VALUES (?, ?, ?, ?)"
+    ),
+    "phase_progress": (
+        "INSERT INTO phase_progress (run_id, phase_number, status, entered_at, completed_at) "
+        "VALUES (?, ?, ?, ?, ?)"
+    ),
+    "model_assignments": (
+        "INSERT INTO model_assignments (run_id, phase_number, model, source, assigned_at) "
+        "VALUES (?, ?, ?, 'setup', ?)"
+    ),
+    "artifacts": (
+        "INSERT INTO artifacts (id, run_id, artifact_type, phase, git_commit_sha, "
+        "content_hash, status, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+    "traceability_links": (
+        "INSERT INTO traceability_links (from_artifact_id, to_artifact_id, run_id, created_at) "
+        "VALUES (?, ?, ?, ?)"
+    ),
+    "interactions": (
+        "INSERT INTO interactions (run_id, artifact_id, timestamp, sdlc_phase, approach, "
+        "agent_role, model, prompt, response, iteration, outcome, human_modified, "
+        "human_modification_notes, duration_seconds, human_review_seconds, prompt_tokens, "
+        "completion_tokens, duration_ms, human_review_ms) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+    "interventions": (
+        "INSERT INTO interventions (run_id, artifact_id, timestamp, sdlc_phase, category, "
+        "severity, rationale, time_spent_minutes) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+    "validation_results": (
+        "INSERT INTO validation_results (id, artifact_id, run_id, sdlc_phase, validation_type, "
+        "result, defects_found, notes, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+    "defects": (
+        "INSERT INTO defects (run_id, validation_result_id, artifact_id, sdlc_phase_detected, "
+        "origin_phase, severity, description, detected_at, resolved_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+    "pipeline_events": (
+        "INSERT INTO pipeline_events (run_id, pipeline_id, timestamp, step, agent_role, "
+        "event_type, artifact_id, detail) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+}
+
+
+# ---------------------------------------------------------------------------
+# Per-run generation
+# ---------------------------------------------------------------------------
+
+def _pick_severity(rng: random.Random) -> str:
+    return rng.choices(_SEVERITIES, _SEVERITY_WEIGHTS)[0].value
+
+
+def _generate_run(
+    rows: _Rows,
+    rng: random.Random,
+    index: int,
+    *,
+    artifacts_per_phase: int,
+    next_validation_id: int,
+) -> int:
+    """Append every row of one run to *rows*; return the next validation id."""
+    approach = 1 + index % 2
+    run_id = f"run-synth-{index + 1:05d}"
+    terminal = rng.randint(2, 8)
+    rows.clock = _BASE_TIME + timedelta(days=index)
+    started_at = rows.clock.isoformat()
+
+    models = {phase: rng.choice(_MODELS) for phase in range(2, 9)}
+    for phase, model in models.items():
+        rows.add("model_assignments", (run_id, phase, model, started_at))
+
+    # Phase-1 seeds exist before the run starts.
+    by_phase: dict[int, list[str]] = {1: []}
+    for n in range(1, rng.randint(2, 4) + 1):
+        seed_id = f"SEED-{n:02d}"
+        by_phase[1].append(seed_id)
+        rows.add("artifacts", (
+            seed_id, run_id, _PHASE_ARTIFACTS[1][1], 1, None,
+            f"{rng.getrandbits(128):032x}", ArtifactStatus.ACCEPTED.value, started_at,
+        ))
+
+    session_bounds: list[str] = [started_at]
+    for phase in range(2, 9):
+        if phase > terminal:
+            rows.add("phase_progress", (run_id, phase, PhaseStatus.NOT_STARTED.value, None, None))
+            continue
+        entered_at = rows.tick(rng, 60, 600)
+        by_phase[phase] = _generate_phase(
+            rows, rng, run_id, approach, phase, models[phase], by_phase,
+            count=max(1, round(artifacts_per_phase * rng.uniform(0.5, 1.5))),
+        )
+        if phase >= 6:
+            next_validation_id = _generate_validation(
+                rows, rng, run_id, phase, by_phase, next_validation_id
+            )
+        if approach == 2:
+            _generate_pipeline(rows, rng, run_id, phase, by_phase[phase])
+        status = (
+            PhaseStatus.COMPLETED if phase < terminal or rng.random() < 0.5
+            else PhaseStatus.PARTIALLY_REACHED
+        )
+        rows.add("phase_progress", (run_id, phase, status.value, entered_at, rows.tick(rng, 1, 60)))
+        if phase in (4, 6):
+            session_bounds.append(rows.clock.isoformat())
+
+    ended_at = rows.tick(rng, 60, 600)
+    while len(session_bounds) < 3:
+        session_bounds.append(ended_at)
+    for number in range(1, 4):
+        start = session_bounds[number - 1]
+        end = session_bounds[number] if number < 3 else ended_at
+        rows.add("sessions", (run_id, number, start, end))
+
+    rows.add("runs", (run_id, f"project{1 + index % 3}", approach, started_at, ended_at, terminal))
+    return next_validation_id
+
+
+def _generate_phase(
+    rows: _Rows,
+    rng: random.Random,
+    run_id: str,
+    approach: int,
+    phase: int,
+    model: str,
+    by_phase: dict[int, list[str]],
+    *,
+    count: int,
+) -> list[str]:
+    """Add the artifacts, links and interactions of one phase; return its artifact ids."""
+    prefix, artifact_type = _PHASE_ARTIFACTS[phase]
+    role = _AGENT_ROLES[phase]
+    upstream = [aid for p in range(1, phase) for aid in by_phase.get(p, [])]
+    previous = by_phase[max(p for p in by_phase if p < phase)]
+    ids: list[str] = []
+
+    for n in range(1, count + 1):
+        artifact_id = f"{prefix}-{n:03d}"
+        ids.append(artifact_id)
+
+        # Iteration chain: rejected attempts, then the accepted one.
+        attempts = min(1 + int(rng.expovariate(0.9)), 8)
+        for iteration in range(1, attempts + 1):
+            final = iteration == attempts
+            modified = final and rng.random() < 0.3
+            outcome = (
+                Outcome.REJECTED if not final
+                else Outcome.ACCEPTED_WITH_MODIFICATIONS if modified and rng.random() < 0.5
+                else Outcome.ACCEPTED
+            )
+            duration_ms = rng.lognormvariate(8.5, 0.6)
+            review_ms = rng.lognormvariate(10.5, 0.8)
+            rows.add("interactions", (
+                run_id, artifact_id, rows.tick(rng, 5, 900), phase, approach, role, model,
+                f"Produce {artifact_id} (attempt {iteration})",
+                f"Draft of {artifact_id}",
+                iteration, outcome.value, int(modified),
+                "Adjusted wording" if modified else None,
+                int(duration_ms // 1000), int(review_ms // 1000),
+                rng.randint(200, 4000), rng.randint(100, 3000),
+                round(duration_ms, 3), round(review_ms, 3),
+            ))
+
+        created_at = rows.clock.isoformat()
+        rows.add("artifacts", (
+            artifact_id, run_id, artifact_type, phase,
+            f"{rng.getrandbits(160):040x}", f"{rng.getrandbits(256):064x}",
+            ArtifactStatus.SUPERSEDED.value if rng.random() < 0.05
+            else ArtifactStatus.ACCEPTED.value,
+            created_at,
+        ))
+
+        targets = {rng.choice(previous)}
+        targets.update(rng.sample(upstream, min(len(upstream), rng.randint(0, 2))))
+        if phase == 6 and by_phase.get(5):
+            targets.add(by_phase[5][(n - 1) % len(by_phase[5])])
+        if phase == 6 and n == count:
+            # The last VER artifact also covers any IMPL left over above.
+            targets.update(by_phase.get(5, [])[count:])
+        for target in sorted(targets):
+            rows.add("traceability_links", (artifact_id, target, run_id, created_at))
+
+        if rng.random() < 0.15:
+            rows.add("interventions", (
+                run_id, artifact_id, rows.tick(rng, 5, 120), phase,
+                rng.choice(list(InterventionCategory)).value, _pick_severity(rng),
+                f"Manual follow-up on {artifact_id}", rng.randint(1, 45),
+            ))
+
+    for _ in range(rng.randint(0, 3)):
+        rows.add("interactions", (
+            run_id, None, rows.tick(rng, 5, 300), phase, approach, role, model,
+            "Exploratory question", "Exploratory answer", 1, Outcome.ACCEPTED.value, 0,
+            None, rng.randint(1, 20), rng.randint(1, 120), rng.randint(50, 800),
+            rng.randint(50, 800), None, None,
+        ))
+    return ids
+
+
+def _generate_validation(
+    rows: _Rows,
+    rng: random.Random,
+    run_id: str,
+    phase: int,
+    by_phase: dict[int, list[str]],
+    validation_id: int,
+) -> int:
+    """Add the validation sessions and defects of one phase; return the next id."""
+    validation_type = ValidationType.ACCEPTANCE_TEST if phase == 8 else ValidationType.TESTING
+    targets = by_phase[phase - 1] if phase > 6 else by_phase.get(5) or by_phase[phase]
+    for artifact_id in rng.sample(targets, min(len(targets), rng.randint(1, 4))):
+        timestamp = rows.tick(rng, 60, 1800)
+        defects = [_pick_severity(rng) for _ in range(int(rng.expovariate(0.8)))]
+        open_critical = False
+        for severity in defects:
+            resolved = rng.random() < 0.8
+            open_critical = open_critical or (severity == Severity.CRITICAL.value and not resolved)
+            rows.add("defects", (
+                run_id, validation_id, artifact_id, phase, rng.randint(2, phase), severity,
+                f"Defect found in {artifact_id}", timestamp,
+                rows.tick(rng, 60, 3600) if resolved else None,
+            ))
+        result = (
+            ValidationResult.REJECTED if open_critical
+            else ValidationResult.CONDITIONAL if defects and rng.random() < 0.3
+            else ValidationResult.ACCEPTED
+        )
+        rows.add("validation_results", (
+            validation_id, artifact_id, run_id, phase, validation_type.value,
+            result.value, len(defects), None, timestamp,
+        ))
+        validation_id += 1
+    return validation_id
+
+
+def _generate_pipeline(
+    rows: _Rows,
+    rng: random.Random,
+    run_id: str,
+    phase: int,
+    artifact_ids: list[str],
+) -> None:
+    """Add the approach-2 pipeline events of one phase."""
+    pipeline_id = f"PIPE-{run_id}-{phase:02d}"
+    role = _AGENT_ROLES[phase]
+    for artifact_id in artifact_ids:
+        step = rng.choice(_PIPELINE_STEPS)
+        for _ in range(int(rng.expovariate(1.5))):
+            for event in (PipelineEventType.GATE_FAIL, PipelineEventType.RETRY):
+                rows.add("pipeline_events", (
+                    run_id, pipeline_id, rows.tick(rng, 1, 60), step, role,
+                    event.value, artifact_id, f"{step} {event.value}",
+                ))
+        if rng.random() < 0.02:
+            for event in (PipelineEventType.HALT, PipelineEventType.RESUME):
+                rows.add("pipeline_events", (
+                    run_id, pipeline_id, rows.tick(rng, 1, 600), step, role,
+                    event.value, artifact_id, f"{step} {event.value}",
+                ))
+        rows.add("pipeline_events", (
+            run_id, pipeline_id, rows.tick(rng, 1, 60), step, role,
+            PipelineEventType.GATE_PASS.value, artifact_id, f"{step} passed",
+        ))
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def generate(
+    db_path: Path,
+    *,
+    runs: int = 10,
+    artifacts_per_phase: int = 12,
+    seed: int = 0,
+) -> dict[str, int]:
+    """Create (or extend) *db_path* with *runs* synthetic runs.
+
+    Args:
+        db_path:             Database to populate; created with
+                             :func:`~sdlc_core.db.setup_db` if needed.  Run
+                             IDs are fixed per index, so target an empty
+                             database.
+        runs:                Number of runs to generate.
+        artifacts_per_phase: Mean artifacts per reached phase; each phase
+                             draws between half and one and a half times this.
+        seed:                Random seed; the same seed yields the same rows.
+
+    Returns:
+        Number of rows written per table.
+
+    Raises:
+        ValueError: If *runs* or *artifacts_per_phase* is less than 1.
+
+    """
+    if runs < 1 or artifacts_per_phase < 1:
+        raise ValueError("runs and artifacts_per_phase must be at least 1.")
+
+    rng = random.Random(seed)
+    rows = _Rows()
+    validation_id = 1
+    for index in range(runs):
+        validation_id = _generate_run(
+            rows, rng, index,
+            artifacts_per_phase=artifacts_per_phase,
+            next_validation_id=validation_id,
+        )
+
+    setup_db(db_path)
+    with _connect(db_path) as conn:
+        # Parents before children so foreign keys hold throughout.
+        for table, sql in _INSERT_SQL.items():
+            conn.executemany(sql, rows.tables.get(table, []))
+
+    return {table: len(rows.tables.get(table, [])) for table in _INSERT_SQL}
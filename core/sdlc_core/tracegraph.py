@@ -0,0 +1,403 @@
+"""tracegraph.py: In-memory traceability graph with transitive queries.
+
+``traceability_links`` stores one directed edge per row: ``from_artifact_id``
+is the downstream artifact and ``to_artifact_id`` the upstream one it traces
+to (``accept_artifact(upstream_ids=...)`` writes them that way).  Flat SQL
+joins only see direct neighbours; this module loads every run's graph from a
+single query into integer adjacency lists so that transitive questions are
+answered in O(V + E):
+
+* :meth:`TraceGraph.upstream`: everything an artifact traces to, directly
+  or not ("is this test linked to a requirement?").
+* :meth:`TraceGraph.downstream`: everything that traces to an artifact
+  ("what is affected if REQ-12 changes?").
+* :meth:`TraceGraph.requirement_coverage`: share of artifacts that reach a
+  requirement, computed with one multi-source traversal.
+* :meth:`TraceGraph.cycles`: strongly connected components with more than
+  one artifact, or a self-link (Tarjan's algorithm, iterative).
+
+:func:`load_graphs` builds the graphs afresh on every call; nothing is
+cached between calls.  :func:`sdlc_core.check.run_all_checks` builds them
+once and passes them to every check that reads the graph.
+
+Usage:
+    python -m sdlc_core.tracegraph --db logs/experiment.db
+    python -m sdlc_core.tracegraph --db logs/experiment.db --impact REQ-12
+    python -m sdlc_core.tracegraph --db logs/experiment.db --upstream TEST-03 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from collections import deque
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+
+class TraceGraph:
+    """Traceability graph of one run.
+
+    Args:
+        run_id:    Run the graph belongs to.
+        artifacts: ``(artifact_id, artifact_type, phase)`` for every artifact.
+        links:     ``(from_artifact_id, to_artifact_id)`` edges.  An endpoint
+                   missing from *artifacts* becomes a node with no type.
+
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        artifacts: Iterable[tuple[str, str | None, int | None]],
+        links: Iterable[tuple[str, str]],
+    ) -> None:
+        """Build adjacency lists. See class docstring for parameters."""
+        self.run_id = run_id
+        self._ids: list[str] = []
+        self._types: list[str | None] = []
+        self._phases: list[int | None] = []
+        self._index: dict[str, int] = {}
+        for artifact_id, artifact_type, phase in artifacts:
+            self._add_node(artifact_id, artifact_type, phase)
+
+        self._up: list[list[int]] = [[] for _ in self._ids]
+        self._down: list[list[int]] = [[] for _ in self._ids]
+        self.edge_count = 0
+        for source, target in links:
+            src = self._node(source)
+            dst = self._node(target)
+            self._up[src].append(dst)
+            self._down[dst].append(src)
+            self.edge_count += 1
+
+    def _add_node(self, artifact_id: str, artifact_type: str | None, phase: int | None) -> int:
+        self._index[artifact_id] = len(self._ids)
+        self._ids.append(artifact_id)
+        self._types.append(artifact_type)
+        self._phases.append(phase)
+        return self._index[artifact_id]
+
+    def _node(self, artifact_id: str) -> int:
+        index = self._index.get(artifact_id)
+        if index is None:
+            index = self._add_node(artifact_id, None, None)
+            self._up.append([])
+            self._down.append([])
+        return index
+
+    # ------------------------------------------------------------------
+    # Accessors
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Return the number of artifacts in the graph."""
+        return len(self._ids)
+
+    def __contains__(self, artifact_id: object) -> bool:
+        """Return whether *artifact_id* is a node of the graph."""
+        return artifact_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over artifact ids in insertion order."""
+        return iter(self._ids)
+
+    def artifact_type(self, artifact_id: str) -> str | None:
+        """Return the ``artifact_type`` of *artifact_id* (``None`` if unknown)."""
+        return self._types[self._require(artifact_id)]
+
+    def phase(self, artifact_id: str) -> int | None:
+        """Return the phase of *artifact_id* (``None`` if unknown)."""
+        return self._phases[self._require(artifact_id)]
+
+    def direct_upstream(self, artifact_id: str) -> list[str]:
+        """Return the artifacts *artifact_id* links to directly."""
+        return [self._ids[i] for i in self._up[self._require(artifact_id)]]
+
+    def direct_downstream(self, artifact_id: str) -> list[str]:
+        """Return the artifacts that link directly to *artifact_id*."""
+        return [self._ids[i] for i in self._down[self._require(artifact_id)]]
+
+    def _require(self, artifact_id: str) -> int:
+        try:
+            return self._index[artifact_id]
+        except KeyError:
+            raise KeyError(f"Artifact {artifact_id!r} is not in run {self.run_id!r}.") from None
+
+    # ------------------------------------------------------------------
+    # Transitive queries
+    # ------------------------------------------------------------------
+
+    def _reach(self, starts: Iterable[int], adjacency: list[list[int]]) -> list[bool]:
+        """Mark every node reachable from *starts* (excluding the starts themselves)."""
+        seen = [False] * len(self._ids)
+        queue = deque(starts)
+        while queue:
+            node = queue.popleft()
+            for nxt in adjacency[node]:
+                if not seen[nxt]:
+                    seen[nxt] = True
+                    queue.append(nxt)
+        return seen
+
+    def upstream(self, artifact_id: str) -> set[str]:
+        """Return every artifact *artifact_id* traces to, transitively.
+
+        The artifact itself is included only if it lies on a cycle.
+        """
+        seen = self._reach([self._require(artifact_id)], self._up)
+        return {self._ids[i] for i, hit in enumerate(seen) if hit}
+
+    def downstream(self, artifact_id: str) -> set[str]:
+        """Return every artifact that traces to *artifact_id*, transitively.
+
+        This is the impact set of a change to *artifact_id*.  The artifact
+        itself is included only if it lies on a cycle.
+        """
+        seen = self._reach([self._require(artifact_id)], self._down)
+        return {self._ids[i] for i, hit in enumerate(seen) if hit}
+
+    def is_requirement(self, artifact_id: str) -> bool:
+        """Return whether *artifact_id* is a requirement (type contains "requirement")."""
+        return _is_requirement(self._types[self._require(artifact_id)])
+
+    def requirement_coverage(self) -> tuple[int, int]:
+        """Count artifacts that transitively trace to a requirement.
+
+        Requirements themselves and phase-1 seeds are not counted.  One
+        traversal from all requirements at once keeps this O(V + E).
+
+        Returns:
+            ``(covered, eligible)`` artifact counts.
+
+        """
+        requirements = [i for i, t in enumerate(self._types) if _is_requirement(t)]
+        reached = self._reach(requirements, self._down)
+        covered = eligible = 0
+        for i, artifact_type in enumerate(self._types):
+            if _is_requirement(artifact_type) or self._phases[i] == 1:
+                continue
+            eligible += 1
+            covered += reached[i]
+        return covered, eligible
+
+    def cycles(self) -> list[list[str]]:
+        """Return every traceability cycle as a sorted list of artifact ids.
+
+        A cycle is a strongly connected component with more than one
+        artifact, or a single artifact that links to itself.  Components
+        are found with an iterative Tarjan traversal in O(V + E).
+        """
+        count = len(self._ids)
+        index = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        stack: list[int] = []
+        components: list[list[str]] = []
+        counter = 0
+
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            work: list[tuple[int, int]] = [(root, 0)]
+            while work:
+                node, edge = work[-1]
+                if edge == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                if edge < len(self._up[node]):
+                    work[-1] = (node, edge + 1)
+                    nxt = self._up[node][edge]
+                    if index[nxt] == -1:
+                        work.append((nxt, 0))
+                    elif on_stack[nxt]:
+                        low[node] = min(low[node], index[nxt])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    members: list[int] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        members.append(member)
+                        if member == node:
+                            break
+                    if len(members) > 1 or node in self._up[node]:
+                        components.append(sorted(self._ids[m] for m in members))
+
+        return sorted(components)
+
+
+def _is_requirement(artifact_type: str | None) -> bool:
+    # Same rule as the metrics queries: artifact_type LIKE '%Requirement%'.
+    return artifact_type is not None and "requirement" in artifact_type.lower()
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+_GRAPH_SQL = """
+    SELECT a.run_id, a.id, a.artifact_type, a.phase, tl.to_artifact_id
+    FROM artifacts a
+    LEFT JOIN traceability_links tl
+        ON tl.from_artifact_id = a.id AND tl.run_id = a.run_id
+    ORDER BY a.run_id, a.rowid
+"""
+
+
+def load_graphs(conn: sqlite3.Connection) -> dict[str, TraceGraph]:
+    """Build the traceability graph of every run with a single query.
+
+    Links are read through their source artifact, so a link whose
+    ``from_artifact_id`` has no artifact row is ignored, matching the
+    joins used by the metrics and checks.
+
+    Args:
+        conn: Open connection to ``experiment.db``.
+
+    Returns:
+        Run id → :class:`TraceGraph`, for every run that has artifacts.
+
+    """
+    artifacts: dict[str, dict[str, tuple[str | None, int | None]]] = {}
+    links: dict[str, list[tuple[str, str]]] = {}
+    for run_id, artifact_id, artifact_type, phase, target in conn.execute(_GRAPH_SQL):
+        artifacts.setdefault(run_id, {})[artifact_id] = (artifact_type, phase)
+        if target is not None:
+            links.setdefault(run_id, []).append((artifact_id, target))
+
+    return {
+        run_id: TraceGraph(
+            run_id,
+            ((aid, t, p) for aid, (t, p) in nodes.items()),
+            links.get(run_id, []),
+        )
+        for run_id, nodes in artifacts.items()
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _latest_run(conn: sqlite3.Connection) -> str | None:
+    row = conn.execute("SELECT id FROM runs ORDER BY started_at DESC LIMIT 1").fetchone()
+    return None if row is None else str(row[0])
+
+
+def _summary(graph: TraceGraph) -> dict[str, Any]:
+    covered, eligible = graph.requirement_coverage()
+    return {
+        "run_id": graph.run_id,
+        "artifacts": len(graph),
+        "links": graph.edge_count,
+        "requirement_coverage": {
+            "covered": covered,
+            "eligible": eligible,
+            "pct": round(covered / eligible * 100, 2) if eligible else None,
+        },
+        "cycles": graph.cycles(),
+    }
+
+
+def _describe(graph: TraceGraph, ids: Iterable[str]) -> list[dict[str, Any]]:
+    return [
+        {"id": aid, "artifact_type": graph.artifact_type(aid), "phase": graph.phase(aid)}
+        for aid in sorted(ids)
+    ]
+
+
+def main() -> None:
+    """Parse command-line arguments and print traceability graph queries."""
+    parser = argparse.ArgumentParser(
+        description="Transitive traceability queries over experiment.db"
+    )
+    parser.add_argument("--db", default="logs/experiment.db", help="Path to experiment DB.")
+    parser.add_argument("--run-id", default=None, help="Run to inspect (default: latest run).")
+    query = parser.add_mutually_exclusive_group()
+    query.add_argument(
+        "--impact", metavar="ARTIFACT_ID",
+        help="List every artifact that transitively traces to ARTIFACT_ID.",
+    )
+    query.add_argument(
+        "--upstream", metavar="ARTIFACT_ID",
+        help="List every artifact ARTIFACT_ID transitively traces to.",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit JSON output.")
+    args = parser.parse_args()
+
+    db_path = Path(args.db)
+    if not db_path.exists():
+        print(f"[sdlc_core.tracegraph] ERROR: database not found at {db_path}", file=sys.stderr)
+        sys.exit(1)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        run_id = args.run_id or _latest_run(conn)
+        graph = load_graphs(conn).get(run_id or "")
+    finally:
+        conn.close()
+    if graph is None:
+        print(f"[sdlc_core.tracegraph] ERROR: no artifacts for run {run_id!r}", file=sys.stderr)
+        sys.exit(1)
+
+    target = args.impact or args.upstream
+    if target is not None:
+        if target not in graph:
+            print(
+                f"[sdlc_core.tracegraph] ERROR: {target} is not an artifact of run {run_id}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        found = graph.downstream(target) if args.impact else graph.upstream(target)
+        payload: dict[str, Any] = {
+            "run_id": run_id,
+            "artifact_id": target,
+            "direction": "downstream" if args.impact else "upstream",
+            "artifacts": _describe(graph, found),
+        }
+        if args.upstream:
+            payload["traces_to_requirement"] = any(graph.is_requirement(a) for a in found)
+    else:
+        payload = _summary(graph)
+
+    if args.json:
+        print(json.dumps(payload, indent=2))
+        return
+
+    if target is None:
+        cov = payload["requirement_coverage"]
+        print(f"run_id: {payload['run_id']}")
+        print(f"artifacts: {payload['artifacts']}  links: {payload['links']}")
+        print(f"requirement_coverage: {cov['covered']}/{cov['eligible']} ({cov['pct']}%)")
+        print(f"cycles: {len(payload['cycles'])}")
+        for cycle in payload["cycles"]:
+            print(f"  {', '.join(cycle)}")
+        return
+
+    if args.impact:
+        print(f"{len(payload['artifacts'])} artifact(s) affected by a change to {target}:")
+    else:
+        print(f"{target} traces to {len(payload['artifacts'])} artifact(s):")
+    for item in payload["artifacts"]:
+        print(f"  {item['id']} (phase {item['phase']}, {item['artifact_type']})")
+    if args.upstream:
+        print(f"traces_to_requirement: {payload['traces_to_requirement']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""test_daemon.py: Tests for the operator command daemon and the ``sdlc`` client."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sdlc_core.daemon import main as sdlc_main
+from sdlc_core.daemon import make_server, ping, request, run_command
+from sdlc_core.db import open_run, setup_db
+from tests.conftest import q_count
+
+
+@pytest.fixture()
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Project directory holding logs/experiment.db with one open run."""
+    db_path = setup_db(tmp_path / "logs" / "experiment.db")
+    open_run(project="proj", approach=1, run_id="run-d-01", db_path=db_path)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SDLC_DB_PATH", raising=False)
+    return tmp_path
+
+
+@pytest.fixture()
+def daemon(project: Path) -> Iterator[Path]:
+    """Start a daemon and yield its socket path."""
+    socket_path = project / "logs" / "sdlc.sock"
+    server = make_server(socket_path)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield socket_path
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+def test_run_command_captures_output_and_exit_code(project: Path) -> None:
+    code, out, err = run_command("status", ["--json"])
+    assert code == 0
+    assert err == ""
+    assert json.loads(out)["run"]["id"] == "run-d-01"
+
+    code, out, err = run_command("phase-status", ["--phase", "9", "--status", "completed"])
+    assert code == 2
+    assert "invalid choice" in err
+
+    with pytest.raises(KeyError, match="unknown command"):
+        run_command("setup", [])
+
+
+def test_daemon_runs_commands_in_the_client_directory(daemon: Path, project: Path) -> None:
+    assert ping(daemon)
+    code, _, _ = request(daemon, "phase-status", ["--phase", "2", "--status", "in_progress"])
+    assert code == 0
+    assert q_count(project / "logs" / "experiment.db", "phase_progress") == 1
+
+    # The daemon resolves the default DB path against the client's cwd.
+    code, out, _ = request(daemon, "status", ["--json"])
+    assert json.loads(out)["active_phase"] == 2
+
+
+def test_daemon_reports_failures_and_unknown_commands(daemon: Path) -> None:
+    code, _, err = request(daemon, "pause", ["--run-id", "run-missing"])
+    assert code == 1
+    assert "run-missing" in err
+    code, _, err = request(daemon, "bogus", [])
+    assert code == 2
+    assert "unknown command" in err
+
+
+def test_second_daemon_on_same_socket_refused(daemon: Path) -> None:
+    with pytest.raises(RuntimeError, match="already listening"):
+        make_server(daemon)
+
+
+def test_stale_socket_file_is_replaced(project: Path) -> None:
+    socket_path = project / "logs" / "sdlc.sock"
+    socket_path.touch()
+    server = make_server(socket_path)
+    assert socket_path.stat().st_mode & 0o077 == 0
+    server.server_close()
+    assert not socket_path.exists()
+
+
+def test_client_uses_daemon_and_stop_request(
+    daemon: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with patch("sys.argv", ["sdlc", "--socket", str(daemon), "status"]):
+        with pytest.raises(SystemExit) as exc:
+            sdlc_main()
+    assert exc.value.code == 0
+    assert "run_id: run-d-01" in capsys.readouterr().out
+
+    with patch("sys.argv", ["sdlc", "--socket", str(daemon), "daemon", "--stop"]):
+        sdlc_main()
+    assert "Stopped daemon" in capsys.readouterr().out
+
+
+def test_client_falls_back_to_in_process(
+    project: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    missing = project / "logs" / "none.sock"
+    with patch("sys.argv", ["sdlc", "--socket", str(missing), "status", "--json"]):
+        with pytest.raises(SystemExit) as exc:
+            sdlc_main()
+    assert exc.value.code == 0
+    assert json.loads(capsys.readouterr().out)["has_run"] is True
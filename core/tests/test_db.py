@@ -2,29 +2,42 @@
 
 from __future__ import annotations
 
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from sdlc_core import db
 from sdlc_core.db import (
     accept_artifact,
+    allocate_pipeline_id,
     close_run,
     close_session,
+    complete_review,
+    enqueue_review,
+    get_checkpoint,
     get_model_assignment,
     log_defect,
     log_interaction,
+    log_interactions,
     log_intervention,
     log_pipeline_event,
+    log_spans,
     log_validation_result,
     log_violation,
     open_run,
     open_session,
+    pending_reviews,
+    record_checkpoint,
     resolve_defect,
     seed_model_assignments,
     set_model_assignment,
     set_phase_status,
     setup_db,
+    step_key,
 )
 from sdlc_core.enums import (
     InterventionCategory,
@@ -45,11 +58,15 @@
     "model_assignments",
     "artifacts",
     "interactions",
+    "review_queue",
+    "spans",
     "interventions",
     "traceability_links",
     "validation_results",
     "defects",
     "pipeline_events",
+    "pipeline_counters",
+    "pipeline_checkpoints",
     "violations",
 }
 
@@ -75,6 +92,55 @@ def test_setup_db_is_idempotent(tmp_path: Path) -> None:
     setup_db(p)
 
 
+def test_setup_db_adds_missing_columns_to_existing_tables(tmp_path: Path) -> None:
+    import sqlite3
+    path = tmp_path / "experiment.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE interactions (id INTEGER PRIMARY KEY, prompt TEXT)")
+    conn.commit()
+    conn.close()
+
+    setup_db(path)
+    setup_db(path)
+
+    conn = sqlite3.connect(path)
+    try:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(interactions)")}
+    finally:
+        conn.close()
+    assert {"duration_ms", "human_review_ms"} <= columns
+
+
+def test_setup_db_widens_pipeline_event_types_in_existing_databases(tmp_path: Path) -> None:
+    import sqlite3
+    path = setup_db(tmp_path / "experiment.db")
+    run_id = open_run(project="p", approach=2, db_path=path)
+    log_pipeline_event(
+        run_id=run_id, pipeline_id="PIPE-01", step="phase2", agent_role="dev",
+        event_type=PipelineEventType.GATE_PASS, detail="ok", db_path=path,
+    )
+    # Recreate the table with the constraint it was first released with.
+    conn = sqlite3.connect(path)
+    table_sql = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'pipeline_events'"
+    ).fetchone()[0]
+    conn.executescript(
+        "ALTER TABLE pipeline_events RENAME TO old_events;"
+        + table_sql.replace(", 'step_start'", "")
+        + "; INSERT INTO pipeline_events SELECT * FROM old_events; DROP TABLE old_events;"
+    )
+    conn.close()
+
+    setup_db(path)
+    setup_db(path)
+    log_pipeline_event(
+        run_id=run_id, pipeline_id="PIPE-01", step="phase3", agent_role="dev",
+        event_type=PipelineEventType.STEP_START, detail="started", db_path=path,
+    )
+    assert q_count(path, "pipeline_events") == 2
+    assert q_count(path, "pipeline_events", "step = 'phase2' AND event_type = 'gate_pass'") == 1
+
+
 def test_setup_db_creates_all_tables(tmp_path: Path) -> None:
     path = setup_db(tmp_path / "experiment.db")
     import sqlite3
@@ -416,6 +482,221 @@ def test_log_interaction_human_modified_with_notes_succeeds(db_path: Path, run_i
     assert rowid > 0
 
 
+def _interaction_row(run_id: str, **overrides: object) -> dict[str, object]:
+    row: dict[str, object] = {
+        "run_id": run_id,
+        "sdlc_phase": 2,
+        "approach": 1,
+        "agent_role": "analyst",
+        "model": "gpt-4",
+        "prompt": "Write requirements.",
+        "response": "Here are the requirements.",
+        "iteration": 1,
+        "outcome": Outcome.ACCEPTED,
+        "human_modified": False,
+    }
+    row.update(overrides)
+    return row
+
+
+def test_log_interactions_inserts_every_row_in_order(db_path: Path, run_id: str) -> None:
+    rowids = log_interactions(
+        rows=[_interaction_row(run_id, prompt=f"p{i}") for i in range(3)],
+        db_path=db_path,
+    )
+    assert len(rowids) == 3
+    assert rowids == sorted(rowids)
+    row = q_one(db_path, "SELECT prompt FROM interactions WHERE id = ?", (rowids[-1],))
+    assert row is not None
+    assert row["prompt"] == "p2"
+
+
+def test_log_interactions_empty_rows_is_noop(db_path: Path, run_id: str) -> None:
+    assert log_interactions(rows=[], db_path=db_path) == []
+    assert q_count(db_path, "interactions") == 0
+
+
+def test_log_interactions_invalid_row_writes_nothing(db_path: Path, run_id: str) -> None:
+    rows = [
+        _interaction_row(run_id),
+        _interaction_row(
+            run_id,
+            outcome=Outcome.ACCEPTED_WITH_MODIFICATIONS,
+            human_modified=True,
+        ),
+    ]
+    with pytest.raises(ValueError, match="human_modification_notes"):
+        log_interactions(rows=rows, db_path=db_path)
+    assert q_count(db_path, "interactions") == 0
+
+
+# ---------------------------------------------------------------------------
+# review_queue
+# ---------------------------------------------------------------------------
+
+
+def _enqueue(db_path: Path, run_id: str, prompt: str = "Write requirements.") -> int:
+    return enqueue_review(
+        run_id=run_id,
+        sdlc_phase=2,
+        approach=1,
+        agent_role="analyst",
+        model="gpt-4",
+        prompt=prompt,
+        response="Here are the requirements.",
+        iteration=1,
+        duration_seconds=3,
+        db_path=db_path,
+    )
+
+
+def test_enqueue_review_does_not_write_interaction(db_path: Path, run_id: str) -> None:
+    _enqueue(db_path, run_id)
+    assert q_count(db_path, "review_queue", "reviewed_at IS NULL") == 1
+    assert q_count(db_path, "interactions") == 0
+
+
+def test_pending_reviews_oldest_first_and_filtered(db_path: Path, run_id: str) -> None:
+    first = _enqueue(db_path, run_id, "p1")
+    second = _enqueue(db_path, run_id, "p2")
+    assert [r["id"] for r in pending_reviews(db_path=db_path)] == [first, second]
+    assert [r["id"] for r in pending_reviews(limit=1, db_path=db_path)] == [first]
+    assert pending_reviews(run_id="other-run", db_path=db_path) == []
+
+
+def test_complete_review_writes_interaction_and_links_queue(db_path: Path, run_id: str) -> None:
+    review_id = _enqueue(db_path, run_id)
+    interaction_id = complete_review(
+        review_id=review_id,
+        outcome=Outcome.REJECTED,
+        human_modified=False,
+        human_review_seconds=7,
+        db_path=db_path,
+    )
+    row = q_one(db_path, "SELECT * FROM interactions WHERE id = ?", (interaction_id,))
+    queued = q_one(db_path, "SELECT * FROM review_queue WHERE id = ?", (review_id,))
+    assert row is not None and queued is not None
+    assert row["outcome"] == "rejected"
+    assert row["human_review_seconds"] == 7
+    assert row["duration_seconds"] == 3
+    assert row["timestamp"] == queued["queued_at"]
+    assert queued["interaction_id"] == interaction_id
+    assert pending_reviews(db_path=db_path) == []
+
+
+def test_complete_review_rejects_second_completion(db_path: Path, run_id: str) -> None:
+    review_id = _enqueue(db_path, run_id)
+    complete_review(
+        review_id=review_id, outcome="accepted", human_modified=False, db_path=db_path
+    )
+    with pytest.raises(ValueError, match="already completed"):
+        complete_review(
+            review_id=review_id, outcome="accepted", human_modified=False, db_path=db_path
+        )
+    assert q_count(db_path, "interactions") == 1
+
+
+def test_concurrent_completions_log_the_review_once(
+    db_path: Path, run_id: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    review_id = _enqueue(db_path, run_id)
+    both_read = threading.Barrier(2)
+    build_params = db._interaction_params  # pyright: ignore[reportPrivateUsage]
+
+    # Hold each session between reading reviewed_at and inserting.  Unless
+    # the read is serialised, both sessions arrive here for the same item.
+    def slow_params(**kwargs: Any) -> tuple[Any, ...]:
+        try:
+            both_read.wait(timeout=0.5)
+        except threading.BrokenBarrierError:
+            pass
+        return build_params(**kwargs)
+
+    monkeypatch.setattr(db, "_interaction_params", slow_params)
+
+    def complete(outcome: str) -> str:
+        try:
+            complete_review(
+                review_id=review_id, outcome=outcome, human_modified=False, db_path=db_path
+            )
+        except ValueError:
+            return "skipped"
+        return "logged"
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = sorted(pool.map(complete, ["accepted", "rejected"]))
+    assert results == ["logged", "skipped"]
+    assert q_count(db_path, "interactions") == 1
+
+
+def test_complete_review_missing_notes_leaves_review_pending(db_path: Path, run_id: str) -> None:
+    review_id = _enqueue(db_path, run_id)
+    with pytest.raises(ValueError, match="human_modification_notes"):
+        complete_review(
+            review_id=review_id,
+            outcome=Outcome.ACCEPTED_WITH_MODIFICATIONS,
+            human_modified=True,
+            db_path=db_path,
+        )
+    assert len(pending_reviews(db_path=db_path)) == 1
+    assert q_count(db_path, "interactions") == 0
+
+
+def test_complete_review_links_queued_spans(db_path: Path, run_id: str) -> None:
+    review_id = _enqueue(db_path, run_id)
+    log_spans(
+        rows=[{
+            "run_id": run_id,
+            "review_id": review_id,
+            "name": "provider_call",
+            "offset_ms": 0.0,
+            "duration_ms": 850.25,
+        }],
+        db_path=db_path,
+    )
+    interaction_id = complete_review(
+        review_id=review_id,
+        outcome="accepted",
+        human_modified=False,
+        human_review_ms=1234.5,
+        db_path=db_path,
+    )
+    span = q_one(db_path, "SELECT interaction_id, duration_ms FROM spans")
+    row = q_one(db_path, "SELECT human_review_ms FROM interactions")
+    assert span is not None and row is not None
+    assert span["interaction_id"] == interaction_id
+    assert span["duration_ms"] == 850.25
+    assert row["human_review_ms"] == 1234.5
+
+
+# ---------------------------------------------------------------------------
+# spans
+# ---------------------------------------------------------------------------
+
+
+def test_log_spans_requires_linkage(db_path: Path, run_id: str) -> None:
+    with pytest.raises(ValueError, match="interaction_id or a review_id"):
+        log_spans(
+            rows=[{"run_id": run_id, "name": "db_write", "offset_ms": 0, "duration_ms": 1}],
+            db_path=db_path,
+        )
+    assert q_count(db_path, "spans") == 0
+
+
+def test_log_spans_rejects_unknown_name(db_path: Path, run_id: str) -> None:
+    with pytest.raises(ValueError):
+        log_spans(
+            rows=[{
+                "run_id": run_id,
+                "review_id": 1,
+                "name": "warmup",
+                "offset_ms": 0,
+                "duration_ms": 1,
+            }],
+            db_path=db_path,
+        )
+
+
 # ---------------------------------------------------------------------------
 # log_intervention
 # ---------------------------------------------------------------------------
@@ -562,6 +843,78 @@ def test_log_pipeline_event_inserts_row(db_path: Path, run_id: str) -> None:
     assert count == 1
 
 
+# ---------------------------------------------------------------------------
+# allocate_pipeline_id
+# ---------------------------------------------------------------------------
+
+
+def test_allocate_pipeline_id_counts_per_run(db_path: Path, run_id: str) -> None:
+    other = open_run(project="proj", approach=2, run_id="run-002", db_path=db_path)
+    assert allocate_pipeline_id(run_id=run_id, db_path=db_path) == "PIPE-run-001-01"
+    assert allocate_pipeline_id(run_id=run_id, db_path=db_path) == "PIPE-run-001-02"
+    assert allocate_pipeline_id(run_id=other, db_path=db_path) == "PIPE-run-002-01"
+
+
+def test_allocate_pipeline_id_continues_after_existing_events(
+    db_path: Path, run_id: str
+) -> None:
+    for pipeline_id in ("PIPE-run-001-07", "PIPE-run-001-03", "PIPE-run-0010-99"):
+        log_pipeline_event(
+            run_id=run_id, pipeline_id=pipeline_id, step="phase2", agent_role="orchestrator",
+            event_type=PipelineEventType.RESUME, detail="started", db_path=db_path,
+        )
+    assert allocate_pipeline_id(run_id=run_id, db_path=db_path) == "PIPE-run-001-08"
+    assert allocate_pipeline_id(run_id=run_id, db_path=db_path) == "PIPE-run-001-09"
+
+
+def test_allocate_pipeline_id_is_unique_across_threads(db_path: Path, run_id: str) -> None:
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ids = list(pool.map(
+            lambda _: allocate_pipeline_id(run_id=run_id, db_path=db_path), range(40)
+        ))
+    assert len(set(ids)) == 40
+    assert max(ids) == "PIPE-run-001-40"
+
+
+# ---------------------------------------------------------------------------
+# pipeline_checkpoints
+# ---------------------------------------------------------------------------
+
+
+def test_step_key_depends_on_every_part() -> None:
+    key = step_key(pipeline_id="PIPE-01", phase=3, artifact_id="DES-01", prompt="p")
+    assert len(key) == 64
+    assert key == step_key(pipeline_id="PIPE-01", phase=3, artifact_id="DES-01", prompt="p")
+    assert key != step_key(pipeline_id="PIPE-02", phase=3, artifact_id="DES-01", prompt="p")
+    assert key != step_key(pipeline_id="PIPE-01", phase=4, artifact_id="DES-01", prompt="p")
+    assert key != step_key(pipeline_id="PIPE-01", phase=3, artifact_id=None, prompt="p")
+    assert key != step_key(pipeline_id="PIPE-01", phase=3, artifact_id="DES-01", prompt="p2")
+
+
+def test_record_checkpoint_is_idempotent(db_path: Path, run_id: str) -> None:
+    def _record() -> str:
+        return record_checkpoint(
+            run_id=run_id, pipeline_id="PIPE-01", phase=3, artifact_id=None, prompt="p",
+            db_path=db_path,
+        )
+
+    assert get_checkpoint(
+        pipeline_id="PIPE-01", phase=3, artifact_id=None, prompt="p", db_path=db_path
+    ) is None
+    key = _record()
+    assert _record() == key
+    assert q_count(db_path, "pipeline_checkpoints") == 1
+    row = get_checkpoint(
+        pipeline_id="PIPE-01", phase=3, artifact_id=None, prompt="p", db_path=db_path
+    )
+    assert row is not None
+    assert row["step_key"] == key
+    assert row["interaction_id"] is None
+    assert get_checkpoint(
+        pipeline_id="PIPE-01", phase=3, artifact_id=None, prompt="edited", db_path=db_path
+    ) is None
+
+
 # ---------------------------------------------------------------------------
 # log_violation
 # ---------------------------------------------------------------------------
@@ -31,6 +31,8 @@
     "ArtifactStatus",
     "PhaseStatus",
     "AutomationLevel",
+    "ReviewMode",
+    "SpanName",
 }
 
 
@@ -0,0 +1,196 @@
+"""test_fake_provider.py: Tests for FakeProvider and the local stub model server."""
+
+from __future__ import annotations
+
+import json
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sdlc_core.providers import LoggedProvider
+from sdlc_core.providers.fake import FakeProvider, FakeProviderError
+from sdlc_core.providers.registry import get_provider
+from sdlc_core.providers.stub_server import StubServer
+from sdlc_core.session import Session
+from tests.conftest import q_one
+
+# ---------------------------------------------------------------------------
+# FakeProvider
+# ---------------------------------------------------------------------------
+
+
+def test_same_prompt_gives_same_reply() -> None:
+    first = FakeProvider(completion_tokens=20, completion_tokens_spread=5, seed=3)
+    second = FakeProvider(completion_tokens=20, completion_tokens_spread=5, seed=3)
+    assert first.complete("Draft requirements") == second.complete("Draft requirements")
+    assert first.complete("Draft requirements") != first.complete("Draft design")
+    assert first.complete("p", system="a") != first.complete("p", system="b")
+
+
+def test_reports_token_usage_and_time_to_first_token() -> None:
+    provider = FakeProvider(completion_tokens=12, latency_ms=10, ttft_fraction=0.5)
+    text = provider.complete("three word prompt", system="be brief")
+    assert len(text.split()) == 12
+    assert provider.last_token_usage == {
+        "prompt_tokens": 5, "completion_tokens": 12, "total_tokens": 17,
+    }
+    assert provider.last_time_to_first_token == pytest.approx(0.005)
+
+
+@pytest.mark.parametrize("latency", ["uniform", "normal", "lognormal", "exponential"])
+def test_latency_distributions_have_requested_mean(latency: str) -> None:
+    provider = FakeProvider(latency=latency, latency_ms=100, latency_spread_ms=20, seed=1)
+    samples = [provider.plan("p").latency for _ in range(4000)]
+    assert min(samples) >= 0
+    assert sum(samples) / len(samples) == pytest.approx(0.1, rel=0.1)
+
+
+def test_latency_sequence_is_reproducible() -> None:
+    def _latencies() -> list[float]:
+        provider = FakeProvider(latency="lognormal", latency_ms=50, latency_spread_ms=30, seed=9)
+        return [provider.plan("p").latency for _ in range(5)]
+
+    assert _latencies() == _latencies()
+
+
+def test_fail_every_injects_failures() -> None:
+    provider = FakeProvider(fail_every=3)
+    outcomes = []
+    for _ in range(6):
+        try:
+            provider.complete("p")
+            outcomes.append("ok")
+        except FakeProviderError:
+            outcomes.append("fail")
+    assert outcomes == ["ok", "ok", "fail", "ok", "ok", "fail"]
+
+
+def test_failure_rate_one_always_fails() -> None:
+    with pytest.raises(FakeProviderError):
+        FakeProvider(failure_rate=1.0).complete("p")
+
+
+def test_invalid_arguments_rejected() -> None:
+    with pytest.raises(ValueError, match="latency distribution"):
+        FakeProvider(latency="pareto")
+    with pytest.raises(ValueError, match="failure_rate"):
+        FakeProvider(failure_rate=2)
+
+
+def test_registered_as_builtin_with_options(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    toml = tmp_path / "models.toml"
+    toml.write_text(
+        '[models.fake]\nprovider = "fake"\nmodel_id = "fake-7b"\n'
+        "options = { completion_tokens = 4, fail_every = 2 }\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("SDLC_MODELS_TOML", str(toml))
+    provider = get_provider("fake")
+    assert isinstance(provider, FakeProvider)
+    assert provider.model_id == "fake-7b"
+    assert len(provider.complete("p").split()) == 4
+    with pytest.raises(FakeProviderError):
+        provider.complete("p")
+
+
+def test_options_must_be_a_table(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    toml = tmp_path / "models.toml"
+    toml.write_text('[models.fake]\nprovider = "fake"\noptions = "fast"\n', encoding="utf-8")
+    monkeypatch.setenv("SDLC_MODELS_TOML", str(toml))
+    with pytest.raises(ValueError, match="options"):
+        get_provider("fake")
+
+
+def test_logged_provider_records_fake_usage(
+    db_path: Path, run_id: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = Session(run_id=run_id, approach=1, active_phase=2, db_path=db_path)
+    provider = LoggedProvider(FakeProvider("fake-7b", completion_tokens=7), session=session)
+    answers = iter(["a", ""])
+    monkeypatch.setattr("builtins.input", lambda _: next(answers))
+    provider.complete("Draft the requirements document.", agent_role="analyst")
+    row = q_one(db_path, "SELECT model, prompt_tokens, completion_tokens FROM interactions")
+    assert row is not None
+    assert tuple(row) == ("fake-7b", 4, 7)
+
+
+# ---------------------------------------------------------------------------
+# Stub server
+# ---------------------------------------------------------------------------
+
+
+def _post(url: str, payload: dict[str, Any]) -> tuple[int, bytes]:
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode(), headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.read()
+
+
+_MESSAGES = [
+    {"role": "system", "content": "be brief"},
+    {"role": "user", "content": "Draft requirements"},
+]
+
+
+def test_stub_ollama_chat_matches_fake_provider() -> None:
+    expected = FakeProvider(completion_tokens=6).complete("Draft requirements", system="be brief")
+    with StubServer(FakeProvider(completion_tokens=6)) as server:
+        status, body = _post(
+            f"{server.url}/api/chat",
+            {"model": "llama3", "messages": _MESSAGES, "stream": False},
+        )
+    payload = json.loads(body)
+    assert status == 200
+    assert payload["message"]["content"] == expected
+    assert payload["eval_count"] == 6
+    assert payload["done"] is True
+
+
+def test_stub_ollama_streams_ndjson() -> None:
+    with StubServer(FakeProvider(completion_tokens=5)) as server:
+        status, body = _post(f"{server.url}/api/chat", {"model": "m", "messages": _MESSAGES})
+    chunks = [json.loads(line) for line in body.decode().splitlines()]
+    assert status == 200
+    assert len(chunks) == 6
+    assert chunks[-1]["done"] is True
+    assert len("".join(c["message"]["content"] for c in chunks).split()) == 5
+
+
+def test_stub_openai_chat_and_stream() -> None:
+    with StubServer(FakeProvider(completion_tokens=4)) as server:
+        status, body = _post(
+            f"{server.url}/v1/chat/completions", {"model": "gpt-4o", "messages": _MESSAGES}
+        )
+        _, stream = _post(
+            f"{server.url}/v1/chat/completions",
+            {
+                "model": "gpt-4o", "messages": _MESSAGES, "stream": True,
+                "stream_options": {"include_usage": True},
+            },
+        )
+    payload = json.loads(body)
+    assert status == 200
+    assert payload["usage"]["completion_tokens"] == 4
+
+    events = [line[len("data: "):] for line in stream.decode().split("\n\n") if line]
+    assert events[-1] == "[DONE]"
+    deltas = [json.loads(e) for e in events[:-1]]
+    text = "".join(d["choices"][0]["delta"].get("content", "") for d in deltas if d["choices"])
+    assert text == payload["choices"][0]["message"]["content"]
+    assert deltas[-1]["usage"]["total_tokens"] == payload["usage"]["total_tokens"]
+
+
+def test_stub_injects_failures_with_configured_status() -> None:
+    with StubServer(FakeProvider(fail_every=2), failure_status=503) as server:
+        url = f"{server.url}/v1/chat/completions"
+        statuses = [_post(url, {"messages": _MESSAGES})[0] for _ in range(4)]
+    assert statuses == [200, 503, 200, 503]
@@ -0,0 +1,97 @@
+"""test_importtime.py: Import-time budget for every sdlc_core command-line entry point."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import tomllib
+from pathlib import Path
+
+import pytest
+
+_CORE = Path(__file__).resolve().parents[1]
+
+# Cumulative ``python -X importtime`` microseconds of the entry module, in
+# milliseconds.  The budgets leave headroom for slow CI machines; the module
+# checks below catch a regression deterministically.
+_DEFAULT_BUDGET_MS = 300.0
+_LIGHT_BUDGET_MS = 120.0
+
+# Operator commands run many times per hour.  They must not load the provider
+# stack, the session dataclass or the TOML parser.
+_LIGHT = {
+    "sdlc_core.daemon",
+    "sdlc_core.status",
+    "sdlc_core.phase_status",
+    "sdlc_core.run_control",
+    "sdlc_core.diff_summary",
+}
+_HEAVY = (
+    "sdlc_core.session",
+    "sdlc_core.providers.registry",
+    "sdlc_core.providers.logged",
+    "tomllib",
+    "dataclasses",
+    "hashlib",
+)
+
+
+def _entry_modules() -> list[str]:
+    data = tomllib.loads((_CORE / "pyproject.toml").read_text(encoding="utf-8"))
+    scripts = data["tool"]["poetry"]["scripts"]
+    return sorted({target.split(":", 1)[0] for target in scripts.values()})
+
+
+def _importtime(module: str) -> dict[str, float]:
+    """Import *module* in a fresh interpreter; return cumulative ms per imported module."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_CORE,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = int(cumulative) / 1000.0
+    return timings
+
+
+@pytest.mark.parametrize("module", _entry_modules())
+def test_entry_point_import_budget(module: str) -> None:
+    budget = _LIGHT_BUDGET_MS if module in _LIGHT else _DEFAULT_BUDGET_MS
+    # Timing is noisy; the fastest of up to three runs has to fit.
+    best = _importtime(module)[module]
+    for _ in range(2):
+        if best <= budget:
+            break
+        best = min(best, _importtime(module)[module])
+    assert best <= budget, f"import {module} took {best:.1f} ms (budget {budget:.0f} ms)"
+
+
+@pytest.mark.parametrize("module", sorted(_LIGHT))
+def test_operator_commands_skip_heavy_modules(module: str) -> None:
+    loaded = _importtime(module)
+    assert not [name for name in _HEAVY if name in loaded]
+
+
+def test_providers_package_imports_lazily() -> None:
+    loaded = _importtime("sdlc_core.providers")
+    assert "sdlc_core.providers.registry" not in loaded
+    assert "sdlc_core.db" not in loaded
+
+
+def test_lazy_attributes_resolve() -> None:
+    import sdlc_core
+    import sdlc_core.providers as providers
+    from sdlc_core.providers.registry import get_provider
+    from sdlc_core.session import Session
+
+    assert sdlc_core.Session is Session
+    assert providers.get_provider is get_provider
+    assert "LoggedProvider" in dir(providers)
+    with pytest.raises(AttributeError):
+        _ = providers.NoSuchProvider
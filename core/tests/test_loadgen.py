@@ -0,0 +1,42 @@
+"""test_loadgen.py: Tests for the concurrent load generator (sdlc_core.loadgen)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from sdlc_core.loadgen import run_load
+from sdlc_core.providers.fake import FakeProvider
+from tests.conftest import q_count
+
+
+def test_workers_drive_the_full_logging_path(tmp_path: Path) -> None:
+    db_path = tmp_path / "load.db"
+    report = run_load(db_path, workers=3, duration=30, interactions=5)
+
+    assert report["interactions"] == 15
+    assert report["errors"] == report["lock_errors"] == 0
+    assert report["interactions_per_second"] > 0
+    assert q_count(db_path, "runs") == 3
+    assert q_count(db_path, "interactions", "outcome = 'accepted'") == 15
+    assert q_count(db_path, "pipeline_events") == 15
+    assert q_count(db_path, "violations") == 0
+    latency = report["latency_ms"]
+    assert latency["step"]["count"] == latency["interaction_write"]["count"] == 15
+    assert latency["pipeline_event_write"]["count"] == 15
+
+
+def test_provider_failures_are_counted(tmp_path: Path) -> None:
+    report = run_load(
+        tmp_path / "load.db", workers=2, duration=30, interactions=4,
+        make_provider=lambda: FakeProvider(fail_every=2),
+    )
+    assert report["interactions"] == 4
+    assert report["errors"] == 4
+    assert report["first_errors"][0].startswith("FakeProviderError")
+
+
+def test_invalid_arguments_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="workers"):
+        run_load(tmp_path / "load.db", workers=0)
@@ -11,6 +11,7 @@
 
 from sdlc_core.db import (
     accept_artifact,
+    log_interaction,
     log_intervention,
     log_validation_result,
     open_run,
@@ -23,7 +24,7 @@
     ValidationResult,
     ValidationType,
 )
-from sdlc_core.metrics import collect_all_metrics, write_report
+from sdlc_core.metrics import ModelPrice, collect_all_metrics, load_prices, write_report
 from sdlc_core.metrics import main as metrics_main
 
 _EXPECTED_TOP_LEVEL_KEYS = {
@@ -37,6 +38,8 @@
     "prompt_refinements",
     "defect_origin_mappings",
     "deployment",
+    "token_usage",
+    "latency_distributions",
 }
 
 
@@ -194,6 +197,233 @@ def test_validation_results_counted(db_path: Path) -> None:
     assert gov.get("governance_compliance_rate_pct") == 100.0
 
 
+# ---------------------------------------------------------------------------
+# Token usage and cost
+# ---------------------------------------------------------------------------
+
+
+def _log_usage(
+    db_path: Path,
+    run_id: str,
+    *,
+    model: str,
+    phase: int,
+    prompt_tokens: int,
+    completion_tokens: int,
+    duration_ms: float,
+    artifact_id: str | None = None,
+    outcome: str = "accepted",
+) -> None:
+    log_interaction(
+        run_id=run_id, sdlc_phase=phase, approach=1, agent_role="dev", model=model,
+        prompt="p", response="r", iteration=1, outcome=outcome, human_modified=False,
+        artifact_id=artifact_id, duration_seconds=int(duration_ms / 1000),
+        duration_ms=duration_ms, prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens, db_path=db_path,
+    )
+
+
+def test_token_usage_empty_db(db_path: Path) -> None:
+    with _conn(db_path) as conn:
+        usage = collect_all_metrics(conn)["token_usage"]
+    assert usage["total_tokens"] == 0
+    assert usage["latency_seconds"] == {"p50": None, "p90": None, "p99": None}
+    assert usage["total_cost_usd"] is None
+
+
+def test_token_usage_throughput_and_percentiles(db_path: Path) -> None:
+    rid = open_run(project="p", approach=1, run_id="r1", db_path=db_path)
+    for i in range(1, 11):
+        _log_usage(
+            db_path, rid, model="llama3", phase=2,
+            prompt_tokens=10, completion_tokens=100 * i, duration_ms=1000.0 * i,
+        )
+    _log_usage(
+        db_path, rid, model="gpt-4o", phase=3,
+        prompt_tokens=20, completion_tokens=50, duration_ms=500.0,
+    )
+    with _conn(db_path) as conn:
+        usage = collect_all_metrics(conn)["token_usage"]
+
+    llama = usage["per_model"]["llama3"]
+    assert llama["interactions"] == 10
+    assert llama["completion_tokens"] == 5500
+    assert llama["tokens_per_second"]["p50"] == 100.0
+    assert llama["latency_seconds"]["p50"] == 5.5
+    assert llama["latency_seconds"]["p90"] == pytest.approx(9.1)
+    assert usage["per_phase"][3]["tokens_per_second"]["p99"] == 100.0
+    assert usage["total_prompt_tokens"] == 120
+
+
+def test_token_usage_per_artifact_and_accepted(db_path: Path) -> None:
+    rid = open_run(project="p", approach=1, run_id="r1", db_path=db_path)
+    accept_artifact(
+        run_id=rid, artifact_id="REQ-01", artifact_type="Requirements Document",
+        phase=2, db_path=db_path,
+    )
+    _log_usage(
+        db_path, rid, model="m", phase=2, prompt_tokens=10, completion_tokens=20,
+        duration_ms=100.0, artifact_id="REQ-01", outcome="rejected",
+    )
+    _log_usage(
+        db_path, rid, model="m", phase=2, prompt_tokens=10, completion_tokens=30,
+        duration_ms=100.0, artifact_id="REQ-01",
+    )
+    _log_usage(
+        db_path, rid, model="m", phase=2, prompt_tokens=5, completion_tokens=5,
+        duration_ms=100.0,
+    )
+    with _conn(db_path) as conn:
+        usage = collect_all_metrics(conn)["token_usage"]
+    assert usage["tokens_per_artifact"] == {"r1/REQ-01": 70}
+    assert usage["mean_tokens_per_accepted_artifact"] == 70.0
+
+
+def test_token_usage_keeps_shared_artifact_ids_apart_across_runs(db_path: Path) -> None:
+    accepted_run = open_run(project="p", approach=1, run_id="r1", db_path=db_path)
+    draft_run = open_run(project="p", approach=1, run_id="r2", db_path=db_path)
+    accept_artifact(
+        run_id=accepted_run, artifact_id="REQ-01", artifact_type="Requirements Document",
+        phase=2, db_path=db_path,
+    )
+    with _conn(db_path) as conn:
+        conn.execute(
+            "INSERT INTO artifacts (id, run_id, artifact_type, phase, status, created_at) "
+            "VALUES ('REQ-01', ?, 'Requirements Document', 2, 'draft', '2026-01-01')",
+            (draft_run,),
+        )
+        conn.commit()
+    _log_usage(
+        db_path, accepted_run, model="m", phase=2, prompt_tokens=10, completion_tokens=30,
+        duration_ms=100.0, artifact_id="REQ-01",
+    )
+    _log_usage(
+        db_path, draft_run, model="m", phase=2, prompt_tokens=100, completion_tokens=900,
+        duration_ms=100.0, artifact_id="REQ-01",
+    )
+    with _conn(db_path) as conn:
+        usage = collect_all_metrics(conn)["token_usage"]
+    assert usage["tokens_per_artifact"] == {"r1/REQ-01": 40, "r2/REQ-01": 1000}
+    assert usage["mean_tokens_per_artifact"] == 520.0
+    assert usage["mean_tokens_per_accepted_artifact"] == 40.0
+
+
+def test_token_usage_cost_with_prices(db_path: Path) -> None:
+    rid = open_run(project="p", approach=1, run_id="r1", db_path=db_path)
+    _log_usage(
+        db_path, rid, model="gpt-4o", phase=2,
+        prompt_tokens=1_000_000, completion_tokens=500_000, duration_ms=1000.0,
+    )
+    _log_usage(
+        db_path, rid, model="llama3", phase=2,
+        prompt_tokens=10, completion_tokens=10, duration_ms=1000.0,
+    )
+    prices = {"gpt-4o": ModelPrice(prompt_per_mtok=2.5, completion_per_mtok=10.0)}
+    with _conn(db_path) as conn:
+        usage = collect_all_metrics(conn, prices=prices)["token_usage"]
+    assert usage["per_model"]["gpt-4o"]["cost_usd"] == 7.5
+    assert usage["per_model"]["llama3"]["cost_usd"] is None
+    assert usage["total_cost_usd"] == 7.5
+    assert usage["unpriced_models"] == ["llama3"]
+
+
+def test_load_prices_keys_by_model_id(tmp_path: Path) -> None:
+    toml = tmp_path / "models.toml"
+    toml.write_text(
+        """
+[models.gpt]
+provider = "openai"
+model_id = "gpt-4o"
+prompt_price_per_mtok = 2.5
+completion_price_per_mtok = 10
+
+[models.local]
+provider = "ollama"
+model_id = "llama3"
+""",
+        encoding="utf-8",
+    )
+    prices = load_prices(toml)
+    assert prices["gpt-4o"] == ModelPrice(2.5, 10.0)
+    assert "gpt" in prices
+    assert "llama3" not in prices
+
+
+def test_load_prices_rejects_negative_price(tmp_path: Path) -> None:
+    toml = tmp_path / "models.toml"
+    toml.write_text(
+        '[models.gpt]\nmodel_id = "gpt-4o"\nprompt_price_per_mtok = -1\n', encoding="utf-8"
+    )
+    with pytest.raises(ValueError, match="prompt_price_per_mtok"):
+        load_prices(toml)
+
+
+# ---------------------------------------------------------------------------
+# Latency distributions
+# ---------------------------------------------------------------------------
+
+
+def test_latency_distributions_empty_db(db_path: Path) -> None:
+    with _conn(db_path) as conn:
+        dist = collect_all_metrics(conn)["latency_distributions"]
+    overall = dist["interaction_duration_seconds"]["overall"]
+    assert overall["count"] == 0
+    assert overall["p99"] is None
+    assert dist["pipeline_event_gap_seconds"]["per_step"] == {}
+
+
+def test_latency_distributions_per_model_and_phase(db_path: Path) -> None:
+    rid = open_run(project="p", approach=1, run_id="r1", db_path=db_path)
+    for ms in (200.0, 400.0, 600.0):
+        _log_usage(
+            db_path, rid, model="llama3", phase=2,
+            prompt_tokens=1, completion_tokens=1, duration_ms=ms,
+        )
+    _log_usage(
+        db_path, rid, model="gpt-4o", phase=3,
+        prompt_tokens=1, completion_tokens=1, duration_ms=4000.0,
+    )
+    with _conn(db_path) as conn:
+        dist = collect_all_metrics(conn)["latency_distributions"]
+    durations = dist["interaction_duration_seconds"]
+    assert durations["overall"]["count"] == 4
+    assert durations["per_model"]["llama3"]["p50"] == 0.4
+    assert durations["per_phase"][3]["max"] == 4.0
+    buckets = {b["le"]: b["count"] for b in durations["per_model"]["llama3"]["histogram"]}
+    assert buckets[0.25] == 1
+    assert buckets[0.5] == 1
+    assert buckets[1.0] == 1
+
+
+def test_latency_distributions_pipeline_gaps_per_step(db_path: Path) -> None:
+    rid = open_run(project="p", approach=2, run_id="r2", db_path=db_path)
+    events = [
+        ("PIPE-1", "2026-01-01T00:00:00+00:00", "phase2"),
+        ("PIPE-1", "2026-01-01T00:00:30+00:00", "phase3"),
+        ("PIPE-1", "2026-01-01T00:01:30+00:00", "phase4"),
+        ("PIPE-2", "2026-01-01T01:00:00+00:00", "phase2"),
+        ("PIPE-2", "2026-01-01T01:00:10+00:00", "phase3"),
+    ]
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executemany(
+            "INSERT INTO pipeline_events"
+            " (run_id, pipeline_id, timestamp, step, agent_role, event_type, detail)"
+            " VALUES (?, ?, ?, ?, 'runner', 'gate_pass', '')",
+            [(rid, pid, ts, step) for pid, ts, step in events],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    with _conn(db_path) as conn:
+        gaps = collect_all_metrics(conn)["latency_distributions"]["pipeline_event_gap_seconds"]
+    assert gaps["overall"]["count"] == 3
+    assert gaps["per_step"]["phase3"]["count"] == 2
+    assert gaps["per_step"]["phase3"]["max"] == 30.0
+    assert gaps["per_step"]["phase4"]["p50"] == 60.0
+    assert "phase2" not in gaps["per_step"]
+
+
 # ---------------------------------------------------------------------------
 # write_report integration
 # ---------------------------------------------------------------------------
@@ -248,3 +478,21 @@ def test_metrics_main_writes_report(
     monkeypatch.setattr("sys.argv", ["metrics", "--db", str(db_path), "--out", str(out)])
     metrics_main()
     assert out.exists()
+
+
+def test_metrics_main_reads_prices(
+    db_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import json
+
+    toml = tmp_path / "models.toml"
+    toml.write_text(
+        '[models.m]\nmodel_id = "m"\nprompt_price_per_mtok = 1\n', encoding="utf-8"
+    )
+    out = tmp_path / "metrics_report.json"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["metrics", "--db", str(db_path), "--out", str(out), "--models-toml", str(toml)],
+    )
+    metrics_main()
+    assert json.loads(out.read_text())["token_usage"]["unpriced_models"] == []
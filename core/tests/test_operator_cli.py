@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -97,22 +99,73 @@ def test_diff_summary_classifies_human_modified_artifact(
         db_path=db_path,
     )
 
-    def fake_run_git(repo: Path, args: list[str]) -> str:
-        if args[0] == "diff":
-            return "artifacts/phase2/REQ-01.md\nREADME.md"
-        if args[0] == "log":
-            return "Researcher\nResearcher"
-        raise AssertionError(f"Unexpected git args: {args}")
+    calls: list[list[str]] = []
 
-    monkeypatch.setattr("sdlc_core.diff_summary._run_git", fake_run_git)
+    def fake_stream_git(repo: Path, args: list[str]) -> Iterator[str]:
+        calls.append(args)
+        yield from [
+            "\x1eResearcher",
+            "",
+            "5\t1\tartifacts/phase2/REQ-01.md",
+            "2\t0\tREADME.md",
+            "\x1eResearcher",
+            "",
+            "-\t-\tartifacts/phase2/REQ-01.png",
+        ]
+
+    monkeypatch.setattr("sdlc_core.diff_summary._stream_git", fake_stream_git)
 
     result = _summary(repo=tmp_path, db_path=db_path, since="abc123")
+    assert len(calls) == 1
+    assert calls[0][-1] == "abc123..HEAD"
     assert result["latest_run_id"] == run_id
     assert result["artifact_classification"]["REQ-01"] == "human-modified"
+    assert result["artifact_churn"]["REQ-01"] == {
+        "commits": 2, "lines_added": 5, "lines_deleted": 1,
+    }
     assert result["authors"] == {"Researcher": 2}
     assert "README.md" in result["unlinked_files"]
 
 
+def test_diff_summary_reads_real_git_history(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    artifact = repo / "artifacts" / "phase3" / "DESIGN-01.md"
+    artifact.parent.mkdir(parents=True)
+
+    def git(*args: str, author: str = "Alice") -> None:
+        subprocess.run(
+            ["git", "-c", f"user.name={author}", "-c", "user.email=a@example.org", *args],
+            cwd=repo, check=True, capture_output=True,
+        )
+
+    git("init", "-q")
+    (repo / "README.md").write_text("base\n", encoding="utf-8")
+    git("add", "-A")
+    git("commit", "-q", "-m", "base")
+    git("tag", "base")
+
+    artifact.write_text("one\ntwo\n", encoding="utf-8")
+    git("add", "-A")
+    git("commit", "-q", "-m", "design", author="Alice")
+    artifact.write_text("one\n2\nthree\n", encoding="utf-8")
+    (repo / "notes.txt").write_text("n\n", encoding="utf-8")
+    git("add", "-A")
+    git("commit", "-q", "-m", "edit", author="Bob")
+
+    db_path = setup_db(tmp_path / "experiment.db")
+    result = _summary(repo=repo, db_path=db_path, since="base")
+    assert result["changed_files"] == ["artifacts/phase3/DESIGN-01.md", "notes.txt"]
+    assert result["authors"] == {"Alice": 1, "Bob": 1}
+    assert result["artifact_churn"] == {
+        "DESIGN-01": {"commits": 2, "lines_added": 4, "lines_deleted": 1},
+    }
+    assert result["latest_run_id"] is None
+    assert result["unlinked_files"] == ["notes.txt"]
+
+    with pytest.raises(subprocess.CalledProcessError):
+        _summary(repo=repo, db_path=db_path, since="no-such-ref")
+
+
 def test_status_snapshot_json_serializable(tmp_path: Path) -> None:
     db_path = tmp_path / "experiment.db"
     setup_db(db_path)
@@ -69,6 +69,35 @@ def test_ollama_provider_complete_basic() -> None:
     assert result == "Hi there!"
 
 
+def test_ollama_provider_reports_time_to_first_token() -> None:
+    from sdlc_core.providers.ollama import OllamaProvider
+
+    mock_ollama = MagicMock()
+    mock_ollama.Client.return_value.chat.return_value = {
+        "message": {"content": "ok"},
+        "load_duration": 100_000_000,
+        "prompt_eval_duration": 150_000_000,
+    }
+    with patch.dict(sys.modules, {"ollama": mock_ollama}):
+        provider = OllamaProvider(model_id="llama3")
+        assert provider.last_time_to_first_token is None
+        provider.complete("Hello")
+
+    assert provider.last_time_to_first_token == pytest.approx(0.25)
+
+
+def test_ollama_provider_time_to_first_token_none_when_unreported() -> None:
+    from sdlc_core.providers.ollama import OllamaProvider
+
+    mock_ollama = MagicMock()
+    mock_ollama.Client.return_value.chat.return_value = {"message": {"content": "ok"}}
+    with patch.dict(sys.modules, {"ollama": mock_ollama}):
+        provider = OllamaProvider(model_id="llama3")
+        provider.complete("Hello")
+
+    assert provider.last_time_to_first_token is None
+
+
 def test_ollama_provider_passes_system_message() -> None:
     from sdlc_core.providers.ollama import OllamaProvider
 
@@ -563,3 +592,117 @@ def test_langchain_provider_last_token_usage_returns_copy() -> None:
     usage = provider.last_token_usage
     usage["prompt_tokens"] = 9999
     assert provider.last_token_usage["prompt_tokens"] == 0
+
+
+def test_langchain_provider_complete_batch_uses_native_batch() -> None:
+    from sdlc_core.providers.langchain_provider import LangChainProvider
+
+    fake_lc_core, fake_model = _make_fake_langchain_modules()
+    first, second = MagicMock(), MagicMock()
+    first.content, second.content = "one", "two"
+    first.usage_metadata = {"input_tokens": 1, "output_tokens": 2, "total_tokens": 3}
+    second.usage_metadata = {"input_tokens": 4, "output_tokens": 5, "total_tokens": 9}
+    fake_model.batch.return_value = [first, second]
+    with patch.dict(
+        sys.modules,
+        {"langchain_core": fake_lc_core, "langchain_core.messages": fake_lc_core.messages},
+    ):
+        provider = LangChainProvider(fake_model)
+        results = provider.complete_batch(["a", "b"], system="sys")
+
+    fake_model.batch.assert_called_once()
+    fake_model.invoke.assert_not_called()
+    inputs = fake_model.batch.call_args.args[0]
+    assert len(inputs) == 2
+    assert inputs[0][0] == {"role": "system", "content": "sys"}
+    assert [r.text for r in results] == ["one", "two"]
+    assert results[1].token_usage["completion_tokens"] == 5
+
+
+# ---------------------------------------------------------------------------
+# Batch helper
+# ---------------------------------------------------------------------------
+
+
+class _EchoProvider:
+    """Plain provider without native batch support or usage reporting."""
+
+    def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str:
+        return f"{system or ''}{prompt}"
+
+
+class _UsageProvider:
+    """Provider whose ``last_token_usage`` is overwritten by every call."""
+
+    def __init__(self) -> None:
+        self.last_token_usage: dict[str, int] = {}
+
+    def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str:
+        self.last_token_usage = {"prompt_tokens": len(prompt), "completion_tokens": 1}
+        return prompt.upper()
+
+
+def test_complete_batch_fallback_preserves_order() -> None:
+    from sdlc_core.providers.batch import complete_batch
+
+    prompts = [f"p{i}" for i in range(10)]
+    results = complete_batch(_EchoProvider(), prompts, system="> ", max_workers=3)
+    assert [r.text for r in results] == [f"> p{i}" for i in range(10)]
+    assert all(r.duration_seconds is not None for r in results)
+
+
+def test_complete_batch_fallback_attributes_usage_per_item() -> None:
+    from sdlc_core.providers.batch import complete_batch
+
+    results = complete_batch(_UsageProvider(), ["a", "bbb"])
+    assert [r.token_usage["prompt_tokens"] for r in results] == [1, 3]
+
+
+def test_complete_batch_uses_native_method_when_defined() -> None:
+    from sdlc_core.providers.base import BatchModelProvider, Completion
+    from sdlc_core.providers.batch import complete_batch, supports_native_batch
+
+    class _Native(_EchoProvider):
+        def __init__(self) -> None:
+            self.calls: list[list[str]] = []
+
+        def complete_batch(
+            self, prompts: list[str], system: str | None = None, **kwargs: Any
+        ) -> list[Completion]:
+            self.calls.append(list(prompts))
+            return [Completion(text=p) for p in prompts]
+
+    provider = _Native()
+    assert isinstance(provider, BatchModelProvider)
+    assert supports_native_batch(provider)
+    results = complete_batch(provider, ["x", "y"])
+    assert provider.calls == [["x", "y"]]
+    assert [r.text for r in results] == ["x", "y"]
+    assert results[0].duration_seconds is not None
+
+
+def test_complete_batch_mock_is_not_treated_as_native() -> None:
+    from sdlc_core.providers.batch import supports_native_batch
+
+    assert not supports_native_batch(MagicMock())
+
+
+def test_complete_batch_rejects_native_result_count_mismatch() -> None:
+    from sdlc_core.providers.base import Completion
+    from sdlc_core.providers.batch import complete_batch
+
+    class _Short(_EchoProvider):
+        def complete_batch(
+            self, prompts: list[str], system: str | None = None, **kwargs: Any
+        ) -> list[Completion]:
+            return []
+
+    with pytest.raises(ValueError, match="returned 0"):
+        complete_batch(_Short(), ["x"])
+
+
+def test_complete_batch_rejects_non_positive_max_workers() -> None:
+    from sdlc_core.providers.batch import complete_batch
+
+    with pytest.raises(ValueError, match="max_workers"):
+        complete_batch(_EchoProvider(), ["x"], max_workers=0)
@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import sys
+import threading
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
@@ -100,6 +101,47 @@ def test_api_key_read_from_env_var(self, monkeypatch: pytest.MonkeyPatch) -> Non
             self._provider(api_key_env="MY_CLAUDE_KEY").complete("prompt")
         mock.Anthropic.assert_called_once_with(api_key="real-key")
 
+    # -- shared client -------------------------------------------------------
+
+    def test_client_reused_across_calls_and_instances(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test")
+        mock = self._mock_anthropic()
+        with patch.dict(sys.modules, {"anthropic": mock}):
+            self._provider().complete("one")
+            self._provider(model_id="claude-haiku-3-5").complete("two")
+        mock.Anthropic.assert_called_once_with(api_key="sk-test")
+        assert mock.Anthropic.return_value.messages.create.call_count == 2
+
+    def test_new_client_per_api_key_and_base_url(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("KEY_A", "a")
+        monkeypatch.setenv("KEY_B", "b")
+        mock = self._mock_anthropic()
+        with patch.dict(sys.modules, {"anthropic": mock}):
+            self._provider(api_key_env="KEY_A").complete("p")
+            self._provider(api_key_env="KEY_B").complete("p")
+            self._provider(api_key_env="KEY_A", api_base="http://gw.local").complete("p")
+        assert [c.kwargs for c in mock.Anthropic.call_args_list] == [
+            {"api_key": "a"},
+            {"api_key": "b"},
+            {"api_key": "a", "base_url": "http://gw.local"},
+        ]
+
+    def test_concurrent_first_calls_build_one_client(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test")
+        mock = self._mock_anthropic()
+        provider = self._provider()
+        with patch.dict(sys.modules, {"anthropic": mock}):
+            threads = [threading.Thread(target=provider.complete, args=("p",)) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        mock.Anthropic.assert_called_once()
+
     # -- error paths ---------------------------------------------------------
 
     def test_import_error_when_package_missing(self) -> None:
@@ -209,6 +251,32 @@ def test_extra_kwargs_forwarded(self, monkeypatch: pytest.MonkeyPatch) -> None:
 
     # -- error paths ---------------------------------------------------------
 
+    def test_complete_batch_returns_results_in_order(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        mock = MagicMock()
+
+        def _create(**kwargs: Any) -> MagicMock:
+            choice = MagicMock()
+            choice.message.content = kwargs["messages"][-1]["content"].upper()
+            return MagicMock(choices=[choice], usage=MagicMock(prompt_tokens=3))
+
+        mock.OpenAI.return_value.chat.completions.create.side_effect = _create
+        with patch.dict(sys.modules, {"openai": mock}):
+            results = self._provider().complete_batch(["a", "b", "c"], max_concurrency=2)
+        assert [r.text for r in results] == ["A", "B", "C"]
+        assert results[0].token_usage["prompt_tokens"] == 3
+        mock.OpenAI.assert_called_once()
+
+    def test_client_reused_across_calls(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        mock = self._mock_openai()
+        with patch.dict(sys.modules, {"openai": mock}):
+            self._provider().complete("one")
+            self._provider().complete_batch(["two", "three"])
+        mock.OpenAI.assert_called_once_with(api_key="sk-test")
+
     def test_import_error_when_package_missing(self) -> None:
         with patch.dict(sys.modules, {"openai": None}):
             with pytest.raises(ImportError, match="openai"):
@@ -410,6 +478,21 @@ def test_captures_token_usage(self) -> None:
         assert usage["completion_tokens"] == 8
         assert usage["total_tokens"] == 20
 
+    def test_complete_batch_uses_batch_completion(self) -> None:
+        mock = self._mock_litellm()
+        mock.batch_completion.return_value = [
+            {"choices": [{"message": {"content": "one"}}], "usage": {"prompt_tokens": 1}},
+            {"choices": [{"message": {"content": "two"}}], "usage": {"prompt_tokens": 2}},
+        ]
+        with patch.dict(sys.modules, {"litellm": mock}):
+            results = self._provider().complete_batch(["a", "b"], system="sys")
+        mock.completion.assert_not_called()
+        messages = mock.batch_completion.call_args.kwargs["messages"]
+        assert len(messages) == 2
+        assert messages[1][-1] == {"role": "user", "content": "b"}
+        assert [r.text for r in results] == ["one", "two"]
+        assert results[1].token_usage["prompt_tokens"] == 2
+
     def test_raises_import_error_when_package_missing(self) -> None:
         with patch.dict(sys.modules, {"litellm": None}):
             with pytest.raises(ImportError, match="litellm"):
@@ -426,3 +509,38 @@ def test_raises_when_api_key_env_missing(
                     model_id="openai/gpt-4o",
                     api_key_env="OPENAI_API_KEY",
                 ).complete("prompt")
+
+
+# ---------------------------------------------------------------------------
+# Shared client cache
+# ---------------------------------------------------------------------------
+
+
+def test_shared_client_is_built_once_per_configuration() -> None:
+    from sdlc_core.providers.examples._clients import shared_client
+
+    factory = MagicMock(side_effect=lambda **kwargs: object())
+    first = shared_client(factory, api_key="k", base_url="http://gw.local")
+    assert shared_client(factory, base_url="http://gw.local", api_key="k") is first
+    assert shared_client(factory, api_key="k") is not first
+    assert factory.call_count == 2
+
+
+def test_shared_client_concurrent_first_use_builds_one_client() -> None:
+    from sdlc_core.providers.examples._clients import shared_client
+
+    factory = MagicMock(side_effect=lambda **kwargs: object())
+    barrier = threading.Barrier(8)
+    clients: list[object] = []
+
+    def use() -> None:
+        barrier.wait()
+        clients.append(shared_client(factory, api_key="concurrent"))
+
+    threads = [threading.Thread(target=use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert factory.call_count == 1
+    assert all(client is clients[0] for client in clients)
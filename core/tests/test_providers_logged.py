@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import sqlite3
+import threading
+import time
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -10,6 +13,7 @@
 import pytest
 
 from sdlc_core.db import accept_artifact, open_run, setup_db
+from sdlc_core.providers import logged
 from sdlc_core.providers.logged import LoggedProvider
 from sdlc_core.session import Session
 from tests.conftest import q_count, q_one
@@ -271,6 +275,272 @@ def test_exploratory_prompt_uses_iteration_one_and_null_artifact(
     assert row["artifact_id"] is None
 
 
+# ---------------------------------------------------------------------------
+# Concurrent review
+# ---------------------------------------------------------------------------
+
+
+def test_concurrent_reviews_take_turns_at_the_terminal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, _ = _make_session(tmp_path)
+    both_called = threading.Barrier(2)
+    screen: list[str] = []
+
+    def display(response: str) -> None:
+        screen.append(response)
+        time.sleep(0.05)  # the researcher reads; another thread may print meanwhile
+
+    def answer(_: str) -> str:
+        return "a" if screen[-1] == "keep" else "r"
+
+    monkeypatch.setattr(logged, "display_response", display)
+    monkeypatch.setattr("builtins.input", answer)
+
+    def worker(response: str) -> None:
+        mock = _mock_provider(response)
+        # Both model calls finish before either review starts.
+        mock.complete.side_effect = lambda *_, **__: (both_called.wait(), response)[1]
+        session = Session(run_id="run-log-01", approach=2, active_phase=3, db_path=db_path)
+        LoggedProvider(mock, session=session).complete("p", agent_role="developer")
+
+    threads = [threading.Thread(target=worker, args=(r,)) for r in ("keep", "drop")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with sqlite3.connect(db_path) as conn:
+        outcomes = dict(conn.execute("SELECT response, outcome FROM interactions").fetchall())
+    assert outcomes == {"keep": "accepted", "drop": "rejected"}
+
+
+# ---------------------------------------------------------------------------
+# Batch completion
+# ---------------------------------------------------------------------------
+
+
+def test_complete_batch_returns_responses_in_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    mock = _mock_provider()
+    mock.complete.side_effect = lambda prompt, **_: f"answer to {prompt}"
+    provider = LoggedProvider(mock, session=session)
+    monkeypatch.setattr("builtins.input", _make_inputs("a", "r", "a"))
+    responses = provider.complete_batch(["p1", "p2", "p3"], agent_role="developer")
+    assert responses == ["answer to p1", "answer to p2", "answer to p3"]
+
+
+def test_complete_batch_writes_one_row_per_prompt(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    provider = LoggedProvider(_mock_provider(), session=session)
+    monkeypatch.setattr("builtins.input", _make_inputs("a", "r"))
+    provider.complete_batch(["p1", "p2"], agent_role="developer")
+    assert q_count(db_path, "interactions") == 2
+    row = q_one(
+        db_path, "SELECT prompt, outcome FROM interactions ORDER BY id DESC LIMIT 1"
+    )
+    assert row is not None
+    assert row["prompt"] == "p2"
+    assert row["outcome"] == "rejected"
+
+
+def test_complete_batch_iterations_follow_artifacts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    _register_artifact(db_path, session.run_id, "ART-01")
+    provider = LoggedProvider(_mock_provider(), session=session)
+    monkeypatch.setattr("builtins.input", _make_inputs("a", "a", "a"))
+    provider.complete_batch(
+        ["p1", "p2", "p3"], agent_role="developer", artifact_ids=["ART-01", "ART-01", None]
+    )
+    rows = [
+        q_one(db_path, "SELECT iteration FROM interactions WHERE prompt = ?", (p,))
+        for p in ("p1", "p2", "p3")
+    ]
+    assert [r["iteration"] for r in rows if r is not None] == [1, 2, 1]
+
+
+def test_complete_batch_rejects_mismatched_artifact_ids(tmp_path: Path) -> None:
+    db_path, session = _make_session(tmp_path)
+    mock = _mock_provider()
+    provider = LoggedProvider(mock, session=session)
+    with pytest.raises(ValueError, match="artifact_ids"):
+        provider.complete_batch(["p1", "p2"], agent_role="developer", artifact_ids=["A"])
+    mock.complete.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Timing and spans
+# ---------------------------------------------------------------------------
+
+
+def _span_names(db_path: Path) -> list[str]:
+    conn = sqlite3.connect(db_path)
+    try:
+        return [r[0] for r in conn.execute("SELECT name FROM spans ORDER BY id")]
+    finally:
+        conn.close()
+
+
+def test_complete_records_millisecond_durations(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    provider = LoggedProvider(_mock_provider(), session=session)
+    monkeypatch.setattr("builtins.input", _make_inputs("a"))
+    provider.complete("prompt", agent_role="developer")
+    row = q_one(db_path, "SELECT duration_ms, human_review_ms FROM interactions")
+    assert row is not None
+    assert isinstance(row["duration_ms"], float)
+    assert isinstance(row["human_review_ms"], float)
+
+
+def test_complete_writes_spans_linked_to_interaction(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    provider = LoggedProvider(_mock_provider(), session=session)
+    monkeypatch.setattr("builtins.input", _make_inputs("a"))
+    provider.complete("prompt", agent_role="developer")
+    assert _span_names(db_path) == ["provider_call", "human_review", "db_write"]
+    interaction = q_one(db_path, "SELECT id FROM interactions")
+    assert interaction is not None
+    assert q_count(db_path, "spans", "interaction_id = ?", (interaction["id"],)) == 3
+
+
+def test_complete_records_first_token_and_validation_spans(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+
+    class _Streaming:
+        _model_id = "streamer"
+        last_time_to_first_token = 0.25
+
+        def complete(self, prompt: str, system: str | None = None, **kwargs: Any) -> str:
+            return "ok"
+
+    provider = LoggedProvider(_Streaming(), session=session, validate_prompts=True)
+    monkeypatch.setattr("builtins.input", _make_inputs("a"))
+    with pytest.warns(UserWarning):
+        provider.complete("unstructured prompt", agent_role="developer")
+    names = _span_names(db_path)
+    assert names[:3] == ["prompt_validation", "provider_call", "first_token"]
+    row = q_one(db_path, "SELECT duration_ms FROM spans WHERE name = 'first_token'")
+    assert row is not None
+    assert row["duration_ms"] == 250.0
+
+
+def test_auto_accept_logs_without_prompting(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    monkeypatch.setattr("builtins.input", _no_input)
+    provider = LoggedProvider(_mock_provider(), session=session, review_mode="auto_accept")
+    provider.complete("p1", agent_role="developer")
+    provider.complete_batch(["p2", "p3"], agent_role="developer")
+    assert q_count(db_path, "interactions", "outcome = 'accepted' AND human_modified = 0") == 3
+    assert q_count(db_path, "spans", "name = 'human_review'") == 0
+
+
+def test_last_interaction_id_tracks_logged_row(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    provider = LoggedProvider(_mock_provider(), session=session, review_mode="auto_accept")
+    assert provider.last_interaction_id is None
+    provider.complete("p1", agent_role="developer")
+    provider.complete("p2", agent_role="developer")
+    row = q_one(db_path, "SELECT MAX(id) FROM interactions")
+    assert row is not None
+    assert provider.last_interaction_id == row[0]
+
+    deferred = LoggedProvider(_mock_provider(), session=session, review_mode="deferred")
+    deferred.complete("p3", agent_role="developer")
+    assert deferred.last_interaction_id is None
+
+
+def test_deferred_complete_spans_reference_review(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    provider = LoggedProvider(_mock_provider(), session=session, review_mode="deferred")
+    provider.complete("prompt", agent_role="developer")
+    assert _span_names(db_path) == ["provider_call", "db_write"]
+    assert q_count(db_path, "spans", "review_id IS NOT NULL AND interaction_id IS NULL") == 2
+
+
+def test_complete_batch_writes_spans_per_item(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    provider = LoggedProvider(_mock_provider(), session=session)
+    monkeypatch.setattr("builtins.input", _make_inputs("a", "a"))
+    provider.complete_batch(["p1", "p2"], agent_role="developer")
+    assert q_count(db_path, "spans", "name = 'provider_call'") == 2
+    assert q_count(db_path, "spans", "name = 'db_write'") == 2
+    assert q_count(db_path, "spans", "interaction_id IS NULL") == 0
+
+
+# ---------------------------------------------------------------------------
+# Deferred review
+# ---------------------------------------------------------------------------
+
+
+def _no_input(_: str) -> str:
+    raise AssertionError("deferred mode must not prompt the researcher")
+
+
+def test_deferred_complete_queues_without_prompting(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    provider = LoggedProvider(_mock_provider("queued"), session=session, review_mode="deferred")
+    monkeypatch.setattr("builtins.input", _no_input)
+    assert provider.complete("prompt", agent_role="developer") == "queued"
+    assert q_count(db_path, "interactions") == 0
+    row = q_one(db_path, "SELECT response, reviewed_at FROM review_queue")
+    assert row is not None
+    assert row["response"] == "queued"
+    assert row["reviewed_at"] is None
+
+
+def test_deferred_complete_keeps_iteration_counter(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    _register_artifact(db_path, session.run_id, "ART-01")
+    provider = LoggedProvider(_mock_provider(), session=session, review_mode="deferred")
+    monkeypatch.setattr("builtins.input", _no_input)
+    provider.complete("p1", agent_role="developer", artifact_id="ART-01")
+    provider.complete("p2", agent_role="developer", artifact_id="ART-01")
+    row = q_one(db_path, "SELECT MAX(iteration) AS it FROM review_queue")
+    assert row is not None
+    assert row["it"] == 2
+
+
+def test_deferred_complete_batch_queues_every_response(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path, session = _make_session(tmp_path)
+    provider = LoggedProvider(_mock_provider(), session=session, review_mode="deferred")
+    monkeypatch.setattr("builtins.input", _no_input)
+    provider.complete_batch(["p1", "p2", "p3"], agent_role="developer")
+    assert q_count(db_path, "review_queue") == 3
+    assert q_count(db_path, "interactions") == 0
+
+
+def test_invalid_review_mode_raises(tmp_path: Path) -> None:
+    db_path, session = _make_session(tmp_path)
+    with pytest.raises(ValueError):
+        LoggedProvider(_mock_provider(), session=session, review_mode="later")
+
+
 # ---------------------------------------------------------------------------
 # model_id property
 # ---------------------------------------------------------------------------
@@ -0,0 +1,137 @@
+"""test_quantiles.py: Tests for sdlc_core.quantiles."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from sdlc_core.quantiles import (
+    FixedHistogram,
+    LatencySummary,
+    QuantileSketch,
+    exact_percentile,
+)
+
+# ---------------------------------------------------------------------------
+# exact_percentile
+# ---------------------------------------------------------------------------
+
+
+def test_exact_percentile_interpolates() -> None:
+    values = [1.0, 2.0, 3.0, 4.0]
+    assert exact_percentile(values, 0) == 1.0
+    assert exact_percentile(values, 50) == 2.5
+    assert exact_percentile(values, 100) == 4.0
+
+
+# ---------------------------------------------------------------------------
+# QuantileSketch
+# ---------------------------------------------------------------------------
+
+
+def test_sketch_empty_returns_none() -> None:
+    sketch = QuantileSketch()
+    assert sketch.quantile(50) is None
+    assert sketch.percentiles() == {"p50": None, "p90": None, "p95": None, "p99": None}
+
+
+def test_sketch_is_exact_below_limit() -> None:
+    sketch = QuantileSketch(exact_limit=100)
+    sketch.extend(float(v) for v in range(1, 101))
+    assert sketch.is_exact
+    assert sketch.quantile(50) == 50.5
+    assert sketch.quantile(99) == pytest.approx(99.01)
+
+
+def test_sketch_switches_to_buckets_and_stays_within_error() -> None:
+    rng = random.Random(7)
+    values = [rng.lognormvariate(0, 1.5) for _ in range(20_000)]
+    sketch = QuantileSketch(exact_limit=500, rel_error=0.01)
+    sketch.extend(values)
+    assert not sketch.is_exact
+
+    ordered = sorted(values)
+    for pct in (50, 90, 99):
+        true = exact_percentile(ordered, pct)
+        estimate = sketch.quantile(pct)
+        assert estimate is not None
+        assert abs(estimate - true) / true < 0.03
+
+
+def test_bucketed_sketch_returns_exact_min_and_max_at_the_extremes() -> None:
+    rng = random.Random(3)
+    values = [rng.uniform(1.0, 2.0) for _ in range(1_000)]
+    sketch = QuantileSketch(exact_limit=10, rel_error=0.05)
+    sketch.extend(values)
+    assert not sketch.is_exact
+    assert sketch.quantile(0) == min(values)
+    assert sketch.quantile(100) == max(values)
+    assert sketch.percentiles((0, 100)) == {"p0": min(values), "p100": max(values)}
+
+
+def test_sketch_tracks_count_min_max_and_zeros() -> None:
+    sketch = QuantileSketch(exact_limit=2)
+    sketch.extend([0.0, 0.0, 0.0, 5.0])
+    assert sketch.count == 4
+    assert sketch.min == 0.0
+    assert sketch.max == 5.0
+    assert sketch.quantile(50) == 0.0
+    assert sketch.quantile(100) == 5.0
+
+
+def test_sketch_rejects_negative_values() -> None:
+    with pytest.raises(ValueError, match="non-negative"):
+        QuantileSketch().add(-1.0)
+
+
+def test_sketch_merge_matches_single_stream() -> None:
+    left = QuantileSketch(exact_limit=10)
+    right = QuantileSketch(exact_limit=10)
+    combined = QuantileSketch(exact_limit=10)
+    for v in range(1, 51):
+        (left if v % 2 else right).add(float(v))
+        combined.add(float(v))
+    left.merge(right)
+    assert left.count == combined.count
+    assert left.quantile(90) == combined.quantile(90)
+
+
+def test_sketch_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        QuantileSketch(rel_error=0)
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(101)
+
+
+# ---------------------------------------------------------------------------
+# FixedHistogram and LatencySummary
+# ---------------------------------------------------------------------------
+
+
+def test_histogram_buckets_are_inclusive_upper_bounds() -> None:
+    hist = FixedHistogram([1, 5])
+    for value in (0.5, 1.0, 3.0, 5.0, 9.0):
+        hist.add(value)
+    assert hist.as_list() == [
+        {"le": 1.0, "count": 2},
+        {"le": 5.0, "count": 2},
+        {"le": "+Inf", "count": 1},
+    ]
+
+
+def test_histogram_rejects_unsorted_bounds() -> None:
+    with pytest.raises(ValueError):
+        FixedHistogram([5, 1])
+
+
+def test_latency_summary_skips_missing_values() -> None:
+    summary = LatencySummary(bounds=[1, 10])
+    for value in (None, 2.0, 4.0, -1.0):
+        summary.add(value)
+    result = summary.as_dict()
+    assert result["count"] == 2
+    assert result["mean"] == 3.0
+    assert result["p50"] == 3.0
+    assert result["exact"] is True
+    assert sum(b["count"] for b in result["histogram"]) == 2
@@ -0,0 +1,200 @@
+"""test_replay.py: Tests for replaying recorded interactions (sdlc_core.replay)."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from sdlc_core.providers.fake import FakeProvider
+from sdlc_core.providers.registry import get_provider
+from sdlc_core.replay import RecordedProvider, replay
+from sdlc_core.synthetic import generate
+from tests.conftest import q_count
+
+_COMPARED = "run_id, artifact_id, sdlc_phase, iteration, outcome, human_modified, prompt"
+
+
+@pytest.fixture()
+def source_db(tmp_path: Path) -> Path:
+    path = tmp_path / "source.db"
+    generate(path, runs=3, artifacts_per_phase=3, seed=5)
+    return path
+
+
+def _rows(db_path: Path, columns: str) -> list[tuple[object, ...]]:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT {columns} FROM interactions ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+
+def test_recorded_replay_reproduces_the_trace(source_db: Path, tmp_path: Path) -> None:
+    target = tmp_path / "replay.db"
+    provider = RecordedProvider(source_db=source_db)
+    # Repeated prompts are served in call order, which only matches the
+    # recorded order when calls are not concurrent.
+    stats = replay(source_db, target, provider, concurrency=1, batch_size=7)
+    provider.close()
+
+    assert stats.failures == 0
+    assert stats.interactions == q_count(source_db, "interactions")
+    assert _rows(target, f"{_COMPARED}, model, response") == _rows(
+        source_db, f"{_COMPARED}, model, response"
+    )
+    assert q_count(target, "artifacts") == q_count(source_db, "artifacts")
+    assert q_count(target, "traceability_links") == q_count(source_db, "traceability_links")
+
+
+def test_replay_against_other_provider_keeps_human_decisions(
+    source_db: Path, tmp_path: Path
+) -> None:
+    target = tmp_path / "replay.db"
+    stats = replay(
+        source_db, target, FakeProvider(completion_tokens=5), model="fake-7b",
+        concurrency=3,
+    )
+
+    assert stats.latency["count"] == stats.interactions
+    assert _rows(target, _COMPARED) == _rows(source_db, _COMPARED)
+    assert {r[0] for r in _rows(target, "model")} == {"fake-7b"}
+    assert {r[0] for r in _rows(target, "completion_tokens")} == {5}
+
+
+def test_shared_provider_with_instance_usage_runs_one_call_at_a_time(
+    source_db: Path, tmp_path: Path
+) -> None:
+    stats = replay(source_db, tmp_path / "replay.db", FakeProvider(), concurrency=4)
+    assert stats.concurrency == 1
+
+
+def test_factory_gives_each_worker_its_own_provider(source_db: Path, tmp_path: Path) -> None:
+    target = tmp_path / "replay.db"
+    built: list[FakeProvider] = []
+
+    def make_provider() -> FakeProvider:
+        provider = FakeProvider(latency_ms=1.0, completion_tokens=20, completion_tokens_spread=15)
+        built.append(provider)
+        return provider
+
+    stats = replay(source_db, target, make_provider=make_provider, concurrency=4)
+
+    assert stats.concurrency == 4
+    assert 1 <= len(built) <= 4
+    # Every row carries the usage of its own call.
+    for response, completion_tokens in _rows(target, "response, completion_tokens"):
+        assert completion_tokens == len(str(response).split())
+    with pytest.raises(ValueError, match="exactly one"):
+        replay(source_db, tmp_path / "other.db", FakeProvider(), make_provider=make_provider)
+
+
+def test_cli_records_the_models_toml_model_id(
+    source_db: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdlc_core.replay import main as replay_main
+
+    toml = tmp_path / "models.toml"
+    toml.write_text('[models.local]\nprovider = "fake"\nmodel_id = "fake-13b"\n', encoding="utf-8")
+    monkeypatch.setenv("SDLC_MODELS_TOML", str(toml))
+    target = tmp_path / "replay.db"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["replay", "--source", str(source_db), "--target", str(target), "--model", "local",
+         "--concurrency", "3", "--json"],
+    )
+    replay_main()
+    assert {r[0] for r in _rows(target, "model")} == {"fake-13b"}
+
+
+def test_failed_calls_are_counted_and_skipped(source_db: Path, tmp_path: Path) -> None:
+    target = tmp_path / "replay.db"
+    total = q_count(source_db, "interactions")
+    stats = replay(source_db, target, FakeProvider(fail_every=4), concurrency=1)
+    assert stats.failures == total // 4
+    assert stats.interactions == q_count(target, "interactions") == total - total // 4
+    assert stats.errors
+
+
+def test_replay_selected_run_only(source_db: Path, tmp_path: Path) -> None:
+    run_id = _rows(source_db, "run_id")[0][0]
+    target = tmp_path / "replay.db"
+    replay(source_db, target, FakeProvider(), run_ids=[str(run_id)])
+    assert q_count(target, "runs") == 1
+    assert q_count(target, "interactions") == q_count(
+        source_db, "interactions", "run_id = ?", (run_id,)
+    )
+
+
+def test_replay_refuses_existing_target_and_unknown_run(
+    source_db: Path, tmp_path: Path
+) -> None:
+    with pytest.raises(FileExistsError):
+        replay(source_db, source_db, FakeProvider())
+    with pytest.raises(ValueError, match="run-missing"):
+        replay(source_db, tmp_path / "new.db", FakeProvider(), run_ids=["run-missing"])
+
+
+def test_recorded_provider_serves_repeats_in_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdlc_core.db import log_interaction, open_run, setup_db
+
+    db_path = setup_db(tmp_path / "experiment.db")
+    run_id = open_run(project="proj", approach=1, run_id="run-001", db_path=db_path)
+    for response in ("first", "second"):
+        log_interaction(
+            run_id=run_id, sdlc_phase=2, approach=1, agent_role="analyst", model="m",
+            prompt="same prompt", response=response, iteration=1, outcome="accepted",
+            human_modified=False, prompt_tokens=2, completion_tokens=1, db_path=db_path,
+        )
+
+    toml = tmp_path / "models.toml"
+    toml.write_text(
+        f'[models.trace]\nprovider = "recorded"\noptions = {{ source_db = "{db_path}" }}\n',
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("SDLC_MODELS_TOML", str(toml))
+    provider = get_provider("trace")
+    assert isinstance(provider, RecordedProvider)
+    assert [provider.complete("same prompt") for _ in range(3)] == ["first", "second", "second"]
+    assert provider.last_token_usage == {
+        "prompt_tokens": 2, "completion_tokens": 1, "total_tokens": 3,
+    }
+    with pytest.raises(KeyError):
+        provider.complete("never asked")
+    provider.close()
+
+
+def test_cli_recorded_serves_only_the_selected_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sdlc_core.db import log_interaction, open_run, setup_db
+    from sdlc_core.replay import main as replay_main
+
+    db_path = setup_db(tmp_path / "experiment.db")
+    for run_id in ("run-001", "run-002"):
+        open_run(project="proj", approach=1, run_id=run_id, db_path=db_path)
+        log_interaction(
+            run_id=run_id, sdlc_phase=2, approach=1, agent_role="analyst", model="m",
+            prompt="templated prompt", response=f"from {run_id}", iteration=1,
+            outcome="accepted", human_modified=False, db_path=db_path,
+        )
+    closed: list[RecordedProvider] = []
+    close = RecordedProvider.close
+
+    def tracking_close(self: RecordedProvider) -> None:
+        closed.append(self)
+        close(self)
+
+    monkeypatch.setattr(RecordedProvider, "close", tracking_close)
+    target = tmp_path / "replay.db"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["replay", "--source", str(db_path), "--target", str(target), "--recorded",
+         "--run-id", "run-002", "--json"],
+    )
+    replay_main()
+    assert _rows(target, "run_id, response") == [("run-002", "from run-002")]
+    assert len(closed) == 1
@@ -0,0 +1,137 @@
+"""test_review.py: Tests for the sdlc_core.review CLI."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sdlc_core.db import complete_review, enqueue_review, open_run, setup_db
+from sdlc_core.review import main
+from tests.conftest import q_count, q_one
+
+
+def _queued_db(tmp_path: Path, count: int) -> Path:
+    db_path = setup_db(tmp_path / "experiment.db")
+    run_id = open_run(project="proj", approach=2, run_id="run-review-01", db_path=db_path)
+    for i in range(count):
+        enqueue_review(
+            run_id=run_id,
+            sdlc_phase=3,
+            approach=2,
+            agent_role="architect",
+            model="llama3",
+            prompt=f"prompt {i}",
+            response=f"response {i}",
+            iteration=1,
+            db_path=db_path,
+        )
+    return db_path
+
+
+def _inputs(*responses: str) -> Callable[[str], str]:
+    it = iter(responses)
+    return lambda _: next(it)
+
+
+def _run(db_path: Path, *extra: str) -> None:
+    with patch("sys.argv", ["sdlc-review", "--db", str(db_path), *extra]):
+        main()
+
+
+def test_review_drains_queue_in_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path = _queued_db(tmp_path, 2)
+    monkeypatch.setattr("builtins.input", _inputs("a", "m", "tightened wording"))
+    _run(db_path)
+
+    assert q_count(db_path, "review_queue", "reviewed_at IS NULL") == 0
+    row = q_one(
+        db_path,
+        "SELECT outcome, human_modification_notes FROM interactions WHERE prompt = ?",
+        ("prompt 1",),
+    )
+    assert row is not None
+    assert row["outcome"] == "accepted_with_modifications"
+    assert row["human_modification_notes"] == "tightened wording"
+
+
+def test_review_limit_leaves_rest_pending(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path = _queued_db(tmp_path, 3)
+    monkeypatch.setattr("builtins.input", _inputs("r"))
+    _run(db_path, "--limit", "1")
+    assert q_count(db_path, "interactions") == 1
+    assert q_count(db_path, "review_queue", "reviewed_at IS NULL") == 2
+
+
+def test_review_interrupt_keeps_current_item_pending(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    db_path = _queued_db(tmp_path, 2)
+
+    def _answers() -> Callable[[str], str]:
+        it = iter(["a"])
+
+        def _read(_: str) -> str:
+            try:
+                return next(it)
+            except StopIteration:
+                raise EOFError from None
+
+        return _read
+
+    monkeypatch.setattr("builtins.input", _answers())
+    _run(db_path)
+    assert q_count(db_path, "interactions") == 1
+    assert "1 still pending" in capsys.readouterr().out
+
+
+def test_review_skips_item_completed_by_another_session(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    db_path = _queued_db(tmp_path, 2)
+    answers = iter(["a", "r"])
+
+    def _read(_: str) -> str:
+        answer = next(answers)
+        if answer == "a":
+            # A second session finishes the first response while it is shown.
+            complete_review(
+                review_id=1, outcome="rejected", human_modified=False, db_path=db_path
+            )
+        return answer
+
+    monkeypatch.setattr("builtins.input", _read)
+    _run(db_path)
+
+    out = capsys.readouterr().out
+    assert "#1 was reviewed elsewhere; skipped." in out
+    assert "1 response(s) reviewed, 0 still pending." in out
+    assert q_count(db_path, "interactions") == 2
+    assert q_count(db_path, "interactions", "outcome = 'rejected'") == 2
+
+
+def test_review_list_does_not_prompt(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    db_path = _queued_db(tmp_path, 2)
+    monkeypatch.setattr("builtins.input", _inputs())
+    _run(db_path, "--list")
+    assert "2 response(s) pending" in capsys.readouterr().out
+    assert q_count(db_path, "interactions") == 0
+
+
+def test_review_empty_queue(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    db_path = _queued_db(tmp_path, 0)
+    _run(db_path)
+    assert "No responses awaiting review" in capsys.readouterr().out
+
+
+def test_review_missing_db_exits(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit):
+        _run(tmp_path / "missing.db")
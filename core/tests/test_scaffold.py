@@ -369,9 +369,103 @@ def test_scaffold_approach2_creates_pipeline_contract(
     assert "runtime_policy" in data
     assert "2" in data["phases"]
     assert "8" in data["phases"]
+    assert data["phases"]["3"]["depends_on"] == [2]
+    assert data["phases"]["3"]["artifacts"] == []
 
-    runner_source = runner_path.read_text(encoding="utf-8")
-    ast.parse(runner_source)
+    from sdlc_core.scheduler import load_graph
+
+    graph = load_graph(data)
+    assert list(graph) == [f"phase{p}" for p in range(2, 9)]
+
+    ast.parse(runner_path.read_text(encoding="utf-8"))
+
+
+_RUNNER_PROMPT = """\
+## Persona
+Architect.
+
+## Task
+Design the module.
+
+## Inputs
+Requirements.
+
+## Output
+Design notes.
+
+## Acceptance
+Covers every requirement.
+
+## Chain
+Think first.
+"""
+
+
+def test_scaffold_approach2_runner_runs_all_phases(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, _mock_git: None
+) -> None:
+    import argparse
+    import importlib
+    import importlib.util
+    import sys
+
+    from sdlc_core.db import accept_artifact, open_run, setup_db
+    from sdlc_core.providers.fake import FakeProvider
+    from sdlc_core.scaffold import _scaffold
+    from tests.conftest import q_count
+
+    output = tmp_path / "a2"
+    _scaffold(2, output)
+    contract = {
+        "runtime_policy": {"max_retries": 0, "requires_reentry_approval": False},
+        "phases": {
+            "2": {"prompt": _RUNNER_PROMPT},
+            "3": {
+                "prompt": _RUNNER_PROMPT,
+                "artifacts": [{"id": "DESIGN-01"}, {"id": "DESIGN-02"}],
+            },
+        },
+    }
+    (output / "pipeline_contract.json").write_text(json.dumps(contract), encoding="utf-8")
+    db_path = setup_db(output / "logs" / "experiment.db")
+    run_id = open_run(project="proj", approach=2, run_id="run-a2-01", db_path=db_path)
+    for artifact_id in ("DESIGN-01", "DESIGN-02"):
+        accept_artifact(
+            run_id=run_id, artifact_id=artifact_id, artifact_type="design_note", phase=3,
+            db_path=db_path,
+        )
+    monkeypatch.chdir(output)
+
+    # Import the generated runner as a package module so ``.preflight`` resolves.
+    spec = importlib.util.spec_from_file_location(
+        "a2_scripts",
+        output / "scripts" / "__init__.py",
+        submodule_search_locations=[str(output / "scripts")],
+    )
+    assert spec is not None and spec.loader is not None
+    package = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "a2_scripts", package)
+    spec.loader.exec_module(package)
+    runner = importlib.import_module("a2_scripts.pipeline_runner")
+    monkeypatch.setitem(sys.modules, "a2_scripts.pipeline_runner", runner)
+
+    monkeypatch.setattr(runner, "get_provider", lambda model_name: FakeProvider(model_name))
+    monkeypatch.setattr(runner, "_model_for_phase", lambda *args: "fake")
+    monkeypatch.setattr("builtins.input", lambda _: "a")
+    args = argparse.Namespace(
+        workers=2, resume=None, approve_reentry_by=None, agent_role="pipeline_orchestrator"
+    )
+    runner._run_all(args, Path("logs") / "experiment.db", run_id)
+
+    assert q_count(db_path, "interactions") == 3
+    assert q_count(db_path, "pipeline_checkpoints") == 3
+    assert q_count(db_path, "pipeline_events", "event_type = 'gate_pass'") == 3
+    assert q_count(db_path, "phase_progress", "status = 'completed'") == 2
+
+    # A bare --resume continues the latest pipeline and skips every passed node.
+    args.resume = ""
+    runner._run_all(args, Path("logs") / "experiment.db", run_id)
+    assert q_count(db_path, "interactions") == 3
 
 
 def test_scaffold_approach1_no_pipeline_contract(
@@ -0,0 +1,158 @@
+"""test_scheduler.py: Tests for the phase DAG scheduler (sdlc_core.scheduler)."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sdlc_core.scheduler import Node, completed_nodes, latest_pipeline_id, load_graph, run_graph
+from tests.conftest import q_count, q_one
+
+_PIPE = "PIPE-run-001-01"
+
+
+def _contract() -> dict[str, Any]:
+    return {
+        "phases": {
+            "2": {"prompt": "Requirements"},
+            "3": {
+                "prompt": "Design",
+                "artifacts": [
+                    {"id": "DESIGN-01"},
+                    {"id": "DESIGN-02", "prompt": "Data model"},
+                    {"id": "DESIGN-03", "depends_on": ["DESIGN-01"]},
+                ],
+            },
+            "4": {},
+        }
+    }
+
+
+def _status(db_path: Path, phase: int) -> str | None:
+    row = q_one(
+        db_path, "SELECT status FROM phase_progress WHERE phase_number = ?", (phase,)
+    )
+    return None if row is None else str(row[0])
+
+
+# ---------------------------------------------------------------------------
+# load_graph
+# ---------------------------------------------------------------------------
+
+
+def test_default_dependencies_chain_phases() -> None:
+    graph = load_graph({"phases": {str(p): {} for p in range(2, 9)}})
+    assert list(graph) == [f"phase{p}" for p in range(2, 9)]
+    assert graph["phase2"].depends_on == ()
+    assert graph["phase5"].depends_on == ("phase4",)
+
+
+def test_artifacts_become_nodes_and_phase_edges_expand() -> None:
+    graph = load_graph(_contract())
+    assert graph["phase3:DESIGN-01"] == Node(
+        "phase3:DESIGN-01", 3, "DESIGN-01", "Design", ("phase2",)
+    )
+    assert graph["phase3:DESIGN-02"].prompt == "Data model"
+    assert graph["phase3:DESIGN-03"].depends_on == ("phase2", "phase3:DESIGN-01")
+    assert graph["phase4"].depends_on == (
+        "phase3:DESIGN-01", "phase3:DESIGN-02", "phase3:DESIGN-03",
+    )
+    assert list(graph).index("phase3:DESIGN-03") > list(graph).index("phase3:DESIGN-01")
+
+
+@pytest.mark.parametrize(
+    ("phases", "match"),
+    [
+        ({"2": {"depends_on": [3]}, "3": {}}, "cycle"),
+        ({"2": {}, "3": {"depends_on": [9]}}, "unknown phase 9"),
+        ({"2": {"artifacts": [{"id": "A", "depends_on": ["B"]}]}}, "unknown artifact B"),
+        ({"2": {"artifacts": [{"id": "A"}, {"id": "A"}]}}, "unique"),
+        ({"two": {}}, "numbers"),
+    ],
+)
+def test_invalid_contracts_rejected(phases: dict[str, Any], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        load_graph({"phases": phases})
+
+
+# ---------------------------------------------------------------------------
+# run_graph
+# ---------------------------------------------------------------------------
+
+
+def test_independent_artifacts_run_concurrently(db_path: Path, run_id: str) -> None:
+    both_started = threading.Barrier(2, timeout=5)
+    order: list[str] = []
+
+    def execute(node: Node) -> None:
+        if node.id in {"phase3:DESIGN-01", "phase3:DESIGN-02"}:
+            both_started.wait()
+        order.append(node.id)
+
+    graph = load_graph(_contract())
+    result = run_graph(graph, execute, run_id=run_id, pipeline_id=_PIPE, db_path=db_path)
+
+    assert result.ok
+    assert sorted(result.executed) == sorted(graph)
+    assert order[0] == "phase2"
+    assert order[-1] == "phase4"
+    assert order.index("phase3:DESIGN-03") > order.index("phase3:DESIGN-01")
+    assert completed_nodes(run_id, _PIPE, db_path) == set(graph)
+    assert q_count(db_path, "pipeline_events", "event_type = 'step_start'") == len(graph)
+    assert q_count(db_path, "phase_progress", "status = 'completed'") == 3
+
+
+def test_single_worker_runs_in_topological_order(db_path: Path, run_id: str) -> None:
+    order: list[str] = []
+    graph = load_graph(_contract())
+    run_graph(graph, lambda node: order.append(node.id), run_id=run_id, pipeline_id=_PIPE,
+              workers=1, db_path=db_path)
+    assert order == list(graph)
+
+
+def test_failure_halts_and_resume_continues(db_path: Path, run_id: str) -> None:
+    graph = load_graph(_contract())
+    calls: list[str] = []
+
+    def failing(node: Node) -> None:
+        calls.append(node.id)
+        if node.id == "phase3:DESIGN-01":
+            raise RuntimeError("model unavailable")
+
+    first = run_graph(graph, failing, run_id=run_id, pipeline_id=_PIPE, workers=1,
+                      db_path=db_path)
+    assert not first.ok
+    assert first.failed == {"phase3:DESIGN-01": "RuntimeError: model unavailable"}
+    assert first.pending == ["phase3:DESIGN-02", "phase3:DESIGN-03", "phase4"]
+    assert _status(db_path, 2) == "completed"
+    assert _status(db_path, 3) == "in_progress"
+    assert _status(db_path, 4) is None
+    for event_type in ("gate_fail", "circuit_break", "halt"):
+        assert q_count(db_path, "pipeline_events", "event_type = ?", (event_type,)) == 1
+
+    calls.clear()
+    assert latest_pipeline_id(run_id, db_path) == _PIPE
+    second = run_graph(graph, lambda node: calls.append(node.id), run_id=run_id,
+                       pipeline_id=_PIPE, workers=1, db_path=db_path)
+    assert second.ok
+    assert second.skipped == ["phase2"]
+    assert calls == [node_id for node_id in graph if node_id != "phase2"]
+    assert q_count(db_path, "phase_progress", "status = 'completed'") == 3
+
+
+def test_other_pipeline_ids_do_not_count_as_progress(db_path: Path, run_id: str) -> None:
+    graph = load_graph({"phases": {"2": {}}})
+    run_graph(graph, lambda node: None, run_id=run_id, pipeline_id=_PIPE, db_path=db_path)
+    again = run_graph(graph, lambda node: None, run_id=run_id, pipeline_id="PIPE-run-001-02",
+                      db_path=db_path)
+    assert again.executed == ["phase2"]
+    assert again.skipped == []
+
+
+def test_workers_must_be_positive(db_path: Path, run_id: str) -> None:
+    with pytest.raises(ValueError, match="workers"):
+        run_graph({}, lambda node: None, run_id=run_id, pipeline_id=_PIPE, workers=0,
+                  db_path=db_path)
@@ -0,0 +1,104 @@
+"""test_search.py: Tests for sdlc_core.search."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from sdlc_core.db import log_interaction, log_intervention, open_run
+from sdlc_core.enums import InterventionCategory, Severity
+from sdlc_core.search import (
+    disable_index,
+    enable_index,
+    fts5_available,
+    is_enabled,
+    phrase,
+    search,
+)
+
+pytestmark = pytest.mark.skipif(not fts5_available(), reason="SQLite built without FTS5")
+
+
+@contextmanager
+def _conn(db_path: Path) -> Generator[sqlite3.Connection]:
+    conn = sqlite3.connect(db_path)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _interaction(db_path: Path, run_id: str, phase: int, prompt: str, response: str) -> None:
+    log_interaction(
+        run_id=run_id, sdlc_phase=phase, approach=1, agent_role="dev", model="m",
+        prompt=prompt, response=response, iteration=1, outcome="accepted",
+        human_modified=False, db_path=db_path,
+    )
+
+
+def test_enable_indexes_existing_and_new_rows(db_path: Path, run_id: str) -> None:
+    _interaction(db_path, run_id, 2, "Describe the retry budget", "Three retries per call.")
+    counts = enable_index(db_path)
+    assert counts["interactions"] == 1
+
+    # Rows written after the build are indexed by the triggers.
+    log_intervention(
+        run_id=run_id, sdlc_phase=3, category=InterventionCategory.CORRECTION,
+        severity=Severity.MINOR, rationale="Circuit breaker threshold was wrong.",
+        time_spent_minutes=5, db_path=db_path,
+    )
+    with _conn(db_path) as conn:
+        assert is_enabled(conn)
+        (hit,) = search(conn, "retry")
+        assert (hit.source, hit.phase) == ("interactions", 2)
+        assert "[retry]" in hit.snippet
+        (hit,) = search(conn, "breaker")
+        assert hit.source == "interventions"
+
+
+def test_phrase_ranking_and_filters(db_path: Path, run_id: str) -> None:
+    other = open_run(project="proj", approach=1, run_id="run-002", db_path=db_path)
+    _interaction(db_path, run_id, 2, "cache invalidation strategy", "use a cache")
+    _interaction(db_path, run_id, 5, "invalidation of the cache", "done")
+    _interaction(db_path, other, 5, "cache cache cache invalidation", "cache")
+    enable_index(db_path)
+
+    with _conn(db_path) as conn:
+        assert len(search(conn, phrase("cache invalidation"))) == 2
+        hits = search(conn, "cache")
+        assert hits[0].run_id == "run-002"
+        assert [h.rank for h in hits] == sorted(h.rank for h in hits)
+        assert {h.phase for h in search(conn, "cache", phase=5)} == {5}
+        assert {h.run_id for h in search(conn, "cache", run_id=run_id)} == {run_id}
+        assert search(conn, "cache", sources=["defects"]) == []
+
+
+def test_updates_and_deletes_stay_in_sync(db_path: Path, run_id: str) -> None:
+    _interaction(db_path, run_id, 2, "original wording", "r")
+    enable_index(db_path)
+    with _conn(db_path) as conn:
+        conn.execute("UPDATE interactions SET prompt = 'revised wording'")
+        conn.commit()
+        assert search(conn, "original") == []
+        assert len(search(conn, "revised")) == 1
+        conn.execute("DELETE FROM interactions")
+        conn.commit()
+        assert search(conn, "revised") == []
+
+
+def test_errors_without_index_or_bad_query(db_path: Path, run_id: str) -> None:
+    with _conn(db_path) as conn, pytest.raises(RuntimeError, match="--build"):
+        search(conn, "anything")
+    enable_index(db_path)
+    with _conn(db_path) as conn:
+        with pytest.raises(ValueError, match="Invalid search query"):
+            search(conn, "AND AND")
+        with pytest.raises(ValueError, match="Unknown search source"):
+            search(conn, "x", sources=["runs"])
+    disable_index(db_path)
+    with _conn(db_path) as conn:
+        assert not is_enabled(conn)
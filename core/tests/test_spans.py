@@ -0,0 +1,58 @@
+"""test_spans.py: Tests for sdlc_core.spans."""
+
+from __future__ import annotations
+
+import pytest
+
+from sdlc_core.enums import SpanName
+from sdlc_core.spans import SpanRecorder
+
+
+def test_span_context_records_duration_and_offset() -> None:
+    recorder = SpanRecorder()
+    with recorder.span(SpanName.PROVIDER_CALL):
+        pass
+    (span,) = recorder.spans
+    assert span.name is SpanName.PROVIDER_CALL
+    assert span.offset_ms >= 0.0
+    assert span.duration_ms >= 0.0
+
+
+def test_span_is_recorded_when_block_raises() -> None:
+    recorder = SpanRecorder()
+    with pytest.raises(RuntimeError), recorder.span("db_write"):
+        raise RuntimeError("boom")
+    assert [s.name for s in recorder.spans] == [SpanName.DB_WRITE]
+
+
+def test_add_clamps_negative_duration() -> None:
+    recorder = SpanRecorder()
+    span = recorder.add(SpanName.FIRST_TOKEN, offset_ms=1.0, duration_ms=-5.0)
+    assert span.duration_ms == 0.0
+
+
+def test_add_rejects_unknown_name() -> None:
+    with pytest.raises(ValueError):
+        SpanRecorder().add("warmup", offset_ms=0.0, duration_ms=1.0)
+
+
+def test_duration_ms_returns_last_matching_span() -> None:
+    recorder = SpanRecorder()
+    recorder.add(SpanName.DB_WRITE, offset_ms=0.0, duration_ms=1.0)
+    recorder.add(SpanName.DB_WRITE, offset_ms=2.0, duration_ms=3.0)
+    assert recorder.duration_ms(SpanName.DB_WRITE) == 3.0
+    assert recorder.duration_ms(SpanName.HUMAN_REVIEW) is None
+
+
+def test_rows_carry_linkage() -> None:
+    recorder = SpanRecorder()
+    recorder.add(SpanName.PROVIDER_CALL, offset_ms=0.0, duration_ms=12.5)
+    (row,) = recorder.rows(run_id="run-01", review_id=4)
+    assert row == {
+        "run_id": "run-01",
+        "interaction_id": None,
+        "review_id": 4,
+        "name": SpanName.PROVIDER_CALL,
+        "offset_ms": 0.0,
+        "duration_ms": 12.5,
+    }
@@ -0,0 +1,89 @@
+"""test_synthetic.py: Tests for sdlc_core.synthetic and sdlc_core.bench."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from sdlc_core.bench import compare, run_benchmark
+from sdlc_core.check import CHECKS, run_all_checks
+from sdlc_core.metrics import category_queries
+from sdlc_core.status import RUN_QUERIES
+from sdlc_core.synthetic import generate
+from tests.conftest import q_count
+
+# ---------------------------------------------------------------------------
+# generate
+# ---------------------------------------------------------------------------
+
+
+def _dump(db_path: Path, table: str) -> list[tuple[object, ...]]:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT * FROM {table} ORDER BY rowid").fetchall()
+    finally:
+        conn.close()
+
+
+def test_generate_counts_match_database(tmp_path: Path) -> None:
+    db_path = tmp_path / "experiment.db"
+    counts = generate(db_path, runs=4, artifacts_per_phase=3, seed=1)
+    assert counts["runs"] == 4
+    assert counts["sessions"] == 12
+    assert counts["phase_progress"] == 4 * 7
+    for table, count in counts.items():
+        assert q_count(db_path, table) == count
+
+
+def test_generate_is_reproducible(tmp_path: Path) -> None:
+    first, second = tmp_path / "a.db", tmp_path / "b.db"
+    generate(first, runs=3, seed=7)
+    generate(second, runs=3, seed=7)
+    for table in ("artifacts", "traceability_links", "interactions", "defects"):
+        assert _dump(first, table) == _dump(second, table)
+
+
+def test_generate_satisfies_structural_checks(tmp_path: Path) -> None:
+    db_path = tmp_path / "experiment.db"
+    generate(db_path, runs=6, artifacts_per_phase=4, seed=3)
+    results = {r["id"]: r for r in run_all_checks(db_path)}
+    # G2 may legitimately fail for runs that stopped before phase 6.
+    for check_id in ("G1", "G3", "G4", "G5", "G6", "G7", "G8", "P1"):
+        assert results[check_id]["passed"], results[check_id]["detail"]
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+    finally:
+        conn.close()
+
+
+def test_generate_rejects_empty_scale(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        generate(tmp_path / "experiment.db", runs=0)
+
+
+# ---------------------------------------------------------------------------
+# bench
+# ---------------------------------------------------------------------------
+
+
+def test_run_benchmark_times_every_query(tmp_path: Path) -> None:
+    db_path = tmp_path / "experiment.db"
+    generate(db_path, runs=2, artifacts_per_phase=2)
+    result = run_benchmark(db_path, repeat=1)
+
+    assert result["dataset"]["runs"] == 2
+    timings = result["timings"]
+    assert set(timings["metrics"]) == set(category_queries())
+    assert [check_id for check_id, _ in CHECKS] == list(timings["checks"])
+    assert set(RUN_QUERIES) <= set(timings["status"])
+    assert all(t["best_ms"] <= t["median_ms"] for t in timings["checks"].values())
+
+
+def test_compare_reports_ratio_for_shared_entries() -> None:
+    result = {"timings": {"checks": {"G1": {"best_ms": 3.0}, "G2": {"best_ms": 1.0}}}}
+    baseline = {"timings": {"checks": {"G1": {"best_ms": 1.5}, "G2": {"best_ms": 0.0}}}}
+    assert compare(result, baseline) == {"checks/G1": 2.0}
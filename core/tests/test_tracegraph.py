@@ -0,0 +1,164 @@
+"""test_tracegraph.py: Tests for sdlc_core.tracegraph."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sdlc_core.db import accept_artifact, open_run
+from sdlc_core.metrics import collect_all_metrics
+from sdlc_core.tracegraph import TraceGraph, load_graphs
+
+# ---------------------------------------------------------------------------
+# TraceGraph
+# ---------------------------------------------------------------------------
+
+
+def _graph(links: list[tuple[str, str]]) -> TraceGraph:
+    artifacts = [
+        ("SEED-01", "Stakeholder Requirements", 1),
+        ("REQ-01", "Requirements Document", 2),
+        ("ARCH-01", "Architecture Document", 3),
+        ("IMPL-01", "Implementation", 5),
+        ("TEST-01", "Verification Test", 6),
+        ("NOTE-01", "Note", 4),
+    ]
+    return TraceGraph("run-1", artifacts, links)
+
+
+_CHAIN = [
+    ("REQ-01", "SEED-01"),
+    ("ARCH-01", "REQ-01"),
+    ("IMPL-01", "ARCH-01"),
+    ("TEST-01", "IMPL-01"),
+]
+
+
+def test_upstream_and_downstream_are_transitive() -> None:
+    graph = _graph(_CHAIN)
+    assert graph.upstream("TEST-01") == {"IMPL-01", "ARCH-01", "REQ-01", "SEED-01"}
+    assert graph.downstream("REQ-01") == {"ARCH-01", "IMPL-01", "TEST-01"}
+    assert graph.downstream("TEST-01") == set()
+    assert graph.direct_upstream("TEST-01") == ["IMPL-01"]
+
+
+def test_requirement_coverage_counts_reachability() -> None:
+    graph = _graph(_CHAIN)
+    # ARCH, IMPL and TEST reach REQ-01; NOTE-01 is unlinked.  The requirement
+    # and the phase-1 seed are not eligible.
+    assert graph.requirement_coverage() == (3, 4)
+
+
+def test_cycles_found_and_acyclic_graph_has_none() -> None:
+    assert _graph(_CHAIN).cycles() == []
+    graph = _graph([*_CHAIN, ("ARCH-01", "TEST-01"), ("NOTE-01", "NOTE-01")])
+    assert graph.cycles() == [["ARCH-01", "IMPL-01", "TEST-01"], ["NOTE-01"]]
+    assert "ARCH-01" in graph.upstream("ARCH-01")
+
+
+def test_cycles_handles_long_chain_without_recursion() -> None:
+    count = 5000
+    artifacts = [(f"A-{i}", "Design", 4) for i in range(count)]
+    links = [(f"A-{i}", f"A-{i + 1}") for i in range(count - 1)] + [(f"A-{count - 1}", "A-0")]
+    graph = TraceGraph("run-1", artifacts, links)
+    (cycle,) = graph.cycles()
+    assert len(cycle) == count
+
+
+def test_unknown_artifact_raises_key_error() -> None:
+    with pytest.raises(KeyError, match="GHOST-01"):
+        _graph(_CHAIN).upstream("GHOST-01")
+
+
+# ---------------------------------------------------------------------------
+# load_graphs
+# ---------------------------------------------------------------------------
+
+
+def test_load_graphs_reads_links_and_refreshes_after_writes(db_path: Path) -> None:
+    rid = open_run(project="p", approach=1, run_id="r1", db_path=db_path)
+    accept_artifact(
+        run_id=rid, artifact_id="REQ-01", artifact_type="Requirements Document",
+        phase=1, db_path=db_path,
+    )
+    conn = sqlite3.connect(db_path)
+    try:
+        assert len(load_graphs(conn)["r1"]) == 1
+        accept_artifact(
+            run_id=rid, artifact_id="ARCH-01", artifact_type="Architecture Document",
+            phase=2, upstream_ids=["REQ-01"], db_path=db_path,
+        )
+        graph = load_graphs(conn)["r1"]
+    finally:
+        conn.close()
+    assert graph.upstream("ARCH-01") == {"REQ-01"}
+    assert graph.edge_count == 1
+
+
+def test_load_graphs_sees_links_deleted_between_connections(db_path: Path) -> None:
+    rid = open_run(project="p", approach=1, run_id="r1", db_path=db_path)
+    accept_artifact(
+        run_id=rid, artifact_id="REQ-01", artifact_type="Requirements Document",
+        phase=1, db_path=db_path,
+    )
+    accept_artifact(
+        run_id=rid, artifact_id="ARCH-01", artifact_type="Architecture Document",
+        phase=2, upstream_ids=["REQ-01"], db_path=db_path,
+    )
+    first = sqlite3.connect(db_path)
+    assert load_graphs(first)["r1"].edge_count == 1
+    first.close()
+    del first
+
+    writer = sqlite3.connect(db_path)
+    with writer:
+        writer.execute("DELETE FROM traceability_links")
+    writer.close()
+    del writer
+
+    # A fresh connection may reuse the closed one's id() and counters.
+    second = sqlite3.connect(db_path)
+    try:
+        assert load_graphs(second)["r1"].edge_count == 0
+    finally:
+        second.close()
+
+
+def test_run_all_checks_builds_the_graph_once(db_path: Path) -> None:
+    from sdlc_core import check
+
+    open_run(project="p", approach=1, run_id="r1", db_path=db_path)
+    with patch("sdlc_core.check.load_graphs", wraps=load_graphs) as spy:
+        results = check.run_all_checks(db_path)
+    assert spy.call_count == 1
+    assert len(results) == len(check.CHECKS)
+
+
+def test_metrics_report_transitive_coverage(db_path: Path) -> None:
+    rid = open_run(project="p", approach=1, run_id="r1", db_path=db_path)
+    accept_artifact(
+        run_id=rid, artifact_id="REQ-01", artifact_type="Requirements Document",
+        phase=2, db_path=db_path,
+    )
+    accept_artifact(
+        run_id=rid, artifact_id="ARCH-01", artifact_type="Architecture Document",
+        phase=3, upstream_ids=["REQ-01"], db_path=db_path,
+    )
+    accept_artifact(
+        run_id=rid, artifact_id="IMPL-01", artifact_type="Implementation",
+        phase=5, upstream_ids=["ARCH-01"], db_path=db_path,
+    )
+    accept_artifact(
+        run_id=rid, artifact_id="DESIGN-01", artifact_type="Design", phase=4, db_path=db_path,
+    )
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        traceability = collect_all_metrics(conn)["traceability"]
+    finally:
+        conn.close()
+    assert traceability["transitive_requirement_coverage_rate_pct"] == pytest.approx(66.67)
+    assert traceability["traceability_cycle_count"] == 0
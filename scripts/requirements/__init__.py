@@ -4,11 +4,20 @@
 
 Modules:
     models          : Requirement dataclass representing a parsed REQ file.
+    fields          : Single-pass tokenizer splitting a REQ file into its
+                      title and **Field:** blocks.
     parser          : Functions for reading and writing REQ-*.md files.
     moscow          : MoSCoW priority derivation from CS/CD scores.
     validate        : Structural integrity checks against the Volere template.
     register        : Functions for updating the README Priority column only.
     update_register : Rebuild the full README register table + total count.
+    corpus          : Shared loader that reads and parses each REQ file once,
+                      with a sidecar parse cache and a process pool for
+                      large directories.
+    refindex        : Inverted REQ-ID → referencing-files index used by
+                      renumber; reports dangling references.
+    watch           : Polling watch mode: re-validate, re-prioritise and
+                      re-register only the REQ files that change.
 
 Scripts (CLI entry points):
     renumber        : Gap-filling sequential renumber of REQ-*.md files after
@@ -17,6 +26,9 @@
                       update the README Priority column.
     update_register : Rebuild the complete README register table from REQ
                       files and update the "Total requirements:" count.
+    bench           : Synthetic-corpus benchmarks: the field tokenizer
+                      against the legacy regexes, and per-step pipeline
+                      timings on a generated on-disk project.
     main            : Orchestrator: renumber (opt) → validate → assign_priority
                       → update_register.
 """
@@ -26,8 +26,13 @@
 import argparse
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from . import moscow, parser, register
+from .models import Requirement
+
+if TYPE_CHECKING:
+    from .corpus import RequirementCorpus
 
 
 def _parse_args() -> argparse.Namespace:
@@ -55,12 +60,28 @@ def _parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
+def _load_all(
+    req_dir: Path, corpus: RequirementCorpus | None
+) -> list[tuple[Path, Requirement | None, str | None]]:
+    """Return ``(path, requirement, error)`` for every REQ file in *req_dir*."""
+    if corpus is not None:
+        return [(e.path, e.requirement, e.error) for e in corpus.entries]
+    loaded: list[tuple[Path, Requirement | None, str | None]] = []
+    for path in sorted(req_dir.glob("REQ-*.md")):
+        try:
+            loaded.append((path, parser.load(path), None))
+        except ValueError as exc:
+            loaded.append((path, None, str(exc)))
+    return loaded
+
+
 def run(
     req_dir: Path,
     readme_path: Path,
     *,
     dry_run: bool = False,
     update_readme: bool = True,
+    corpus: RequirementCorpus | None = None,
 ) -> dict[str, str]:
     """Run the priority assignment pipeline programmatically.
 
@@ -75,6 +96,9 @@ def run(
         update_readme: When True (default), update the README Priority column
                        after writing the individual files.  Pass False when an
                        orchestrator will rebuild the whole register separately.
+        corpus:        Already-loaded corpus for ``req_dir``.  Its parsed
+                       requirements are used instead of re-reading every file,
+                       and it is refreshed after the priorities are written.
 
     Returns:
         Mapping of requirement ID → assigned MoSCoW label for every
@@ -88,8 +112,8 @@ def run(
         print(f"[ERROR] Directory not found: {req_dir}", file=sys.stderr)
         sys.exit(1)
 
-    req_files = sorted(req_dir.glob("REQ-*.md"))
-    if not req_files:
+    loaded = _load_all(req_dir, corpus)
+    if not loaded:
         print(f"[ERROR] No REQ-*.md files found in {req_dir}.", file=sys.stderr)
         sys.exit(1)
 
@@ -100,11 +124,9 @@ def run(
     print(f"\n{header}")
     print("-" * len(header))
 
-    for path in req_files:
-        try:
-            req = parser.load(path)
-        except ValueError as exc:
-            print(f"  [SKIP] {path.name}: {exc}", file=sys.stderr)
+    for path, req, error in loaded:
+        if req is None:
+            print(f"  [SKIP] {path.name}: {error}", file=sys.stderr)
             skipped.append(path.name)
             continue
 
@@ -127,6 +149,9 @@ def run(
     print("-" * len(header))
     print(f"\n{len(priorities)} requirements processed, {len(skipped)} skipped.")
 
+    if corpus is not None and not dry_run:
+        corpus.refresh()
+
     if dry_run:
         print("\n[DRY RUN] No files were modified.")
         return priorities
@@ -0,0 +1,439 @@
+"""bench.py: Benchmarks for the requirements tooling on synthetic corpora.
+
+Two benchmarks are available.
+
+Parse benchmark (default):
+    Generates a synthetic corpus of REQ-*.md texts in memory and times two
+    ways of extracting their fields:
+
+        legacy     The per-field regex scans used before ``fields.py``
+                   existed (eight searches for ``parser.load`` plus a full
+                   ``_FIELD_RE`` pass for ``validate.validate_file``).
+        tokenizer  One ``fields.tokenize`` pass per file, shared by
+                   ``parser.parse_document`` and
+                   ``validate.validate_document``.
+
+    Both paths are checked to extract the same requirement and the same
+    field blocks from every generated file before any timing is reported.
+    No files are written.
+
+Pipeline benchmark (``--pipeline``):
+    Writes a synthetic project to a temporary directory (numbering gaps,
+    random dependency links, a few malformed files) and times each pipeline
+    step in the order ``main.py`` runs them: the initial corpus load,
+    ``renumber``, ``validate``, ``assign_priority`` and ``update_register``.
+    Those steps reuse the loaded corpus, so parsing every file is counted
+    under ``load``: ``validate`` only reports the cached violations and
+    ``update_register`` only patches the rows that changed.  Two reference
+    entries, not part of the total, time the standalone paths that parse
+    every file themselves: ``validate_full`` (``validate_dir`` without a
+    corpus) and ``update_register_full`` (a full register rebuild).
+    Every repetition starts from a fresh copy of the same generated files,
+    so a given ``--files``/``--seed`` pair is reproducible.
+
+Both benchmarks can write their results as JSON with ``--output`` so that
+runs can be compared over time.
+
+Usage (run from the repository root):
+    python -m scripts.requirements.bench [OPTIONS]
+
+    --files N        Number of synthetic REQ files (default: 10000).
+    --repeat N       Timed repetitions; the best run is reported (default: 3).
+    --seed N         Random seed for the generator (default: 0).
+    --pipeline       Run the pipeline benchmark instead of the parse one.
+    --gap-rate F     Pipeline only: share of IDs left out of the sequence
+                     (default: 0.1).
+    --output PATH    Also write the results to PATH as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import re
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from . import assign_priority, parser, renumber, update_register, validate
+from .corpus import RequirementCorpus
+from .fields import ReqDocument, tokenize
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+# ---------------------------------------------------------------------------
+
+_TYPES = ("Functional", "Non-functional", "Interface", "Constraint", "Environmental")
+_STATUSES = ("Draft", "Reviewed", "Approved", "Deprecated")
+_PRIORITIES = ("Must", "Should", "Could", "Won't")
+_WORDS = (
+    "system", "user", "shall", "report", "latency", "export", "audit", "record",
+    "within", "seconds", "dashboard", "access", "role", "notify", "task", "data",
+)
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def synthetic_text(index: int, rng: random.Random) -> str:
+    """Return one REQ file body for ``REQ-<index>``; roughly 1 in 50 is malformed."""
+    bullets = "\n".join(f"- {_sentence(rng, 10)}" for _ in range(rng.randint(2, 6)))
+    deps = ", ".join(f"REQ-{rng.randint(1, index + 1)}" for _ in range(rng.randint(0, 3)))
+    text = (
+        f"# {_sentence(rng, 6)[:-1]}\n\n"
+        f"**ID:** REQ-{index}\n\n"
+        f"**Type:** {rng.choice(_TYPES)}\n\n"
+        "**Originator:** Stakeholder interview\n\n"
+        f"**Description:**\n{_sentence(rng, 40)}\n\n"
+        f"**Rationale:**\n{_sentence(rng, 30)}\n\n"
+        f"**Fit Criterion:**\n\n{bullets}\n\n"
+        f"**Customer Satisfaction (0–5):**\n\n- {rng.randint(0, 5)}: {_sentence(rng, 12)}\n\n"
+        f"**Customer Dissatisfaction (0–5):**\n\n- {rng.randint(0, 5)}: {_sentence(rng, 12)}\n\n"
+        f"**Dependencies / Conflicts:**\n{deps or 'None'}\n\n"
+        f"**Status:**\n{rng.choice(_STATUSES)}\n\n"
+        f"**Priority:**\n{rng.choice(_PRIORITIES)}\n\n"
+        "**History:**\n\n- 2026-01-01 | Analyst | Created | Synthetic\n"
+    )
+    if rng.random() < 0.02:
+        text = text.replace("**Priority:**", "**Priorty:**")
+    return text
+
+
+def synthetic_corpus(count: int, seed: int = 0) -> list[tuple[Path, str]]:
+    """Return *count* ``(path, text)`` pairs; paths are not created on disk."""
+    rng = random.Random(seed)
+    return [(Path(f"REQ-{i}.md"), synthetic_text(i, rng)) for i in range(1, count + 1)]
+
+
+def write_corpus(dest: Path, count: int, *, seed: int = 0, gap_rate: float = 0.1) -> list[Path]:
+    """Write *count* synthetic ``REQ-*.md`` files into *dest*.
+
+    IDs are assigned in increasing order, but each candidate number is
+    skipped with probability *gap_rate*, so the sequence has gaps for
+    ``renumber`` to close.  Dependency links may point at skipped numbers
+    and therefore dangle, as they do after real deletions.
+
+    Args:
+        dest:     Target directory; created if missing.
+        count:    Number of files to write.
+        seed:     Random seed; the same seed always yields the same files.
+        gap_rate: Probability that a number is left out of the sequence.
+
+    Returns:
+        The written paths, in ID order.
+
+    Raises:
+        ValueError: If *gap_rate* is not in ``[0, 1)``.
+
+    """
+    if not 0 <= gap_rate < 1:
+        raise ValueError("gap_rate must be in [0, 1).")
+    rng = random.Random(seed)
+    dest.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    number = 0
+    while len(paths) < count:
+        number += 1
+        if rng.random() < gap_rate:
+            continue
+        path = dest / f"REQ-{number}.md"
+        path.write_text(synthetic_text(number, rng), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# Legacy regex implementation (kept only for comparison)
+# ---------------------------------------------------------------------------
+
+_LEGACY_TITLE_RE = re.compile(r"^#\s+(.+)", re.MULTILINE)
+_LEGACY_ID_RE = re.compile(r"\*\*ID:\*\*\s*(REQ-\d+)")
+_LEGACY_TYPE_RE = re.compile(r"\*\*Type:\*\*\s*(\S[^\n]*)", re.MULTILINE)
+_LEGACY_CS_RE = re.compile(
+    r"\*\*Customer Satisfaction \(0.5\):\*\*\s*(.*?)(?=\n\*\*|\Z)", re.DOTALL
+)
+_LEGACY_CD_RE = re.compile(
+    r"\*\*Customer Dissatisfaction \(0.5\):\*\*\s*(.*?)(?=\n\*\*|\Z)", re.DOTALL
+)
+_LEGACY_STATUS_RE = re.compile(r"\*\*Status:\*\*\s*\n(\S[^\n]*)", re.MULTILINE)
+_LEGACY_PRIORITY_RE = re.compile(r"\*\*Priority:\*\*\s*\n(\S[^\n]*)", re.MULTILINE)
+_LEGACY_FIELD_RE = re.compile(r"\*\*([^*]+):\*\*\s*\n?(.*?)(?=\n\*\*|\Z)", re.DOTALL)
+_LEGACY_H1_RE = re.compile(r"^#\s+\S", re.MULTILINE)
+
+
+def _legacy_parse(text: str, path: Path) -> tuple[object, ...] | None:
+    id_match = _LEGACY_ID_RE.search(text)
+    cs_match = _LEGACY_CS_RE.search(text)
+    cd_match = _LEGACY_CD_RE.search(text)
+    cs = parser._extract_score(cs_match.group(1)) if cs_match else None
+    cd = parser._extract_score(cd_match.group(1)) if cd_match else None
+    title = _LEGACY_TITLE_RE.search(text)
+    req_type = _LEGACY_TYPE_RE.search(text)
+    status = _LEGACY_STATUS_RE.search(text)
+    priority = _LEGACY_PRIORITY_RE.search(text)
+    if cs is None or cd is None or not (title and req_type and status and priority):
+        return None
+    return (
+        id_match.group(1) if id_match else path.stem, cs, cd,
+        status.group(1).strip(), priority.group(1).strip(),
+        req_type.group(1).strip(), title.group(1).strip(),
+    )
+
+
+def _legacy_fields(text: str) -> tuple[bool, dict[str, str]]:
+    fields = {m.group(1).strip(): m.group(2).strip() for m in _LEGACY_FIELD_RE.finditer(text)}
+    return bool(_LEGACY_H1_RE.search(text)), fields
+
+
+def _legacy_pass(corpus: list[tuple[Path, str]]) -> list[object]:
+    return [(_legacy_parse(text, path), _legacy_fields(text)) for path, text in corpus]
+
+
+# ---------------------------------------------------------------------------
+# Tokenizer implementation
+# ---------------------------------------------------------------------------
+
+def _current_parse(text: str, path: Path) -> tuple[object, ...] | None:
+    return _current_fields(tokenize(text), text, path)
+
+
+def _current_fields(doc: ReqDocument, text: str, path: Path) -> tuple[object, ...] | None:
+    try:
+        req = parser.parse_document(doc, text, path)
+    except ValueError:
+        return None
+    return (req.req_id, req.cs, req.cd, req.status, req.priority, req.req_type, req.title)
+
+
+def _tokenizer_pass(corpus: list[tuple[Path, str]]) -> list[object]:
+    results: list[object] = []
+    for path, text in corpus:
+        doc = tokenize(text)
+        results.append((_current_fields(doc, text, path), validate.validate_document(doc, path)))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+def _best_of(repeat: int, fn: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _check_equivalent(corpus: list[tuple[Path, str]]) -> int:
+    """Return the number of files whose parsed or validated fields differ."""
+    mismatches = 0
+    for path, text in corpus:
+        doc = tokenize(text)
+        current = (doc.title is not None, {n: f.value for n, f in doc.fields.items()})
+        if (
+            _legacy_parse(text, path) != _current_fields(doc, text, path)
+            or _legacy_fields(text) != current
+        ):
+            mismatches += 1
+    return mismatches
+
+
+def run(
+    files: int = 10_000,
+    *,
+    repeat: int = 3,
+    seed: int = 0,
+    output: Path | None = None,
+) -> dict[str, float]:
+    """Generate the corpus, verify both paths agree, and print timings.
+
+    Args:
+        files:  Number of synthetic REQ texts.
+        repeat: Timed repetitions per path; the fastest is reported.
+        seed:   Random seed for :func:`synthetic_corpus`.
+        output: When given, also write the results there as JSON.
+
+    Returns:
+        ``{"legacy_seconds": ..., "tokenizer_seconds": ..., "speedup": ...}``.
+
+    Raises:
+        RuntimeError: If the two paths disagree on any generated file.
+
+    """
+    corpus = synthetic_corpus(files, seed)
+    mismatches = _check_equivalent(corpus)
+    if mismatches:
+        raise RuntimeError(f"{mismatches} file(s) parse differently; timings not comparable.")
+
+    legacy = _best_of(repeat, lambda: _legacy_pass(corpus))
+    current = _best_of(repeat, lambda: _tokenizer_pass(corpus))
+    result = {
+        "legacy_seconds": legacy,
+        "tokenizer_seconds": current,
+        "speedup": legacy / current if current else float("inf"),
+    }
+
+    print(f"\n{files} synthetic REQ files, parse + validate, best of {repeat}:")
+    print(f"  legacy regexes : {legacy * 1000:9.1f} ms  ({legacy / files * 1e6:6.1f} µs/file)")
+    print(f"  tokenizer      : {current * 1000:9.1f} ms  ({current / files * 1e6:6.1f} µs/file)")
+    print(f"  speedup        : {result['speedup']:9.2f}x")
+    if output is not None:
+        _write_results(output, "parse", files=files, repeat=repeat, seed=seed, results=result)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Pipeline benchmark
+# ---------------------------------------------------------------------------
+
+PIPELINE_STEPS: tuple[str, ...] = (
+    "load", "renumber", "validate", "assign_priority", "update_register",
+)
+
+# Standalone runs that parse every file themselves; reported for comparison
+# but left out of the pipeline total.
+REFERENCE_STEPS: tuple[str, ...] = ("validate_full", "update_register_full")
+
+
+def _time_pipeline(req_dir: Path) -> dict[str, float]:
+    """Run every pipeline step once on *req_dir* and return per-step seconds."""
+    readme = req_dir / "README.md"
+    timings: dict[str, float] = {}
+
+    def timed(step: str, fn: Callable[[], object]) -> None:
+        t0 = time.perf_counter()
+        fn()
+        timings[step] = time.perf_counter() - t0
+
+    # The steps report every file they touch; keep that out of the results.
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+        t0 = time.perf_counter()
+        corpus = RequirementCorpus(req_dir, use_cache=False)
+        timings["load"] = time.perf_counter() - t0
+        timed("renumber", lambda: renumber.run(req_dir, readme, corpus=corpus))
+        timed("validate", lambda: validate.validate_dir(req_dir, corpus=corpus))
+        timed("assign_priority", lambda: assign_priority.run(
+            req_dir, readme, update_readme=False, corpus=corpus,
+        ))
+        timed("update_register", lambda: update_register.update(readme, req_dir, corpus=corpus))
+        timed("validate_full", lambda: validate.validate_dir(req_dir))
+        timed("update_register_full", lambda: update_register.update(readme, req_dir, full=True))
+    return timings
+
+
+def run_pipeline(
+    files: int = 10_000,
+    *,
+    repeat: int = 3,
+    seed: int = 0,
+    gap_rate: float = 0.1,
+    output: Path | None = None,
+) -> dict[str, float]:
+    """Time each pipeline step on a generated on-disk project.
+
+    Args:
+        files:    Number of synthetic REQ files.
+        repeat:   Repetitions, each on a fresh copy of the generated files;
+                  the fastest time of each step is reported.
+        seed:     Random seed for :func:`write_corpus`.
+        gap_rate: Share of IDs left out of the sequence.
+        output:   When given, also write the results there as JSON.
+
+    Returns:
+        Best seconds per step (keys of :data:`PIPELINE_STEPS` and
+        :data:`REFERENCE_STEPS`) plus ``"total"``, the sum of the
+        :data:`PIPELINE_STEPS` bests.
+
+    """
+    best = dict.fromkeys((*PIPELINE_STEPS, *REFERENCE_STEPS), float("inf"))
+    with tempfile.TemporaryDirectory(prefix="req-bench-") as tmp:
+        template = Path(tmp) / "template"
+        write_corpus(template, files, seed=seed, gap_rate=gap_rate)
+        for attempt in range(repeat):
+            req_dir = Path(tmp) / f"run-{attempt}"
+            shutil.copytree(template, req_dir)
+            for step, seconds in _time_pipeline(req_dir).items():
+                best[step] = min(best[step], seconds)
+            shutil.rmtree(req_dir)
+
+    result = {**best, "total": sum(best[step] for step in PIPELINE_STEPS)}
+    print(f"\n{files} synthetic REQ files on disk (gap rate {gap_rate}), best of {repeat}:")
+    for step in (*PIPELINE_STEPS, "total"):
+        _print_step(step, result[step], files)
+    print("  (validate and update_register reuse the corpus; parsing is counted under load)")
+    print("Standalone, parsing every file (not in total):")
+    for step in REFERENCE_STEPS:
+        _print_step(step, result[step], files)
+    if output is not None:
+        _write_results(
+            output, "pipeline",
+            files=files, repeat=repeat, seed=seed, gap_rate=gap_rate, results=result,
+        )
+    return result
+
+
+def _print_step(step: str, seconds: float, files: int) -> None:
+    print(f"  {step:<20}: {seconds * 1000:9.1f} ms  ({seconds / files * 1e6:6.1f} µs/file)")
+
+
+def _write_results(path: Path, benchmark: str, **fields: object) -> None:
+    """Write one benchmark result, with run metadata, to *path* as JSON."""
+    payload = {
+        "benchmark": benchmark,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        **fields,
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"Results written to {path}")
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+def _parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="bench",
+        description="Benchmark the requirements tooling on a synthetic corpus.",
+    )
+    p.add_argument("--files", type=int, default=10_000, metavar="N",
+                   help="Number of synthetic REQ files (default: 10000).")
+    p.add_argument("--repeat", type=int, default=3, metavar="N",
+                   help="Timed repetitions; the best run is reported (default: 3).")
+    p.add_argument("--seed", type=int, default=0, metavar="N",
+                   help="Random seed for the generator (default: 0).")
+    p.add_argument("--pipeline", action="store_true",
+                   help="Time each pipeline step on an on-disk corpus instead of parsing.")
+    p.add_argument("--gap-rate", type=float, default=0.1, metavar="F",
+                   help="Pipeline only: share of IDs left out of the sequence (default: 0.1).")
+    p.add_argument("--output", type=Path, default=None, metavar="PATH",
+                   help="Also write the results to PATH as JSON.")
+    return p.parse_args()
+
+
+def main() -> None:
+    """Parse command-line arguments and run the selected benchmark."""
+    args = _parse_args()
+    if args.pipeline:
+        run_pipeline(
+            args.files, repeat=args.repeat, seed=args.seed,
+            gap_rate=args.gap_rate, output=args.output,
+        )
+    else:
+        run(args.files, repeat=args.repeat, seed=args.seed, output=args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""corpus.py: Shared, cached loader for a directory of REQ-*.md files.
+
+Every pipeline step needs the same parsed view of the requirement files.
+``RequirementCorpus`` reads each file once per pipeline run, tokenizes it once
+for ``parser`` and ``validate``, and hands the results
+to every step, so a ``req-pipeline`` run no longer globs and re-parses the
+directory four times.
+
+Caching:
+    Parse results are stored in a sidecar file (``.req-cache.json``) next to
+    the REQ files, keyed on file name and validated against the file's
+    ``(mtime_ns, size, sha256)``.  On the next run a file whose mtime and size
+    are unchanged reuses its cached fields without being parsed; a file whose
+    stat changed but whose content hash did not (e.g. after ``touch``) also
+    reuses them.  Only genuinely edited files are parsed again.  The cache is
+    a pure accelerator: deleting it, or a cache written by a different
+    format version, simply causes a full parse.
+
+Parallelism:
+    When more than ``_POOL_THRESHOLD`` files need parsing (a cold cache on a
+    large project), parsing is spread over a process pool.  Smaller batches
+    are parsed in-process, where pool start-up would cost more than it saves.
+
+Steps that modify files (renumber, assign_priority) call :meth:`refresh`
+afterwards; only the files they touched are re-read.
+
+Usage::
+
+    corpus = RequirementCorpus(Path("requirements/project1"))
+    for entry in corpus.entries:
+        if entry.requirement is None:
+            print(entry.path.name, entry.error)
+    corpus.save_cache()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from . import parser, validate
+from .fields import tokenize
+from .models import Requirement
+from .refindex import find_references
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+CACHE_FILENAME = ".req-cache.json"
+
+# Bump when the cached record layout or the parse/validation rules change,
+# so stale results from an older version are discarded.
+_CACHE_VERSION = 4
+
+# Minimum number of files to parse before a process pool is used.
+_POOL_THRESHOLD = 200
+
+# Requirement fields stored in the cache (source_path and raw_text are
+# restored from the file itself).
+_CACHED_FIELDS: tuple[str, ...] = (
+    "req_id", "cs", "cd", "status", "priority", "req_type", "title",
+)
+
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+@dataclass
+class CorpusEntry:
+    """One REQ file as seen by the pipeline.
+
+    Attributes:
+        path:        Path to the ``REQ-*.md`` file.
+        text:        Full content of the file.
+        requirement: Parsed requirement, or ``None`` if parsing failed.
+        error:       ``parser`` error message when ``requirement`` is ``None``.
+        violations:  Template violations reported by ``validate``.
+        references:  Distinct ``REQ-NN`` tokens mentioned in the file.
+
+    """
+
+    path: Path
+    text: str
+    requirement: Requirement | None
+    error: str | None
+    violations: list[str]
+    references: list[str]
+
+
+# ---------------------------------------------------------------------------
+# Parsing (module-level so it can run in worker processes)
+# ---------------------------------------------------------------------------
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _parse_record(text: str, path: Path) -> dict[str, Any]:
+    """Return the cacheable parse result for *text*, without stat fields."""
+    record: dict[str, Any] = {"sha256": _digest(text), "fields": None, "error": None}
+    doc = tokenize(text)
+    try:
+        req = parser.parse_document(doc, text, path)
+    except ValueError as exc:
+        record["error"] = str(exc)
+    else:
+        record["fields"] = {name: getattr(req, name) for name in _CACHED_FIELDS}
+    record["violations"] = validate.validate_document(doc, path)
+    record["references"] = find_references(text)
+    return record
+
+
+def _read_and_parse(path_str: str, cached_sha: str | None) -> tuple[str, dict[str, Any] | None]:
+    """Read *path_str*; parse it unless its hash equals *cached_sha*.
+
+    Returns:
+        ``(text, record)`` where ``record`` is ``None`` when the cached
+        result is still valid.
+
+    """
+    path = Path(path_str)
+    text = path.read_text(encoding="utf-8")
+    if cached_sha is not None and _digest(text) == cached_sha:
+        return text, None
+    return text, _parse_record(text, path)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+class RequirementCorpus:
+    """Parsed view of every ``REQ-*.md`` file in one directory.
+
+    Args:
+        req_dir:     Directory containing ``REQ-*.md`` files.
+        use_cache:   When True (default), read and update the sidecar cache.
+        max_workers: Upper bound on parser processes for large batches.
+                     Defaults to ``os.cpu_count()``; ``1`` disables the pool.
+
+    """
+
+    def __init__(
+        self,
+        req_dir: Path,
+        *,
+        use_cache: bool = True,
+        max_workers: int | None = None,
+    ) -> None:
+        """Scan *req_dir*. See class docstring for parameters."""
+        self.req_dir = req_dir
+        self.cache_path = req_dir / CACHE_FILENAME
+        self._use_cache = use_cache
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._records: dict[str, dict[str, Any]] = self._load_cache() if use_cache else {}
+        self._texts: dict[str, str] = {}
+        self._entries: list[CorpusEntry] = []
+        self._dirty = False
+        self.parsed_count = 0
+        self.refresh()
+
+    # ------------------------------------------------------------------
+    # Accessors
+    # ------------------------------------------------------------------
+
+    @property
+    def entries(self) -> list[CorpusEntry]:
+        """Return one entry per ``REQ-*.md`` file, sorted by file name."""
+        return list(self._entries)
+
+    @property
+    def paths(self) -> list[Path]:
+        """Return the ``REQ-*.md`` paths, sorted by file name."""
+        return [entry.path for entry in self._entries]
+
+    def requirements(self) -> list[Requirement]:
+        """Return the successfully parsed requirements, sorted by file name."""
+        return [e.requirement for e in self._entries if e.requirement is not None]
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Re-scan the directory, re-reading only files whose stat changed.
+
+        Call after a step has written, renamed, or deleted REQ files.
+        ``parsed_count`` is set to the number of files actually parsed.
+        """
+        paths = sorted(self.req_dir.glob("REQ-*.md"))
+        names = {p.name for p in paths}
+        stale = set(self._records) - names
+        for name in stale:
+            del self._records[name]
+            self._texts.pop(name, None)
+        self._dirty = self._dirty or bool(stale)
+
+        pending: list[tuple[Path, os.stat_result]] = []
+        for path in paths:
+            stat = path.stat()
+            record = self._records.get(path.name)
+            if record is not None and _stat_matches(record, stat):
+                if path.name not in self._texts:
+                    self._texts[path.name] = path.read_text(encoding="utf-8")
+                continue
+            pending.append((path, stat))
+
+        self.parsed_count = 0
+        for (path, stat), (text, record) in zip(pending, self._parse(pending), strict=True):
+            if record is None:
+                record = self._records[path.name]
+            else:
+                self.parsed_count += 1
+            record["mtime_ns"] = stat.st_mtime_ns
+            record["size"] = stat.st_size
+            self._records[path.name] = record
+            self._texts[path.name] = text
+            self._dirty = True
+
+        self._entries = [self._entry(path) for path in paths]
+
+    def _parse(
+        self, pending: list[tuple[Path, os.stat_result]]
+    ) -> list[tuple[str, dict[str, Any] | None]]:
+        jobs = [
+            (str(path), self._records.get(path.name, {}).get("sha256"))
+            for path, _ in pending
+        ]
+        if len(jobs) < _POOL_THRESHOLD or self._max_workers < 2:
+            return [_read_and_parse(*job) for job in jobs]
+
+        workers = min(self._max_workers, len(jobs))
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_read_and_parse, *zip(*jobs, strict=True), chunksize=chunksize))
+
+    def _entry(self, path: Path) -> CorpusEntry:
+        record = self._records[path.name]
+        text = self._texts[path.name]
+        fields = record["fields"]
+        requirement = (
+            Requirement(**fields, source_path=path, raw_text=text)
+            if fields is not None else None
+        )
+        return CorpusEntry(
+            path=path,
+            text=text,
+            requirement=requirement,
+            error=record["error"],
+            violations=list(record["violations"]),
+            references=list(record["references"]),
+        )
+
+    # ------------------------------------------------------------------
+    # Cache file
+    # ------------------------------------------------------------------
+
+    def _load_cache(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def save_cache(self) -> None:
+        """Write the sidecar cache if anything changed since it was loaded.
+
+        Does nothing when the corpus was created with ``use_cache=False``.
+        Write failures are reported as warnings; the cache is optional.
+        """
+        if not self._use_cache or not self._dirty:
+            return
+        payload = {"version": _CACHE_VERSION, "files": self._records}
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+        except OSError as exc:
+            print(f"[WARN] Could not write parse cache {self.cache_path}: {exc}", file=sys.stderr)
+            return
+        self._dirty = False
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _stat_matches(record: dict[str, Any], stat: os.stat_result) -> bool:
+    return record.get("mtime_ns") == stat.st_mtime_ns and record.get("size") == stat.st_size
@@ -0,0 +1,145 @@
+"""fields.py: Single-pass tokenizer for REQ-*.md files.
+
+Splits a REQ file into its ``# Title`` heading and its ``**Field:**`` blocks
+with one split on bold-line boundaries, so ``parser`` and ``validate`` read
+every field from the same token list instead of each running its own set of
+regexes over the whole text.
+
+Block boundaries follow the template rules used since the first version of
+the scripts:
+
+    * A field starts at a line beginning with ``**Name:**``; whitespace
+      around the name is ignored, so ``**Priority :**`` is ``Priority``.
+    * Its value is the rest of that line plus every following line up to
+      the next field header.  Other lines starting with ``**`` (such as a
+      Description that opens with bold text) belong to the value.
+    * The title is the first line of the form ``# Text``.
+
+When a field name appears more than once, the first occurrence wins.
+
+Usage::
+
+    text = path.read_text(encoding="utf-8")
+    doc = tokenize(text)
+    doc.title                       # "Short descriptive title" or None
+    doc.fields["Status"].value      # "Draft"
+
+    # One tokenization feeds both consumers:
+    req = parser.parse_document(doc, text, path)
+    violations = validate.validate_document(doc, path)
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+# A field header at the start of a chunk that followed a ``\n**`` split.
+_HEADER_RE = re.compile(r"([^*\n]+):\*\*")
+# Surrounding whitespace that ``_HEADER_RE`` captures and ``tokenize`` strips.
+_PAD = r"[^\S\n]*"
+_TITLE_RE = re.compile(r"^#[ \t]+(\S[^\n]*)", re.MULTILINE)
+
+
+# Not frozen: a frozen dataclass's __init__ costs about three times as much,
+# and one Field is built per block of every file in the corpus.
+@dataclass(slots=True)
+class Field:
+    """One ``**Name:**`` block.
+
+    Attributes:
+        name:   Field name without the bold markers or colon.
+        value:  Block content with surrounding whitespace stripped.
+        inline: ``True`` when the value starts on the header line itself
+                (``**ID:** REQ-01``) rather than on the following line.
+
+    """
+
+    name: str
+    value: str
+    inline: bool
+
+    @property
+    def first_line(self) -> str:
+        """Return the first line of the value (empty when the value is empty)."""
+        return self.value.split("\n", 1)[0].strip()
+
+
+@dataclass(frozen=True)
+class ReqDocument:
+    """Title and fields of one REQ file.
+
+    Attributes:
+        title:  Text of the first ``# Title`` heading, or ``None``.
+        fields: Field blocks keyed by name, in file order.
+
+    """
+
+    title: str | None
+    fields: dict[str, Field]
+
+
+def header_pattern(name: str) -> str:
+    """Return a regex source matching the ``**Name:**`` header of field *name*.
+
+    The pattern accepts exactly the header lines :func:`tokenize` files under
+    *name*, so code that rewrites a field in place finds the same block the
+    parser read.  Compile it with ``re.MULTILINE``.
+
+    Args:
+        name: Field name as it appears in :attr:`ReqDocument.fields`.
+
+    Returns:
+        Regex source anchored at the start of a line.
+
+    """
+    return rf"^\*\*{_PAD}{re.escape(name)}{_PAD}:\*\*"
+
+
+def tokenize(text: str) -> ReqDocument:
+    """Split *text* into its title and ``**Field:**`` blocks in one pass.
+
+    Args:
+        text: Full content of a REQ-*.md file.
+
+    Returns:
+        The tokenized document.
+
+    """
+    title: str | None = None
+    fields: dict[str, Field] = {}
+
+    # Every field header starts a line with ``**``, so splitting on that
+    # boundary yields one chunk per header plus one per other bold line.
+    # The leading newline lets a file that opens with a bold line split the
+    # same way.
+    preamble, *chunks = ("\n" + text).split("\n**")
+
+    title_match = _TITLE_RE.search(preamble)
+    name: str | None = None
+    parts: list[str] = []
+    for chunk in chunks:
+        if title_match is None:
+            title_match = _TITLE_RE.search(chunk, chunk.find("\n") + 1 or len(chunk))
+        header = _HEADER_RE.match(chunk)
+        if header is None:
+            # A bold line that is not a header continues the current value.
+            parts.append("\n**" + chunk)
+            continue
+        _add_field(fields, name, parts)
+        name = header.group(1).strip()
+        parts = [chunk[header.end():]]
+    _add_field(fields, name, parts)
+
+    if title_match is not None:
+        title = title_match.group(1).strip()
+    return ReqDocument(title=title, fields=fields)
+
+
+def _add_field(fields: dict[str, Field], name: str | None, parts: list[str]) -> None:
+    """Store the block *parts* under *name* unless an earlier block has it."""
+    if name is None or name in fields:
+        return
+    block = "".join(parts)
+    inline = bool(block.partition("\n")[0].strip())
+    fields[name] = Field(name, block.strip(), inline)
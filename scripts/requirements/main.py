@@ -23,12 +23,18 @@
         the Priority (and Status if absent) field back into each file.
 
     Step 3: update_register
-        Rebuilds the complete requirements table and metrics block in the
-        project README.md from the REQ files.  Metrics cover total count,
+        Brings the requirements table and metrics block in the project
+        README.md in line with the REQ files, patching only the rows that
+        changed and skipping the write when nothing did.  Metrics cover total count,
         MoSCoW breakdown, type breakdown, status breakdown, and avg CS/CD.
         If no README.md exists in the target directory it is created
         automatically from a standard template.
 
+All steps share one :class:`~corpus.RequirementCorpus`, so each REQ file is
+read and parsed once per run.  Parse results are cached in
+``<req-dir>/.req-cache.json`` and reused on later runs for files whose
+mtime, size and content hash are unchanged.
+
 Running this script is the single command needed to fully synchronise the
 requirements register after any change to REQ-*.md files.
 
@@ -51,6 +57,13 @@
     --strict-validate    Abort the pipeline if any REQ file fails validation.
     --skip-priority      Skip Step 2 (priority assignment).
     --skip-register      Skip Step 3 (register rebuild).
+    --no-cache           Ignore and do not write the parse cache.
+    --full-register      Regenerate every register row in Step 3 instead of
+                         patching only the rows that changed.
+    --watch              After the run, keep polling the REQ files and
+                         re-run only the affected steps on each change.
+    --poll-interval S    Seconds between polls in watch mode (default 0.5).
+    --debounce S         Quiet period that ends a change burst (default 0.3).
 
 Examples:
     # Process all projects (default)
@@ -60,6 +73,7 @@
     python -m scripts.requirements.main --req-dir requirements/project1
 
 See Also:
+    scripts/requirements/corpus.py          : shared cached loader.
     scripts/requirements/renumber.py        : Step 0 logic.
     scripts/requirements/validate.py        : Step 1 logic.
     scripts/requirements/assign_priority.py : Step 2 logic.
@@ -75,6 +89,8 @@
 from pathlib import Path
 
 from . import assign_priority, renumber, update_register, validate
+from .corpus import CACHE_FILENAME, RequirementCorpus
+from .watch import DEFAULT_DEBOUNCE, DEFAULT_POLL_INTERVAL, watch
 
 # ---------------------------------------------------------------------------
 # Argument parsing
@@ -146,6 +162,41 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Abort the pipeline if any REQ file fails template validation.",
     )
+    p.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Parse every REQ file, ignoring and not writing {CACHE_FILENAME}.",
+    )
+    p.add_argument(
+        "--full-register",
+        action="store_true",
+        help="Regenerate every register row in Step 3 and always rewrite README.md.",
+    )
+    p.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "After the pipeline run, watch the REQ files and re-validate, "
+            "re-prioritise and re-register only the files that change."
+        ),
+    )
+    p.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        metavar="SECONDS",
+        help=f"Seconds between polls in watch mode (default: {DEFAULT_POLL_INTERVAL}).",
+    )
+    p.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        metavar="SECONDS",
+        help=(
+            "Quiet period that ends a burst of changes in watch mode "
+            f"(default: {DEFAULT_DEBOUNCE})."
+        ),
+    )
     return p.parse_args()
 
 
@@ -160,6 +211,8 @@ def run(
     skip_register: bool = False,
     skip_validate: bool = False,
     strict_validate: bool = False,
+    use_cache: bool = True,
+    full_register: bool = False,
 ) -> None:
     """Execute the full requirements processing pipeline.
 
@@ -172,6 +225,14 @@ def run(
         skip_register:    When True, skip Step 3 (register rebuild).
         skip_validate:    When True, skip Step 1 (template validation).
         strict_validate:  When True, abort if any file fails validation.
+        use_cache:        When True (default), reuse and update the parse
+                          cache in *req_dir*.  The cache is never written
+                          during a dry run.
+        full_register:    When True, Step 3 regenerates every register row
+                          instead of patching only the changed ones.
+
+    An interrupted renumber left in *req_dir* (see :func:`renumber.recover`)
+    is completed before the REQ files are loaded.
 
     Raises:
         SystemExit: If req_dir is missing, or on validation failure in
@@ -182,6 +243,17 @@ def run(
         print(f"[ERROR] Requirements directory not found: {req_dir}", file=sys.stderr)
         sys.exit(1)
 
+    # Finish a renumber interrupted after its journal was written before
+    # anything reads the directory, whichever steps are enabled.  The
+    # journaled renumber is already committed, so this runs in a dry run too.
+    renumber.recover(req_dir)
+
+    corpus = RequirementCorpus(req_dir, use_cache=use_cache)
+    print(
+        f"Loaded {len(corpus.paths)} REQ file(s) "
+        f"({corpus.parsed_count} parsed, {len(corpus.paths) - corpus.parsed_count} cached)."
+    )
+
     active_steps = (
         [("Step 0", "Renumbering REQ files")] * int(not skip_renumber)
         + [("Step 1", "Validating REQ files")] * int(not skip_validate)
@@ -202,6 +274,7 @@ def run(
             req_dir=req_dir,
             readme_path=readme_path,
             dry_run=dry_run,
+            corpus=corpus,
         )
 
     # ------------------------------------------------------------------
@@ -211,7 +284,9 @@ def run(
         current_step += 1
         _print_step_banner(current_step, total_steps, "Validating REQ files")
 
-        _, errors = validate.validate_dir(req_dir, strict=strict_validate)
+        _, errors = validate.validate_dir(
+            req_dir, strict=strict_validate, corpus=corpus
+        )
         if errors and not strict_validate:
             print(
                 f"  [WARN] {errors} file(s) have template violations; "
@@ -234,6 +309,7 @@ def run(
             # skip the partial Priority-column-only update here to avoid
             # writing a half-formed table that Step 3 immediately overwrites.
             update_readme=skip_register,
+            corpus=corpus,
         )
 
     # ------------------------------------------------------------------
@@ -247,12 +323,17 @@ def run(
             readme_path=readme_path,
             req_dir=req_dir,
             dry_run=dry_run,
+            corpus=corpus,
+            full=full_register,
         )
         print(f"\nRegister contains {total} requirements.")
 
     # ------------------------------------------------------------------
     # Summary
     # ------------------------------------------------------------------
+    if not dry_run:
+        corpus.save_cache()
+
     print()
     if dry_run:
         print("[DRY RUN] No files were modified.")
@@ -279,16 +360,7 @@ def main() -> None:
     if args.req_dir is not None:
         # Single-project mode: user explicitly specified a directory.
         readme = Path(args.readme) if args.readme else Path(args.req_dir) / "README.md"
-        run(
-            req_dir=Path(args.req_dir),
-            readme_path=readme,
-            dry_run=args.dry_run,
-            skip_renumber=args.skip_renumber,
-            skip_priority=args.skip_priority,
-            skip_register=args.skip_register,
-            skip_validate=args.skip_validate,
-            strict_validate=args.strict_validate,
-        )
+        projects = [(Path(args.req_dir), readme)]
     else:
         # Default: auto-discover every project folder under req_root.
         req_root = Path(args.req_root)
@@ -307,24 +379,37 @@ def main() -> None:
 
         names = ", ".join(d.name for d in project_dirs)
         print(f"Discovered {len(project_dirs)} project(s): {names}\n")
+        projects = [(d, d / "README.md") for d in project_dirs]
 
-        for project_dir in project_dirs:
-            readme = project_dir / "README.md"
+    for req_dir, readme in projects:
+        if args.req_dir is None:
             print(f"{'=' * 60}")
-            print(f"  Project: {project_dir.name}")
+            print(f"  Project: {req_dir.name}")
             print(f"{'=' * 60}")
-            run(
-                req_dir=project_dir,
-                readme_path=readme,
-                dry_run=args.dry_run,
-                skip_renumber=args.skip_renumber,
-                skip_priority=args.skip_priority,
-                skip_register=args.skip_register,
-                skip_validate=args.skip_validate,
-                strict_validate=args.strict_validate,
-            )
+        run(
+            req_dir=req_dir,
+            readme_path=readme,
+            dry_run=args.dry_run,
+            skip_renumber=args.skip_renumber,
+            skip_priority=args.skip_priority,
+            skip_register=args.skip_register,
+            skip_validate=args.skip_validate,
+            strict_validate=args.strict_validate,
+            use_cache=not args.no_cache,
+            full_register=args.full_register,
+        )
+        if args.req_dir is None:
             print()
 
+    if args.watch:
+        watch(
+            projects,
+            poll_interval=args.poll_interval,
+            debounce=args.debounce,
+            dry_run=args.dry_run,
+            use_cache=not args.no_cache,
+        )
+
 
 if __name__ == "__main__":
     main()
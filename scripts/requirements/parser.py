@@ -1,9 +1,12 @@
 """parser.py: Reading and writing REQ-*.md files.
 
-Provides two public functions:
+Provides three public functions:
 
-    load(path)          Read a single REQ-*.md file and return a Requirement.
-    save(req, updates)  Apply field updates to a Requirement and write it back.
+    load(path)              Read a single REQ-*.md file and return a Requirement.
+    parse_text(text, path)  Build a Requirement from already-read file content.
+    parse_document(doc, text, path)
+                            Same, from a ``fields.tokenize`` result.
+    save(req, updates)      Apply field updates to a Requirement and write it back.
 
 File structure:
     Every REQ file starts with an optional markdown heading that acts as the
@@ -43,6 +46,7 @@
 import re
 from pathlib import Path
 
+from .fields import Field, ReqDocument, header_pattern, tokenize
 from .models import Requirement
 
 # ---------------------------------------------------------------------------
@@ -50,27 +54,20 @@
 # ---------------------------------------------------------------------------
 
 _TITLE_HEADING_RE = re.compile(r"^#\s+(.+)", re.MULTILINE)
-_ID_RE = re.compile(r"\*\*ID:\*\*\s*(REQ-\d+)")
-_TYPE_RE = re.compile(r"\*\*Type:\*\*\s*(\S[^\n]*)", re.MULTILINE)
-_CS_RE = re.compile(
-    r"\*\*Customer Satisfaction \(0.5\):\*\*\s*(.*?)(?=\n\*\*|\Z)", re.DOTALL
-)
-_CD_RE = re.compile(
-    r"\*\*Customer Dissatisfaction \(0.5\):\*\*\s*(.*?)(?=\n\*\*|\Z)", re.DOTALL
-)
-_STATUS_RE = re.compile(r"\*\*Status:\*\*\s*\n(\S[^\n]*)", re.MULTILINE)
-_PRIORITY_RE = re.compile(r"\*\*Priority:\*\*\s*\n(\S[^\n]*)", re.MULTILINE)
+_REQ_ID_RE = re.compile(r"REQ-\d+")
+_CS_NAME_RE = re.compile(r"Customer Satisfaction \(0.5\)")
+_CD_NAME_RE = re.compile(r"Customer Dissatisfaction \(0.5\)")
 _SCORE_BULLET_RE = re.compile(r"^\s*-\s*(\d)", re.MULTILINE)
 _SCORE_PLAIN_RE = re.compile(r"^\s*(\d)\s*$", re.MULTILINE)
 
 # Anchors used when inserting absent bold fields
 _DEPS_BLOCK_RE = re.compile(
-    r"(\*\*Dependencies / Conflicts:\*\*\s*\n\S[^\n]*)", re.MULTILINE
+    rf"({header_pattern('Dependencies / Conflicts')}\s*\n\S[^\n]*)", re.MULTILINE
 )
 _STATUS_BLOCK_RE = re.compile(
-    r"(\*\*Status:\*\*\s*\n\S[^\n]*)", re.MULTILINE
+    rf"({header_pattern('Status')}\s*\n\S[^\n]*)", re.MULTILINE
 )
-_HISTORY_RE = re.compile(r"(\*\*History:\*\*)", re.MULTILINE)
+_HISTORY_RE = re.compile(rf"({header_pattern('History')})", re.MULTILINE)
 
 
 # ---------------------------------------------------------------------------
@@ -92,16 +89,51 @@ def load(path: Path) -> Requirement:
             ``Status``, ``Priority``, CS, or CD) is absent or unparseable.
 
     """
-    text = path.read_text(encoding="utf-8")
+    return parse_text(path.read_text(encoding="utf-8"), path)
+
+
+def parse_text(text: str, path: Path) -> Requirement:
+    """Parse the content of a REQ-*.md file that has already been read.
+
+    Args:
+        text: Full content of the file.
+        path: Path the content was read from; used for the fallback ID,
+              error messages, and ``Requirement.source_path``.
+
+    Returns:
+        A fully populated :class:`~models.Requirement` instance.
+
+    Raises:
+        ValueError: Under the same conditions as :func:`load`.
+
+    """
+    return parse_document(tokenize(text), text, path)
+
+
+def parse_document(doc: ReqDocument, text: str, path: Path) -> Requirement:
+    """Build a Requirement from a file that has already been tokenized.
+
+    Args:
+        doc:  Result of :func:`fields.tokenize` on *text*.
+        text: Full content of the file, kept as ``Requirement.raw_text``.
+        path: Path the content was read from.
 
-    id_match = _ID_RE.search(text)
-    req_id = id_match.group(1) if id_match else path.stem
+    Returns:
+        A fully populated :class:`~models.Requirement` instance.
 
-    cs_match = _CS_RE.search(text)
-    cd_match = _CD_RE.search(text)
+    Raises:
+        ValueError: Under the same conditions as :func:`load`.
+
+    """
+    id_field = doc.fields.get("ID")
+    id_match = _REQ_ID_RE.match(id_field.value) if id_field else None
+    req_id = id_match.group(0) if id_match else path.stem
 
-    cs = _extract_score(cs_match.group(1)) if cs_match else None
-    cd = _extract_score(cd_match.group(1)) if cd_match else None
+    cs_field = _find_field(doc, _CS_NAME_RE)
+    cd_field = _find_field(doc, _CD_NAME_RE)
+
+    cs = _extract_score(cs_field.value) if cs_field else None
+    cd = _extract_score(cd_field.value) if cd_field else None
 
     if cs is None or cd is None:
         raise ValueError(
@@ -109,27 +141,26 @@ def load(path: Path) -> Requirement:
             "Ensure the file follows the standard REQ template."
         )
 
-    title_match = _TITLE_HEADING_RE.search(text)
-    if not title_match:
+    if doc.title is None:
         raise ValueError(
             f"Missing title heading in '{path.name}'. "
             "File must start with '# Short descriptive title'."
         )
 
-    type_match = _TYPE_RE.search(text)
-    if not type_match:
+    type_field = doc.fields.get("Type")
+    if not type_field or not type_field.value:
         raise ValueError(
             f"Missing '**Type:**' field in '{path.name}'."
         )
 
-    status_match = _STATUS_RE.search(text)
-    if not status_match:
+    status = _next_line_value(doc, "Status")
+    if status is None:
         raise ValueError(
             f"Missing '**Status:**' field in '{path.name}'."
         )
 
-    priority_match = _PRIORITY_RE.search(text)
-    if not priority_match:
+    priority = _next_line_value(doc, "Priority")
+    if priority is None:
         raise ValueError(
             f"Missing '**Priority:**' field in '{path.name}'."
         )
@@ -138,12 +169,12 @@ def load(path: Path) -> Requirement:
         req_id=req_id,
         cs=cs,
         cd=cd,
-        status=status_match.group(1).strip(),
-        priority=priority_match.group(1).strip(),
+        status=status,
+        priority=priority,
         source_path=path,
         raw_text=text,
-        req_type=type_match.group(1).strip(),
-        title=title_match.group(1).strip(),
+        req_type=type_field.first_line,
+        title=doc.title,
     )
 
 
@@ -153,7 +184,7 @@ def save(
     status: str | None = None,
     priority: str | None = None,
     title: str | None = None,
-) -> None:
+) -> bool:
     """Write updated field values back to the requirement's source file.
 
     Only fields explicitly passed as keyword arguments are written.  Fields
@@ -170,6 +201,10 @@ def save(
                   it is replaced in place; when absent it is prepended to the
                   file.
 
+    Returns:
+        ``True`` if the file was rewritten, ``False`` if the updates left its
+        content unchanged (the file is not touched, so its mtime is kept).
+
     """
     text = req.raw_text
 
@@ -182,7 +217,11 @@ def save(
     if priority is not None:
         text = _upsert_field(text, "Priority", priority)
 
+    if text == req.raw_text:
+        return False
     req.source_path.write_text(text, encoding="utf-8")
+    req.raw_text = text
+    return True
 
 
 # ---------------------------------------------------------------------------
@@ -207,6 +246,26 @@ def _upsert_title(text: str, title: str) -> str:
     return f"# {title}\n\n{text.lstrip()}"
 
 
+def _find_field(doc: ReqDocument, name_re: re.Pattern[str]) -> Field | None:
+    """Return the first field whose name matches *name_re* in full."""
+    for name, field in doc.fields.items():
+        if name_re.fullmatch(name):
+            return field
+    return None
+
+
+def _next_line_value(doc: ReqDocument, name: str) -> str | None:
+    """Return the value of a field written on the line after its label.
+
+    ``Status`` and ``Priority`` must use the two-line form, because
+    :func:`_upsert_field` only rewrites fields in that form.
+    """
+    field = doc.fields.get(name)
+    if field is None or field.inline or not field.value:
+        return None
+    return field.first_line
+
+
 def _extract_score(block: str) -> int | None:
     """Extract a single integer score from a CS/CD field value block.
 
@@ -214,7 +273,7 @@ def _extract_score(block: str) -> int | None:
     format (``4`` on its own line).
 
     Args:
-        block: Raw text of the field value as captured by the regex.
+        block: Raw text of the field value.
 
     Returns:
         Integer score, or ``None`` if no digit could be found.
@@ -232,9 +291,12 @@ def _extract_score(block: str) -> int | None:
 def _upsert_field(text: str, field: str, value: str) -> str:
     """Update an existing field or insert a new one at the correct position.
 
+    An existing header is found with :func:`fields.header_pattern`, so
+    ``**Priority :**`` is rewritten in place just as the parser reads it.
+
     Args:
         text:  Full content of a REQ file.
-        field: Field name exactly as it appears between ``**`` markers,
+        field: Field name without the ``**`` markers or colon,
                e.g. ``"Status"`` or ``"Priority"``.
         value: New field value (single line).
 
@@ -242,9 +304,7 @@ def _upsert_field(text: str, field: str, value: str) -> str:
         Updated file content as a string.
 
     """
-    existing = re.compile(
-        rf"(\*\*{re.escape(field)}:\*\*\s*\n)(\S[^\n]*)", re.MULTILINE
-    )
+    existing = re.compile(rf"({header_pattern(field)}\s*\n)(\S[^\n]*)", re.MULTILINE)
     if existing.search(text):
         return existing.sub(rf"\g<1>{value}", text)
 
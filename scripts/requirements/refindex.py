@@ -0,0 +1,186 @@
+"""refindex.py: Inverted index of REQ-ID references across a project.
+
+Maps every ``REQ-NN`` token to the files that mention it, whether in
+``**Dependencies / Conflicts:**``, the ``**ID:**`` line, or free text.
+``renumber`` uses it to rewrite only the files that reference a changed ID
+instead of running its substitution over every file, and it reports
+dangling references (IDs with no matching ``REQ-NN.md``) in time
+proportional to the number of distinct IDs referenced.
+
+Persistence:
+    The per-file reference lists are stored in the corpus parse cache
+    (``.req-cache.json``) alongside the other parsed fields, so the index
+    is rebuilt from cached data in memory and only edited files are scanned
+    again.  :meth:`ReferenceIndex.update` and :meth:`ReferenceIndex.remove`
+    maintain an index in place between scans.
+
+Usage (run from the repository root):
+    python -m scripts.requirements.refindex [--req-dir PATH] [--id REQ-NN]
+
+    Prints the number of indexed references and any dangling ones; with
+    ``--id``, lists the files that mention that requirement.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .corpus import RequirementCorpus
+
+# Same token rule as renumber: an isolated REQ-NN with word boundaries.
+_REF_RE = re.compile(r"\bREQ-\d+\b")
+
+
+def find_references(text: str) -> list[str]:
+    """Return the distinct ``REQ-NN`` tokens in *text*, sorted."""
+    return sorted(set(_REF_RE.findall(text)))
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+class ReferenceIndex:
+    """ID → referencing-files index for one requirements directory."""
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._refs: dict[Path, tuple[str, ...]] = {}
+        self._by_id: dict[str, set[Path]] = {}
+
+    @classmethod
+    def from_corpus(cls, corpus: RequirementCorpus) -> ReferenceIndex:
+        """Build the index from the cached reference lists of *corpus*."""
+        index = cls()
+        for entry in corpus.entries:
+            index.update(entry.path, entry.references)
+        return index
+
+    @classmethod
+    def from_texts(cls, texts: Mapping[Path, str]) -> ReferenceIndex:
+        """Build the index by scanning already-read file contents."""
+        index = cls()
+        for path, text in texts.items():
+            index.update(path, find_references(text))
+        return index
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def update(self, path: Path, refs: Iterable[str]) -> None:
+        """Replace the references recorded for *path*."""
+        self.remove(path)
+        refs = tuple(refs)
+        self._refs[path] = refs
+        for ref in refs:
+            self._by_id.setdefault(ref, set()).add(path)
+
+    def remove(self, path: Path) -> None:
+        """Forget *path* and its references (no-op if unknown)."""
+        for ref in self._refs.pop(path, ()):
+            holders = self._by_id[ref]
+            holders.discard(path)
+            if not holders:
+                del self._by_id[ref]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def reference_count(self) -> int:
+        """Return the number of (file, ID) reference pairs."""
+        return sum(len(refs) for refs in self._refs.values())
+
+    def references(self, path: Path) -> tuple[str, ...]:
+        """Return the IDs mentioned in *path* (empty if not indexed)."""
+        return self._refs.get(path, ())
+
+    def files_referencing(self, ids: Iterable[str]) -> set[Path]:
+        """Return every indexed file that mentions at least one of *ids*."""
+        files: set[Path] = set()
+        for req_id in ids:
+            files |= self._by_id.get(req_id, set())
+        return files
+
+    def dangling(self) -> dict[str, list[Path]]:
+        """Return referenced IDs with no ``<ID>.md`` among the indexed files.
+
+        Returns:
+            Mapping of missing ID → sorted files that mention it.
+
+        """
+        existing = {path.stem for path in self._refs}
+        return {
+            req_id: sorted(holders)
+            for req_id, holders in sorted(self._by_id.items())
+            if req_id not in existing
+        }
+
+
+def report_dangling(index: ReferenceIndex) -> int:
+    """Print a warning per dangling reference and return how many IDs dangle."""
+    dangling = index.dangling()
+    for req_id, holders in dangling.items():
+        names = ", ".join(path.name for path in holders)
+        print(f"  [WARN] {req_id} is referenced but does not exist (in {names})", file=sys.stderr)
+    return len(dangling)
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+def _parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="refindex",
+        description="Show REQ-ID cross-references and report dangling ones.",
+    )
+    p.add_argument(
+        "--req-dir",
+        default="requirements/project1",
+        metavar="PATH",
+        help="Directory containing REQ-*.md files (default: requirements/project1).",
+    )
+    p.add_argument(
+        "--id",
+        default=None,
+        metavar="REQ-NN",
+        help="List the files that mention this requirement ID.",
+    )
+    return p.parse_args()
+
+
+def main() -> None:
+    """Parse command-line arguments and print the reference report."""
+    from .corpus import RequirementCorpus
+
+    args = _parse_args()
+    req_dir = Path(args.req_dir)
+    if not req_dir.exists():
+        print(f"[ERROR] Directory not found: {req_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    corpus = RequirementCorpus(req_dir)
+    corpus.save_cache()
+    index = ReferenceIndex.from_corpus(corpus)
+
+    if args.id:
+        for path in sorted(index.files_referencing([args.id])):
+            print(path.name)
+        return
+
+    print(f"{index.reference_count} reference(s) across {len(corpus.paths)} file(s).")
+    dangling = report_dangling(index)
+    print(f"{dangling} dangling ID(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,16 +7,30 @@
 removed.
 
 After renaming the files the script rewrites the **ID:** field and the
-**Dependencies / Conflicts:** field inside every file so that cross-
-references remain consistent.
+**Dependencies / Conflicts:** field so that cross-references remain
+consistent.  A reference index (``refindex.py``) identifies the files that
+mention a changed ID, so only those files are rewritten.  References to IDs
+that have no file are reported as dangling before anything is changed.
 
 Safety:
-    Renaming is performed in two atomic phases to prevent collisions:
-
-        Phase 1: every file is renamed to a temporary name
-                  (``REQ-TEMP-<index>.md``) that cannot clash with any
-                  current or target name.
-        Phase 2: every temporary file is renamed to its final target name.
+    Changes are applied through a journal so that an interrupted renumber
+    can always be completed:
+
+        Stage:   the new content of every affected file is written, in
+                 parallel and flushed to disk, under its final name in
+                 ``.renumber-staging/``.  Nothing in the directory has
+                 changed yet; a crash here leaves the originals intact.
+        Journal: the plan (old → new names, staged files) is written
+                 atomically to ``.renumber-journal.json``.  From this point
+                 the renumber is committed.
+        Commit:  the originals of renamed files are removed, then every
+                 staged file is moved into place with ``os.replace``.  Each
+                 step is idempotent, and the journal records which phase
+                 has finished.
+
+    ``recover()`` (run automatically at the start of every renumber, or via
+    ``--recover``) replays the commit from the journal if one is present,
+    or discards an incomplete staging directory if not.
 
     If ``--dry-run`` is given, no files are modified and the planned changes
     are printed instead.
@@ -29,6 +43,7 @@
     --readme PATH    Path to the README.md register to update.
                      Default: requirements/project1/README.md
     --dry-run        Print planned renames without writing any files.
+    --recover        Only finish (or discard) an interrupted renumber.
 
 See Also:
     scripts/requirements/README.md    : overview and usage guide.
@@ -40,13 +55,33 @@
 from __future__ import annotations
 
 import argparse
+import json
+import os
 import re
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .refindex import ReferenceIndex, report_dangling
+
+if TYPE_CHECKING:
+    from .corpus import RequirementCorpus
 
 # Matches an isolated REQ-NN token (word boundary on both sides).
 _REQ_ID_RE = re.compile(r"\bREQ-(\d+)\b")
 
+JOURNAL_FILENAME = ".renumber-journal.json"
+STAGING_DIRNAME = ".renumber-staging"
+
+_JOURNAL_VERSION = 1
+_STAGED = "staged"      # staged files complete; originals untouched
+_PLACING = "placing"    # originals of renamed files removed
+
+# Threads used to write (and fsync) staged files.
+_STAGE_WORKERS = 8
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -116,6 +151,115 @@ def replacer(match: re.Match[str]) -> str:
     return _REQ_ID_RE.sub(replacer, text)
 
 
+# ---------------------------------------------------------------------------
+# Journal
+# ---------------------------------------------------------------------------
+
+def _write_durable(path: Path, text: str) -> None:
+    """Write *text* to *path* and fsync it before returning."""
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write(text)
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+def _stage(req_dir: Path, staged: dict[str, str]) -> None:
+    """Write every ``name → text`` in *staged* into a fresh staging directory."""
+    staging = req_dir / STAGING_DIRNAME
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir()
+
+    # One os.sync() after all writes is far cheaper than an fsync per file;
+    # platforms without it (Windows) fall back to fsync'ing each file.
+    sync_each = not hasattr(os, "sync")
+
+    def write(item: tuple[str, str]) -> None:
+        path = staging / item[0]
+        if sync_each:
+            _write_durable(path, item[1])
+        else:
+            path.write_text(item[1], encoding="utf-8")
+
+    with ThreadPoolExecutor(max_workers=_STAGE_WORKERS) as pool:
+        # list() re-raises the first write error, if any.
+        list(pool.map(write, staged.items()))
+    if not sync_each:
+        os.sync()
+
+
+def _write_journal(req_dir: Path, journal: dict[str, object]) -> None:
+    """Atomically replace the journal with *journal*."""
+    path = req_dir / JOURNAL_FILENAME
+    tmp_path = path.with_name(path.name + ".tmp")
+    _write_durable(tmp_path, json.dumps(journal, indent=2, sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+def _commit(req_dir: Path, journal: dict[str, object]) -> None:
+    """Apply a journaled renumber.  Safe to call again after a crash.
+
+    Args:
+        req_dir: Directory being renumbered.
+        journal: Journal contents as written by :func:`_write_journal`.
+
+    """
+    staging = req_dir / STAGING_DIRNAME
+    renames: dict[str, str] = journal["renames"]  # type: ignore[assignment]
+    files: list[str] = journal["files"]  # type: ignore[assignment]
+
+    if journal["state"] == _STAGED:
+        # Every renamed file's new content is staged, so its original can go.
+        # No staged file has been placed yet, so each of these names still
+        # holds an original.
+        for old_name in renames:
+            (req_dir / old_name).unlink(missing_ok=True)
+        journal = {**journal, "state": _PLACING}
+        _write_journal(req_dir, journal)
+
+    for name in files:
+        source = staging / name
+        if source.exists():
+            os.replace(source, req_dir / name)
+
+    shutil.rmtree(staging, ignore_errors=True)
+    (req_dir / JOURNAL_FILENAME).unlink(missing_ok=True)
+
+
+def recover(req_dir: Path) -> bool:
+    """Finish an interrupted renumber in *req_dir*, if there is one.
+
+    When a journal is present the commit is replayed to completion.  A
+    staging directory without a journal is an incomplete stage and is
+    discarded, leaving the original files as they were.
+
+    Args:
+        req_dir: Directory containing ``REQ-*.md`` files.
+
+    Returns:
+        ``True`` if an interrupted renumber was completed.
+
+    """
+    journal_path = req_dir / JOURNAL_FILENAME
+    if journal_path.exists():
+        journal = json.loads(journal_path.read_text(encoding="utf-8"))
+        if journal.get("version") != _JOURNAL_VERSION:
+            print(
+                f"[ERROR] Unsupported renumber journal version in {journal_path}.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        print(f"[INFO] Completing interrupted renumber recorded in {journal_path}")
+        _commit(req_dir, journal)
+        return True
+
+    staging = req_dir / STAGING_DIRNAME
+    if staging.exists():
+        print(f"[INFO] Discarding incomplete renumber staging directory {staging}")
+        shutil.rmtree(staging)
+    return False
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -125,14 +269,16 @@ def run(
     readme_path: Path,
     *,
     dry_run: bool = False,
+    corpus: RequirementCorpus | None = None,
 ) -> dict[str, str]:
     """Renumber all REQ-*.md files in *req_dir* to fill sequence gaps.
 
     Steps performed:
         1. Scan *req_dir* for ``REQ-*.md`` files and build an old→new ID map.
-        2. Rewrite the text of every file that needs updating (``**ID:**``
-           and ``**Dependencies / Conflicts:**`` fields).
-        3. Rename files in two phases to avoid name collisions.
+        2. Report dangling references, then compute the new text of every
+           file that mentions a changed ID (``**ID:**`` and
+           ``**Dependencies / Conflicts:**`` fields).
+        3. Stage, journal and commit the changes (see module docstring).
 
     Args:
         req_dir:     Directory containing ``REQ-*.md`` files.
@@ -141,6 +287,9 @@ def run(
                      ``update_register`` afterwards to rebuild the table).
         dry_run:     When True, print planned changes without modifying any
                      files.
+        corpus:      Already-loaded corpus for *req_dir*.  File contents are
+                     taken from it instead of being re-read, and it is
+                     refreshed after the files are renamed.
 
     Returns:
         The old→new ID mapping that was applied (empty when no gaps exist).
@@ -153,11 +302,31 @@ def run(
         print(f"[ERROR] Directory not found: {req_dir}", file=sys.stderr)
         sys.exit(1)
 
-    req_files = sorted(req_dir.glob("REQ-*.md"))
+    if dry_run:
+        if (req_dir / JOURNAL_FILENAME).exists():
+            print(
+                "[WARN] An interrupted renumber is pending; run without --dry-run "
+                "to complete it.",
+                file=sys.stderr,
+            )
+    elif recover(req_dir) and corpus is not None:
+        corpus.refresh()
+
+    if corpus is not None:
+        texts = {e.path: e.text for e in corpus.entries}
+        index = ReferenceIndex.from_corpus(corpus)
+    else:
+        texts = {
+            path: path.read_text(encoding="utf-8")
+            for path in sorted(req_dir.glob("REQ-*.md"))
+        }
+        index = ReferenceIndex.from_texts(texts)
+    req_files = list(texts)
     if not req_files:
         print(f"[ERROR] No REQ-*.md files found in {req_dir}.", file=sys.stderr)
         sys.exit(1)
 
+    report_dangling(index)
     id_map = _build_id_map(req_files)
 
     if not id_map:
@@ -179,41 +348,35 @@ def run(
         return id_map
 
     # -----------------------------------------------------------------------
-    # Phase 1: rewrite file content for ALL files (even those whose own ID
-    # does not change, since their Dependencies / Conflicts may reference IDs
-    # that do change).
-    # -----------------------------------------------------------------------
-    print("\nRewriting file content...")
-    for path in req_files:
-        text = path.read_text(encoding="utf-8")
-        new_text = _rewrite_ids_in_text(text, id_map)
-        if new_text != text:
-            path.write_text(new_text, encoding="utf-8")
-
-    # -----------------------------------------------------------------------
-    # Phase 2a: rename files that need a new name → temporary names, so that
-    # a direct rename (e.g. REQ-59→REQ-58) never overwrites an existing file.
+    # Stage the new content of every file that mentions a changed ID (its own
+    # **ID:** line or a Dependencies / Conflicts entry).  Renamed files are
+    # always staged, even if their text does not mention their own ID, since
+    # the commit removes their originals.
     # -----------------------------------------------------------------------
-    # Maps each temp path to its intended final path.
-    temp_map: dict[Path, Path] = {}
-    files_to_rename = {
-        path: req_dir / f"{id_map[path.stem]}.md"
-        for path in req_files
-        if path.stem in id_map
+    renames = {path.name: f"{id_map[path.stem]}.md" for path in req_files if path.stem in id_map}
+    affected = index.files_referencing(id_map) | {req_dir / name for name in renames}
+    staged: dict[str, str] = {}
+    for path in sorted(affected):
+        new_text = _rewrite_ids_in_text(texts[path], id_map)
+        if path.name in renames or new_text != texts[path]:
+            staged[renames.get(path.name, path.name)] = new_text
+
+    print(f"\nStaging {len(staged)} of {len(req_files)} file(s)...")
+    _stage(req_dir, staged)
+
+    journal = {
+        "version": _JOURNAL_VERSION,
+        "state": _STAGED,
+        "renames": renames,
+        "files": sorted(staged),
     }
+    _write_journal(req_dir, journal)
 
-    print("Renaming files... (phase 1: to temp names)")
-    for old_path, new_path in files_to_rename.items():
-        temp_path = req_dir / f"REQ-TEMP-{old_path.stem}.md"
-        old_path.rename(temp_path)
-        temp_map[temp_path] = new_path
+    print("Committing staged files...")
+    _commit(req_dir, journal)
 
-    # -----------------------------------------------------------------------
-    # Phase 2b: rename temporary files to their final names.
-    # -----------------------------------------------------------------------
-    print("Renaming files... (phase 2: to final names)")
-    for temp_path, final_path in temp_map.items():
-        temp_path.rename(final_path)
+    if corpus is not None:
+        corpus.refresh()
 
     print(
         f"\nRenumber complete: {len(id_map)} file(s) renamed, "
@@ -251,12 +414,22 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print planned renames without writing any files.",
     )
+    p.add_argument(
+        "--recover",
+        action="store_true",
+        help="Only complete (or discard) an interrupted renumber, then exit.",
+    )
     return p.parse_args()
 
 
 def main() -> None:
     """Parse command-line arguments and run the renumber pipeline."""
     args = _parse_args()
+    if args.recover:
+        req_dir = Path(args.req_dir)
+        if not recover(req_dir):
+            print(f"No interrupted renumber found in {req_dir}.")
+        return
     run(
         req_dir=Path(args.req_dir),
         readme_path=Path(args.readme),
@@ -0,0 +1,88 @@
+"""conftest.py: Shared fixtures and REQ file builders for scripts.requirements tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# REQ file builder
+# ---------------------------------------------------------------------------
+
+
+def req_text(
+    req_id: str,
+    *,
+    title: str | None = None,
+    req_type: str = "Functional",
+    cs: int = 3,
+    cd: int = 2,
+    depends: str = "None",
+    status: str = "Approved",
+    priority: str = "Should",
+) -> str:
+    """Return the text of a complete Volere REQ file."""
+    return f"""\
+# {title or f"Requirement {req_id}"}
+
+**ID:** {req_id}
+
+**Type:** {req_type}
+
+**Originator:** Stakeholder Interview
+
+**Description:**
+The system shall support {req_id}.
+
+**Rationale:**
+Needed for the workflow.
+
+**Fit Criterion:**
+
+- The behaviour of {req_id} is observable.
+
+**Customer Satisfaction (0–5):**
+
+- {cs}: Satisfied.
+
+**Customer Dissatisfaction (0–5):**
+
+- {cd}: Dissatisfied.
+
+**Dependencies / Conflicts:**
+{depends}
+
+**Status:**
+{status}
+
+**Priority:**
+{priority}
+
+**History:**
+
+- 2026-02-16 | Author | Created | Initial version
+"""
+
+
+def write_req(req_dir: Path, req_id: str, **kwargs: object) -> Path:
+    """Write ``<req_id>.md`` built by :func:`req_text` into *req_dir*."""
+    path = req_dir / f"{req_id}.md"
+    path.write_text(req_text(req_id, **kwargs), encoding="utf-8")  # type: ignore[arg-type]
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def req_dir(tmp_path: Path) -> Path:
+    """Project directory with three requirements REQ-01 to REQ-03."""
+    directory = tmp_path / "project"
+    directory.mkdir()
+    write_req(directory, "REQ-01", cs=5, cd=5)
+    write_req(directory, "REQ-02", cs=3, cd=2, depends="REQ-01")
+    write_req(directory, "REQ-03", req_type="Non-Functional", cs=1, cd=0, depends="REQ-02")
+    return directory
@@ -0,0 +1,126 @@
+"""test_corpus.py: Tests for the cached corpus loader and its invalidation rules."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from scripts.requirements import corpus as corpus_module
+from scripts.requirements.corpus import CACHE_FILENAME, RequirementCorpus
+from scripts.requirements.tests.conftest import write_req
+
+
+def _warm(req_dir: Path) -> RequirementCorpus:
+    """Load *req_dir* cold and write its cache."""
+    corpus = RequirementCorpus(req_dir)
+    assert corpus.parsed_count == 3
+    corpus.save_cache()
+    return corpus
+
+
+def _set_mtime(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_warm_cache_parses_nothing(req_dir: Path) -> None:
+    _warm(req_dir)
+    corpus = RequirementCorpus(req_dir)
+    assert corpus.parsed_count == 0
+    assert [r.req_id for r in corpus.requirements()] == ["REQ-01", "REQ-02", "REQ-03"]
+    assert corpus.entries[1].references == ["REQ-01", "REQ-02"]
+
+
+def test_mtime_change_with_same_content_reuses_the_cached_parse(
+    req_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _warm(req_dir)
+    path = req_dir / "REQ-02.md"
+    _set_mtime(path, path.stat().st_mtime_ns + 10**9)
+
+    # The hash still matches, so the file must not be tokenized again.
+    def fail(text: str, path: Path) -> None:
+        raise AssertionError(f"{path.name} was re-parsed")
+
+    monkeypatch.setattr(corpus_module, "_parse_record", fail)
+    corpus = RequirementCorpus(req_dir)
+    assert corpus.parsed_count == 0
+    corpus.save_cache()
+    monkeypatch.undo()
+
+    # The new stat is stored, so the next load skips even the hash.
+    records = json.loads((req_dir / CACHE_FILENAME).read_text(encoding="utf-8"))["files"]
+    assert records["REQ-02.md"]["mtime_ns"] == path.stat().st_mtime_ns
+
+
+def test_size_change_with_same_mtime_is_reparsed(req_dir: Path) -> None:
+    _warm(req_dir)
+    path = req_dir / "REQ-02.md"
+    mtime_ns = path.stat().st_mtime_ns
+    write_req(req_dir, "REQ-02", status="Draft", depends="REQ-01")
+    _set_mtime(path, mtime_ns)
+
+    corpus = RequirementCorpus(req_dir)
+    assert corpus.parsed_count == 1
+    assert corpus.requirements()[1].status == "Draft"
+
+
+def test_same_size_edit_is_caught_by_the_hash(req_dir: Path) -> None:
+    _warm(req_dir)
+    path = req_dir / "REQ-02.md"
+    before = path.stat()
+    # "Approved" and "Rejected" have the same length.
+    write_req(req_dir, "REQ-02", status="Rejected", depends="REQ-01")
+    assert path.stat().st_size == before.st_size
+    _set_mtime(path, before.st_mtime_ns + 10**9)
+
+    corpus = RequirementCorpus(req_dir)
+    assert corpus.parsed_count == 1
+    assert corpus.requirements()[1].status == "Rejected"
+
+
+def test_cache_version_bump_forces_a_full_parse(
+    req_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _warm(req_dir)
+    monkeypatch.setattr(
+        corpus_module,
+        "_CACHE_VERSION",
+        corpus_module._CACHE_VERSION + 1,  # pyright: ignore[reportPrivateUsage]
+    )
+    corpus = RequirementCorpus(req_dir)
+    assert corpus.parsed_count == 3
+    corpus.save_cache()
+
+    data = json.loads((req_dir / CACHE_FILENAME).read_text(encoding="utf-8"))
+    assert data["version"] == corpus_module._CACHE_VERSION  # pyright: ignore[reportPrivateUsage]
+
+
+def test_corrupt_cache_file_is_ignored(req_dir: Path) -> None:
+    (req_dir / CACHE_FILENAME).write_text("{not json", encoding="utf-8")
+    assert RequirementCorpus(req_dir).parsed_count == 3
+
+
+def test_refresh_rereads_only_touched_files_and_drops_deleted_ones(req_dir: Path) -> None:
+    corpus = _warm(req_dir)
+    write_req(req_dir, "REQ-04", depends="REQ-09")
+    (req_dir / "REQ-01.md").unlink()
+
+    corpus.refresh()
+    assert corpus.parsed_count == 1
+    assert [p.name for p in corpus.paths] == ["REQ-02.md", "REQ-03.md", "REQ-04.md"]
+    corpus.save_cache()
+    records = json.loads((req_dir / CACHE_FILENAME).read_text(encoding="utf-8"))["files"]
+    assert sorted(records) == ["REQ-02.md", "REQ-03.md", "REQ-04.md"]
+
+
+def test_parse_errors_are_cached_with_the_entry(req_dir: Path) -> None:
+    (req_dir / "REQ-02.md").write_text("# Broken\n\n**ID:** REQ-02\n", encoding="utf-8")
+    RequirementCorpus(req_dir).save_cache()
+
+    entry = RequirementCorpus(req_dir).entries[1]
+    assert entry.requirement is None
+    assert entry.error is not None
+    assert "Missing field: **Type:**" in entry.violations
@@ -0,0 +1,61 @@
+"""test_fields.py: Tests for the REQ field tokenizer and in-place field updates."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from scripts.requirements import parser, validate
+from scripts.requirements.fields import tokenize
+from scripts.requirements.tests.conftest import req_text, write_req
+
+
+def test_tokenize_splits_title_and_fields() -> None:
+    doc = tokenize(req_text("REQ-01", depends="REQ-02"))
+    assert doc.title == "Requirement REQ-01"
+    assert doc.fields["ID"].value == "REQ-01"
+    assert doc.fields["ID"].inline
+    assert doc.fields["Dependencies / Conflicts"].value == "REQ-02"
+    assert not doc.fields["Status"].inline
+
+
+def test_bold_line_inside_a_value_does_not_end_the_field(tmp_path: Path) -> None:
+    text = req_text("REQ-01").replace(
+        "The system shall support REQ-01.",
+        "**Offline mode** must be supported.\nSync resumes on reconnect.",
+    )
+    path = tmp_path / "REQ-01.md"
+    path.write_text(text, encoding="utf-8")
+
+    description = tokenize(text).fields["Description"].value
+    assert description == "**Offline mode** must be supported.\nSync resumes on reconnect."
+    assert validate.validate_file(path) == []
+
+
+def test_first_header_wins_including_its_bold_lines() -> None:
+    text = "# T\n\n**Note:**\nfirst\n**bold** line\n\n**Note:**\nsecond\n"
+    assert tokenize(text).fields["Note"].value == "first\n**bold** line"
+
+
+def test_save_rewrites_padded_header_in_place(tmp_path: Path) -> None:
+    text = req_text("REQ-01", priority="Could").replace("**Priority:**", "**Priority :**")
+    path = tmp_path / "REQ-01.md"
+    path.write_text(text, encoding="utf-8")
+    req = parser.load(path)
+    assert req.priority == "Could"
+
+    assert parser.save(req, priority="Must")
+    saved = path.read_text(encoding="utf-8")
+    assert saved.count("Priority") == 1
+    assert "**Priority :**\nMust" in saved
+    assert parser.load(path).priority == "Must"
+
+
+def test_save_inserts_priority_after_padded_status(tmp_path: Path) -> None:
+    req = parser.load(write_req(tmp_path, "REQ-01"))
+    req.raw_text = req.raw_text.replace("**Priority:**\nShould\n\n", "").replace(
+        "**Status:**", "**Status :**"
+    )
+
+    assert parser.save(req, priority="Must")
+    path = req.source_path
+    assert "**Status :**\nApproved\n\n**Priority:**\nMust" in path.read_text(encoding="utf-8")
@@ -0,0 +1,49 @@
+"""test_refindex.py: Tests for the REQ-ID reference index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from scripts.requirements.corpus import RequirementCorpus
+from scripts.requirements.refindex import ReferenceIndex, find_references
+from scripts.requirements.tests.conftest import write_req
+
+
+def test_find_references_matches_isolated_ids_only() -> None:
+    text = "Depends on REQ-02 and REQ-10, not XREQ-3 or REQ-4a; again REQ-02."
+    assert find_references(text) == ["REQ-02", "REQ-10"]
+
+def test_reference_index_update_and_remove(req_dir: Path) -> None:
+    index = ReferenceIndex.from_corpus(RequirementCorpus(req_dir, use_cache=False))
+    req_02 = req_dir / "REQ-02.md"
+    req_03 = req_dir / "REQ-03.md"
+    assert index.files_referencing(["REQ-01"]) == {req_dir / "REQ-01.md", req_02}
+    assert index.reference_count == 5
+    assert index.dangling() == {}
+
+    index.update(req_03, ["REQ-03", "REQ-09"])
+    assert index.references(req_03) == ("REQ-03", "REQ-09")
+    assert index.files_referencing(["REQ-02"]) == {req_02}
+    assert index.dangling() == {"REQ-09": [req_03]}
+
+    index.remove(req_03)
+    index.remove(req_03)
+    assert index.references(req_03) == ()
+    assert index.files_referencing(["REQ-09", "REQ-03"]) == set()
+    assert index.dangling() == {}
+    assert index.reference_count == 3
+
+
+def test_reference_index_matches_a_fresh_scan_after_updates(req_dir: Path) -> None:
+    corpus = RequirementCorpus(req_dir, use_cache=False)
+    index = ReferenceIndex.from_corpus(corpus)
+    write_req(req_dir, "REQ-02", depends="REQ-03, REQ-07")
+    (req_dir / "REQ-01.md").unlink()
+    corpus.refresh()
+
+    index.remove(req_dir / "REQ-01.md")
+    index.update(req_dir / "REQ-02.md", corpus.entries[0].references)
+    fresh = ReferenceIndex.from_texts({e.path: e.text for e in corpus.entries})
+    for path in corpus.paths:
+        assert index.references(path) == fresh.references(path)
+    assert index.dangling() == fresh.dangling() == {"REQ-07": [req_dir / "REQ-02.md"]}
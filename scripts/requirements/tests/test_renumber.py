@@ -0,0 +1,130 @@
+"""test_renumber.py: Tests for the journaled renumber and its crash recovery."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from scripts.requirements import main, renumber
+from scripts.requirements.tests.conftest import write_req
+
+
+class _CrashError(RuntimeError):
+    """Simulated process death in the middle of a commit."""
+
+
+@pytest.fixture()
+def gapped_dir(tmp_path: Path) -> Path:
+    """REQ-01, REQ-03, REQ-05 and REQ-07, with references between them."""
+    directory = tmp_path / "gapped"
+    directory.mkdir()
+    write_req(directory, "REQ-01")
+    write_req(directory, "REQ-03", depends="REQ-01")
+    write_req(directory, "REQ-05", depends="REQ-03")
+    write_req(directory, "REQ-07", depends="REQ-05, REQ-01")
+    return directory
+
+
+def _contents(req_dir: Path) -> dict[str, str]:
+    return {p.name: p.read_text(encoding="utf-8") for p in sorted(req_dir.iterdir())}
+
+
+def _expected(gapped_dir: Path, tmp_path: Path) -> dict[str, str]:
+    """Directory contents after an uninterrupted renumber of a copy of *gapped_dir*."""
+    reference = tmp_path / "reference"
+    shutil.copytree(gapped_dir, reference)
+    renumber.run(reference, reference / "README.md")
+    return _contents(reference)
+
+
+def test_uninterrupted_renumber_rewrites_ids_and_references(
+    gapped_dir: Path, tmp_path: Path
+) -> None:
+    files = _expected(gapped_dir, tmp_path)
+    assert sorted(files) == ["REQ-1.md", "REQ-2.md", "REQ-3.md", "REQ-4.md"]
+    assert "**ID:** REQ-3" in files["REQ-3.md"]
+    assert "REQ-3, REQ-1" in files["REQ-4.md"]
+
+
+def test_recover_after_crash_in_staged_state(
+    gapped_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = _expected(gapped_dir, tmp_path)
+    write_journal = renumber._write_journal  # pyright: ignore[reportPrivateUsage]
+
+    def crash_before_placing(req_dir: Path, journal: dict[str, object]) -> None:
+        # The originals are already removed, but the journal still says "staged".
+        if journal["state"] == renumber._PLACING:  # pyright: ignore[reportPrivateUsage]
+            raise _CrashError
+        write_journal(req_dir, journal)
+
+    monkeypatch.setattr(renumber, "_write_journal", crash_before_placing)
+    with pytest.raises(_CrashError):
+        renumber.run(gapped_dir, gapped_dir / "README.md")
+    monkeypatch.undo()
+
+    assert (gapped_dir / renumber.JOURNAL_FILENAME).exists()
+    assert renumber.recover(gapped_dir)
+    assert _contents(gapped_dir) == expected
+
+
+def test_recover_after_crash_in_placing_state(
+    gapped_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = _expected(gapped_dir, tmp_path)
+    replace = os.replace
+    placed: list[str] = []
+
+    def crash_after_first_placement(src: os.PathLike[str], dst: os.PathLike[str]) -> None:
+        if Path(src).parent.name == renumber.STAGING_DIRNAME:
+            if placed:
+                raise _CrashError
+            placed.append(Path(dst).name)
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", crash_after_first_placement)
+    with pytest.raises(_CrashError):
+        renumber.run(gapped_dir, gapped_dir / "README.md")
+    monkeypatch.undo()
+
+    assert placed
+    assert renumber.recover(gapped_dir)
+    assert _contents(gapped_dir) == expected
+    assert not renumber.recover(gapped_dir)
+
+
+def test_incomplete_staging_without_journal_is_discarded(gapped_dir: Path) -> None:
+    before = _contents(gapped_dir)
+    (gapped_dir / renumber.STAGING_DIRNAME).mkdir()
+    (gapped_dir / renumber.STAGING_DIRNAME / "REQ-2.md").write_text("partial", encoding="utf-8")
+
+    assert not renumber.recover(gapped_dir)
+    assert _contents(gapped_dir) == before
+
+
+def test_pipeline_completes_interrupted_renumber_even_when_skipping_it(
+    gapped_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected_names = sorted(_expected(gapped_dir, tmp_path))
+
+    def crash(req_dir: Path, journal: dict[str, object]) -> None:
+        raise _CrashError
+
+    monkeypatch.setattr(renumber, "_commit", crash)
+    with pytest.raises(_CrashError):
+        renumber.run(gapped_dir, gapped_dir / "README.md")
+    monkeypatch.undo()
+
+    main.run(
+        gapped_dir,
+        gapped_dir / "README.md",
+        skip_renumber=True,
+        skip_priority=True,
+        skip_register=True,
+        use_cache=False,
+    )
+    assert sorted(p.name for p in gapped_dir.glob("REQ-*.md")) == expected_names
+    assert not (gapped_dir / renumber.JOURNAL_FILENAME).exists()
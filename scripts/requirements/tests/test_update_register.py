@@ -0,0 +1,54 @@
+"""test_update_register.py: Tests for the incremental README register update."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from scripts.requirements import update_register
+from scripts.requirements.corpus import RequirementCorpus
+from scripts.requirements.tests.conftest import write_req
+
+
+def _edit(req_dir: Path) -> None:
+    """Change one row, add one and remove one."""
+    write_req(req_dir, "REQ-02", status="Rejected", priority="Could", depends="REQ-01")
+    write_req(req_dir, "REQ-04", title="Export audit log", cs=4, cd=4)
+    (req_dir / "REQ-03.md").unlink()
+
+
+def test_incremental_register_matches_full_rebuild(
+    req_dir: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    full_dir = tmp_path / "full" / req_dir.name
+    shutil.copytree(req_dir, full_dir)
+    for directory in (req_dir, full_dir):
+        update_register.update(directory / "README.md", directory, full=True)
+        _edit(directory)
+    capsys.readouterr()
+
+    update_register.update(
+        req_dir / "README.md", req_dir, corpus=RequirementCorpus(req_dir, use_cache=False)
+    )
+    assert "Register rows: 1 changed, 1 added, 1 removed." in capsys.readouterr().out
+    update_register.update(full_dir / "README.md", full_dir, full=True)
+
+    incremental = (req_dir / "README.md").read_text(encoding="utf-8")
+    assert incremental == (full_dir / "README.md").read_text(encoding="utf-8")
+    assert "| REQ-04 | Export audit log |" in incremental
+    assert "REQ-03" not in incremental
+
+
+def test_unchanged_register_is_not_rewritten(
+    req_dir: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    readme = req_dir / "README.md"
+    assert update_register.update(readme, req_dir) == 3
+    mtime_ns = readme.stat().st_mtime_ns
+    capsys.readouterr()
+
+    assert update_register.update(readme, req_dir) == 3
+    assert "Register unchanged" in capsys.readouterr().out
+    assert readme.stat().st_mtime_ns == mtime_ns
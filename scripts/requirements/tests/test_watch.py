@@ -0,0 +1,82 @@
+"""test_watch.py: Tests for watch-mode snapshots, debounce and change batches."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from scripts.requirements import parser, update_register, watch
+from scripts.requirements.corpus import RequirementCorpus
+from scripts.requirements.tests.conftest import write_req
+
+
+def test_settle_waits_until_the_directory_is_quiet(
+    req_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        if len(sleeps) == 1:
+            # A second save lands inside the first debounce window.
+            write_req(req_dir, "REQ-04")
+
+    monkeypatch.setattr(time, "sleep", sleep)
+    settled = watch._settle(  # pyright: ignore[reportPrivateUsage]
+        req_dir, watch.snapshot(req_dir), 0.3
+    )
+    assert sleeps == [0.3, 0.3]
+    assert settled == watch.snapshot(req_dir)
+    assert req_dir / "REQ-04.md" in settled
+
+
+def test_diff_snapshots_reports_changed_and_removed(req_dir: Path) -> None:
+    before = watch.snapshot(req_dir)
+    write_req(req_dir, "REQ-02", status="Draft", depends="REQ-01")
+    write_req(req_dir, "REQ-04")
+    (req_dir / "REQ-03.md").unlink()
+
+    changed, removed = watch.diff_snapshots(before, watch.snapshot(req_dir))
+    assert changed == [req_dir / "REQ-02.md", req_dir / "REQ-04.md"]
+    assert removed == [req_dir / "REQ-03.md"]
+
+
+def test_process_changes_reprioritises_only_the_touched_files(req_dir: Path) -> None:
+    readme = req_dir / "README.md"
+    update_register.update(readme, req_dir, full=True)
+    corpus = RequirementCorpus(req_dir)
+    before = watch.snapshot(req_dir)
+
+    # REQ-02 now scores 5 + 4: Must.  REQ-01 and REQ-03 also disagree with
+    # their scores but are not part of this batch.
+    path = write_req(req_dir, "REQ-02", cs=5, cd=4, depends="REQ-01")
+    # Same size as before; make sure the mtime moves even on coarse clocks.
+    mtime_ns = before[path][0] + 10**9
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    (req_dir / "REQ-03.md").unlink()
+    changed, removed = watch.diff_snapshots(before, watch.snapshot(req_dir))
+
+    rewritten = watch.process_changes(corpus, readme, changed, removed)
+    assert rewritten == [req_dir / "REQ-02.md"]
+    assert parser.load(req_dir / "REQ-02.md").priority == "Must"
+    assert parser.load(req_dir / "REQ-01.md").priority == "Should"
+
+    register = readme.read_text(encoding="utf-8")
+    assert "| REQ-02 | Requirement REQ-02 | Functional | 5 | 4 | Approved | Must |" in register
+    assert "REQ-03" not in register
+
+
+def test_process_changes_dry_run_writes_nothing(req_dir: Path) -> None:
+    readme = req_dir / "README.md"
+    update_register.update(readme, req_dir, full=True)
+    register = readme.read_text(encoding="utf-8")
+    path = write_req(req_dir, "REQ-02", cs=5, cd=4, depends="REQ-01")
+    text = path.read_text(encoding="utf-8")
+
+    corpus = RequirementCorpus(req_dir)
+    assert watch.process_changes(corpus, readme, [path], [], dry_run=True) == []
+    assert path.read_text(encoding="utf-8") == text
+    assert readme.read_text(encoding="utf-8") == register
@@ -4,6 +4,12 @@
 metadata, and regenerates the complete requirements table and the
 "Total requirements:" count in the project README.md.
 
+By default the rebuild is incremental: the existing table rows are parsed and
+compared cell by cell with the REQ files, rows whose cells are unchanged are
+kept byte-for-byte, and the README is not written at all when neither the
+table nor the metrics block changed.  Pass ``--full`` to regenerate and
+rewrite the whole table regardless.
+
 The REQ files are the authoritative source for all columns: ID, Type, CS,
 CD, Status, Priority, and Title.  Title is read from the leading ``# Title``
 heading in each REQ file.  When a file does not yet have a title heading,
@@ -18,6 +24,7 @@
     --readme PATH    Path to the README.md register to update.
                      Default: requirements/project1/README.md
     --dry-run        Print the generated table without writing any files.
+    --full           Regenerate every table row and always rewrite README.md.
 
 See Also:
     scripts/requirements/README.md     : overview and usage guide.
@@ -32,10 +39,14 @@
 import re
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from . import parser as req_parser
 from .models import Requirement
 
+if TYPE_CHECKING:
+    from .corpus import RequirementCorpus
+
 # ---------------------------------------------------------------------------
 # Regex helpers
 # ---------------------------------------------------------------------------
@@ -261,6 +272,28 @@ def _create_readme(readme_path: Path, req_dir: Path) -> None:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+_TABLE_HEADER = "| ID | Title | Type | CS | CD | Status | Priority | File |"
+_TABLE_SEPARATOR = "| -- | ----- | ---- | -- | -- | ------ | -------- | ---- |"
+
+
+def _row_cells(req: Requirement) -> tuple[str, ...]:
+    """Return the register cells for *req*, in column order."""
+    rid = req.req_id
+    return (
+        rid, req.title, req.req_type, str(req.cs), str(req.cd),
+        req.status, req.priority, f"[{rid}.md]({rid}.md)",
+    )
+
+
+def _format_row(cells: tuple[str, ...]) -> str:
+    return "| " + " | ".join(cells) + " |"
+
+
+def _split_row(line: str) -> tuple[str, ...]:
+    """Split a markdown table row into stripped cell values."""
+    return tuple(cell.strip() for cell in line.strip().strip("|").split("|"))
+
+
 def _build_table(reqs: list[Requirement]) -> str:
     """Return the full markdown requirements table as a string.
 
@@ -274,19 +307,87 @@ def _build_table(reqs: list[Requirement]) -> str:
         Markdown table string without a trailing newline.
 
     """
-    header = "| ID | Title | Type | CS | CD | Status | Priority | File |"
-    sep    = "| -- | ----- | ---- | -- | -- | ------ | -------- | ---- |"
-    rows   = [header, sep]
+    rows = [_TABLE_HEADER, _TABLE_SEPARATOR]
+    rows.extend(_format_row(_row_cells(req)) for req in reqs)
+    return "\n".join(rows)
+
+
+def _find_table(lines: list[str]) -> tuple[int, int] | None:
+    """Return the ``[start, end)`` line range of the requirements table.
+
+    The table is located the same way as in :func:`_replace_table_in_text`.
+    """
+    for i, raw in enumerate(lines):
+        stripped = raw.strip()
+        if _TABLE_ROW_RE.match(stripped) and "| ID |" in stripped and "| Title |" in stripped:
+            end = i
+            while end < len(lines):
+                cur = lines[end].strip()
+                if _TABLE_ROW_RE.match(cur) or _SEPARATOR_ROW_RE.match(cur):
+                    end += 1
+                else:
+                    break
+            return i, end
+    return None
+
 
+def _patch_table_in_text(
+    text: str, reqs: list[Requirement]
+) -> tuple[str, dict[str, int]] | None:
+    """Patch only the requirements table rows whose cells changed.
+
+    Existing rows are matched to requirements by ID and compared cell by
+    cell, so a row that is unchanged keeps its exact original text (including
+    any manual spacing).  Rows are emitted in *reqs* order; rows for IDs no
+    longer present are dropped.
+
+    Args:
+        text: Full content of the README file.
+        reqs: Parsed requirements, in display order.
+
+    Returns:
+        ``(new_text, counts)`` where ``counts`` has ``changed``, ``added`` and
+        ``removed`` row totals, or ``None`` when the README has no table with
+        the expected header (the caller then falls back to a full rebuild).
+
+    """
+    lines = text.splitlines(keepends=True)
+    span = _find_table(lines)
+    if span is None:
+        return None
+    start, end = span
+    if _split_row(lines[start]) != _split_row(_TABLE_HEADER):
+        return None
+
+    existing: dict[str, tuple[str, tuple[str, ...]]] = {}
+    for raw in lines[start + 1:end]:
+        if _SEPARATOR_ROW_RE.match(raw.strip()):
+            continue
+        cells = _split_row(raw)
+        existing.setdefault(cells[0], (raw.rstrip("\n"), cells))
+
+    counts = {"changed": 0, "added": 0, "removed": 0}
+    body: list[str] = []
     for req in reqs:
-        rid  = req.req_id
-        link = f"[{rid}.md]({rid}.md)"
-        rows.append(
-            f"| {rid} | {req.title} | {req.req_type} | {req.cs} | {req.cd} "
-            f"| {req.status} | {req.priority} | {link} |"
-        )
+        cells = _row_cells(req)
+        old = existing.pop(req.req_id, None)
+        if old is None:
+            counts["added"] += 1
+            body.append(_format_row(cells))
+        elif old[1] != cells:
+            counts["changed"] += 1
+            body.append(_format_row(cells))
+        else:
+            body.append(old[0])
+    counts["removed"] = len(existing)
 
-    return "\n".join(rows)
+    header_lines = [lines[start]]
+    if start + 1 < end and _SEPARATOR_ROW_RE.match(lines[start + 1].strip()):
+        header_lines.append(lines[start + 1])
+    else:
+        header_lines.append(_TABLE_SEPARATOR + "\n")
+    table = "".join(header_lines) + "".join(row + "\n" for row in body)
+    return "".join(lines[:start]) + table + "".join(lines[end:]), counts
 
 
 def _replace_table_in_text(text: str, new_table: str) -> str:
@@ -343,35 +444,56 @@ def _replace_table_in_text(text: str, new_table: str) -> str:
 # Public API
 # ---------------------------------------------------------------------------
 
-def update(readme_path: Path, req_dir: Path, *, dry_run: bool = False) -> int:
+def update(
+    readme_path: Path,
+    req_dir: Path,
+    *,
+    dry_run: bool = False,
+    corpus: RequirementCorpus | None = None,
+    full: bool = False,
+) -> int:
     """Rebuild the register table and update the total count in README.md.
 
     Steps performed:
         1. Scan *req_dir* for ``REQ-*.md`` files and parse each one.
-        2. Regenerate the complete table with all columns including Priority.
-        3. Update the ``**Total requirements:** N`` metadata line.
-        4. Write the result back to *readme_path* (unless ``dry_run``).
+        2. Patch the table rows whose cells changed (or, with ``full``,
+           regenerate the complete table).
+        3. Regenerate the metrics block.
+        4. Write the result back to *readme_path*, unless ``dry_run`` or
+           the content is unchanged.
 
     Args:
         readme_path: Path to the ``README.md`` file to update.
         req_dir:     Directory containing ``REQ-*.md`` files.
         dry_run:     When True, print the generated table to stdout without
                      modifying any files.
+        corpus:      Already-loaded corpus for *req_dir*; when given, its
+                     parsed requirements are used instead of re-reading
+                     every file.
+        full:        When True, regenerate every row and rewrite the README
+                     even if nothing changed.
 
     Returns:
         Number of requirements successfully processed (i.e. table row count).
 
     """
-    req_files = sorted(req_dir.glob("REQ-*.md"))
     reqs: list[Requirement] = []
     skipped: list[str] = []
 
-    for path in req_files:
-        try:
-            reqs.append(req_parser.load(path))
-        except ValueError as exc:
-            print(f"  [SKIP] {path.name}: {exc}", file=sys.stderr)
-            skipped.append(path.name)
+    if corpus is not None:
+        for entry in corpus.entries:
+            if entry.requirement is not None:
+                reqs.append(entry.requirement)
+            else:
+                print(f"  [SKIP] {entry.path.name}: {entry.error}", file=sys.stderr)
+                skipped.append(entry.path.name)
+    else:
+        for path in sorted(req_dir.glob("REQ-*.md")):
+            try:
+                reqs.append(req_parser.load(path))
+            except ValueError as exc:
+                print(f"  [SKIP] {path.name}: {exc}", file=sys.stderr)
+                skipped.append(path.name)
 
     if not reqs:
         print(
@@ -404,13 +526,24 @@ def update(readme_path: Path, req_dir: Path, *, dry_run: bool = False) -> int:
     if not readme_path.exists():
         _create_readme(readme_path, req_dir)
 
-    text = readme_path.read_text(encoding="utf-8")
+    original = readme_path.read_text(encoding="utf-8")
 
     # Replace the metrics block (handles both new delimited block and legacy line).
-    text = _replace_metrics_in_text(text, new_block)
-
-    # Replace the requirements table block.
-    text = _replace_table_in_text(text, new_table)
+    text = _replace_metrics_in_text(original, new_block)
+
+    patched = None if full else _patch_table_in_text(text, reqs)
+    if patched is None:
+        # Replace the requirements table block.
+        text = _replace_table_in_text(text, new_table)
+    else:
+        text, counts = patched
+        if text == original:
+            print(f"Register unchanged: {total} requirements already up to date in {readme_path}")
+            return total
+        print(
+            f"Register rows: {counts['changed']} changed, {counts['added']} added, "
+            f"{counts['removed']} removed."
+        )
 
     readme_path.write_text(text, encoding="utf-8")
     print(f"Register updated: {total} requirements written to {readme_path}")
@@ -444,6 +577,11 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print the generated table without writing any files.",
     )
+    p.add_argument(
+        "--full",
+        action="store_true",
+        help="Regenerate every table row and always rewrite README.md.",
+    )
     return p.parse_args()
 
 
@@ -454,6 +592,7 @@ def main() -> None:
         readme_path=Path(args.readme),
         req_dir=Path(args.req_dir),
         dry_run=args.dry_run,
+        full=args.full,
     )
 
 
@@ -16,6 +16,10 @@
 Public API:
 
     validate_file(path)     Check a single file; return a list of violations.
+    validate_text(text, path)
+                            Same checks on content that has already been read.
+    validate_document(doc, path)
+                            Same checks on a ``fields.tokenize`` result.
     validate_dir(req_dir)   Check every REQ-*.md in a directory; print a
                             report and return (ok_count, error_count).
 """
@@ -25,6 +29,12 @@
 import re
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .fields import ReqDocument, tokenize
+
+if TYPE_CHECKING:
+    from .corpus import RequirementCorpus
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -57,12 +67,8 @@
     {"Must", "Should", "Could", "Won't"}
 )
 
-# Matches **Field Name:** followed by a value on the same or next line.
-_FIELD_RE = re.compile(r"\*\*([^*]+):\*\*\s*\n?(.*?)(?=\n\*\*|\Z)", re.DOTALL)
-_ID_RE = re.compile(r"\*\*ID:\*\*\s*(REQ-\d+)")
+_ID_RE = re.compile(r"REQ-\d+")
 _SCORE_RE = re.compile(r"^\s*-\s*(\d)|^\s*(\d)\s*$", re.MULTILINE)
-# Matches the leading ``# Title`` heading (first non-blank line must be a h1).
-_TITLE_HEADING_RE = re.compile(r"^#\s+\S", re.MULTILINE)
 
 
 # ---------------------------------------------------------------------------
@@ -80,21 +86,44 @@ def validate_file(path: Path) -> list[str]:
         file is fully compliant.
 
     """
-    text = path.read_text(encoding="utf-8")
+    return validate_text(path.read_text(encoding="utf-8"), path)
+
+
+def validate_text(text: str, path: Path) -> list[str]:
+    """Check the content of a REQ-*.md file against the template.
+
+    Args:
+        text: Full content of the file.
+        path: Path the content was read from; its stem is the expected ID.
+
+    Returns:
+        List of human-readable violation strings, as for :func:`validate_file`.
+
+    """
+    return validate_document(tokenize(text), path)
+
+
+def validate_document(doc: ReqDocument, path: Path) -> list[str]:
+    """Check a REQ file that has already been tokenized.
+
+    Args:
+        doc:  Result of :func:`fields.tokenize` on the file's content.
+        path: Path the content was read from; its stem is the expected ID.
+
+    Returns:
+        List of human-readable violation strings, as for :func:`validate_file`.
+
+    """
     violations: list[str] = []
 
     # 1. Title heading present and non-empty.
-    if not _TITLE_HEADING_RE.search(text):
+    if doc.title is None:
         violations.append(
             "Missing title heading: file must start with '# Requirement title'"
         )
 
-    # Build a dict of field name → raw value block from the file.
-    fields: dict[str, str] = {}
-    for m in _FIELD_RE.finditer(text):
-        name = m.group(1).strip()
-        value = m.group(2).strip()
-        fields[name] = value
+    # Field name → value block, from the shared tokenizer.
+    fields = {name: field.value for name, field in doc.fields.items()}
 
     # 2. All mandatory fields present and non-empty.
     for field in REQUIRED_FIELDS:
@@ -104,9 +133,9 @@ def validate_file(path: Path) -> list[str]:
             violations.append(f"Empty field: **{field}:**")
 
     # 3. ID matches filename.
-    id_match = _ID_RE.search(text)
+    id_match = _ID_RE.match(fields.get("ID", ""))
     if id_match:
-        declared_id = id_match.group(1)
+        declared_id = id_match.group(0)
         # e.g. "REQ-01"
         expected_id = path.stem
         if declared_id != expected_id:
@@ -150,7 +179,12 @@ def validate_file(path: Path) -> list[str]:
     return violations
 
 
-def validate_dir(req_dir: Path, *, strict: bool = False) -> tuple[int, int]:
+def validate_dir(
+    req_dir: Path,
+    *,
+    strict: bool = False,
+    corpus: RequirementCorpus | None = None,
+) -> tuple[int, int]:
     """Validate every REQ-*.md file in *req_dir* and print a report.
 
     Args:
@@ -158,22 +192,26 @@ def validate_dir(req_dir: Path, *, strict: bool = False) -> tuple[int, int]:
         strict:  When True, treat any violation as a hard error (non-zero
                  exit via ``sys.exit``).  When False (default), violations
                  are reported as warnings and processing continues.
+        corpus:  Already-loaded corpus for *req_dir*; its cached violations
+                 are reported instead of re-reading every file.
 
     Returns:
         ``(ok_count, error_count)``: number of files that passed and
         failed respectively.
 
     """
-    req_files = sorted(req_dir.glob("REQ-*.md"))
-    if not req_files:
+    if corpus is not None:
+        results = [(entry.path, entry.violations) for entry in corpus.entries]
+    else:
+        results = [(path, validate_file(path)) for path in sorted(req_dir.glob("REQ-*.md"))]
+    if not results:
         print(f"[WARN] No REQ-*.md files found in {req_dir}.", file=sys.stderr)
         return 0, 0
 
     ok_count = 0
     error_count = 0
 
-    for path in req_files:
-        violations = validate_file(path)
+    for path, violations in results:
         if violations:
             error_count += 1
             print(f"  [FAIL] {path.name}", file=sys.stderr)
@@ -182,7 +220,7 @@ def validate_dir(req_dir: Path, *, strict: bool = False) -> tuple[int, int]:
         else:
             ok_count += 1
 
-    _print_validation_summary(ok_count, error_count, len(req_files))
+    _print_validation_summary(ok_count, error_count, len(results))
 
     if strict and error_count:
         sys.exit(1)
@@ -0,0 +1,234 @@
+"""watch.py: Re-run the affected pipeline steps whenever REQ files change.
+
+Polls the ``REQ-*.md`` files of one or more project directories (stdlib
+only: a ``(mtime_ns, size)`` snapshot per file, compared every poll
+interval).  When a change is seen, polling continues until the directory
+has been quiet for the debounce period, so an editor's save burst or a
+``git checkout`` is handled as one batch.  Each batch then runs only the
+work that depends on the touched files:
+
+    1. Validate each touched file and print its violations.
+    2. Recompute its MoSCoW priority with ``moscow.compute`` and write it
+       back if it changed.
+    3. Patch the README register incrementally (only the affected rows and
+       the metrics block are rewritten).
+
+Renumbering is never run from watch mode, since renaming files while an
+author is editing them would be surprising; run the full pipeline for that.
+A renumber interrupted earlier is still completed before watching starts.
+Priority writes made by a batch are absorbed into the snapshot so they do
+not trigger another batch.
+
+Usage (run from the repository root):
+    python -m scripts.requirements.main --watch [--req-dir PATH]
+
+Stop with Ctrl-C.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import moscow, parser, renumber, update_register
+from .corpus import RequirementCorpus
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_DEBOUNCE = 0.3
+
+Snapshot = dict[Path, tuple[int, int]]
+
+
+# ---------------------------------------------------------------------------
+# Snapshots
+# ---------------------------------------------------------------------------
+
+def snapshot(req_dir: Path) -> Snapshot:
+    """Return ``{path: (mtime_ns, size)}`` for every ``REQ-*.md`` in *req_dir*.
+
+    Files that disappear between the directory listing and the ``stat``
+    call are left out, as if they had already been deleted.
+    """
+    result: Snapshot = {}
+    for path in req_dir.glob("REQ-*.md"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        result[path] = (stat.st_mtime_ns, stat.st_size)
+    return result
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> tuple[list[Path], list[Path]]:
+    """Return ``(changed, removed)`` paths between two snapshots.
+
+    ``changed`` covers both new files and files whose mtime or size moved.
+    Both lists are sorted.
+    """
+    changed = sorted(path for path, sig in new.items() if old.get(path) != sig)
+    removed = sorted(path for path in old if path not in new)
+    return changed, removed
+
+
+def _settle(req_dir: Path, current: Snapshot, debounce: float) -> Snapshot:
+    """Poll until *req_dir* is unchanged for *debounce* seconds."""
+    while True:
+        time.sleep(debounce)
+        latest = snapshot(req_dir)
+        if latest == current:
+            return latest
+        current = latest
+
+
+# ---------------------------------------------------------------------------
+# Per-project state
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Project:
+    req_dir: Path
+    readme_path: Path
+    corpus: RequirementCorpus
+    snapshot: Snapshot
+
+
+def process_changes(
+    corpus: RequirementCorpus,
+    readme_path: Path,
+    changed: list[Path],
+    removed: list[Path],
+    *,
+    dry_run: bool = False,
+) -> list[Path]:
+    """Validate, re-prioritise and re-register the touched files only.
+
+    Args:
+        corpus:      Corpus for the project; refreshed here, so only the
+                     touched files are re-read.
+        readme_path: README.md register of the project.
+        changed:     Added or modified ``REQ-*.md`` paths.
+        removed:     Deleted ``REQ-*.md`` paths.
+        dry_run:     When True, report what would change without writing.
+
+    Returns:
+        The REQ files whose priority was rewritten.
+
+    """
+    corpus.refresh()
+    by_path = {entry.path: entry for entry in corpus.entries}
+
+    for path in removed:
+        print(f"  [REMOVED] {path.name}")
+
+    rewritten: list[Path] = []
+    for path in changed:
+        entry = by_path.get(path)
+        if entry is None:
+            # Created and deleted again within the debounce window.
+            continue
+        if entry.violations:
+            print(f"  [FAIL] {path.name}", file=sys.stderr)
+            for v in entry.violations:
+                print(f"         • {v}", file=sys.stderr)
+        else:
+            print(f"  [OK]   {path.name}")
+
+        req = entry.requirement
+        if req is None:
+            print(f"  [SKIP] {path.name}: {entry.error}", file=sys.stderr)
+            continue
+        label = moscow.compute(req.cs, req.cd)
+        if label != req.priority:
+            print(f"         Priority {req.priority} → {label} (CS={req.cs}, CD={req.cd})")
+            if not dry_run and parser.save(req, status=req.status, priority=label):
+                rewritten.append(path)
+
+    if rewritten:
+        corpus.refresh()
+
+    update_register.update(
+        readme_path=readme_path,
+        req_dir=corpus.req_dir,
+        dry_run=dry_run,
+        corpus=corpus,
+    )
+    if not dry_run:
+        corpus.save_cache()
+    return rewritten
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def watch(
+    projects: list[tuple[Path, Path]],
+    *,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+    dry_run: bool = False,
+    use_cache: bool = True,
+) -> None:
+    """Watch *projects* and process each batch of changes until interrupted.
+
+    Args:
+        projects:      ``(req_dir, readme_path)`` pairs to watch.
+        poll_interval: Seconds between directory polls.
+        debounce:      Quiet period, in seconds, that ends a change batch.
+        dry_run:       When True, report changes without writing any files.
+        use_cache:     Forwarded to :class:`~corpus.RequirementCorpus`.
+
+    Raises:
+        ValueError: If *poll_interval* or *debounce* is not positive.
+
+    """
+    if poll_interval <= 0 or debounce <= 0:
+        raise ValueError("poll_interval and debounce must be positive.")
+
+    for req_dir, _ in projects:
+        renumber.recover(req_dir)
+    states = [
+        _Project(
+            req_dir=req_dir,
+            readme_path=readme_path,
+            corpus=RequirementCorpus(req_dir, use_cache=use_cache),
+            snapshot=snapshot(req_dir),
+        )
+        for req_dir, readme_path in projects
+    ]
+    names = ", ".join(str(state.req_dir) for state in states)
+    print(f"\nWatching {names} (poll every {poll_interval}s). Press Ctrl-C to stop.")
+
+    try:
+        while True:
+            time.sleep(poll_interval)
+            for state in states:
+                current = snapshot(state.req_dir)
+                if current == state.snapshot:
+                    continue
+                current = _settle(state.req_dir, current, debounce)
+                changed, removed = diff_snapshots(state.snapshot, current)
+
+                stamp = time.strftime("%H:%M:%S")
+                print(
+                    f"\n[{stamp}] {state.req_dir}: {len(changed)} changed, "
+                    f"{len(removed)} removed"
+                )
+                rewritten = process_changes(
+                    state.corpus, state.readme_path, changed, removed, dry_run=dry_run
+                )
+                # Absorb this batch's own priority writes so they are not
+                # reported as a new change; edits made meanwhile still are.
+                fresh = snapshot(state.req_dir)
+                for path in rewritten:
+                    if path in fresh:
+                        current[path] = fresh[path]
+                state.snapshot = current
+    except KeyboardInterrupt:
+        print("\nWatch stopped.")